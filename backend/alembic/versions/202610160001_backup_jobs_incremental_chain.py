@@ -0,0 +1,54 @@
+"""Agrega la cadena de respaldos incrementales a backup_jobs.
+
+Columnas nuevas: backup_type (completo/incremental), parent_id (respaldo
+previo de la cadena) y snapshot_at (marca de corte del volcado, usada como
+punto de partida del siguiente incremental).
+
+Revision ID: 202610160001
+Revises: 202512050001
+Create Date: 2026-10-16 09:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202610160001"
+down_revision = "202512050001"
+branch_labels = None
+depends_on = None
+
+_BACKUP_TYPE = sa.Enum("FULL", "INCREMENTAL", name="backup_type")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _BACKUP_TYPE.create(bind, checkfirst=True)
+    with op.batch_alter_table("backup_jobs") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "backup_type",
+                _BACKUP_TYPE,
+                nullable=False,
+                server_default="FULL",
+            )
+        )
+        batch_op.add_column(sa.Column("parent_id", sa.Integer(), nullable=True))
+        batch_op.add_column(
+            sa.Column("snapshot_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.create_foreign_key(
+            "fk_backup_jobs_parent_id", "backup_jobs", ["parent_id"], ["id"]
+        )
+        batch_op.create_index("ix_backup_jobs_parent_id", ["parent_id"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("backup_jobs") as batch_op:
+        batch_op.drop_index("ix_backup_jobs_parent_id")
+        batch_op.drop_constraint("fk_backup_jobs_parent_id", type_="foreignkey")
+        batch_op.drop_column("snapshot_at")
+        batch_op.drop_column("parent_id")
+        batch_op.drop_column("backup_type")
+    _BACKUP_TYPE.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,91 @@
+"""Agrega la sucursal de enrutamiento indexada a sync_outbox.
+
+La columna store_id desnormaliza la sucursal declarada en el payload
+(store_id/origin_store_id/destination_store_id/sucursal_id) para que los
+ciclos de sincronización por sucursal filtren con un índice en lugar de
+decodificar cada payload. NULL representa eventos globales.
+
+Revision ID: 202610160002
+Revises: 202610160001
+Create Date: 2026-10-16 11:00:00.000000
+"""
+from __future__ import annotations
+
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202610160002"
+down_revision = "202610160001"
+branch_labels = None
+depends_on = None
+
+_STORE_KEYS = ("store_id", "origin_store_id", "destination_store_id", "sucursal_id")
+_BATCH_SIZE = 1000
+
+
+def _resolve_store_id(raw_payload: str | None) -> int | None:
+    try:
+        payload = json.loads(raw_payload or "{}")
+    except (TypeError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    for key in _STORE_KEYS:
+        candidate = payload.get(key)
+        if candidate is None:
+            continue
+        try:
+            return int(candidate)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _backfill_store_routing(connection: sa.engine.Connection) -> None:
+    outbox = sa.table(
+        "sync_outbox",
+        sa.column("id", sa.Integer),
+        sa.column("payload", sa.Text),
+        sa.column("store_id", sa.Integer),
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(outbox.c.id, outbox.c.payload)
+            .where(outbox.c.id > last_id)
+            .order_by(outbox.c.id)
+            .limit(_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        updates = [
+            {"row_id": row_id, "routed_store_id": store_id}
+            for row_id, raw_payload in rows
+            if (store_id := _resolve_store_id(raw_payload)) is not None
+        ]
+        if updates:
+            connection.execute(
+                sa.update(outbox)
+                .where(outbox.c.id == sa.bindparam("row_id"))
+                .values(store_id=sa.bindparam("routed_store_id")),
+                updates,
+            )
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sync_outbox") as batch_op:
+        batch_op.add_column(sa.Column("store_id", sa.Integer(), nullable=True))
+        batch_op.create_index(
+            "ix_sync_outbox_status_store_id", ["status", "store_id", "id"]
+        )
+    _backfill_store_routing(op.get_bind())
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sync_outbox") as batch_op:
+        batch_op.drop_index("ix_sync_outbox_status_store_id")
+        batch_op.drop_column("store_id")
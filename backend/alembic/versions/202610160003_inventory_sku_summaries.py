@@ -0,0 +1,43 @@
+"""Crea el resumen persistido de discrepancias de inventario por SKU.
+
+inventory_sku_summaries guarda los SKU con existencias distintas entre
+sucursales (mínimo, máximo y cantidades por sucursal) e
+inventory_sku_summary_state la marca de agua del detector incremental.
+
+Revision ID: 202610160003
+Revises: 202610160002
+Create Date: 2026-10-16 13:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202610160003"
+down_revision = "202610160002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_sku_summaries",
+        sa.Column("sku", sa.String(length=80), primary_key=True),
+        sa.Column("product_name", sa.String(length=120), nullable=False),
+        sa.Column("min_quantity", sa.Integer(), nullable=False),
+        sa.Column("max_quantity", sa.Integer(), nullable=False),
+        sa.Column("store_quantities", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_table(
+        "inventory_sku_summary_state",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("watermark_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("rebuilt_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("inventory_sku_summary_state")
+    op.drop_table("inventory_sku_summaries")
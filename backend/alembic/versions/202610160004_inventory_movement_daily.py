@@ -0,0 +1,89 @@
+"""Crea el acumulado diario de movimientos de inventario.
+
+inventory_movement_daily guarda por sucursal × dispositivo × tipo × día el
+número de movimientos, las unidades y el valor, y se llena desde
+inventory_movements con una sola agregación.
+
+Revision ID: 202610160004
+Revises: 202610160003
+Create Date: 2026-10-16 14:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "202610160004"
+down_revision = "202610160003"
+branch_labels = None
+depends_on = None
+
+
+MOVEMENT_TYPE_VALUES = ("entrada", "salida", "ajuste")
+
+
+def _movement_type_column(bind) -> sa.types.TypeEngine:
+    if bind.dialect.name == "postgresql":
+        return postgresql.ENUM(
+            *MOVEMENT_TYPE_VALUES, name="movement_type", create_type=False
+        )
+    return sa.Enum(*MOVEMENT_TYPE_VALUES, name="movement_type")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.create_table(
+        "inventory_movement_daily",
+        sa.Column(
+            "store_id",
+            sa.Integer(),
+            sa.ForeignKey("sucursales.id_sucursal", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "device_id",
+            sa.Integer(),
+            sa.ForeignKey("devices.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("movement_type", _movement_type_column(bind), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("movement_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("units", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "total_value", sa.Numeric(14, 2), nullable=False, server_default="0"
+        ),
+    )
+    op.create_index(
+        "ix_inventory_movement_daily_day_store",
+        "inventory_movement_daily",
+        ["day", "store_id"],
+    )
+    # El día se toma en UTC, como el acumulado incremental; en PostgreSQL
+    # DATE(timestamptz) usaría la zona horaria de la sesión.
+    day = (
+        "DATE(fecha AT TIME ZONE 'UTC')"
+        if bind.dialect.name == "postgresql"
+        else "DATE(fecha)"
+    )
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO inventory_movement_daily
+                (store_id, device_id, movement_type, day, movement_count, units, total_value)
+            SELECT sucursal_destino_id, producto_id, tipo_movimiento, {day},
+                   COUNT(id), SUM(cantidad), SUM(COALESCE(costo_unitario, 0) * cantidad)
+            FROM inventory_movements
+            GROUP BY sucursal_destino_id, producto_id, tipo_movimiento, {day}
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_inventory_movement_daily_day_store", table_name="inventory_movement_daily"
+    )
+    op.drop_table("inventory_movement_daily")
@@ -0,0 +1,143 @@
+"""Crea el índice de búsqueda del catálogo de dispositivos.
+
+device_search_documents guarda el texto normalizado de cada dispositivo
+activo; sobre ella se crean las tablas FTS5 y sus triggers (SQLite) o los
+índices GIN de pg_trgm/tsvector (PostgreSQL), y se llena desde devices.
+
+Revision ID: 202610160005
+Revises: 202610160004
+Create Date: 2026-10-16 15:00:00.000000
+"""
+from __future__ import annotations
+
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.app.db.catalog_search_index import (
+    create_catalog_search_index,
+    drop_catalog_search_index,
+)
+
+
+revision = "202610160005"
+down_revision = "202610160004"
+branch_labels = None
+depends_on = None
+
+# Copia fija de la normalización de services/catalog_search_index.py: la
+# migración no debe depender de los modelos ni del código vigente.
+_SEARCH_FIELDS = (
+    "name",
+    "sku",
+    "imei",
+    "serial",
+    "marca",
+    "modelo",
+    "color",
+    "categoria",
+    "capacidad",
+)
+_FILTER_COLUMNS = (
+    "marca",
+    "modelo",
+    "color",
+    "categoria",
+    "condicion",
+    "proveedor",
+    "estado",
+    "ubicacion",
+)
+_BATCH_SIZE = 2_000
+
+
+def _normalize(value: object) -> str:
+    if value is None:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(value))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def _fill_documents(bind: sa.engine.Connection) -> None:
+    """Llena device_search_documents con los dispositivos activos, por lotes."""
+
+    fields = sorted({"id", "sucursal_id", "is_deleted", *_SEARCH_FIELDS, *_FILTER_COLUMNS})
+    devices = sa.table("devices", *(sa.column(name) for name in fields))
+    documents = sa.table(
+        "device_search_documents",
+        sa.column("device_id"),
+        sa.column("store_id"),
+        sa.column("store_key"),
+        sa.column("document"),
+        *(sa.column(name) for name in _FILTER_COLUMNS),
+    )
+    last_id = 0
+    while True:
+        batch = bind.execute(
+            sa.select(*(devices.c[name] for name in fields))
+            .where(devices.c.is_deleted.is_(sa.false()), devices.c.id > last_id)
+            .order_by(devices.c.id)
+            .limit(_BATCH_SIZE)
+        ).all()
+        if not batch:
+            break
+        rows = []
+        for device in batch:
+            parts = (_normalize(getattr(device, name)) for name in _SEARCH_FIELDS)
+            row = {
+                "device_id": device.id,
+                "store_id": device.sucursal_id,
+                "store_key": f"#{device.sucursal_id}#",
+                "document": " ".join(part for part in parts if part),
+            }
+            row.update({name: _normalize(getattr(device, name)) for name in _FILTER_COLUMNS})
+            rows.append(row)
+        bind.execute(sa.insert(documents), rows)
+        last_id = batch[-1].id
+
+
+def upgrade() -> None:
+    op.create_table(
+        "device_search_documents",
+        sa.Column(
+            "device_id",
+            sa.Integer(),
+            sa.ForeignKey("devices.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "store_id",
+            sa.Integer(),
+            sa.ForeignKey("sucursales.id_sucursal", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("store_key", sa.String(length=20), nullable=False, server_default=""),
+        sa.Column("document", sa.Text(), nullable=False, server_default=""),
+        sa.Column("marca", sa.String(length=80), nullable=False, server_default=""),
+        sa.Column("modelo", sa.String(length=120), nullable=False, server_default=""),
+        sa.Column("color", sa.String(length=60), nullable=False, server_default=""),
+        sa.Column("categoria", sa.String(length=80), nullable=False, server_default=""),
+        sa.Column("condicion", sa.String(length=60), nullable=False, server_default=""),
+        sa.Column("proveedor", sa.String(length=120), nullable=False, server_default=""),
+        sa.Column("estado", sa.String(length=40), nullable=False, server_default=""),
+        sa.Column("ubicacion", sa.String(length=120), nullable=False, server_default=""),
+    )
+    op.create_index(
+        "ix_device_search_documents_store_id",
+        "device_search_documents",
+        ["store_id"],
+    )
+    bind = op.get_bind()
+    create_catalog_search_index(bind)
+    # La normalización (minúsculas, sin acentos) se hace en Python.
+    _fill_documents(bind)
+
+
+def downgrade() -> None:
+    drop_catalog_search_index(op.get_bind())
+    op.drop_index(
+        "ix_device_search_documents_store_id", table_name="device_search_documents"
+    )
+    op.drop_table("device_search_documents")
@@ -0,0 +1,78 @@
+"""Crea el índice de búsqueda de clientes y la tabla de etiquetas.
+
+customer_search_documents guarda el texto normalizado y las claves exactas
+(RTN, teléfono, correo) de cada cliente activo; sobre ella se crea la tabla
+FTS5 trigram y sus triggers (SQLite) o el índice GIN de pg_trgm
+(PostgreSQL). customer_tags refleja segmento_etiquetas con un índice por
+etiqueta. Ambas se llenan desde clientes.
+
+Revision ID: 202610160006
+Revises: 202610160005
+Create Date: 2026-10-16 16:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from backend.app.db.customer_search_index import (
+    create_customer_search_index,
+    drop_customer_search_index,
+)
+from backend.app.services.customer_search_index import rebuild_customer_search_index
+
+
+revision = "202610160006"
+down_revision = "202610160005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "customer_search_documents",
+        sa.Column(
+            "customer_id",
+            sa.Integer(),
+            sa.ForeignKey("clientes.id_cliente", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("document", sa.Text(), nullable=False, server_default=""),
+        sa.Column("tax_id_key", sa.String(length=30), nullable=False, server_default=""),
+        sa.Column("phone_key", sa.String(length=40), nullable=False, server_default=""),
+        sa.Column("email_key", sa.String(length=120), nullable=False, server_default=""),
+    )
+    for column in ("tax_id_key", "phone_key", "email_key"):
+        op.create_index(
+            f"ix_customer_search_documents_{column}",
+            "customer_search_documents",
+            [column],
+        )
+    op.create_table(
+        "customer_tags",
+        sa.Column(
+            "customer_id",
+            sa.Integer(),
+            sa.ForeignKey("clientes.id_cliente", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("tag", sa.String(length=60), primary_key=True),
+    )
+    op.create_index("ix_customer_tags_tag", "customer_tags", ["tag"])
+    bind = op.get_bind()
+    create_customer_search_index(bind)
+    # La normalización (minúsculas, sin acentos, sólo dígitos) se hace en Python.
+    rebuild_customer_search_index(Session(bind=bind))
+
+
+def downgrade() -> None:
+    drop_customer_search_index(op.get_bind())
+    op.drop_index("ix_customer_tags_tag", table_name="customer_tags")
+    op.drop_table("customer_tags")
+    for column in ("tax_id_key", "phone_key", "email_key"):
+        op.drop_index(
+            f"ix_customer_search_documents_{column}",
+            table_name="customer_search_documents",
+        )
+    op.drop_table("customer_search_documents")
@@ -0,0 +1,33 @@
+"""Índices para la paginación por cursor de los listados.
+
+Cubren el orden estable de cada listado en modo cursor: bitácora de
+auditoría y ventas por (fecha, id) y dispositivos de una sucursal por
+(nombre, id).
+
+Revision ID: 202610160007
+Revises: 202610160006
+Create Date: 2026-10-16 17:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "202610160007"
+down_revision = "202610160006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_audit_logs_created_at_id", "audit_logs", ["created_at", "id"])
+    op.create_index("ix_ventas_fecha_id", "ventas", ["fecha", "id_venta"])
+    op.create_index(
+        "ix_devices_store_name_id", "devices", ["sucursal_id", "name", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_devices_store_name_id", table_name="devices")
+    op.drop_index("ix_ventas_fecha_id", table_name="ventas")
+    op.drop_index("ix_audit_logs_created_at_id", table_name="audit_logs")
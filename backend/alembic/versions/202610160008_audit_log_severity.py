@@ -0,0 +1,117 @@
+"""Agrega la severidad precalculada e indexada a audit_logs.
+
+La severidad (info/warning/critical) se derivaba en cada consulta con
+cadenas de ``ILIKE '%palabra%'`` sobre ``action`` y ``details``. Ahora se
+clasifica al escribir el evento; esta migración rellena los registros
+existentes con las mismas palabras clave de ``utils/audit.py`` y crea los
+índices (severity, created_at) y (entity_type, entity_id, created_at).
+
+Revision ID: 202610160008
+Revises: 202610160007
+Create Date: 2026-10-16 18:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202610160008"
+down_revision = "202610160007"
+branch_labels = None
+depends_on = None
+
+_BATCH_SIZE = 1000
+_CRITICAL_KEYWORDS = (
+    "fail",
+    "denied",
+    "block",
+    "lock",
+    "intrusion",
+    "breach",
+    "error",
+    "stock bajo",
+    "stock-bajo",
+    "stockout",
+)
+_WARNING_KEYWORDS = (
+    "password",
+    "totp",
+    "2fa",
+    "deactivate",
+    "retry",
+    "cancel",
+    "sync",
+    "ajuste manual",
+    "inconsistencia",
+    "fiscal",
+    "config",
+)
+
+
+def _classify(action: str | None, details: str | None) -> str:
+    haystack = f"{action or ''} {details or ''}".lower()
+    if any(keyword in haystack for keyword in _CRITICAL_KEYWORDS):
+        return "critical"
+    if any(keyword in haystack for keyword in _WARNING_KEYWORDS):
+        return "warning"
+    return "info"
+
+
+def _backfill_severity(connection: sa.engine.Connection) -> None:
+    logs = sa.table(
+        "audit_logs",
+        sa.column("id", sa.Integer),
+        sa.column("action", sa.String),
+        sa.column("details", sa.Text),
+        sa.column("severity", sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(logs.c.id, logs.c.action, logs.c.details)
+            .where(logs.c.id > last_id)
+            .order_by(logs.c.id)
+            .limit(_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        # "info" ya es el valor por omisión de la columna.
+        updates = [
+            {"row_id": row_id, "classified": severity}
+            for row_id, action, details in rows
+            if (severity := _classify(action, details)) != "info"
+        ]
+        if updates:
+            connection.execute(
+                sa.update(logs)
+                .where(logs.c.id == sa.bindparam("row_id"))
+                .values(severity=sa.bindparam("classified")),
+                updates,
+            )
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("audit_logs") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "severity", sa.String(length=16), nullable=False, server_default="info"
+            )
+        )
+    _backfill_severity(op.get_bind())
+    op.create_index(
+        "ix_audit_logs_severity_created_at", "audit_logs", ["severity", "created_at"]
+    )
+    op.create_index(
+        "ix_audit_logs_entity_created_at",
+        "audit_logs",
+        ["entity_type", "entity_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_entity_created_at", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_severity_created_at", table_name="audit_logs")
+    with op.batch_alter_table("audit_logs") as batch_op:
+        batch_op.drop_column("severity")
@@ -0,0 +1,79 @@
+"""Crea la cola persistente de trabajos en segundo plano.
+
+background_jobs reemplaza el registro JSON de ``pos_async_jobs.json``: cada
+trabajo guarda tipo, prioridad, parámetros, intentos, progreso y el archivo
+resultante, y los workers lo toman por (status, priority, available_at).
+
+Revision ID: 202610160009
+Revises: 202610160008
+Create Date: 2026-10-16 19:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202610160009"
+down_revision = "202610160008"
+branch_labels = None
+depends_on = None
+
+
+JOB_STATUS_VALUES = ("QUEUED", "RUNNING", "COMPLETED", "FAILED")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("job_type", sa.String(length=60), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(*JOB_STATUS_VALUES, name="background_job_status"),
+            nullable=False,
+            server_default="QUEUED",
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="5"),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("progress", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("progress_message", sa.String(length=255), nullable=True),
+        sa.Column("result_path", sa.String(length=500), nullable=True),
+        sa.Column("result_filename", sa.String(length=255), nullable=True),
+        sa.Column("result_media_type", sa.String(length=120), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("worker_id", sa.String(length=80), nullable=True),
+        sa.Column(
+            "created_by_id",
+            sa.Integer(),
+            sa.ForeignKey("usuarios.id_usuario", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_background_jobs_job_type", "background_jobs", ["job_type"])
+    op.create_index(
+        "ix_background_jobs_created_by_id", "background_jobs", ["created_by_id"]
+    )
+    op.create_index(
+        "ix_background_jobs_claim",
+        "background_jobs",
+        ["status", "priority", "available_at", "created_at"],
+    )
+    op.create_index("ix_background_jobs_expires_at", "background_jobs", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_background_jobs_expires_at", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_claim", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_created_by_id", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_job_type", table_name="background_jobs")
+    op.drop_table("background_jobs")
+    sa.Enum(name="background_job_status").drop(op.get_bind(), checkfirst=True)
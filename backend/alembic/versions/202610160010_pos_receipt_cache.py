@@ -0,0 +1,63 @@
+"""Crea el índice de la caché de recibos POS.
+
+pos_receipt_cache relaciona cada venta (y la versión de la venta y de la
+configuración POS con que se generó) con el PDF guardado en disco bajo su
+SHA-256 y con el ticket ESC/POS.
+
+Revision ID: 202610160010
+Revises: 202610160009
+Create Date: 2026-10-16 21:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "202610160010"
+down_revision = "202610160009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pos_receipt_cache",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "sale_id",
+            sa.Integer(),
+            sa.ForeignKey("ventas.id_venta", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("store_id", sa.Integer(), nullable=False),
+        sa.Column("sale_version", sa.String(length=64), nullable=False),
+        sa.Column("config_version", sa.String(length=64), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("escpos_ticket", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "sale_id",
+            "sale_version",
+            "config_version",
+            name="uq_pos_receipt_cache_version",
+        ),
+    )
+    op.create_index("ix_pos_receipt_cache_sale_id", "pos_receipt_cache", ["sale_id"])
+    op.create_index("ix_pos_receipt_cache_store_id", "pos_receipt_cache", ["store_id"])
+    op.create_index(
+        "ix_pos_receipt_cache_content_hash", "pos_receipt_cache", ["content_hash"]
+    )
+    op.create_index(
+        "ix_pos_receipt_cache_last_used_at", "pos_receipt_cache", ["last_used_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pos_receipt_cache_last_used_at", table_name="pos_receipt_cache")
+    op.drop_index("ix_pos_receipt_cache_content_hash", table_name="pos_receipt_cache")
+    op.drop_index("ix_pos_receipt_cache_store_id", table_name="pos_receipt_cache")
+    op.drop_index("ix_pos_receipt_cache_sale_id", table_name="pos_receipt_cache")
+    op.drop_table("pos_receipt_cache")
@@ -45,6 +45,106 @@ class Settings(BaseSettings):
                 "DATABASE_URL", "SOFTMOBILE_DATABASE_URL"),
         ),
     ]
+    database_read_url: Annotated[
+        str | None,
+        Field(
+            default=None,
+            validation_alias=AliasChoices(
+                "DATABASE_READ_URL",
+                "SOFTMOBILE_DATABASE_READ_URL",
+            ),
+        ),
+    ]
+    database_pool_size: Annotated[
+        int,
+        Field(
+            default=10,
+            validation_alias=AliasChoices(
+                "DATABASE_POOL_SIZE",
+                "SOFTMOBILE_DATABASE_POOL_SIZE",
+            ),
+        ),
+    ]
+    database_max_overflow: Annotated[
+        int,
+        Field(
+            default=20,
+            validation_alias=AliasChoices(
+                "DATABASE_MAX_OVERFLOW",
+                "SOFTMOBILE_DATABASE_MAX_OVERFLOW",
+            ),
+        ),
+    ]
+    database_pool_timeout_seconds: Annotated[
+        float,
+        Field(
+            default=30.0,
+            validation_alias=AliasChoices(
+                "DATABASE_POOL_TIMEOUT_SECONDS",
+                "SOFTMOBILE_DATABASE_POOL_TIMEOUT_SECONDS",
+            ),
+        ),
+    ]
+    database_pool_recycle_seconds: Annotated[
+        int,
+        Field(
+            default=1800,
+            validation_alias=AliasChoices(
+                "DATABASE_POOL_RECYCLE_SECONDS",
+                "SOFTMOBILE_DATABASE_POOL_RECYCLE_SECONDS",
+            ),
+        ),
+    ]
+    database_pool_pre_ping: Annotated[
+        bool,
+        Field(
+            default=True,
+            validation_alias=AliasChoices(
+                "DATABASE_POOL_PRE_PING",
+                "SOFTMOBILE_DATABASE_POOL_PRE_PING",
+            ),
+        ),
+    ]
+    sqlite_journal_mode: Annotated[
+        str,
+        Field(
+            default="WAL",
+            validation_alias=AliasChoices(
+                "SQLITE_JOURNAL_MODE",
+                "SOFTMOBILE_SQLITE_JOURNAL_MODE",
+            ),
+        ),
+    ]
+    sqlite_synchronous: Annotated[
+        str,
+        Field(
+            default="NORMAL",
+            validation_alias=AliasChoices(
+                "SQLITE_SYNCHRONOUS",
+                "SOFTMOBILE_SQLITE_SYNCHRONOUS",
+            ),
+        ),
+    ]
+    sqlite_busy_timeout_ms: Annotated[
+        int,
+        Field(
+            default=5000,
+            validation_alias=AliasChoices(
+                "SQLITE_BUSY_TIMEOUT_MS",
+                "SOFTMOBILE_SQLITE_BUSY_TIMEOUT_MS",
+            ),
+        ),
+    ]
+    sqlite_mmap_size_bytes: Annotated[
+        int,
+        Field(
+            default=268_435_456,
+            validation_alias=AliasChoices(
+                "SQLITE_MMAP_SIZE_BYTES",
+                "SOFTMOBILE_SQLITE_MMAP_SIZE_BYTES",
+            ),
+        ),
+    ]
     title: str = Field(default="Softmobile Central")
     version: str = Field(default="2.2.0")
     api_v1_prefix: Annotated[
@@ -171,6 +271,46 @@ class Settings(BaseSettings):
             ),
         ),
     ]
+    auth_principal_cache_ttl_seconds: Annotated[
+        int,
+        Field(
+            default=30,
+            validation_alias=AliasChoices(
+                "AUTH_PRINCIPAL_CACHE_TTL_SECONDS",
+                "SOFTMOBILE_AUTH_PRINCIPAL_CACHE_TTL",
+            ),
+        ),
+    ]
+    auth_principal_cache_max_entries: Annotated[
+        int,
+        Field(
+            default=2048,
+            validation_alias=AliasChoices(
+                "AUTH_PRINCIPAL_CACHE_MAX_ENTRIES",
+                "SOFTMOBILE_AUTH_PRINCIPAL_CACHE_MAX_ENTRIES",
+            ),
+        ),
+    ]
+    session_activity_flush_seconds: Annotated[
+        int,
+        Field(
+            default=60,
+            validation_alias=AliasChoices(
+                "SESSION_ACTIVITY_FLUSH_SECONDS",
+                "SOFTMOBILE_SESSION_ACTIVITY_FLUSH_SECONDS",
+            ),
+        ),
+    ]
+    session_activity_batch_size: Annotated[
+        int,
+        Field(
+            default=200,
+            validation_alias=AliasChoices(
+                "SESSION_ACTIVITY_BATCH_SIZE",
+                "SOFTMOBILE_SESSION_ACTIVITY_BATCH_SIZE",
+            ),
+        ),
+    ]
     sync_interval_seconds: Annotated[
         int,
         Field(
@@ -201,6 +341,226 @@ class Settings(BaseSettings):
             ),
         ),
     ]
+    sync_cycle_page_size: Annotated[
+        int,
+        Field(
+            default=500,
+            validation_alias=AliasChoices(
+                "SYNC_CYCLE_PAGE_SIZE",
+                "SOFTMOBILE_SYNC_CYCLE_PAGE_SIZE",
+            ),
+        ),
+    ]
+    cache_backend_url: Annotated[
+        str | None,
+        Field(
+            default=None,
+            validation_alias=AliasChoices(
+                "CACHE_BACKEND_URL",
+                "SOFTMOBILE_CACHE_BACKEND_URL",
+            ),
+        ),
+    ]
+    cache_max_entries: Annotated[
+        int,
+        Field(
+            default=1024,
+            validation_alias=AliasChoices(
+                "CACHE_MAX_ENTRIES",
+                "SOFTMOBILE_CACHE_MAX_ENTRIES",
+            ),
+        ),
+    ]
+    cache_local_ttl_seconds: Annotated[
+        float,
+        Field(
+            default=5.0,
+            validation_alias=AliasChoices(
+                "CACHE_LOCAL_TTL_SECONDS",
+                "SOFTMOBILE_CACHE_LOCAL_TTL_SECONDS",
+            ),
+        ),
+    ]
+    cache_sweep_interval_seconds: Annotated[
+        float,
+        Field(
+            default=60.0,
+            validation_alias=AliasChoices(
+                "CACHE_SWEEP_INTERVAL_SECONDS",
+                "SOFTMOBILE_CACHE_SWEEP_INTERVAL_SECONDS",
+            ),
+        ),
+    ]
+    audit_async_enabled: Annotated[
+        bool,
+        Field(
+            default=False,
+            validation_alias=AliasChoices(
+                "AUDIT_ASYNC_ENABLED",
+                "SOFTMOBILE_AUDIT_ASYNC_ENABLED",
+            ),
+        ),
+    ]
+    audit_queue_max_size: Annotated[
+        int,
+        Field(
+            default=10_000,
+            validation_alias=AliasChoices(
+                "AUDIT_QUEUE_MAX_SIZE",
+                "SOFTMOBILE_AUDIT_QUEUE_MAX_SIZE",
+            ),
+        ),
+    ]
+    audit_batch_size: Annotated[
+        int,
+        Field(
+            default=200,
+            validation_alias=AliasChoices(
+                "AUDIT_BATCH_SIZE",
+                "SOFTMOBILE_AUDIT_BATCH_SIZE",
+            ),
+        ),
+    ]
+    audit_flush_interval_seconds: Annotated[
+        float,
+        Field(
+            default=1.0,
+            validation_alias=AliasChoices(
+                "AUDIT_FLUSH_INTERVAL_SECONDS",
+                "SOFTMOBILE_AUDIT_FLUSH_INTERVAL_SECONDS",
+            ),
+        ),
+    ]
+    audit_spill_path: Annotated[
+        str,
+        Field(
+            default="./logs/audit_spill.jsonl",
+            validation_alias=AliasChoices(
+                "AUDIT_SPILL_PATH",
+                "SOFTMOBILE_AUDIT_SPILL_PATH",
+            ),
+        ),
+    ]
+    job_workers: Annotated[
+        int,
+        Field(
+            default=2,
+            validation_alias=AliasChoices(
+                "JOB_WORKERS",
+                "SOFTMOBILE_JOB_WORKERS",
+            ),
+        ),
+    ]
+    job_poll_interval_seconds: Annotated[
+        float,
+        Field(
+            default=2.0,
+            validation_alias=AliasChoices(
+                "JOB_POLL_INTERVAL_SECONDS",
+                "SOFTMOBILE_JOB_POLL_INTERVAL_SECONDS",
+            ),
+        ),
+    ]
+    job_max_attempts: Annotated[
+        int,
+        Field(
+            default=3,
+            validation_alias=AliasChoices(
+                "JOB_MAX_ATTEMPTS",
+                "SOFTMOBILE_JOB_MAX_ATTEMPTS",
+            ),
+        ),
+    ]
+    job_retry_backoff_seconds: Annotated[
+        int,
+        Field(
+            default=30,
+            validation_alias=AliasChoices(
+                "JOB_RETRY_BACKOFF_SECONDS",
+                "SOFTMOBILE_JOB_RETRY_BACKOFF_SECONDS",
+            ),
+        ),
+    ]
+    job_stale_after_seconds: Annotated[
+        int,
+        Field(
+            default=600,
+            validation_alias=AliasChoices(
+                "JOB_STALE_AFTER_SECONDS",
+                "SOFTMOBILE_JOB_STALE_AFTER_SECONDS",
+            ),
+        ),
+    ]
+    job_result_retention_hours: Annotated[
+        int,
+        Field(
+            default=24,
+            validation_alias=AliasChoices(
+                "JOB_RESULT_RETENTION_HOURS",
+                "SOFTMOBILE_JOB_RESULT_RETENTION_HOURS",
+            ),
+        ),
+    ]
+    render_workers: Annotated[
+        int,
+        Field(
+            default=2,
+            validation_alias=AliasChoices(
+                "RENDER_WORKERS",
+                "SOFTMOBILE_RENDER_WORKERS",
+            ),
+        ),
+    ]
+    render_timeout_seconds: Annotated[
+        float,
+        Field(
+            default=120.0,
+            validation_alias=AliasChoices(
+                "RENDER_TIMEOUT_SECONDS",
+                "SOFTMOBILE_RENDER_TIMEOUT_SECONDS",
+            ),
+        ),
+    ]
+    pos_receipt_cache_directory: Annotated[
+        str,
+        Field(
+            default="./pos_receipts",
+            validation_alias=AliasChoices(
+                "POS_RECEIPT_CACHE_DIR",
+                "SOFTMOBILE_POS_RECEIPT_CACHE_DIR",
+            ),
+        ),
+    ]
+    pos_receipt_cache_retention_days: Annotated[
+        int,
+        Field(
+            default=90,
+            validation_alias=AliasChoices(
+                "POS_RECEIPT_CACHE_RETENTION_DAYS",
+                "SOFTMOBILE_POS_RECEIPT_CACHE_RETENTION_DAYS",
+            ),
+        ),
+    ]
+    inventory_discrepancy_incremental: Annotated[
+        bool,
+        Field(
+            default=True,
+            validation_alias=AliasChoices(
+                "INVENTORY_DISCREPANCY_INCREMENTAL",
+                "SOFTMOBILE_INVENTORY_DISCREPANCY_INCREMENTAL",
+            ),
+        ),
+    ]
+    inventory_discrepancy_full_rebuild_seconds: Annotated[
+        int,
+        Field(
+            default=86400,
+            validation_alias=AliasChoices(
+                "INVENTORY_DISCREPANCY_FULL_REBUILD_SECONDS",
+                "SOFTMOBILE_INVENTORY_DISCREPANCY_FULL_REBUILD_SECONDS",
+            ),
+        ),
+    ]
     config_sync_directory: Annotated[
         str,
         Field(
@@ -244,6 +604,36 @@ class Settings(BaseSettings):
             ),
         ),
     ]
+    sync_remote_timeout_seconds: Annotated[
+        float,
+        Field(
+            default=15.0,
+            validation_alias=AliasChoices(
+                "SYNC_REMOTE_TIMEOUT_SECONDS",
+                "SOFTMOBILE_SYNC_REMOTE_TIMEOUT_SECONDS",
+            ),
+        ),
+    ]
+    sync_dispatch_batch_size: Annotated[
+        int,
+        Field(
+            default=1,
+            validation_alias=AliasChoices(
+                "SYNC_DISPATCH_BATCH_SIZE",
+                "SOFTMOBILE_SYNC_DISPATCH_BATCH_SIZE",
+            ),
+        ),
+    ]
+    sync_dispatch_concurrency: Annotated[
+        int,
+        Field(
+            default=4,
+            validation_alias=AliasChoices(
+                "SYNC_DISPATCH_CONCURRENCY",
+                "SOFTMOBILE_SYNC_DISPATCH_CONCURRENCY",
+            ),
+        ),
+    ]
     enable_background_scheduler: Annotated[
         bool,
         Field(
@@ -986,6 +1376,66 @@ class Settings(BaseSettings):
             ),
         ),
     ]
+    backup_dump_chunk_bytes: Annotated[
+        int,
+        Field(
+            default=1048576,
+            validation_alias=AliasChoices(
+                "BACKUP_DUMP_CHUNK_BYTES",
+                "SOFTMOBILE_BACKUP_DUMP_CHUNK_BYTES",
+            ),
+        ),
+    ]
+    backup_dump_batch_rows: Annotated[
+        int,
+        Field(
+            default=500,
+            validation_alias=AliasChoices(
+                "BACKUP_DUMP_BATCH_ROWS",
+                "SOFTMOBILE_BACKUP_DUMP_BATCH_ROWS",
+            ),
+        ),
+    ]
+    backup_restore_workers: Annotated[
+        int,
+        Field(
+            default=4,
+            validation_alias=AliasChoices(
+                "BACKUP_RESTORE_WORKERS",
+                "SOFTMOBILE_BACKUP_RESTORE_WORKERS",
+            ),
+        ),
+    ]
+    backup_incremental_interval_seconds: Annotated[
+        int,
+        Field(
+            default=0,
+            validation_alias=AliasChoices(
+                "BACKUP_INCREMENTAL_INTERVAL_SECONDS",
+                "SOFTMOBILE_BACKUP_INCREMENTAL_INTERVAL_SECONDS",
+            ),
+        ),
+    ]
+    backup_incremental_max_chain: Annotated[
+        int,
+        Field(
+            default=96,
+            validation_alias=AliasChoices(
+                "BACKUP_INCREMENTAL_MAX_CHAIN",
+                "SOFTMOBILE_BACKUP_INCREMENTAL_MAX_CHAIN",
+            ),
+        ),
+    ]
+    backup_incremental_overlap_seconds: Annotated[
+        int,
+        Field(
+            default=60,
+            validation_alias=AliasChoices(
+                "BACKUP_INCREMENTAL_OVERLAP_SECONDS",
+                "SOFTMOBILE_BACKUP_INCREMENTAL_OVERLAP_SECONDS",
+            ),
+        ),
+    ]
     accounts_receivable_reminders_enabled: Annotated[
         bool,
         Field(
@@ -1255,7 +1705,16 @@ class Settings(BaseSettings):
         "sync_interval_seconds",
         "sync_retry_interval_seconds",
         "sync_max_attempts",
+        "sync_cycle_page_size",
+        "cache_max_entries",
+        "database_pool_size",
+        "sync_dispatch_batch_size",
+        "sync_dispatch_concurrency",
         "backup_interval_seconds",
+        "backup_dump_chunk_bytes",
+        "backup_dump_batch_rows",
+        "backup_restore_workers",
+        "backup_incremental_max_chain",
         "session_cookie_expire_minutes",
         "max_failed_login_attempts",
         "account_lock_minutes",
@@ -1290,6 +1749,19 @@ class Settings(BaseSettings):
         raise ValueError(
             "allowed_origins debe ser una lista de orígenes válidos")
 
+    @field_validator("sqlite_journal_mode", "sqlite_synchronous", mode="before")
+    @classmethod
+    def _normalize_sqlite_pragma(cls, value: Any, info: ValidationInfo) -> str:
+        allowed = {
+            "sqlite_journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+            "sqlite_synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+        }[info.field_name]
+        normalized = str(value).strip().upper()
+        if normalized not in allowed:
+            raise ValueError(
+                f"{info.field_name} debe ser uno de: {', '.join(sorted(allowed))}")
+        return normalized
+
     @field_validator("session_cookie_samesite", mode="before")
     @classmethod
     def _normalize_samesite(cls, value: Any) -> str:
@@ -1304,6 +1776,11 @@ class Settings(BaseSettings):
     @field_validator(
         "inventory_low_stock_threshold",
         "inventory_adjustment_variance_threshold",
+        "inventory_discrepancy_full_rebuild_seconds",
+        "database_max_overflow",
+        "database_pool_recycle_seconds",
+        "sqlite_busy_timeout_ms",
+        "sqlite_mmap_size_bytes",
     )
     @classmethod
     def _ensure_non_negative(cls, value: int, info: ValidationInfo) -> int:
@@ -0,0 +1,224 @@
+"""Cache de principales autenticados y registro diferido de actividad de sesiones.
+
+Cada petición autenticada resolvía la lista negra de JWT, la sesión activa, el
+usuario y sus permisos antes de llegar al *handler*. Este módulo conserva el
+resultado de esa resolución por un periodo corto, indexado por el token de
+sesión (``jti``), y acumula las marcas ``last_used_at`` para escribirlas en
+lotes en lugar de hacerlo en cada petición.
+
+La cache es local al proceso: las invalidaciones explícitas (logout,
+revocación, cambios de roles o permisos, desactivación de usuarios) cubren al
+worker que procesa la operación y el TTL corto acota la ventana en el resto.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..config import settings
+
+
+@dataclass(slots=True)
+class CachedPrincipal:
+    """Resultado de autenticar un token de sesión."""
+
+    session_token: str
+    session_id: int
+    user_id: int
+    username: str
+    user: Any
+    roles: frozenset[str]
+    store_ids: frozenset[int]
+    session_expires_at: datetime | None = None
+    permissions: Mapping[str, Mapping[str, bool]] | None = None
+    expires_at: float = field(default=0.0, compare=False)
+
+
+def detached_copy(instance: Any) -> Any:
+    """Genera una copia desacoplada con las columnas ya cargadas de la instancia.
+
+    La copia puede incorporarse a otra sesión con ``Session.merge(load=False)``
+    sin emitir consultas; las relaciones se cargan de forma perezosa al
+    accederlas desde la sesión destino.
+    """
+
+    mapper = inspect(instance).mapper
+    clone = mapper.class_manager.new_instance()
+    for attribute in mapper.column_attrs:
+        setattr(clone, attribute.key, getattr(instance, attribute.key))
+    make_transient_to_detached(clone)
+    return clone
+
+
+class PrincipalCache:
+    """Cache LRU con TTL e índices por usuario y sesión para invalidaciones."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl = float(ttl_seconds)
+        self._max_entries = max(int(max_entries), 1)
+        self._lock = Lock()
+        self._entries: OrderedDict[str, CachedPrincipal] = OrderedDict()
+        self._by_user: dict[int, set[str]] = {}
+        self._by_session: dict[int, set[str]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def configure(self, *, ttl_seconds: float, max_entries: int) -> None:
+        """Ajusta TTL y capacidad descartando las entradas actuales."""
+
+        with self._lock:
+            self._ttl = float(ttl_seconds)
+            self._max_entries = max(int(max_entries), 1)
+            self._clear_locked()
+
+    def get(self, session_token: str) -> CachedPrincipal | None:
+        if not self.enabled:
+            return None
+        now = monotonic()
+        with self._lock:
+            principal = self._entries.get(session_token)
+            if principal is None:
+                return None
+            if principal.expires_at <= now:
+                self._discard_locked(session_token)
+                return None
+            self._entries.move_to_end(session_token)
+            return principal
+
+    def put(self, principal: CachedPrincipal) -> None:
+        if not self.enabled:
+            return
+        principal.expires_at = monotonic() + self._ttl
+        key = principal.session_token
+        with self._lock:
+            self._discard_locked(key)
+            self._entries[key] = principal
+            self._by_user.setdefault(principal.user_id, set()).add(key)
+            self._by_session.setdefault(principal.session_id, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                oldest_key = next(iter(self._entries))
+                self._discard_locked(oldest_key)
+
+    def invalidate_token(self, session_token: str) -> None:
+        with self._lock:
+            self._discard_locked(session_token)
+
+    def invalidate_session(self, session_id: int) -> None:
+        with self._lock:
+            for key in list(self._by_session.get(session_id, ())):
+                self._discard_locked(key)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in list(self._by_user.get(user_id, ())):
+                self._discard_locked(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear_locked()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _clear_locked(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+        self._by_session.clear()
+
+    def _discard_locked(self, key: str) -> None:
+        principal = self._entries.pop(key, None)
+        if principal is None:
+            return
+        for index, index_key in (
+            (self._by_user, principal.user_id),
+            (self._by_session, principal.session_id),
+        ):
+            keys = index.get(index_key)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                index.pop(index_key, None)
+
+
+class SessionActivityBuffer:
+    """Acumula marcas ``last_used_at`` por sesión para escribirlas en lote."""
+
+    def __init__(self, *, flush_seconds: float, batch_size: int) -> None:
+        self._flush_seconds = float(flush_seconds)
+        self._batch_size = max(int(batch_size), 1)
+        self._lock = Lock()
+        self._pending: dict[int, datetime] = {}
+        self._last_flush = monotonic()
+
+    def configure(self, *, flush_seconds: float, batch_size: int) -> None:
+        with self._lock:
+            self._flush_seconds = float(flush_seconds)
+            self._batch_size = max(int(batch_size), 1)
+
+    def record(self, session_id: int, used_at: datetime) -> None:
+        with self._lock:
+            current = self._pending.get(session_id)
+            if current is None or used_at > current:
+                self._pending[session_id] = used_at
+
+    def discard(self, session_id: int) -> None:
+        with self._lock:
+            self._pending.pop(session_id, None)
+
+    def is_due(self) -> bool:
+        with self._lock:
+            if not self._pending:
+                return False
+            if self._flush_seconds <= 0 or len(self._pending) >= self._batch_size:
+                return True
+            return monotonic() - self._last_flush >= self._flush_seconds
+
+    def drain(self) -> dict[int, datetime]:
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._last_flush = monotonic()
+            return pending
+
+    def restore(self, pending: Mapping[int, datetime]) -> None:
+        """Reincorpora marcas no persistidas tras un fallo de escritura."""
+
+        for session_id, used_at in pending.items():
+            self.record(session_id, used_at)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.auth_principal_cache_ttl_seconds,
+    max_entries=settings.auth_principal_cache_max_entries,
+)
+
+session_activity = SessionActivityBuffer(
+    flush_seconds=settings.session_activity_flush_seconds,
+    batch_size=settings.session_activity_batch_size,
+)
+
+
+__all__ = [
+    "CachedPrincipal",
+    "PrincipalCache",
+    "SessionActivityBuffer",
+    "detached_copy",
+    "principal_cache",
+    "session_activity",
+]
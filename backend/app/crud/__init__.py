@@ -11,11 +11,12 @@ ESTADO ACTUAL:
 - ✅ Fase 1: __all__ exports agregados a 12 módulos especializados
 - 🔄 Fase 2: 4 módulos nuevos creados (pos, analytics, transfers, invoicing) - preparados para migración
 - ⏸️ Fase 3: Migrar funciones desde crud_legacy a módulos nuevos
-- ⏸️ Fase 4: Eliminar wildcard de crud_legacy completamente
+- ✅ Fase 4: Eliminar wildcard de crud_legacy (espacio de nombres perezoso, ver abajo)
 
 Para agregar nuevas funciones CRUD:
 - Preferir módulos especializados (users.py, devices.py, etc.)
 - Agregar función a __all__ del módulo correspondiente
+- Regenerar el índice: python backend/scripts/generate_crud_index.py
 - Evitar agregar más funciones a crud_legacy.py
 - Usar imports explícitos en código nuevo
 
@@ -41,33 +42,32 @@ Módulos nuevos preparados para migración (4):
 """
 
 # TODO: Migrar funciones desde crud_legacy.py a módulos especializados
-# Nota: crud_legacy aún usa wildcard por compatibilidad con 31 routers.
-# Se mantiene mientras se migran funciones a módulos especializados.
 #
-# Importamos legacy primero para que los módulos especializados sobrescriban
-# cualquier firma obsoleta (por ejemplo list_sales/start_date, métricas).
-from ..crud_legacy import *  # noqa: F401,F403
+# Carga perezosa: los símbolos se resuelven en el primer acceso mediante el
+# índice generado en `_index.py` (backend/scripts/generate_crud_index.py), que
+# conserva la precedencia de los antiguos `import *`: crud_legacy primero y los
+# módulos especializados después, sobrescribiendo las firmas obsoletas (por
+# ejemplo list_sales/start_date, métricas). Importar `crud` ya no carga
+# crud_legacy ni los módulos especializados hasta que se usan.
+from importlib import import_module
+from typing import Any
 
-# Imports explícitos desde módulos especializados (sobrescriben legacy cuando coinciden)
-# Nota: Los submódulos controlan sus exports mediante __all__
-from .users import *  # noqa: F401,F403
-from .devices import *  # noqa: F401,F403
-from .stores import *  # noqa: F401,F403
-from .warehouses import *  # noqa: F401,F403
-from .audit import *  # noqa: F401,F403
-from .inventory import *  # noqa: F401,F403
-from .customers import *  # noqa: F401,F403
-from .suppliers import *  # noqa: F401,F403
-from .sync import *  # noqa: F401,F403
-from .sales import *  # noqa: F401,F403
-from .purchases import *  # noqa: F401,F403
-from .loyalty import *  # noqa: F401,F403
+from ._index import SUBMODULES, SYMBOLS
 
-# Módulos nuevos preparados para recibir funciones de crud_legacy
-from .pos import *  # noqa: F401,F403
-from .analytics import *  # noqa: F401,F403
-from .transfers import *  # noqa: F401,F403
-from .invoicing import *  # noqa: F401,F403
+__all__ = sorted(SYMBOLS)
 
-# Utilidades adicionales expuestas para compatibilidad
-from ..utils.system_log_helpers import purge_system_logs  # noqa: F401
+
+def __getattr__(name: str) -> Any:
+    module_name = SYMBOLS.get(name)
+    if module_name is not None:
+        value = getattr(import_module(module_name, __name__), name)
+    elif name in SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(SYMBOLS) | SUBMODULES)
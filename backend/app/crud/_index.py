@@ -0,0 +1,551 @@
+"""Índice símbolo → módulo del espacio de nombres `crud`.
+
+Archivo generado por `backend/scripts/generate_crud_index.py`; no editar a mano.
+"""
+
+SYMBOLS: dict[str, str] = {
+    "ADMIN": "..crud_legacy",
+    "ALLOWED_CUSTOMER_STATUSES": "..crud_legacy",
+    "ALLOWED_CUSTOMER_TYPES": "..crud_legacy",
+    "AUDIT_EXPORT_HEADERS": ".audit",
+    "Any": "..crud_legacy",
+    "AuditAcknowledgementConflict": ".audit",
+    "AuditAcknowledgementError": ".audit",
+    "AuditAcknowledgementNotFound": ".audit",
+    "ColumnElement": "..crud_legacy",
+    "CustomerPaymentOutcome": "..crud_legacy",
+    "DEFAULT_SECURITY_MODULES": "..crud_legacy",
+    "Decimal": "..crud_legacy",
+    "GERENTE": "..crud_legacy",
+    "INVITADO": "..crud_legacy",
+    "IntegrityError": "..crud_legacy",
+    "Iterable": "..crud_legacy",
+    "Literal": "..crud_legacy",
+    "Mapping": "..crud_legacy",
+    "NoResultFound": "..crud_legacy",
+    "OPERADOR": "..crud_legacy",
+    "OUTBOX_PRIORITY_MAP": "..crud_legacy",
+    "OUTBOX_PRIORITY_ORDER": "..crud_legacy",
+    "Path": "..crud_legacy",
+    "ROLE_MODULE_PERMISSION_MATRIX": "..crud_legacy",
+    "ROUND_HALF_UP": "..crud_legacy",
+    "RTN_CANONICAL_TEMPLATE": "..crud_legacy",
+    "SYSTEM_MODULE_MAP": "..crud_legacy",
+    "Select": "..crud_legacy",
+    "Sequence": "..crud_legacy",
+    "Session": "..crud_legacy",
+    "String": "..crud_legacy",
+    "StringIO": "..crud_legacy",
+    "SyncOutboxItem": ".sync",
+    "ValidationError": "..crud_legacy",
+    "_create_system_log": ".audit",
+    "_ensure_debt_respects_limit": ".customers",
+    "_hydrate_movement_references": ".inventory",
+    "_log_action": ".audit",
+    "_register_purchase_status_event": ".purchases",
+    "acknowledge_audit_alert": ".audit",
+    "activate_totp_secret": ".users",
+    "add_jwt_to_blacklist": ".users",
+    "add_purchase_order_document": "..crud_legacy",
+    "and_": "..crud_legacy",
+    "append_customer_history": "..crud_legacy",
+    "append_customer_note": "..crud_legacy",
+    "append_repair_parts": "..crud_legacy",
+    "apply_customer_anonymization": "..crud_legacy",
+    "apply_loyalty_for_sale": ".loyalty",
+    "archive_product_bundle": "..crud_legacy",
+    "archive_product_variant": "..crud_legacy",
+    "assign_device_to_bin": "..crud_legacy",
+    "assign_supplier_batch": "..crud_legacy",
+    "audit_trail_utils": "..crud_legacy",
+    "audit_utils": "..crud_legacy",
+    "authorize_rma_request": "..crud_legacy",
+    "base64": "..crud_legacy",
+    "binascii": "..crud_legacy",
+    "buffer_sync_outbox_item": ".sync",
+    "build_cash_close_report": ".sales",
+    "build_customer_portfolio": "..crud_legacy",
+    "build_customer_statement_report": "..crud_legacy",
+    "build_global_report_dashboard": ".audit",
+    "build_global_report_overview": ".audit",
+    "build_inventory_snapshot": ".inventory",
+    "build_purchase_movement_comment": "..crud_legacy",
+    "build_sale_movement_comment": "..crud_legacy",
+    "build_sale_return_comment": "..crud_legacy",
+    "build_sales_by_product_report": ".sales",
+    "build_sales_summary_report": ".sales",
+    "build_transfer_movement_comment": "..crud_legacy",
+    "build_user_directory": ".users",
+    "calculate_aging_analytics": ".analytics",
+    "calculate_inventory_valuation": "..crud_legacy",
+    "calculate_profit_margin": ".analytics",
+    "calculate_purchase_supplier_metrics": "..crud_legacy",
+    "calculate_realtime_store_widget": ".analytics",
+    "calculate_reorder_suggestions": ".analytics",
+    "calculate_rotation_analytics": ".analytics",
+    "calculate_sales_by_category": "..crud_legacy",
+    "calculate_sales_by_store": "..crud_legacy",
+    "calculate_sales_projection": ".analytics",
+    "calculate_sales_timeseries": "..crud_legacy",
+    "calculate_stockout_forecast": ".analytics",
+    "calculate_store_comparatives": ".analytics",
+    "calculate_store_sales_forecast": ".analytics",
+    "calculate_weighted_average_cost": "..crud_legacy",
+    "calendar": "..crud_legacy",
+    "cancel_purchase_order": ".purchases",
+    "cancel_sale": ".sales",
+    "cancel_transfer_order": ".transfers",
+    "case": "..crud_legacy",
+    "cast": "..crud_legacy",
+    "catalog_search_index": "..crud_legacy",
+    "clear_login_lock": ".users",
+    "close_cash_session": ".pos",
+    "close_repair_order": "..crud_legacy",
+    "close_rma_request": "..crud_legacy",
+    "coalesce_sync_outbox": ".sync",
+    "compute_inventory_metrics": ".inventory",
+    "compute_purchase_suggestions": ".purchases",
+    "consume_supplier_batch": "..crud_legacy",
+    "contacts_to_json": "..crud_legacy",
+    "copy": "..crud_legacy",
+    "core_logger": "..crud_legacy",
+    "count_audit_logs": ".audit",
+    "count_devices_matching_filters": ".devices",
+    "count_incomplete_devices": ".inventory",
+    "count_inventory_import_history": ".inventory",
+    "count_purchase_orders": ".purchases",
+    "count_purchase_records": ".purchases",
+    "count_purchase_vendors": ".purchases",
+    "count_store_devices": ".devices",
+    "count_stores": ".stores",
+    "count_supplier_batch_overview": ".suppliers",
+    "count_sync_attempts_since": "..crud_legacy",
+    "count_sync_outbox_processed_since": "..crud_legacy",
+    "count_sync_queue_processed_since": "..crud_legacy",
+    "count_users": ".users",
+    "create_active_session": ".users",
+    "create_backup_job": "..crud_legacy",
+    "create_customer": ".customers",
+    "create_customer_privacy_request": "..crud_legacy",
+    "create_device": ".devices",
+    "create_dte_authorization": ".invoicing",
+    "create_inventory_import_record": ".inventory",
+    "create_inventory_movement": ".inventory",
+    "create_password_reset_token": ".users",
+    "create_price_list": "..crud_legacy",
+    "create_price_list_item": "..crud_legacy",
+    "create_product_bundle": "..crud_legacy",
+    "create_product_variant": "..crud_legacy",
+    "create_purchase_order": ".purchases",
+    "create_purchase_order_from_suggestion": ".purchases",
+    "create_purchase_record": ".purchases",
+    "create_purchase_vendor": ".purchases",
+    "create_recurring_order": "..crud_legacy",
+    "create_repair_order": "..crud_legacy",
+    "create_reservation": ".inventory",
+    "create_rma_request": "..crud_legacy",
+    "create_sale": ".sales",
+    "create_store": ".stores",
+    "create_supplier": ".suppliers",
+    "create_supplier_batch": ".suppliers",
+    "create_support_feedback": "..crud_legacy",
+    "create_system_log": ".audit",
+    "create_transfer_order": ".transfers",
+    "create_user": ".users",
+    "create_warehouse": "..crud_legacy",
+    "create_wms_bin": "..crud_legacy",
+    "credit": "..crud_legacy",
+    "csv": "..crud_legacy",
+    "customer_payload": "..crud_legacy",
+    "customer_privacy_request_payload": "..crud_legacy",
+    "customer_search_index": "..crud_legacy",
+    "dataclass": "..crud_legacy",
+    "date": "..crud_legacy",
+    "datetime": "..crud_legacy",
+    "deactivate_totp_secret": ".users",
+    "defaultdict": "..crud_legacy",
+    "delete_customer": ".customers",
+    "delete_device": ".devices",
+    "delete_pos_draft": ".pos",
+    "delete_price_list": "..crud_legacy",
+    "delete_price_list_item": "..crud_legacy",
+    "delete_repair_order": "..crud_legacy",
+    "delete_supplier": ".suppliers",
+    "delete_supplier_batch": ".suppliers",
+    "desc": "..crud_legacy",
+    "detect_return_anomalies": "..crud_legacy",
+    "device_category_expr": "..crud_legacy",
+    "device_sync_payload": "..crud_legacy",
+    "device_value": "..crud_legacy",
+    "dispatch_transfer_order": ".transfers",
+    "encode_audit_log_cursor": ".audit",
+    "encode_customer_cursor": ".customers",
+    "encode_device_cursor": ".devices",
+    "encode_sale_cursor": ".sales",
+    "encode_sync_outbox_cursor": ".sync",
+    "enqueue_dte_dispatch": ".invoicing",
+    "enqueue_sync_outbox": ".sync",
+    "enqueue_sync_outbox_bulk": ".sync",
+    "enqueue_sync_queue_events": "..crud_legacy",
+    "ensure_default_warehouse": ".warehouses",
+    "ensure_discount_percentage": "..crud_legacy",
+    "ensure_loyalty_account": ".loyalty",
+    "ensure_non_negative_decimal": "..crud_legacy",
+    "ensure_positive_decimal": "..crud_legacy",
+    "ensure_role": ".users",
+    "ensure_role_permissions": ".users",
+    "ensure_store_by_name": ".stores",
+    "ensure_unique_identifier_payload": "..crud_legacy",
+    "ensure_unique_identifiers": "..crud_legacy",
+    "execute_recurring_order": "..crud_legacy",
+    "expire_reservations": ".inventory",
+    "export_audit_logs_csv": ".audit",
+    "export_customers_csv": "..crud_legacy",
+    "export_purchase_vendors_csv": ".purchases",
+    "export_suppliers_csv": ".suppliers",
+    "fetch_due_sync_queue_entries": ".sync",
+    "fetch_sync_queue_candidates": "..crud_legacy",
+    "find_device_for_import": "..crud_legacy",
+    "flush_session": "..crud_legacy",
+    "flush_session_activity": ".users",
+    "format_currency": "..crud_legacy",
+    "func": "..crud_legacy",
+    "generate_analytics_alerts": "..crud_legacy",
+    "generate_customer_tax_id_placeholder": "..crud_legacy",
+    "get_active_session_by_token": ".users",
+    "get_audit_acknowledgements_map": ".audit",
+    "get_backup_job": "..crud_legacy",
+    "get_cash_session": ".pos",
+    "get_customer": ".customers",
+    "get_customer_accounts_receivable": "..crud_legacy",
+    "get_customer_dashboard_metrics": "..crud_legacy",
+    "get_customer_summary": "..crud_legacy",
+    "get_device": ".devices",
+    "get_device_current_bin": "..crud_legacy",
+    "get_device_global": "..crud_legacy",
+    "get_device_identifier": "..crud_legacy",
+    "get_dte_authorization": ".invoicing",
+    "get_dte_document": ".invoicing",
+    "get_inactive_products_report": "..crud_legacy",
+    "get_inventory_current_report": ".inventory",
+    "get_inventory_integrity_report": ".inventory",
+    "get_inventory_movements_report": ".inventory",
+    "get_inventory_reservation": ".inventory",
+    "get_inventory_value_report": ".inventory",
+    "get_known_import_column_patterns": ".inventory",
+    "get_last_audit_entries": ".audit",
+    "get_last_cash_session_for_store": ".pos",
+    "get_latest_backup_job": "..crud_legacy",
+    "get_latest_sync_outbox_update": "..crud_legacy",
+    "get_latest_sync_queue_update": "..crud_legacy",
+    "get_loyalty_account": ".loyalty",
+    "get_loyalty_account_by_id": ".loyalty",
+    "get_loyalty_summary": ".loyalty",
+    "get_oldest_pending_sync_outbox_update": "..crud_legacy",
+    "get_oldest_pending_sync_queue_update": "..crud_legacy",
+    "get_open_cash_session": ".pos",
+    "get_password_reset_token": ".users",
+    "get_payment_center_summary": "..crud_legacy",
+    "get_persistent_audit_alerts": ".audit",
+    "get_pos_config": ".pos",
+    "get_pos_promotions": ".pos",
+    "get_price_list": "..crud_legacy",
+    "get_price_list_item": "..crud_legacy",
+    "get_product_bundle": "..crud_legacy",
+    "get_product_variant": "..crud_legacy",
+    "get_purchase_order": ".purchases",
+    "get_purchase_record": "..crud_legacy",
+    "get_purchase_statistics": ".purchases",
+    "get_purchase_vendor": ".purchases",
+    "get_recurring_order": "..crud_legacy",
+    "get_repair_order": "..crud_legacy",
+    "get_rma_request": "..crud_legacy",
+    "get_role": ".users",
+    "get_sale": ".sales",
+    "get_store": ".stores",
+    "get_store_by_name": ".stores",
+    "get_store_membership": "..crud_legacy",
+    "get_store_sync_overview": "..crud_legacy",
+    "get_supplier": ".suppliers",
+    "get_supplier_batch_overview": ".suppliers",
+    "get_supplier_by_name": "..crud_legacy",
+    "get_suppliers_accounts_payable": ".suppliers",
+    "get_sync_discrepancies_report": "..crud_legacy",
+    "get_sync_outbox_entry": "..crud_legacy",
+    "get_sync_outbox_statistics": ".sync",
+    "get_sync_queue_entry": "..crud_legacy",
+    "get_top_selling_products": ".inventory",
+    "get_totp_secret": ".users",
+    "get_transfer_order": ".transfers",
+    "get_user": ".users",
+    "get_user_by_username": ".users",
+    "get_user_dashboard_metrics": ".users",
+    "get_warehouse": ".warehouses",
+    "get_warranty_assignment": "..crud_legacy",
+    "get_warranty_metrics": "..crud_legacy",
+    "history_to_json": "..crud_legacy",
+    "import_purchase_orders_from_csv": "..crud_legacy",
+    "invalidate_audit_username_cache": ".audit",
+    "invalidate_inventory_movements_cache": ".inventory",
+    "invalidate_persistent_audit_alerts_cache": ".audit",
+    "inventory_accounting": "..crud_legacy",
+    "inventory_alert_settings": "..crud_legacy",
+    "inventory_audit": "..crud_legacy",
+    "inventory_availability": "..crud_legacy",
+    "inventory_movement_payload": "..crud_legacy",
+    "inventory_movement_rollup": "..crud_legacy",
+    "inventory_movements_report_cache_key": "..crud_legacy",
+    "is_jwt_blacklisted": ".users",
+    "is_session_expired": ".users",
+    "is_tax_id_integrity_error": "..crud_legacy",
+    "issue_store_credit": "..crud_legacy",
+    "iter_audit_log_export_rows": ".audit",
+    "iter_devices": ".devices",
+    "joinedload": "..crud_legacy",
+    "json": "..crud_legacy",
+    "last_history_timestamp": "..crud_legacy",
+    "linear_regression": "..crud_legacy",
+    "list_active_sessions": ".users",
+    "list_analytics_categories": "..crud_legacy",
+    "list_audit_logs": ".audit",
+    "list_backup_jobs": "..crud_legacy",
+    "list_customers": ".customers",
+    "list_devices": ".devices",
+    "list_devices_below_minimum_thresholds": ".inventory",
+    "list_devices_in_bin": "..crud_legacy",
+    "list_dte_authorizations": ".invoicing",
+    "list_dte_dispatch_queue": ".invoicing",
+    "list_dte_documents": ".invoicing",
+    "list_import_validation_details": "..crud_legacy",
+    "list_import_validations": ".inventory",
+    "list_incomplete_devices": ".inventory",
+    "list_inventory_import_history": ".inventory",
+    "list_inventory_reservations": ".inventory",
+    "list_inventory_summary": ".inventory",
+    "list_loyalty_accounts": ".loyalty",
+    "list_loyalty_transactions": ".loyalty",
+    "list_operations_history": "..crud_legacy",
+    "list_payment_center_transactions": "..crud_legacy",
+    "list_price_lists": "..crud_legacy",
+    "list_product_bundles": "..crud_legacy",
+    "list_product_variants": "..crud_legacy",
+    "list_purchase_orders": ".purchases",
+    "list_purchase_records": ".purchases",
+    "list_purchase_records_for_report": ".purchases",
+    "list_purchase_vendors": ".purchases",
+    "list_recurring_orders": "..crud_legacy",
+    "list_repair_orders": "..crud_legacy",
+    "list_role_permissions": ".users",
+    "list_roles": ".users",
+    "list_sales": ".sales",
+    "list_store_credits": "..crud_legacy",
+    "list_stores": ".stores",
+    "list_supplier_batches": ".suppliers",
+    "list_suppliers": ".suppliers",
+    "list_sync_attempts": "..crud_legacy",
+    "list_sync_conflicts": "..crud_legacy",
+    "list_sync_history_by_store": "..crud_legacy",
+    "list_sync_outbox": "..crud_legacy",
+    "list_sync_outbox_by_cursor": ".sync",
+    "list_sync_outbox_by_entity": "..crud_legacy",
+    "list_sync_outbox_page": ".sync",
+    "list_sync_queue_entries": "..crud_legacy",
+    "list_sync_sessions": "..crud_legacy",
+    "list_system_errors": ".audit",
+    "list_system_logs": ".audit",
+    "list_transfer_orders": ".transfers",
+    "list_users": ".users",
+    "list_vendor_purchase_history": ".purchases",
+    "list_warehouses": ".warehouses",
+    "list_warranty_assignments": "..crud_legacy",
+    "list_wms_bins": "..crud_legacy",
+    "literal": "..crud_legacy",
+    "load_purchase_order_document": "..crud_legacy",
+    "log_audit_event": ".audit",
+    "log_dte_event": ".invoicing",
+    "log_sync_discrepancies": "..crud_legacy",
+    "log_unknown_login_attempt": ".users",
+    "logger": "..crud_legacy",
+    "map_system_level": "..crud_legacy",
+    "mark_dte_dispatch_sent": ".invoicing",
+    "mark_outbox_entries_sent": "..crud_legacy",
+    "mark_outbox_entry_failed": "..crud_legacy",
+    "mark_password_reset_token_used": ".users",
+    "mark_session_used": ".users",
+    "mask_email": "..crud_legacy",
+    "mask_generic_text": "..crud_legacy",
+    "mask_person_name": "..crud_legacy",
+    "mask_phone": "..crud_legacy",
+    "math": "..crud_legacy",
+    "merge_defaults": "..crud_legacy",
+    "mirror_sync_queue_events": "..crud_legacy",
+    "models": "..crud_legacy",
+    "movement_value": "..crud_legacy",
+    "normalize_customer_segment_category": "..crud_legacy",
+    "normalize_customer_status": "..crud_legacy",
+    "normalize_customer_tags": "..crud_legacy",
+    "normalize_customer_tax_id": "..crud_legacy",
+    "normalize_customer_type": "..crud_legacy",
+    "normalize_date_range": "..crud_legacy",
+    "normalize_hardware_settings": "..crud_legacy",
+    "normalize_movement_comment": "..crud_legacy",
+    "normalize_optional_note": "..crud_legacy",
+    "normalize_reservation_reason": "..crud_legacy",
+    "normalize_role_names": "..crud_legacy",
+    "normalize_rtn": "..crud_legacy",
+    "normalize_store_code": "..crud_legacy",
+    "normalize_store_ids": "..crud_legacy",
+    "normalize_store_status": "..crud_legacy",
+    "open_cash_session": ".pos",
+    "or_": "..crud_legacy",
+    "paginate_cash_sessions": ".pos",
+    "persistent_alerts_cache_key": "..crud_legacy",
+    "pos_receipt_cache": "..crud_legacy",
+    "prepare_audit_entry": ".audit",
+    "priority_weight": "..crud_legacy",
+    "process_rma_request": "..crud_legacy",
+    "products_to_json": "..crud_legacy",
+    "project_linear_sum": "..crud_legacy",
+    "promotions": "..crud_legacy",
+    "provision_totp_secret": ".users",
+    "purchase_documents": "..crud_legacy",
+    "purchase_order_payload": "..crud_legacy",
+    "purge_system_logs": "..utils.system_log_helpers",
+    "quantize_currency": "..crud_legacy",
+    "quantize_points": "..crud_legacy",
+    "quantize_rate": "..crud_legacy",
+    "re": "..crud_legacy",
+    "recalculate_sale_price": "..crud_legacy",
+    "recalculate_store_inventory_value": ".stores",
+    "receive_purchase_order": ".purchases",
+    "receive_transfer_order": ".transfers",
+    "record_session_activity": ".users",
+    "record_sync_attempt": "..crud_legacy",
+    "record_sync_dispatch_results": ".sync",
+    "record_sync_session": "..crud_legacy",
+    "redeem_store_credit": "..crud_legacy",
+    "redeem_store_credit_for_customer": "..crud_legacy",
+    "refresh_expired_warranties": "..crud_legacy",
+    "register_backup_restore": "..crud_legacy",
+    "register_customer_payment": "..crud_legacy",
+    "register_dte_ack": ".invoicing",
+    "register_dte_document": ".invoicing",
+    "register_failed_login": ".users",
+    "register_inventory_movement": ".inventory",
+    "register_payment_center_credit_note": "..crud_legacy",
+    "register_payment_center_refund": "..crud_legacy",
+    "register_pos_receipt_delivery": "..crud_legacy",
+    "register_pos_receipt_download": "..crud_legacy",
+    "register_pos_sale": ".pos",
+    "register_purchase_return": "..crud_legacy",
+    "register_sale_return": "..crud_legacy",
+    "register_successful_login": ".users",
+    "register_system_error": ".audit",
+    "register_warranty_claim": "..crud_legacy",
+    "reject_transfer_order": "..crud_legacy",
+    "release_reservation": ".inventory",
+    "remove_repair_part": "..crud_legacy",
+    "renew_reservation": ".inventory",
+    "reserve_dte_folio": ".invoicing",
+    "reset_outbox_entries": "..crud_legacy",
+    "reset_user_password": ".users",
+    "resolve_device_for_inventory": "..crud_legacy",
+    "resolve_device_for_pos": ".pos",
+    "resolve_devices_for_pos": ".pos",
+    "resolve_outbox_conflicts": "..crud_legacy",
+    "resolve_outbox_priority": "..crud_legacy",
+    "resolve_price_for_device": "..crud_legacy",
+    "resolve_sync_queue_entry": "..crud_legacy",
+    "resolve_system_module": "..crud_legacy",
+    "return_policy_settings": "..crud_legacy",
+    "revoke_session": ".users",
+    "save_pos_draft": ".pos",
+    "schemas": "..crud_legacy",
+    "search_devices": ".devices",
+    "search_sales_history": ".sales",
+    "secrets": "..crud_legacy",
+    "select": "..crud_legacy",
+    "selectinload": "..crud_legacy",
+    "send_purchase_order_email": "..crud_legacy",
+    "set_purchase_vendor_status": ".purchases",
+    "set_user_roles": ".users",
+    "set_user_status": ".users",
+    "settings": "..crud_legacy",
+    "severity_weight": "..crud_legacy",
+    "soft_delete_store": ".stores",
+    "soft_delete_user": ".users",
+    "summarize_sync_outbox_by_entity_type": "..crud_legacy",
+    "summarize_sync_outbox_statuses": "..crud_legacy",
+    "summarize_sync_queue_by_event_type": "..crud_legacy",
+    "summarize_sync_queue_statuses": "..crud_legacy",
+    "support_feedback_metrics": "..crud_legacy",
+    "telemetry": "..crud_legacy",
+    "textwrap": "..crud_legacy",
+    "timedelta": "..crud_legacy",
+    "timezone": "..crud_legacy",
+    "to_decimal": "..crud_legacy",
+    "token_protection": "..crud_legacy",
+    "transactional_session": "..crud_legacy",
+    "transfer_between_warehouses": "..crud_legacy",
+    "transfer_order_payload": "..crud_legacy",
+    "transition_purchase_order_status": "..crud_legacy",
+    "tuple_": "..crud_legacy",
+    "unset_default_warehouse": ".warehouses",
+    "update_active_session_token": ".users",
+    "update_customer": ".customers",
+    "update_device": ".devices",
+    "update_dte_authorization": ".invoicing",
+    "update_loyalty_account": ".loyalty",
+    "update_outbox_priority": "..crud_legacy",
+    "update_pos_config": ".pos",
+    "update_pos_promotions": ".pos",
+    "update_price_list": "..crud_legacy",
+    "update_price_list_item": "..crud_legacy",
+    "update_product_bundle": "..crud_legacy",
+    "update_product_variant": "..crud_legacy",
+    "update_purchase_vendor": ".purchases",
+    "update_repair_order": "..crud_legacy",
+    "update_role_permissions": ".users",
+    "update_sale": ".sales",
+    "update_store": ".stores",
+    "update_supplier": ".suppliers",
+    "update_supplier_batch": ".suppliers",
+    "update_support_feedback_status": "..crud_legacy",
+    "update_sync_queue_entry": "..crud_legacy",
+    "update_totp_last_verified": ".users",
+    "update_user": ".users",
+    "update_warranty_claim_status": "..crud_legacy",
+    "update_wms_bin": "..crud_legacy",
+    "upsert_device_identifier": "..crud_legacy",
+    "upsert_store_membership": "..crud_legacy",
+    "user_display_name": ".users",
+    "user_has_module_permission": ".users",
+    "uuid4": "..crud_legacy",
+    "validate_device_numeric_fields": "..crud_legacy",
+    "verify_supervisor_pin_hash": "..crud_legacy",
+    "write_audit_entries": ".audit",
+}
+
+SUBMODULES: frozenset[str] = frozenset(
+    {
+        "analytics",
+        "audit",
+        "common",
+        "customers",
+        "devices",
+        "inventory",
+        "invoicing",
+        "loyalty",
+        "pos",
+        "purchases",
+        "purchases_legacy_part_2",
+        "purchases_legacy_part_3",
+        "sales",
+        "stores",
+        "suppliers",
+        "sync",
+        "transfers",
+        "users",
+        "warehouses",
+    }
+)
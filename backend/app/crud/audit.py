@@ -1,14 +1,11 @@
 """Operaciones CRUD para el módulo de Auditoría."""
 from __future__ import annotations
 
-import copy
-import csv
 import json
-from collections.abc import Iterable, Mapping
-from datetime import date, datetime, timedelta, timezone
-from io import StringIO
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime, timezone
 
-from sqlalchemy import func, or_, select, tuple_, case
+from sqlalchemy import func, insert, select, tuple_, case
 from sqlalchemy.sql import Select
 from sqlalchemy.orm import Session, joinedload
 
@@ -16,30 +13,59 @@ from .. import models, schemas, telemetry
 from ..core.transactions import flush_session, transactional_session
 from ..utils import audit as audit_utils
 from ..utils import audit_trail as audit_trail_utils
+from ..services.audit_alert_tracker import persistent_alert_tracker
+from ..services.streaming_exports import render_csv, stream_scalar_batches
 from ..utils.cache import TTLCache
+from ..utils.keyset import Keyset, SortKey
 from ..utils.misc_helpers import severity_weight
 from .sync import get_sync_outbox_statistics
 
 
-_PERSISTENT_ALERTS_CACHE: TTLCache[list[dict[str, object]]] = TTLCache(
-    ttl_seconds=60.0
+def invalidate_persistent_audit_alerts_cache() -> None:
+    """Descarta el estado de recordatorios críticos; se recalcula al consultar."""
+
+    persistent_alert_tracker.reset()
+    telemetry.record_reminder_cache_invalidation()
+
+
+# Nombre de usuario por id para `logs_sistema.usuario`; "" si el usuario no existe.
+_AUDIT_USERNAME_CACHE: TTLCache[str] = TTLCache(
+    ttl_seconds=300.0, name="audit_usernames"
 )
 
 
-def _persistent_alerts_cache_key(
-    *,
-    threshold_minutes: int,
-    min_occurrences: int,
-    lookback_hours: int,
-    limit: int,
-) -> tuple[int, int, int, int]:
-    return (threshold_minutes, min_occurrences, lookback_hours, limit)
+def _resolve_usernames(db: Session, user_ids: Iterable[int | None]) -> dict[int, str | None]:
+    wanted = {user_id for user_id in user_ids if user_id is not None}
+    resolved: dict[int, str | None] = {}
+    missing: list[int] = []
+    for user_id in wanted:
+        cached = _AUDIT_USERNAME_CACHE.get(user_id)
+        if cached is None:
+            missing.append(user_id)
+        else:
+            resolved[user_id] = cached or None
+    if missing:
+        rows = dict(
+            db.execute(
+                select(models.User.id, models.User.username).where(
+                    models.User.id.in_(missing)
+                )
+            ).all()
+        )
+        for user_id in missing:
+            username = rows.get(user_id) or ""
+            _AUDIT_USERNAME_CACHE.set(user_id, username)
+            resolved[user_id] = username or None
+    return resolved
 
 
-def invalidate_persistent_audit_alerts_cache() -> None:
-    """Limpia la cache en memoria de recordatorios críticos."""
+def invalidate_audit_username_cache(user_id: int | None = None) -> None:
+    """Descarta los nombres de usuario cacheados para la bitácora."""
 
-    _PERSISTENT_ALERTS_CACHE.clear()
+    if user_id is None:
+        _AUDIT_USERNAME_CACHE.clear()
+    else:
+        _AUDIT_USERNAME_CACHE.delete(user_id)
 
 
 def _user_display_name(user: models.User | None) -> str | None:
@@ -130,28 +156,35 @@ def create_system_log(
     return entry
 
 
-def log_audit_event(
-    db: Session,
+def _serialize_audit_details(details: str | Mapping[str, object] | None) -> str | None:
+    if not isinstance(details, Mapping):
+        return details
+    try:
+        return json.dumps(details, ensure_ascii=False)
+    except TypeError:
+        safe_details = {
+            key: value if isinstance(
+                value, (str, int, float, bool, type(None))) else str(value)
+            for key, value in details.items()
+        }
+        return json.dumps(safe_details, ensure_ascii=False)
+
+
+def prepare_audit_entry(
     *,
     action: str,
     entity_type: str,
     entity_id: str | int,
     performed_by_id: int | None,
     details: str | Mapping[str, object] | None = None,
-) -> models.AuditLog:
-    entity_id_str = str(entity_id)
-    if isinstance(details, Mapping):
-        try:
-            serialized_details = json.dumps(details, ensure_ascii=False)
-        except TypeError:
-            safe_details = {
-                key: value if isinstance(
-                    value, (str, int, float, bool, type(None))) else str(value)
-                for key, value in details.items()
-            }
-            serialized_details = json.dumps(safe_details, ensure_ascii=False)
-    else:
-        serialized_details = details
+) -> dict[str, object]:
+    """Normaliza un evento de auditoría a un diccionario serializable en JSON.
+
+    Es el formato que comparten ``log_audit_event`` y la escritura en lote de
+    ``write_audit_entries`` (cola asíncrona de auditoría).
+    """
+
+    serialized_details = _serialize_audit_details(details)
     description_text: str | None = None
     if isinstance(serialized_details, str):
         description_text, _ = audit_trail_utils.parse_audit_details(
@@ -160,36 +193,120 @@ def log_audit_event(
         description_text = details
     if description_text is None:
         description_text = f"{action} sobre {entity_type} {entity_id}".strip()
+    return {
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": str(entity_id),
+        "performed_by_id": performed_by_id,
+        "details": serialized_details,
+        "severity": audit_utils.classify_severity(action or "", serialized_details),
+        "description": description_text,
+    }
+
+
+def log_audit_event(
+    db: Session,
+    *,
+    action: str,
+    entity_type: str,
+    entity_id: str | int,
+    performed_by_id: int | None,
+    details: str | Mapping[str, object] | None = None,
+) -> models.AuditLog:
+    """Registra el evento dentro de la transacción del llamador (modo estricto)."""
+
+    entry = prepare_audit_entry(
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        performed_by_id=performed_by_id,
+        details=details,
+    )
     with transactional_session(db):
         log = models.AuditLog(
             action=action,
             entity_type=entity_type,
-            entity_id=entity_id_str,
+            entity_id=entry["entity_id"],
             performed_by_id=performed_by_id,
-            details=serialized_details,
+            details=entry["details"],
+            severity=entry["severity"],
         )
         db.add(log)
         flush_session(db)
-        usuario = None
-        if performed_by_id is not None:
-            user = db.get(models.User, performed_by_id)
-            if user is not None:
-                usuario = user.username
-        module = _resolve_system_module(entity_type)
-        level = _map_system_level(action, description_text)
+        usuario = _resolve_usernames(db, [performed_by_id]).get(performed_by_id)  # type: ignore[arg-type]
         create_system_log(
             db,
             audit_log=log,
             usuario=usuario,
-            module=module,
+            module=_resolve_system_module(entity_type),
             action=action,
-            description=description_text,
-            level=level,
+            description=str(entry["description"]),
+            level=_map_system_level(action, str(entry["description"])),
         )
-        invalidate_persistent_audit_alerts_cache()
+        if log.severity == "critical":
+            persistent_alert_tracker.mark_dirty()
     return log
 
 
+def write_audit_entries(db: Session, entries: Sequence[Mapping[str, object]]) -> int:
+    """Inserta en lote pares ``AuditLog``/``SystemLog`` a partir de ``prepare_audit_entry``.
+
+    ``created_at`` (ISO 8601 o ``datetime``) conserva la hora en que se
+    aceptó el evento. No confirma la transacción; devuelve la cantidad escrita.
+    """
+
+    if not entries:
+        return 0
+    now = datetime.now(timezone.utc)
+    audit_rows: list[dict[str, object]] = []
+    for entry in entries:
+        created_at = entry.get("created_at") or now
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        audit_rows.append(
+            {
+                "action": entry["action"],
+                "entity_type": entry["entity_type"],
+                "entity_id": str(entry["entity_id"]),
+                "performed_by_id": entry.get("performed_by_id"),
+                "details": entry.get("details"),
+                "severity": entry.get("severity")
+                or audit_utils.classify_severity(
+                    str(entry["action"]), entry.get("details")  # type: ignore[arg-type]
+                ),
+                "created_at": created_at,
+            }
+        )
+    audit_table = models.AuditLog.__table__
+    audit_ids = list(
+        db.scalars(
+            insert(audit_table).returning(
+                audit_table.c.id, sort_by_parameter_order=True),
+            audit_rows,
+        )
+    )
+    usernames = _resolve_usernames(db, (row["performed_by_id"] for row in audit_rows))  # type: ignore[misc]
+    system_rows = []
+    for entry, row, audit_id in zip(entries, audit_rows, audit_ids):
+        description = str(entry.get("description") or row["action"])
+        system_rows.append(
+            {
+                "usuario": usernames.get(row["performed_by_id"]),  # type: ignore[arg-type]
+                "modulo": _resolve_system_module(str(row["entity_type"])),
+                "accion": row["action"],
+                "descripcion": description,
+                "fecha": row["created_at"],
+                "nivel": _map_system_level(str(row["action"]), description),
+                "audit_log_id": audit_id,
+            }
+        )
+    db.execute(insert(models.SystemLog.__table__), system_rows)
+    # Sólo los eventos críticos alimentan los recordatorios persistentes.
+    if any(row["severity"] == "critical" for row in audit_rows):
+        persistent_alert_tracker.mark_dirty()
+    return len(audit_rows)
+
+
 _log_action = log_audit_event
 log_action = log_audit_event
 
@@ -280,11 +397,22 @@ def _normalize_date_range(
     return start_dt, end_dt
 
 
-def list_audit_logs(
-    db: Session,
+# Orden estable de `list_audit_logs` en modo cursor (más recientes primero).
+_AUDIT_LOG_KEYSET = Keyset(
+    SortKey(models.AuditLog.created_at, descending=True),
+    SortKey(models.AuditLog.id, descending=True),
+)
+
+
+def encode_audit_log_cursor(log: models.AuditLog) -> str:
+    """Cursor de la página siguiente a partir del último registro listado."""
+
+    return _AUDIT_LOG_KEYSET.encode(log)
+
+
+def _filter_audit_logs(
+    statement: Select,
     *,
-    limit: int = 50,
-    offset: int = 0,
     action: str | None = None,
     entity_type: str | None = None,
     module: str | None = None,
@@ -292,19 +420,9 @@ def list_audit_logs(
     severity: audit_utils.AuditSeverity | None = None,
     date_from: date | datetime | None = None,
     date_to: date | datetime | None = None,
-) -> list[models.AuditLog]:
-    critical_keywords = audit_utils.severity_keywords()["critical"]
-    warning_keywords = audit_utils.severity_keywords()["warning"]
-
-    def _keyword_condition(keyword: str):
-        pattern = f"%{keyword}%"
-        return or_(
-            models.AuditLog.action.ilike(pattern),
-            func.coalesce(models.AuditLog.details, "").ilike(pattern),
-        )
+) -> Select:
+    """Filtros comunes del listado, el conteo y la exportación de la bitácora."""
 
-    statement = select(models.AuditLog).order_by(
-        models.AuditLog.created_at.desc())
     if module:
         statement = statement.join(
             models.SystemLog,
@@ -320,25 +438,54 @@ def list_audit_logs(
         statement = statement.where(
             models.AuditLog.performed_by_id == performed_by_id)
     if severity:
-        critical_conditions = [_keyword_condition(keyword)
-                               for keyword in critical_keywords]
-        warning_conditions = [_keyword_condition(keyword)
-                              for keyword in warning_keywords]
-        critical_condition = or_(*critical_conditions)
-        warning_condition = or_(*warning_conditions)
-        if severity == "critical":
-            statement = statement.where(critical_condition)
-        elif severity == "warning":
-            statement = statement.where(warning_condition, ~critical_condition)
-        elif severity == "info":
-            statement = statement.where(
-                ~critical_condition, ~warning_condition)
+        statement = statement.where(models.AuditLog.severity == severity)
     if date_from is not None or date_to is not None:
         start_dt, end_dt = _normalize_date_range(date_from, date_to)
         statement = statement.where(
-            models.AuditLog.created_at >= start_dt, models.AuditLog.created_at <= end_dt
+            models.AuditLog.created_at >= start_dt,
+            models.AuditLog.created_at <= end_dt,
         )
-    statement = statement.offset(offset).limit(limit)
+    return statement
+
+
+def list_audit_logs(
+    db: Session,
+    *,
+    limit: int = 50,
+    offset: int = 0,
+    action: str | None = None,
+    entity_type: str | None = None,
+    module: str | None = None,
+    performed_by_id: int | None = None,
+    severity: audit_utils.AuditSeverity | None = None,
+    date_from: date | datetime | None = None,
+    date_to: date | datetime | None = None,
+    cursor: str | None = None,
+) -> list[models.AuditLog]:
+    """Bitácora filtrada, de la más reciente a la más antigua.
+
+    Con ``cursor`` (cadena vacía para la primera página) se pagina por keyset
+    sobre ``(created_at, id)`` e ``offset`` se ignora.
+    """
+
+    statement = select(models.AuditLog)
+    if cursor is not None:
+        statement = _AUDIT_LOG_KEYSET.apply(statement, cursor)
+    else:
+        statement = statement.order_by(models.AuditLog.created_at.desc())
+    statement = _filter_audit_logs(
+        statement,
+        action=action,
+        entity_type=entity_type,
+        module=module,
+        performed_by_id=performed_by_id,
+        severity=severity,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    if cursor is None:
+        statement = statement.offset(offset)
+    statement = statement.limit(limit)
     return list(db.scalars(statement).unique())
 
 
@@ -353,51 +500,16 @@ def count_audit_logs(
     date_from: date | datetime | None = None,
     date_to: date | datetime | None = None,
 ) -> int:
-    critical_keywords = audit_utils.severity_keywords()["critical"]
-    warning_keywords = audit_utils.severity_keywords()["warning"]
-
-    def _keyword_condition(keyword: str):
-        pattern = f"%{keyword}%"
-        return or_(
-            models.AuditLog.action.ilike(pattern),
-            func.coalesce(models.AuditLog.details, "").ilike(pattern),
-        )
-
-    statement = select(func.count()).select_from(models.AuditLog)
-    if module:
-        statement = statement.join(
-            models.SystemLog,
-            models.SystemLog.audit_log_id == models.AuditLog.id,
-        ).where(models.SystemLog.modulo == module.strip().lower())
-    else:
-        statement = statement.outerjoin(models.SystemLog)
-    if action:
-        statement = statement.where(models.AuditLog.action == action)
-    if entity_type:
-        statement = statement.where(models.AuditLog.entity_type == entity_type)
-    if performed_by_id is not None:
-        statement = statement.where(
-            models.AuditLog.performed_by_id == performed_by_id)
-    if severity:
-        critical_conditions = [_keyword_condition(keyword)
-                               for keyword in critical_keywords]
-        warning_conditions = [_keyword_condition(keyword)
-                              for keyword in warning_keywords]
-        critical_condition = or_(*critical_conditions)
-        warning_condition = or_(*warning_conditions)
-        if severity == "critical":
-            statement = statement.where(critical_condition)
-        elif severity == "warning":
-            statement = statement.where(warning_condition, ~critical_condition)
-        elif severity == "info":
-            statement = statement.where(
-                ~critical_condition, ~warning_condition)
-    if date_from is not None or date_to is not None:
-        start_dt, end_dt = _normalize_date_range(date_from, date_to)
-        statement = statement.where(
-            models.AuditLog.created_at >= start_dt,
-            models.AuditLog.created_at <= end_dt,
-        )
+    statement = _filter_audit_logs(
+        select(func.count()).select_from(models.AuditLog),
+        action=action,
+        entity_type=entity_type,
+        module=module,
+        performed_by_id=performed_by_id,
+        severity=severity,
+        date_from=date_from,
+        date_to=date_to,
+    )
     return int(db.scalar(statement) or 0)
 
 
@@ -447,10 +559,24 @@ def get_audit_acknowledgements_map(
     }
 
 
-def export_audit_logs_csv(
+AUDIT_EXPORT_HEADERS = (
+    "ID",
+    "Acción",
+    "Tipo de entidad",
+    "ID de entidad",
+    "Detalle",
+    "Usuario responsable",
+    "Fecha de creación",
+    "Estado alerta",
+    "Acuse registrado",
+    "Nota de acuse",
+)
+
+
+def iter_audit_log_export_rows(
     db: Session,
     *,
-    limit: int = 50,
+    limit: int | None = 50,
     offset: int = 0,
     action: str | None = None,
     entity_type: str | None = None,
@@ -459,11 +585,16 @@ def export_audit_logs_csv(
     severity: audit_utils.AuditSeverity | None = None,
     date_from: date | datetime | None = None,
     date_to: date | datetime | None = None,
-) -> str:
-    logs = list_audit_logs(
-        db,
-        limit=limit,
-        offset=offset,
+) -> Iterator[list[object]]:
+    """Filas de la exportación CSV leídas por lotes con ``yield_per``.
+
+    Los acuses se consultan por lote, sólo para las entidades del lote.
+    """
+
+    statement = _filter_audit_logs(
+        select(models.AuditLog).order_by(
+            models.AuditLog.created_at.desc(), models.AuditLog.id.desc()
+        ),
         action=action,
         entity_type=entity_type,
         module=module,
@@ -471,43 +602,28 @@ def export_audit_logs_csv(
         severity=severity,
         date_from=date_from,
         date_to=date_to,
-    )
-    buffer = StringIO()
-    acknowledgements = get_audit_acknowledgements_map(
-        db,
-        entities={(log.entity_type, log.entity_id) for log in logs},
-    )
-    writer = csv.writer(buffer)
-    writer.writerow(
-        [
-            "ID",
-            "Acción",
-            "Tipo de entidad",
-            "ID de entidad",
-            "Detalle",
-            "Usuario responsable",
-            "Fecha de creación",
-            "Estado alerta",
-            "Acuse registrado",
-            "Nota de acuse",
-        ]
-    )
-    for log in logs:
-        key = (log.entity_type, log.entity_id)
-        acknowledgement = acknowledgements.get(key)
-        status = "Pendiente"
-        acknowledgement_text = ""
-        acknowledgement_note = ""
-        if acknowledgement and acknowledgement.acknowledged_at >= log.created_at:
-            display_name = _user_display_name(acknowledgement.acknowledged_by)
-            status = "Atendida"
-            acknowledgement_text = acknowledgement.acknowledged_at.strftime(
-                "%Y-%m-%dT%H:%M:%S")
-            if display_name:
-                acknowledgement_text += f" · {display_name}"
-            acknowledgement_note = acknowledgement.note or ""
-        writer.writerow(
-            [
+    ).offset(offset)
+    if limit is not None:
+        statement = statement.limit(limit)
+    for logs in stream_scalar_batches(db, statement):
+        acknowledgements = get_audit_acknowledgements_map(
+            db,
+            entities={(log.entity_type, log.entity_id) for log in logs},
+        )
+        for log in logs:
+            acknowledgement = acknowledgements.get((log.entity_type, log.entity_id))
+            status = "Pendiente"
+            acknowledgement_text = ""
+            acknowledgement_note = ""
+            if acknowledgement and acknowledgement.acknowledged_at >= log.created_at:
+                display_name = _user_display_name(acknowledgement.acknowledged_by)
+                status = "Atendida"
+                acknowledgement_text = acknowledgement.acknowledged_at.strftime(
+                    "%Y-%m-%dT%H:%M:%S")
+                if display_name:
+                    acknowledgement_text += f" · {display_name}"
+                acknowledgement_note = acknowledgement.note or ""
+            yield [
                 log.id,
                 log.action,
                 log.entity_type,
@@ -519,8 +635,34 @@ def export_audit_logs_csv(
                 acknowledgement_text,
                 acknowledgement_note,
             ]
-        )
-    return buffer.getvalue()
+
+
+def export_audit_logs_csv(
+    db: Session,
+    *,
+    limit: int = 50,
+    offset: int = 0,
+    action: str | None = None,
+    entity_type: str | None = None,
+    module: str | None = None,
+    performed_by_id: int | None = None,
+    severity: audit_utils.AuditSeverity | None = None,
+    date_from: date | datetime | None = None,
+    date_to: date | datetime | None = None,
+) -> str:
+    rows = iter_audit_log_export_rows(
+        db,
+        limit=limit,
+        offset=offset,
+        action=action,
+        entity_type=entity_type,
+        module=module,
+        performed_by_id=performed_by_id,
+        severity=severity,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return render_csv(rows, header=AUDIT_EXPORT_HEADERS)
 
 
 def acknowledge_audit_alert(
@@ -538,21 +680,15 @@ def acknowledge_audit_alert(
     if not normalized_type or not normalized_id:
         raise ValueError("entity identifiers must be provided")
 
-    recent_logs_stmt = (
+    # Recorre el índice (entity_type, entity_id, created_at) desde el final.
+    last_critical = db.scalars(
         select(models.AuditLog)
         .where(models.AuditLog.entity_type == normalized_type)
         .where(models.AuditLog.entity_id == normalized_id)
+        .where(models.AuditLog.severity == "critical")
         .order_by(models.AuditLog.created_at.desc())
-        .limit(200)
-    )
-    recent_logs = list(db.scalars(recent_logs_stmt))
-    last_critical: models.AuditLog | None = None
-    for item in recent_logs:
-        severity = audit_utils.classify_severity(
-            item.action or "", item.details)
-        if severity == "critical":
-            last_critical = item
-            break
+        .limit(1)
+    ).first()
 
     if last_critical is None:
         telemetry.record_audit_acknowledgement_failure(
@@ -613,7 +749,8 @@ def acknowledge_audit_alert(
         flush_session(db)
         db.refresh(acknowledgement)
 
-    invalidate_persistent_audit_alerts_cache()
+    # Los acuses se consultan al armar los recordatorios; basta releer eventos nuevos.
+    persistent_alert_tracker.mark_dirty()
     telemetry.record_audit_acknowledgement(normalized_type, event)
     return acknowledgement
 
@@ -640,34 +777,12 @@ def get_persistent_audit_alerts(
     if offset < 0:
         raise ValueError("offset must be >= 0")
 
-    fetch_limit = limit + offset
-
-    cache_key = _persistent_alerts_cache_key(
+    persistent_alerts, from_tracker = persistent_alert_tracker.alerts(
+        db,
         threshold_minutes=threshold_minutes,
         min_occurrences=min_occurrences,
         lookback_hours=lookback_hours,
-        limit=fetch_limit,
-    )
-    cached = _PERSISTENT_ALERTS_CACHE.get(cache_key)
-    if cached is not None:
-        return copy.deepcopy(cached)[offset: offset + limit]
-
-    now = datetime.now(timezone.utc)
-    lookback_start = now - timedelta(hours=lookback_hours)
-
-    statement = (
-        select(models.AuditLog)
-        .where(models.AuditLog.created_at >= lookback_start)
-        .order_by(models.AuditLog.created_at.asc())
-    )
-    logs = list(db.scalars(statement))
-
-    persistent_alerts = audit_utils.identify_persistent_critical_alerts(
-        logs,
-        threshold_minutes=threshold_minutes,
-        min_occurrences=min_occurrences,
-        limit=fetch_limit,
-        reference_time=now,
+        limit=limit + offset,
     )
 
     keys = {(str(alert["entity_type"]), str(alert["entity_id"]))
@@ -744,7 +859,10 @@ def get_persistent_audit_alerts(
             }
         )
 
-    _PERSISTENT_ALERTS_CACHE.set(cache_key, copy.deepcopy(enriched))
+    if from_tracker:
+        telemetry.record_reminder_cache_hit(enriched)
+    else:
+        telemetry.record_reminder_cache_miss(enriched)
     return enriched[offset: offset + limit]
 
 
@@ -1311,6 +1429,7 @@ def build_global_report_dashboard(
 
 
 __all__ = [
+    "AUDIT_EXPORT_HEADERS",
     "AuditAcknowledgementConflict",
     "AuditAcknowledgementError",
     "AuditAcknowledgementNotFound",
@@ -1320,17 +1439,22 @@ __all__ = [
     "count_audit_logs",
     "create_system_log",
     "_create_system_log",
+    "encode_audit_log_cursor",
     "export_audit_logs_csv",
+    "iter_audit_log_export_rows",
     "get_audit_acknowledgements_map",
     "get_last_audit_entries",
     "get_persistent_audit_alerts",
+    "invalidate_audit_username_cache",
     "invalidate_persistent_audit_alerts_cache",
     "list_audit_logs",
     "list_system_errors",
     "list_system_logs",
     "log_audit_event",
     "_log_action",
+    "prepare_audit_entry",
     "register_system_error",
+    "write_audit_entries",
 ]
 
 # Aliases para compatibilidad con código legacy
@@ -7,12 +7,14 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Sequence, Any
 from datetime import datetime, timezone
 
-from sqlalchemy import select, func, cast, String, or_
+from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from .. import models, schemas
 from ..core.transactions import flush_session, transactional_session
+from ..services import customer_search_index
+from ..utils.keyset import Keyset, SortKey
 from .common import to_decimal as _to_decimal
 from .audit import log_audit_event as _log_action
 from .sync import enqueue_sync_outbox
@@ -378,6 +380,16 @@ def _sync_customer_ledger_entry(db: Session, entry: models.CustomerLedgerEntry)
         )
 
 
+# Orden estable de `list_customers` (por nombre y, en empate, por id).
+_CUSTOMER_KEYSET = Keyset(SortKey(models.Customer.name), SortKey(models.Customer.id))
+
+
+def encode_customer_cursor(customer: models.Customer) -> str:
+    """Cursor de la página siguiente a partir del último cliente listado."""
+
+    return _CUSTOMER_KEYSET.encode(customer)
+
+
 def list_customers(
     db: Session,
     *,
@@ -389,16 +401,24 @@ def list_customers(
     has_debt: bool | None = None,
     segment_category: str | None = None,
     tags: Sequence[str] | None = None,
+    cursor: str | None = None,
 ) -> list[models.Customer]:
-    statement = (
+    """Clientes activos ordenados por nombre.
+
+    Con ``cursor`` (cadena vacía para la primera página, ver
+    `encode_customer_cursor`) se pagina por keyset a partir del último
+    cliente de la página previa e ``offset`` se ignora.
+    """
+
+    statement = _CUSTOMER_KEYSET.apply(
         select(models.Customer)
         .options(selectinload(models.Customer.loyalty_account))
         .options(selectinload(models.Customer.segment_snapshot))
-        .where(models.Customer.is_deleted.is_(False))
-        .order_by(models.Customer.name.asc())
-        .offset(offset)
-        .limit(limit)
-    )
+        .where(models.Customer.is_deleted.is_(False)),
+        cursor,
+    ).limit(limit)
+    if cursor is None:
+        statement = statement.offset(offset)
     if status:
         normalized_status = _normalize_customer_status(status)
         statement = statement.where(
@@ -414,31 +434,15 @@ def list_customers(
             statement = statement.where(
                 models.Customer.segment_category == normalized_category
             )
-    normalized_tags = _normalize_customer_tags(tags)
-    if normalized_tags:
-        tags_column = func.lower(cast(models.Customer.tags, String))
-        for tag in normalized_tags:
-            statement = statement.where(tags_column.like(f'%"{tag}"%'))
+    tags_clause = customer_search_index.customer_tags_clause(
+        _normalize_customer_tags(tags)
+    )
+    if tags_clause is not None:
+        statement = statement.where(tags_clause)
     if query:
-        normalized = f"%{query.lower()}%"
-        statement = statement.where(
-            or_(
-                func.lower(models.Customer.name).like(normalized),
-                func.lower(models.Customer.contact_name).like(normalized),
-                func.lower(models.Customer.email).like(normalized),
-                func.lower(models.Customer.phone).like(normalized),
-                func.lower(models.Customer.customer_type).like(normalized),
-                func.lower(models.Customer.status).like(normalized),
-                func.lower(func.coalesce(models.Customer.segment_category, "")).like(
-                    normalized),
-                func.lower(func.coalesce(models.Customer.notes, "")
-                           ).like(normalized),
-                func.lower(cast(models.Customer.tags, String)
-                           ).like(normalized),
-                func.lower(func.coalesce(models.Customer.tax_id, "")
-                           ).like(normalized),
-            )
-        )
+        search_clause = customer_search_index.customer_search_clause(db, query)
+        if search_clause is not None:
+            statement = statement.where(search_clause)
     if has_debt is True:
         statement = statement.where(models.Customer.outstanding_debt > 0)
     elif has_debt is False:
@@ -510,6 +514,7 @@ def create_customer(
                 raise ValueError("customer_tax_id_duplicate") from exc
             raise ValueError("customer_already_exists") from exc
         db.refresh(customer)
+        customer_search_index.sync_customer_search_index(db, customer)
 
         _log_action(
             db,
@@ -656,6 +661,7 @@ def update_customer(
                 raise ValueError("customer_tax_id_duplicate") from exc
             raise
         db.refresh(customer)
+        customer_search_index.sync_customer_search_index(db, customer)
 
         if ledger_entry is not None:
             _sync_customer_ledger_entry(db, ledger_entry)
@@ -702,6 +708,7 @@ def delete_customer(
         not has_dependencies or is_superadmin)
     with transactional_session(db):
         if should_hard_delete:
+            customer_search_index.remove_customer_search_document(db, customer_id)
             db.delete(customer)
             flush_session(db)
             _log_action(
@@ -715,6 +722,7 @@ def delete_customer(
             customer.is_deleted = True
             db.add(customer)
             flush_session(db)
+            customer_search_index.remove_customer_search_document(db, customer_id)
             _log_action(
                 db,
                 action="customer_soft_deleted",
@@ -734,6 +742,7 @@ def delete_customer(
 __all__ = [
     "create_customer",
     "delete_customer",
+    "encode_customer_cursor",
     "get_customer",
     "list_customers",
     "update_customer",
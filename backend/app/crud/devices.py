@@ -1,19 +1,23 @@
 """Operaciones CRUD para el módulo de Inventario (Devices)."""
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime, timezone, date
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Any
 
-from sqlalchemy import select, or_
+from sqlalchemy import ColumnElement, Select, case, func, or_, select
 from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from .. import models, schemas
 from ..core.transactions import flush_session, transactional_session
-from .common import to_decimal
+from ..services import catalog_search_index
+from ..services.streaming_exports import QUERY_BATCH_SIZE, stream_scalars
+from ..utils.keyset import Keyset, SortKey
+from .common import normalize_date_range, to_decimal
 from .audit import log_audit_event as _log_action
-from .stores import recalculate_store_inventory_value
+from .stores import get_store, recalculate_store_inventory_value
 from .warehouses import ensure_default_warehouse
 
 
@@ -155,6 +159,8 @@ def create_device(
 
             raise ValueError("device_creation_failed") from exc
 
+        catalog_search_index.sync_device_search_document(db, device)
+
         # 4. Auditoría y Sincronización
         _log_action(
             db,
@@ -239,6 +245,7 @@ def update_device(
         device.updated_at = datetime.now(timezone.utc)
         db.add(device)
         flush_session(db)
+        catalog_search_index.sync_device_search_document(db, device)
 
         # Auditoría
         details: dict[str, Any] = {
@@ -275,6 +282,7 @@ def delete_device(
         device.is_deleted = True
         device.deleted_at = datetime.now(timezone.utc)
         db.add(device)
+        catalog_search_index.remove_device_search_document(db, device.id)
 
         details: dict[str, Any] = {
             "reason": reason,
@@ -295,6 +303,82 @@ def delete_device(
     return device
 
 
+def _apply_store_device_filters(
+    db: Session,
+    statement: Select[Any],
+    store_id: int,
+    *,
+    search_clause: ColumnElement[bool] | None,
+    categoria: str | None,
+    low_stock: bool,
+    estado: models.CommercialState | None,
+    condicion: str | None,
+    estado_inventario: str | None,
+    ubicacion: str | None,
+    proveedor: str | None,
+    warehouse_id: int | None,
+    fecha_ingreso_desde: date | None,
+    fecha_ingreso_hasta: date | None,
+) -> Select[Any]:
+    statement = statement.where(
+        models.Device.store_id == store_id,
+        models.Device.is_deleted.is_(False)
+    )
+    if warehouse_id is not None:
+        statement = statement.where(models.Device.warehouse_id == warehouse_id)
+    if search_clause is not None:
+        statement = statement.where(search_clause)
+    if categoria:
+        statement = statement.where(models.Device.categoria == categoria)
+    if low_stock:
+        statement = statement.where(models.Device.quantity <=
+                                    models.Device.minimum_stock)
+    if estado:
+        statement = statement.where(models.Device.estado_comercial == estado)
+    if condicion:
+        statement = statement.where(models.Device.condicion == condicion)
+    if estado_inventario:
+        statement = statement.where(models.Device.estado == estado_inventario)
+    substring_filters = catalog_search_index.device_filter_clause(
+        db, {"ubicacion": ubicacion, "proveedor": proveedor}
+    )
+    if substring_filters is not None:
+        statement = statement.where(substring_filters)
+    if fecha_ingreso_desde:
+        statement = statement.where(
+            models.Device.fecha_ingreso >= fecha_ingreso_desde)
+    if fecha_ingreso_hasta:
+        statement = statement.where(
+            models.Device.fecha_ingreso <= fecha_ingreso_hasta)
+    return statement
+
+
+# Orden estable de `list_devices` en modo cursor.
+_DEVICE_KEYSET = Keyset(SortKey(models.Device.name), SortKey(models.Device.id))
+
+
+def encode_device_cursor(device: models.Device) -> str:
+    """Cursor de la página siguiente a partir del último dispositivo listado."""
+
+    return _DEVICE_KEYSET.encode(device)
+
+
+def _search_ids(db: Session, store_id: int, search: str | None) -> list[int] | None:
+    """Primeras coincidencias por relevancia; sólo se usan para ordenar."""
+
+    if not search or not search.strip():
+        return None
+    return catalog_search_index.search_device_ids(db, search, store_id=store_id)
+
+
+def _search_clause(
+    db: Session, store_id: int, search: str | None
+) -> ColumnElement[bool] | None:
+    if not search or not search.strip():
+        return None
+    return catalog_search_index.device_search_clause(db, search, store_id=store_id)
+
+
 def list_devices(
     db: Session,
     store_id: int,
@@ -312,60 +396,254 @@ def list_devices(
     warehouse_id: int | None = None,
     fecha_ingreso_desde: date | None = None,
     fecha_ingreso_hasta: date | None = None,
+    cursor: str | None = None,
 ) -> list[models.Device]:
-    stmt = select(models.Device).where(
-        models.Device.store_id == store_id,
-        models.Device.is_deleted.is_(False)
+    """Dispositivos activos de la sucursal.
+
+    Con ``cursor`` (cadena vacía para la primera página) se pagina por keyset
+    sobre ``(name, id)`` e ``offset`` se ignora; las búsquedas se devuelven
+    entonces por nombre en lugar de por relevancia.
+    """
+
+    search_ids = _search_ids(db, store_id, search) if cursor is None else None
+    if search_ids == []:
+        return []
+    stmt = _apply_store_device_filters(
+        db,
+        select(models.Device),
+        store_id,
+        search_clause=_search_clause(db, store_id, search),
+        categoria=categoria,
+        low_stock=low_stock,
+        estado=estado,
+        condicion=condicion,
+        estado_inventario=estado_inventario,
+        ubicacion=ubicacion,
+        proveedor=proveedor,
+        warehouse_id=warehouse_id,
+        fecha_ingreso_desde=fecha_ingreso_desde,
+        fecha_ingreso_hasta=fecha_ingreso_hasta,
     )
 
-    if warehouse_id is not None:
-        stmt = stmt.where(models.Device.warehouse_id == warehouse_id)
-
-    if search:
-        term = f"%{search.strip()}%"
-        stmt = stmt.where(or_(
-            models.Device.name.ilike(term),
-            models.Device.sku.ilike(term),
-            models.Device.imei.ilike(term),
-            models.Device.serial.ilike(term),
-            models.Device.marca.ilike(term),
-            models.Device.modelo.ilike(term)
-        ))
+    if cursor is not None:
+        stmt = _DEVICE_KEYSET.apply(stmt, cursor)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return list(db.scalars(stmt))
 
-    if categoria:
-        stmt = stmt.where(models.Device.categoria == categoria)
+    stmt = _order_store_devices(stmt, search_ids)
+    if limit is not None:
+        stmt = stmt.offset(offset).limit(limit)
 
-    if low_stock:
-        stmt = stmt.where(models.Device.quantity <=
-                          models.Device.minimum_stock)
+    return list(db.scalars(stmt))
 
-    if estado:
-        stmt = stmt.where(models.Device.estado_comercial == estado)
 
-    if condicion:
-        stmt = stmt.where(models.Device.condicion == condicion)
+def _relevance(search_ids: list[int]) -> ColumnElement[int]:
+    # Conserva el orden de relevancia del índice de búsqueda; las coincidencias
+    # más allá de `MAX_MATCHES` quedan al final.
+    ranking = {device_id: position for position, device_id in enumerate(search_ids)}
+    return case(ranking, value=models.Device.id, else_=len(ranking))
 
-    if estado_inventario:
-        stmt = stmt.where(models.Device.estado == estado_inventario)
 
-    if ubicacion:
-        stmt = stmt.where(models.Device.ubicacion.ilike(f"%{ubicacion}%"))
+def _order_store_devices(stmt: Select[Any], search_ids: list[int] | None) -> Select[Any]:
+    if search_ids:
+        return stmt.order_by(_relevance(search_ids), models.Device.name)
+    return stmt.order_by(models.Device.name)
 
-    if proveedor:
-        stmt = stmt.where(models.Device.proveedor.ilike(f"%{proveedor}%"))
 
-    if fecha_ingreso_desde:
-        stmt = stmt.where(models.Device.fecha_ingreso >= fecha_ingreso_desde)
+def iter_devices(
+    db: Session,
+    store_id: int,
+    *,
+    search: str | None = None,
+    categoria: str | None = None,
+    low_stock: bool = False,
+    estado: models.CommercialState | None = None,
+    condicion: str | None = None,
+    estado_inventario: str | None = None,
+    ubicacion: str | None = None,
+    proveedor: str | None = None,
+    warehouse_id: int | None = None,
+    fecha_ingreso_desde: date | None = None,
+    fecha_ingreso_hasta: date | None = None,
+    batch_size: int = QUERY_BATCH_SIZE,
+) -> Iterator[models.Device]:
+    """Mismo resultado que `list_devices(limit=None)`, leído por lotes.
 
-    if fecha_ingreso_hasta:
-        stmt = stmt.where(models.Device.fecha_ingreso <= fecha_ingreso_hasta)
+    Para exportaciones: recorre la consulta con ``yield_per`` en lugar de
+    cargar todos los dispositivos de la sucursal en memoria.
+    """
+
+    search_ids = _search_ids(db, store_id, search)
+    if search_ids == []:
+        return
+    stmt = _apply_store_device_filters(
+        db,
+        select(models.Device),
+        store_id,
+        search_clause=_search_clause(db, store_id, search),
+        categoria=categoria,
+        low_stock=low_stock,
+        estado=estado,
+        condicion=condicion,
+        estado_inventario=estado_inventario,
+        ubicacion=ubicacion,
+        proveedor=proveedor,
+        warehouse_id=warehouse_id,
+        fecha_ingreso_desde=fecha_ingreso_desde,
+        fecha_ingreso_hasta=fecha_ingreso_hasta,
+    )
+    yield from stream_scalars(
+        db, _order_store_devices(stmt, search_ids), batch_size=batch_size
+    )
+
+
+def count_store_devices(
+    db: Session,
+    store_id: int,
+    *,
+    search: str | None = None,
+    estado: models.CommercialState | None = None,
+    categoria: str | None = None,
+    condicion: str | None = None,
+    estado_inventario: str | None = None,
+    ubicacion: str | None = None,
+    proveedor: str | None = None,
+    warehouse_id: int | None = None,
+    fecha_ingreso_desde: date | None = None,
+    fecha_ingreso_hasta: date | None = None,
+    low_stock: bool = False,
+) -> int:
+    """Total de dispositivos de la sucursal con los mismos filtros que `list_devices`."""
+
+    get_store(db, store_id)
+    statement = _apply_store_device_filters(
+        db,
+        select(func.count()).select_from(models.Device),
+        store_id,
+        search_clause=_search_clause(db, store_id, search),
+        categoria=categoria,
+        low_stock=low_stock,
+        estado=estado,
+        condicion=condicion,
+        estado_inventario=estado_inventario,
+        ubicacion=ubicacion,
+        proveedor=proveedor,
+        warehouse_id=warehouse_id,
+        fecha_ingreso_desde=fecha_ingreso_desde,
+        fecha_ingreso_hasta=fecha_ingreso_hasta,
+    )
+    return int(db.scalar(statement) or 0)
+
+
+def _apply_device_search_filters(
+    db: Session,
+    statement: Select[Any],
+    filters: schemas.DeviceSearchFilters,
+    *,
+    search_clause: ColumnElement[bool] | None = None,
+) -> Select[Any]:
+    statement = statement.where(models.Device.is_deleted.is_(False))
+    if search_clause is not None:
+        statement = statement.where(search_clause)
+    if filters.imei:
+        statement = statement.where(models.Device.imei == filters.imei)
+    if filters.serial:
+        statement = statement.where(models.Device.serial == filters.serial)
+    if filters.capacidad_gb is not None:
+        statement = statement.where(
+            models.Device.capacidad_gb == filters.capacidad_gb)
+    if filters.estado_comercial is not None:
+        statement = statement.where(
+            models.Device.estado_comercial == filters.estado_comercial)
+    substring_filters = catalog_search_index.device_filter_clause(
+        db,
+        {
+            "color": filters.color,
+            "marca": filters.marca,
+            "modelo": filters.modelo,
+            "categoria": filters.categoria,
+            "condicion": filters.condicion,
+            "estado": filters.estado,
+            "ubicacion": filters.ubicacion,
+            "proveedor": filters.proveedor,
+        },
+    )
+    if substring_filters is not None:
+        statement = statement.where(substring_filters)
+    if filters.fecha_ingreso_desde or filters.fecha_ingreso_hasta:
+        start, end = normalize_date_range(
+            filters.fecha_ingreso_desde, filters.fecha_ingreso_hasta
+        )
+        statement = statement.where(
+            models.Device.fecha_ingreso >= start.date(),
+            models.Device.fecha_ingreso <= end.date(),
+        )
+    return statement
 
-    stmt = stmt.order_by(models.Device.name)
 
+def search_devices(
+    db: Session,
+    filters: schemas.DeviceSearchFilters,
+    *,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[models.Device]:
+    """Búsqueda avanzada del catálogo en todas las sucursales.
+
+    Excluye los dispositivos dados de baja (``is_deleted``), igual que
+    ``list_devices``: el índice de búsqueda sólo guarda los activos, de modo
+    que sin este filtro una búsqueda por IMEI o serie devolvería bajas que la
+    misma búsqueda por texto o por marca ya no encuentra.
+    """
+
+    statement: Select[tuple[models.Device]] = (
+        select(models.Device)
+        .options(
+            joinedload(models.Device.store),
+            joinedload(models.Device.identifier),
+        )
+        .join(models.Store)
+    )
+    search_ids = (
+        catalog_search_index.search_device_ids(db, filters.q) if filters.q else None
+    )
+    if search_ids == []:
+        return []
+    statement = _apply_device_search_filters(
+        db,
+        statement,
+        filters,
+        search_clause=(
+            catalog_search_index.device_search_clause(db, filters.q) if filters.q else None
+        ),
+    )
+    if search_ids:
+        statement = statement.order_by(_relevance(search_ids))
+    statement = statement.order_by(
+        models.Device.store_id.asc(), models.Device.sku.asc())
+    if offset:
+        statement = statement.offset(offset)
     if limit is not None:
-        stmt = stmt.offset(offset).limit(limit)
+        statement = statement.limit(limit)
+    return list(db.scalars(statement).unique())
 
-    return list(db.scalars(stmt))
+
+def count_devices_matching_filters(
+    db: Session, filters: schemas.DeviceSearchFilters
+) -> int:
+    statement: Select[tuple[int]] = select(func.count()).select_from(models.Device).join(
+        models.Store
+    )
+    statement = _apply_device_search_filters(
+        db,
+        statement,
+        filters,
+        search_clause=(
+            catalog_search_index.device_search_clause(db, filters.q) if filters.q else None
+        ),
+    )
+    return int(db.scalar(statement) or 0)
 
 
 def _ensure_unique_identifiers(
@@ -488,9 +766,14 @@ def _ensure_unique_identifier_payload(
 
 
 __all__ = [
+    "count_devices_matching_filters",
+    "count_store_devices",
     "create_device",
     "delete_device",
+    "encode_device_cursor",
     "get_device",
+    "iter_devices",
     "list_devices",
+    "search_devices",
     "update_device",
 ]
@@ -1,9 +1,11 @@
 """Operaciones CRUD para el módulo de Inventario (Movimientos, Reservas)."""
 from __future__ import annotations
 
+import base64
+import binascii
 import json
 from collections.abc import Iterable, Sequence
-from datetime import date, datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 
@@ -13,7 +15,12 @@ from sqlalchemy.orm import Session, joinedload
 from .. import models, schemas
 from ..core.roles import ADMIN, GERENTE
 from ..core.transactions import flush_session, transactional_session
-from ..services import inventory_accounting, inventory_audit
+from ..services import (
+    inventory_accounting,
+    inventory_audit,
+    inventory_availability,
+    inventory_movement_rollup,
+)
 from ..utils import audit_trail as audit_trail_utils
 from ..utils.cache import TTLCache
 from ..config import settings
@@ -29,14 +36,64 @@ from .warehouses import get_warehouse
 
 
 _INVENTORY_MOVEMENTS_CACHE: TTLCache[schemas.InventoryMovementsReport] = TTLCache(
-    ttl_seconds=60.0
+    ttl_seconds=60.0, name="inventory_movements_report", shared=True
 )
+# Rangos con más meses que este límite se etiquetan con el comodín de mes.
+_MOVEMENTS_CACHE_MAX_MONTH_TAGS = 24
+_ANY_BUCKET = "*"
+
+
+def _movements_cache_tag(store: int | str, month: str | None = None) -> str:
+    if month is None:
+        return f"inventory_movements:store={store}"
+    return f"inventory_movements:store={store}:month={month}"
+
+
+def _month_bucket(moment: date | datetime) -> str:
+    return f"{moment.year:04d}-{moment.month:02d}"
+
+
+def _movements_report_tags(
+    store_filter: set[int] | None, start_dt: datetime, end_dt: datetime
+) -> list[str]:
+    """Etiquetas sucursal × mes (y por sucursal) que cubren un reporte."""
+
+    stores: list[int | str] = sorted(store_filter) if store_filter else [_ANY_BUCKET]
+    month_count = (end_dt.year - start_dt.year) * 12 + end_dt.month - start_dt.month + 1
+    if month_count > _MOVEMENTS_CACHE_MAX_MONTH_TAGS:
+        months = [_ANY_BUCKET]
+    else:
+        months = []
+        year, month = start_dt.year, start_dt.month
+        for _ in range(month_count):
+            months.append(f"{year:04d}-{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    tags = [_movements_cache_tag(store, month) for store in stores for month in months]
+    tags.extend(_movements_cache_tag(store) for store in stores)
+    return tags
+
 
+def invalidate_inventory_movements_cache(
+    store_id: int | None = None,
+    moved_at: date | datetime | None = None,
+) -> None:
+    """Invalida los reportes de movimientos afectados por un movimiento.
 
-def invalidate_inventory_movements_cache() -> None:
-    """Limpia la caché de reportes de movimientos de inventario."""
+    Con ``store_id`` sólo se descartan los reportes cuyo alcance incluye esa
+    sucursal y, si se indica ``moved_at``, el mes del movimiento; sin sucursal
+    se limpia toda la caché.
+    """
 
-    _INVENTORY_MOVEMENTS_CACHE.clear()
+    if store_id is None:
+        _INVENTORY_MOVEMENTS_CACHE.clear()
+        return
+    stores: tuple[int | str, ...] = (store_id, _ANY_BUCKET)
+    if moved_at is None:
+        tags = [_movements_cache_tag(store) for store in stores]
+    else:
+        months = (_month_bucket(moved_at), _ANY_BUCKET)
+        tags = [_movements_cache_tag(store, month) for store in stores for month in months]
+    _INVENTORY_MOVEMENTS_CACHE.invalidate_tags(*tags)
 
 
 def _inventory_movements_report_cache_key(
@@ -46,7 +103,8 @@ def _inventory_movements_report_cache_key(
     movement_type: models.MovementType | None,
     limit: int | None,
     offset: int,
-) -> tuple[tuple[int, ...], str, str, str | None, int | None, int]:
+    cursor: str | None = None,
+) -> tuple[tuple[int, ...], str, str, str | None, int | None, int, str | None]:
     store_key = tuple(sorted(store_filter)) if store_filter else tuple()
     movement_key = movement_type.value if movement_type else None
     return (
@@ -56,6 +114,7 @@ def _inventory_movements_report_cache_key(
         movement_key,
         limit,
         offset,
+        cursor,
     )
 
 
@@ -449,6 +508,7 @@ def create_inventory_movement(
         )
         db.add(movement)
         db.flush()
+        inventory_movement_rollup.record_inventory_movement_rollup(db, movement)
 
         _record_inventory_movement_reference(
             db,
@@ -568,6 +628,10 @@ def create_inventory_movement(
                 "unit_cost": float(movement_unit_cost or Decimal("0")),
             },
         )
+        inventory_availability.invalidate_inventory_availability_cache(
+            store_id, sku=device.sku, device_id=device.id
+        )
+        invalidate_inventory_movements_cache(store_id, movement.created_at)
 
         return movement
 
@@ -823,6 +887,93 @@ def get_inventory_current_report(
     return schemas.InventoryCurrentReport(stores=report_stores, totals=totals)
 
 
+def _encode_movement_cursor(movement: models.InventoryMovement) -> str:
+    raw = f"{movement.created_at.isoformat()}|{movement.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_movement_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, movement_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(movement_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("invalid_movement_cursor") from exc
+
+
+def _whole_day_bounds(
+    start_dt: datetime, end_dt: datetime
+) -> tuple[date, date] | None:
+    """Días inclusivos del rango cuando está alineado a días completos UTC."""
+
+    for moment in (start_dt, end_dt):
+        if moment.utcoffset() not in (None, timedelta(0)):
+            return None
+    if start_dt.time() != time.min or end_dt.time() != time.max:
+        return None
+    return start_dt.date(), end_dt.date()
+
+
+def _movement_daily_totals(
+    db: Session,
+    filters: Sequence[Any],
+    *,
+    store_filter: set[int] | None,
+    start_dt: datetime,
+    end_dt: datetime,
+    movement_type: models.MovementType | None,
+) -> tuple[schemas.MovementPeriodSummary, ...]:
+    """Totales diarios por tipo para el resumen y los periodos del reporte.
+
+    Los rangos de días completos se leen del acumulado
+    ``inventory_movement_daily``; los rangos con hora se agregan sobre
+    ``inventory_movements`` con ``GROUP BY`` en la base de datos.
+    """
+
+    day_bounds = _whole_day_bounds(start_dt, end_dt)
+    if day_bounds is not None:
+        rows = inventory_movement_rollup.daily_movement_totals(
+            db,
+            store_ids=store_filter,
+            day_from=day_bounds[0],
+            day_to=day_bounds[1],
+            movement_type=movement_type,
+        )
+    else:
+        day = func.date(models.InventoryMovement.created_at).label("day")
+        rows = db.execute(
+            select(
+                day,
+                models.InventoryMovement.movement_type,
+                func.count(models.InventoryMovement.id),
+                func.sum(models.InventoryMovement.quantity),
+                func.sum(
+                    func.coalesce(models.InventoryMovement.unit_cost, 0)
+                    * models.InventoryMovement.quantity
+                ),
+            )
+            .where(*filters)
+            .group_by(day, models.InventoryMovement.movement_type)
+        )
+    summaries: list[schemas.MovementPeriodSummary] = []
+    for period, movement_enum, count, quantity, value in rows:
+        if isinstance(period, str):
+            period = date.fromisoformat(period)
+        elif isinstance(period, datetime):
+            period = period.date()
+        summaries.append(
+            schemas.MovementPeriodSummary(
+                periodo=period,
+                tipo_movimiento=movement_enum,
+                total_movimientos=int(count or 0),
+                total_cantidad=int(quantity or 0),
+                total_valor=_quantize_currency(to_decimal(value)),
+            )
+        )
+    summaries.sort(key=lambda entry: (entry.periodo, entry.tipo_movimiento.value))
+    return tuple(summaries)
+
+
 def get_inventory_movements_report(
     db: Session,
     *,
@@ -832,16 +983,38 @@ def get_inventory_movements_report(
     movement_type: models.MovementType | None = None,
     limit: int | None = None,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> schemas.InventoryMovementsReport:
+    """Reporte de movimientos con totales agregados y detalle paginado.
+
+    ``resumen`` y ``periodos`` se leen de ``inventory_movement_daily`` y cubren
+    todo el rango filtrado: ``limit``, ``offset`` y ``cursor`` sólo paginan
+    ``movimientos``. Hasta el 16/10/2026 los totales sumaban únicamente la
+    página devuelta.
+
+    El detalle se ordena por fecha e identificador descendentes; ``cursor``
+    (el ``siguiente_cursor`` de la página previa) continúa la paginación por
+    keyset sin recorrer las filas ya entregadas.
+    """
+
     store_filter = _normalize_store_ids(store_ids)
     start_dt, end_dt = _normalize_date_range(date_from, date_to)
 
     cache_key = _inventory_movements_report_cache_key(
-        store_filter, start_dt, end_dt, movement_type, limit, offset
+        store_filter, start_dt, end_dt, movement_type, limit, offset, cursor
     )
     cached_report = _INVENTORY_MOVEMENTS_CACHE.get(cache_key)
     if cached_report is not None:
-        return cached_report.model_copy(deep=True)
+        return cached_report
+
+    filters = [
+        models.InventoryMovement.created_at >= start_dt,
+        models.InventoryMovement.created_at <= end_dt,
+    ]
+    if store_filter:
+        filters.append(models.InventoryMovement.store_id.in_(store_filter))
+    if movement_type is not None:
+        filters.append(models.InventoryMovement.movement_type == movement_type)
 
     movement_stmt = (
         select(models.InventoryMovement)
@@ -851,24 +1024,23 @@ def get_inventory_movements_report(
             joinedload(models.InventoryMovement.device),
             joinedload(models.InventoryMovement.performed_by),
         )
-        .order_by(models.InventoryMovement.created_at.desc())
-    )
-
-    if store_filter:
-        movement_stmt = movement_stmt.where(
-            models.InventoryMovement.store_id.in_(store_filter)
+        .where(*filters)
+        .order_by(
+            models.InventoryMovement.created_at.desc(),
+            models.InventoryMovement.id.desc(),
         )
-    movement_stmt = movement_stmt.where(
-        models.InventoryMovement.created_at >= start_dt
     )
-    movement_stmt = movement_stmt.where(
-        models.InventoryMovement.created_at <= end_dt
-    )
-    if movement_type is not None:
+    if cursor:
+        cursor_created_at, cursor_id = _decode_movement_cursor(cursor)
         movement_stmt = movement_stmt.where(
-            models.InventoryMovement.movement_type == movement_type
+            or_(
+                models.InventoryMovement.created_at < cursor_created_at,
+                and_(
+                    models.InventoryMovement.created_at == cursor_created_at,
+                    models.InventoryMovement.id < cursor_id,
+                ),
+            )
         )
-
     if offset:
         movement_stmt = movement_stmt.offset(offset)
     if limit is not None:
@@ -890,78 +1062,64 @@ def get_inventory_movements_report(
         for key, log in audit_logs.items()
     }
 
-    totals_by_type: dict[models.MovementType, dict[str, Decimal | int]] = {}
-    period_map: dict[tuple[date, models.MovementType],
-                     dict[str, Decimal | int]] = {}
-    total_units = 0
-    total_value = Decimal("0")
-    report_entries: list[schemas.MovementReportEntry] = []
-
-    for movement in movements:
-        value = _movement_value(movement)
-        total_units += movement.quantity
-        total_value += value
-
-        type_data = totals_by_type.setdefault(
-            movement.movement_type,
-            {"quantity": 0, "value": Decimal("0")},
+    report_entries = tuple(
+        schemas.MovementReportEntry(
+            id=movement.id,
+            tipo_movimiento=movement.movement_type,
+            cantidad=movement.quantity,
+            valor_total=_movement_value(movement),
+            sucursal_destino_id=movement.store_id,
+            sucursal_destino=movement.tienda_destino,
+            sucursal_origen_id=movement.source_store_id,
+            sucursal_origen=movement.tienda_origen,
+            comentario=movement.comment,
+            usuario=movement.usuario,
+            referencia_tipo=getattr(movement, "reference_type", None),
+            referencia_id=getattr(movement, "reference_id", None),
+            fecha=movement.created_at,
+            ultima_accion=audit_trails.get(str(movement.id)),
         )
-        type_data["quantity"] = int(type_data["quantity"]) + movement.quantity
-        type_data["value"] = to_decimal(type_data["value"]) + value
+        for movement in movements
+    )
 
-        period_key = (movement.created_at.date(), movement.movement_type)
-        period_data = period_map.setdefault(
-            period_key,
-            {"quantity": 0, "value": Decimal("0")},
-        )
-        period_data["quantity"] = int(
-            period_data["quantity"]) + movement.quantity
-        period_data["value"] = to_decimal(period_data["value"]) + value
-
-        report_entries.append(
-            schemas.MovementReportEntry(
-                id=movement.id,
-                tipo_movimiento=movement.movement_type,
-                cantidad=movement.quantity,
-                valor_total=value,
-                sucursal_destino_id=movement.store_id,
-                sucursal_destino=movement.tienda_destino,
-                sucursal_origen_id=movement.source_store_id,
-                sucursal_origen=movement.tienda_origen,
-                comentario=movement.comment,
-                usuario=movement.usuario,
-                referencia_tipo=getattr(movement, "reference_type", None),
-                referencia_id=getattr(movement, "reference_id", None),
-                fecha=movement.created_at,
-                ultima_accion=audit_trails.get(str(movement.id)),
-            )
-        )
+    period_summaries = _movement_daily_totals(
+        db,
+        filters,
+        store_filter=store_filter,
+        start_dt=start_dt,
+        end_dt=end_dt,
+        movement_type=movement_type,
+    )
 
-    period_summaries = [
-        schemas.MovementPeriodSummary(
-            periodo=period,
-            tipo_movimiento=movement_type,
-            total_cantidad=int(data["quantity"]),
-            total_valor=to_decimal(data["value"]),
+    totals_by_type: dict[models.MovementType, dict[str, Decimal | int]] = {}
+    for period in period_summaries:
+        type_data = totals_by_type.setdefault(
+            period.tipo_movimiento,
+            {"count": 0, "quantity": 0, "value": Decimal("0")},
         )
-        for (period, movement_type), data in sorted(period_map.items())
-    ]
+        type_data["count"] = int(type_data["count"]) + period.total_movimientos
+        type_data["quantity"] = int(type_data["quantity"]) + period.total_cantidad
+        type_data["value"] = to_decimal(type_data["value"]) + period.total_valor
 
-    summary_by_type = [
+    summary_by_type = tuple(
         schemas.MovementTypeSummary(
             tipo_movimiento=movement_enum,
+            total_movimientos=int(totals_by_type.get(
+                movement_enum, {}).get("count", 0)),
             total_cantidad=int(totals_by_type.get(
                 movement_enum, {}).get("quantity", 0)),
             total_valor=to_decimal(totals_by_type.get(
                 movement_enum, {}).get("value", 0)),
         )
         for movement_enum in models.MovementType
-    ]
+    )
 
     resumen = schemas.InventoryMovementsSummary(
-        total_movimientos=len(movements),
-        total_unidades=total_units,
-        total_valor=total_value,
+        total_movimientos=sum(entry.total_movimientos for entry in summary_by_type),
+        total_unidades=sum(entry.total_cantidad for entry in summary_by_type),
+        total_valor=sum(
+            (entry.total_valor for entry in summary_by_type), Decimal("0")
+        ),
         por_tipo=summary_by_type,
     )
 
@@ -969,8 +1127,17 @@ def get_inventory_movements_report(
         resumen=resumen,
         periodos=period_summaries,
         movimientos=report_entries,
+        siguiente_cursor=(
+            _encode_movement_cursor(movements[-1])
+            if limit is not None and movements and len(movements) == limit
+            else None
+        ),
+    )
+    _INVENTORY_MOVEMENTS_CACHE.set(
+        cache_key,
+        report,
+        tags=_movements_report_tags(store_filter, start_dt, end_dt),
     )
-    _INVENTORY_MOVEMENTS_CACHE.set(cache_key, report.model_copy(deep=True))
     return report
 
 
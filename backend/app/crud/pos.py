@@ -9,14 +9,15 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Any, TYPE_CHECKING
+from typing import Any, Sequence, TYPE_CHECKING
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Session
 
 from backend.app import models, schemas
 from backend.app.core.transactions import flush_session, transactional_session
+from backend.app.services import pos_config_cache, pos_receipt_cache
 from backend.app.utils.decimal_helpers import to_decimal
 from backend.app.utils.json_helpers import normalize_hardware_settings
 
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     'resolve_device_for_pos',
+    'resolve_devices_for_pos',
     'get_cash_session',
     'get_open_cash_session',
     'get_last_cash_session_for_store',
@@ -85,6 +87,88 @@ def resolve_device_for_pos(
     raise LookupError("device_not_found")
 
 
+def resolve_devices_for_pos(
+    db: Session,
+    *,
+    store_id: int,
+    lookups: Sequence[tuple[int | None, str | None]],
+) -> list[models.Device]:
+    """Resuelve todas las líneas de un carrito con a lo sumo dos consultas.
+
+    Cada elemento de ``lookups`` es ``(device_id, imei)`` y se resuelve igual
+    que en :func:`resolve_device_for_pos`: el identificador tiene prioridad,
+    luego el IMEI del dispositivo y, por último, los IMEI registrados en
+    ``DeviceIdentifier``. Si alguna línea no se encuentra se lanza
+    ``LookupError("device_not_found")``.
+    """
+
+    device_ids: set[int] = set()
+    imeis: set[str] = set()
+    for device_id, imei in lookups:
+        if device_id:
+            device_ids.add(device_id)
+        elif imei and imei.strip():
+            imeis.add(imei.strip().lower())
+        else:
+            raise LookupError("device_not_found")
+
+    conditions = []
+    if device_ids:
+        conditions.append(
+            and_(
+                models.Device.id.in_(device_ids),
+                models.Device.is_deleted.is_(False),
+            )
+        )
+    if imeis:
+        conditions.append(func.lower(models.Device.imei).in_(imeis))
+    by_id: dict[int, models.Device] = {}
+    by_imei: dict[str, models.Device] = {}
+    if conditions:
+        statement = (
+            select(models.Device)
+            .where(models.Device.store_id == store_id, or_(*conditions))
+            .order_by(models.Device.id)
+        )
+        for device in db.scalars(statement):
+            if device.id in device_ids and not device.is_deleted:
+                by_id[device.id] = device
+            normalized = (device.imei or "").lower()
+            if normalized in imeis:
+                by_imei.setdefault(normalized, device)
+
+    pending = imeis.difference(by_imei)
+    if pending:
+        identifier_stmt = (
+            select(
+                models.Device,
+                func.lower(models.DeviceIdentifier.imei_1),
+                func.lower(models.DeviceIdentifier.imei_2),
+            )
+            .join(models.DeviceIdentifier)
+            .where(models.Device.store_id == store_id)
+            .where(
+                or_(
+                    func.lower(models.DeviceIdentifier.imei_1).in_(pending),
+                    func.lower(models.DeviceIdentifier.imei_2).in_(pending),
+                )
+            )
+            .order_by(models.Device.id)
+        )
+        for device, imei_1, imei_2 in db.execute(identifier_stmt):
+            for normalized in (imei_1, imei_2):
+                if normalized in pending:
+                    by_imei.setdefault(normalized, device)
+
+    resolved: list[models.Device] = []
+    for device_id, imei in lookups:
+        device = by_id.get(device_id) if device_id else by_imei.get(imei.strip().lower())
+        if device is None:
+            raise LookupError("device_not_found")
+        resolved.append(device)
+    return resolved
+
+
 def get_cash_session(db: Session, session_id: int) -> models.CashRegisterSession:
     statement = select(models.CashRegisterSession).where(
         models.CashRegisterSession.id == session_id)
@@ -327,11 +411,14 @@ def close_cash_session(
 
 
 def get_pos_config(db: Session, store_id: int) -> models.POSConfig:
-    store = get_store(db, store_id)
-    statement = select(models.POSConfig).where(
-        models.POSConfig.store_id == store_id)
+    statement = (
+        select(models.POSConfig)
+        .where(models.POSConfig.store_id == store_id)
+        .execution_options(populate_existing=True)
+    )
     config = db.scalars(statement).first()
     if config is None:
+        store = get_store(db, store_id)
         prefix = store.name[:3].upper() if store.name else "POS"
         generated_prefix = f"{prefix}-{store_id:03d}"[:12]
         config = models.POSConfig(
@@ -340,20 +427,13 @@ def get_pos_config(db: Session, store_id: int) -> models.POSConfig:
             db.add(config)
             flush_session(db)
             db.refresh(config)
-    else:
-        db.refresh(config)
-    normalized_hardware = normalize_hardware_settings(
-        config.hardware_settings if isinstance(
-            config.hardware_settings, dict) else None
-    )
-    if config.hardware_settings != normalized_hardware:
+    compiled = pos_config_cache.get_compiled(config)
+    if config.hardware_settings != compiled.hardware_settings:
         with transactional_session(db):
-            config.hardware_settings = normalized_hardware
+            config.hardware_settings = compiled.hardware_settings_copy()
             db.add(config)
             flush_session(db)
             db.refresh(config)
-    else:
-        config.hardware_settings = normalized_hardware
     return config
 
 
@@ -432,6 +512,8 @@ def update_pos_config(
             operation="UPSERT",
             payload=_pos_config_payload(config),
         )
+        pos_receipt_cache.invalidate_store(db, payload.store_id)
+    pos_config_cache.invalidate_store(payload.store_id)
     return config
 
 
@@ -455,9 +537,11 @@ def update_pos_promotions(
     from backend.app import crud_legacy
     
     # Delegate to crud_legacy for now - this function has complex promotion logic
-    return crud_legacy.update_pos_promotions(
+    response = crud_legacy.update_pos_promotions(
         db, payload, updated_by_id=updated_by_id, reason=reason
     )
+    pos_config_cache.invalidate_store(payload.store_id)
+    return response
 
 
 def save_pos_draft(
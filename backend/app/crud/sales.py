@@ -12,7 +12,9 @@ from sqlalchemy.orm import Session, joinedload
 
 from .. import models, schemas
 from ..core.transactions import flush_session, transactional_session
+from ..services import pos_receipt_cache
 from ..services.sales import consume_supplier_batch
+from ..utils.keyset import Keyset, SortKey
 from .audit import log_audit_event as _log_action
 from .common import to_decimal
 from .customers import (
@@ -541,6 +543,19 @@ def get_sale(db: Session, sale_id: int) -> models.Sale:
     return sale
 
 
+# Orden estable de los listados de ventas (más recientes primero).
+_SALE_KEYSET = Keyset(
+    SortKey(models.Sale.created_at, descending=True),
+    SortKey(models.Sale.id, descending=True),
+)
+
+
+def encode_sale_cursor(sale: models.Sale) -> str:
+    """Cursor de la página siguiente a partir de la última venta listada."""
+
+    return _SALE_KEYSET.encode(sale)
+
+
 def list_sales(
     db: Session,
     *,
@@ -551,18 +566,25 @@ def list_sales(
     end_date: date | datetime | None = None,
     status: str | None = None,
     search: str | None = None,
-    limit: int = 100,
+    limit: int | None = 100,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> list[models.Sale]:
-    statement = (
-        select(models.Sale)
-        .options(
-            joinedload(models.Sale.items).joinedload(models.SaleItem.device),
-            joinedload(models.Sale.customer),
-            joinedload(models.Sale.performed_by),
-        )
-        .order_by(desc(models.Sale.created_at))
+    """Ventas filtradas, de la más reciente a la más antigua.
+
+    Con ``cursor`` (cadena vacía para la primera página) se pagina por keyset
+    sobre ``(created_at, id)`` e ``offset`` se ignora.
+    """
+
+    statement = select(models.Sale).options(
+        joinedload(models.Sale.items).joinedload(models.SaleItem.device),
+        joinedload(models.Sale.customer),
+        joinedload(models.Sale.performed_by),
     )
+    if cursor is not None:
+        statement = _SALE_KEYSET.apply(statement, cursor)
+    else:
+        statement = statement.order_by(desc(models.Sale.created_at))
 
     if store_id is not None:
         statement = statement.where(models.Sale.store_id == store_id)
@@ -602,7 +624,9 @@ def list_sales(
             )
         )
 
-    statement = statement.limit(limit).offset(offset)
+    statement = statement.limit(limit)
+    if cursor is None:
+        statement = statement.offset(offset)
     return list(db.scalars(statement).unique())
 
 
@@ -704,6 +728,7 @@ def update_sale(
             performed_by_id=performed_by_id,
             details=f"Actualización de venta #{sale.id}",
         )
+        pos_receipt_cache.invalidate_sale(db, sale.id)
         flush_session(db)
         db.refresh(sale)
 
@@ -806,6 +831,7 @@ def cancel_sale(
             performed_by_id=performed_by_id,
             details=f"Venta #{sale.id} cancelada. Motivo: {reason or 'N/A'}",
         )
+        pos_receipt_cache.invalidate_sale(db, sale.id)
         flush_session(db)
         db.refresh(sale)
 
@@ -863,7 +889,7 @@ def search_sales_history(
         joinedload(models.Sale.items).joinedload(models.SaleItem.device),
         joinedload(models.Sale.customer),
         joinedload(models.Sale.performed_by),
-    ).order_by(desc(models.Sale.created_at))
+    ).order_by(*_SALE_KEYSET.order_by())
 
     if ticket:
         ticket_id = None
@@ -1145,6 +1171,7 @@ __all__ = [
     "build_sales_summary_report",
     "cancel_sale",
     "create_sale",
+    "encode_sale_cursor",
     "get_sale",
     "list_sales",
     "search_sales_history",
@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import case, func, select
+from sqlalchemy import and_, bindparam, case, func, insert, or_, select, update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from .. import models
-from ..core.transactions import transactional_session
+from ..core.transactions import flush_session, transactional_session
+from ..models.sync import resolve_outbox_store_id
+from ..utils.keyset import Keyset, SortKey
 from ..utils.sync_helpers import priority_weight
 
 _OUTBOX_PRIORITY_MAP: dict[str, models.SyncOutboxPriority] = {
@@ -34,6 +40,36 @@ _OUTBOX_PRIORITY_ORDER: dict[models.SyncOutboxPriority, int] = {
 }
 
 
+_OUTBOX_BUFFER_KEY = "sync_outbox_buffer"
+_BULK_LOOKUP_CHUNK = 500
+_OUTBOX_UPDATABLE: tuple[str, ...] = (
+    "operation",
+    "payload",
+    "store_id",
+    "status",
+    "priority",
+    "attempts",
+    "last_error",
+    "conflict_flag",
+    "version",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SyncOutboxItem:
+    """Entidad a encolar mediante ``enqueue_sync_outbox_bulk``."""
+
+    entity_type: str
+    entity_id: str
+    operation: str
+    payload: dict[str, object]
+    store_id: int | None = None
+    priority: models.SyncOutboxPriority | None = None
+    # Replica el evento en ``sync_queue`` como lo hace la ruta heredada.
+    mirror_queue: bool = False
+
+
 def _resolve_outbox_priority(entity_type: str, priority: models.SyncOutboxPriority | None) -> models.SyncOutboxPriority:
     if priority is not None:
         return priority
@@ -50,7 +86,19 @@ def enqueue_sync_outbox(
     payload: dict[str, object],
     store_id: int | None = None,
     priority: models.SyncOutboxPriority | None = None,
-) -> models.SyncOutbox:
+) -> models.SyncOutbox | None:
+    if buffer_sync_outbox_item(
+        db,
+        SyncOutboxItem(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            operation=operation,
+            payload=payload,
+            store_id=store_id,
+            priority=priority,
+        ),
+    ):
+        return None
     with transactional_session(db):
         normalized_payload = json.loads(
             json.dumps(payload or {}, ensure_ascii=False, default=str)
@@ -83,10 +131,14 @@ def enqueue_sync_outbox(
                 conflict_flag=conflict_flag,
                 version=1,
             )
+            if store_id is not None:
+                entry.store_id = int(store_id)
             db.add(entry)
         else:
             entry.operation = operation
             entry.payload = normalized_payload
+            if store_id is not None:
+                entry.store_id = int(store_id)
             entry.status = models.SyncOutboxStatus.PENDING
             entry.attempt_count = 0
             entry.error_message = None
@@ -111,6 +163,368 @@ def enqueue_sync_outbox(
         return entry
 
 
+def buffer_sync_outbox_item(db: Session, item: SyncOutboxItem) -> bool:
+    """Acumula ``item`` si hay un ``coalesce_sync_outbox`` activo en la sesión."""
+
+    buffer = db.info.get(_OUTBOX_BUFFER_KEY)
+    if buffer is None:
+        return False
+    buffer.append(item)
+    return True
+
+
+@contextmanager
+def coalesce_sync_outbox(db: Session) -> Iterator[list[SyncOutboxItem]]:
+    """Agrupa los encolados de la sesión y los escribe en lote al salir.
+
+    Debe abrirse dentro de la transacción de la operación masiva: si el
+    bloque falla, los eventos acumulados se descartan junto con ella.
+    """
+
+    if _OUTBOX_BUFFER_KEY in db.info:
+        yield db.info[_OUTBOX_BUFFER_KEY]
+        return
+    buffer: list[SyncOutboxItem] = []
+    db.info[_OUTBOX_BUFFER_KEY] = buffer
+    try:
+        yield buffer
+    finally:
+        db.info.pop(_OUTBOX_BUFFER_KEY, None)
+    enqueue_sync_outbox_bulk(db, buffer)
+
+
+def _normalize_outbox_payload(payload: dict[str, object] | None) -> tuple[str, dict[str, object]]:
+    raw = json.dumps(payload or {}, ensure_ascii=False, default=str)
+    return raw, json.loads(raw)
+
+
+def _existing_outbox_rows(
+    db: Session, keys: Sequence[tuple[str, str]]
+) -> dict[tuple[str, str], dict[str, object]]:
+    outbox = models.SyncOutbox.__table__
+    existing: dict[tuple[str, str], dict[str, object]] = {}
+    wanted = set(keys)
+    for start in range(0, len(keys), _BULK_LOOKUP_CHUNK):
+        chunk = keys[start:start + _BULK_LOOKUP_CHUNK]
+        statement = select(
+            outbox.c.id,
+            outbox.c.entity_type,
+            outbox.c.entity_id,
+            outbox.c.operation,
+            outbox.c.payload,
+            outbox.c.status,
+            outbox.c.conflict_flag,
+            outbox.c.version,
+        ).where(
+            outbox.c.entity_type.in_({entity_type for entity_type, _ in chunk}),
+            outbox.c.entity_id.in_({entity_id for _, entity_id in chunk}),
+        )
+        for row in db.execute(statement).mappings():
+            key = (row["entity_type"], row["entity_id"])
+            if key in wanted:
+                existing[key] = dict(row)
+    return existing
+
+
+def enqueue_sync_outbox_bulk(
+    db: Session, items: Iterable[SyncOutboxItem]
+) -> int:
+    """Encola muchas entidades con una consulta de lectura y un upsert en lote.
+
+    Reproduce la semántica de ``enqueue_sync_outbox`` aplicada en orden:
+    entradas repetidas de la misma entidad se combinan (gana la última) y el
+    conflicto se evalúa contra el estado previo en la base o en el lote.
+    Devuelve el número de entidades escritas.
+    """
+
+    items = list(items)
+    if not items:
+        return 0
+
+    keys = list(dict.fromkeys((item.entity_type, item.entity_id) for item in items))
+    now = datetime.now(timezone.utc)
+    pending = models.SyncOutboxStatus.PENDING
+    with transactional_session(db):
+        existing = _existing_outbox_rows(db, keys)
+        states: dict[tuple[str, str], dict[str, object]] = {}
+        conflict_logs: list[models.SystemLog] = []
+        mirrored: list[SyncOutboxItem] = []
+        for item in items:
+            key = (item.entity_type, item.entity_id)
+            raw_payload, normalized = _normalize_outbox_payload(item.payload)
+            state = states.get(key)
+            if state is None:
+                row = existing.get(key)
+                state = {
+                    "id": row["id"] if row else None,
+                    "operation": row["operation"] if row else None,
+                    "payload": row["payload"] if row else None,
+                    "status": row["status"] if row else None,
+                    "conflict_flag": bool(row["conflict_flag"]) if row else False,
+                    "version": int(row["version"] or 1) if row else 1,
+                    "store_id": None,
+                }
+                states[key] = state
+            conflict = False
+            if state["status"] == pending:
+                previous = state["payload"]
+                if isinstance(previous, str):
+                    try:
+                        previous = json.loads(previous)
+                    except json.JSONDecodeError:
+                        previous = {}
+                if not isinstance(previous, dict):
+                    previous = {}
+                conflict = item.operation != state["operation"] or any(
+                    previous.get(field) != value for field, value in normalized.items()
+                )
+            exists = state["status"] is not None
+            if conflict:
+                state["conflict_flag"] = True
+                if exists:
+                    state["version"] += 1
+                conflict_logs.append(
+                    models.SystemLog(
+                        usuario=None,
+                        modulo="inventario",
+                        accion="sync_conflict_potential",
+                        descripcion=f"Conflicto detectado en {item.entity_type}:{item.entity_id}",
+                        fecha=now,
+                        nivel=models.SystemLogLevel.WARNING,
+                        audit_log=None,
+                    )
+                )
+            state["operation"] = item.operation
+            state["payload"] = raw_payload
+            state["status"] = pending
+            state["priority"] = _resolve_outbox_priority(item.entity_type, item.priority)
+            routed_store = item.store_id
+            if routed_store is None:
+                routed_store = resolve_outbox_store_id(normalized)
+            state["store_id"] = routed_store
+            if item.mirror_queue:
+                mirrored.append(item)
+
+        rows = [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "operation": state["operation"],
+                "payload": state["payload"],
+                "store_id": state["store_id"],
+                "status": pending,
+                "priority": state["priority"],
+                "attempts": 0,
+                "last_error": None,
+                "conflict_flag": state["conflict_flag"],
+                "version": state["version"],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (entity_type, entity_id), state in states.items()
+        ]
+        _upsert_outbox_rows(db, rows, [state["id"] for state in states.values()])
+        if conflict_logs:
+            db.add_all(conflict_logs)
+        flush_session(db)
+
+        for instance in list(db.identity_map.values()):
+            if isinstance(instance, models.SyncOutbox) and (
+                (instance.entity_type, instance.entity_id) in states
+            ):
+                db.expire(instance)
+
+    if mirrored:
+        # Late import to avoid circular dependency
+        from .. import crud_legacy
+
+        crud_legacy.mirror_sync_queue_events(db, mirrored)
+    return len(rows)
+
+
+def _upsert_outbox_rows(
+    db: Session, rows: list[dict[str, object]], row_ids: list[int | None]
+) -> None:
+    outbox = models.SyncOutbox.__table__
+    if db.get_bind().dialect.name == "postgresql":
+        statement = postgresql.insert(outbox)
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[outbox.c.entity_type, outbox.c.entity_id],
+                set_={name: statement.excluded[name] for name in _OUTBOX_UPDATABLE},
+            ),
+            rows,
+        )
+        return
+
+    new_rows = [row for row, row_id in zip(rows, row_ids) if row_id is None]
+    updated_rows = [
+        {"row_id": row_id, **{f"new_{name}": row[name] for name in _OUTBOX_UPDATABLE}}
+        for row, row_id in zip(rows, row_ids)
+        if row_id is not None
+    ]
+    if new_rows:
+        db.execute(insert(outbox), new_rows)
+    if updated_rows:
+        db.execute(
+            update(outbox)
+            .where(outbox.c.id == bindparam("row_id"))
+            .values({name: bindparam(f"new_{name}") for name in _OUTBOX_UPDATABLE}),
+            updated_rows,
+        )
+
+
+def list_sync_outbox_page(
+    db: Session,
+    *,
+    statuses: Sequence[models.SyncOutboxStatus],
+    store_id: int | None = None,
+    after_id: int = 0,
+    limit: int = 500,
+) -> list[models.SyncOutbox]:
+    """Obtiene una página de la cola híbrida paginando por ``id`` (keyset).
+
+    Con ``store_id`` se devuelven los eventos de esa sucursal y los globales
+    (sin sucursal), apoyándose en el índice ``(status, store_id, id)``.
+    """
+
+    statement = (
+        select(models.SyncOutbox)
+        .where(
+            models.SyncOutbox.status.in_(tuple(statuses)),
+            models.SyncOutbox.id > after_id,
+        )
+        .order_by(models.SyncOutbox.id)
+        .limit(limit)
+    )
+    if store_id is not None:
+        statement = statement.where(
+            or_(
+                models.SyncOutbox.store_id == store_id,
+                models.SyncOutbox.store_id.is_(None),
+            )
+        )
+    return list(db.scalars(statement))
+
+
+# Orden del tablero de la cola híbrida: prioridad, conflictos primero y los
+# cambios más recientes antes; el ``id`` desempata para el modo cursor.
+_OUTBOX_KEYSET = Keyset(
+    SortKey(
+        case(_OUTBOX_PRIORITY_ORDER, value=models.SyncOutbox.priority, else_=2),
+        value=lambda entry: _OUTBOX_PRIORITY_ORDER.get(entry.priority, 2),
+    ),
+    SortKey(
+        case((models.SyncOutbox.conflict_flag.is_(True), 0), else_=1),
+        value=lambda entry: 0 if entry.conflict_flag else 1,
+    ),
+    SortKey(models.SyncOutbox.updated_at, descending=True),
+    SortKey(models.SyncOutbox.id, descending=True),
+)
+
+
+def encode_sync_outbox_cursor(entry: models.SyncOutbox) -> str:
+    """Cursor de la página siguiente a partir del último evento listado."""
+
+    return _OUTBOX_KEYSET.encode(entry)
+
+
+def list_sync_outbox_by_cursor(
+    db: Session,
+    *,
+    statuses: Iterable[models.SyncOutboxStatus] | None = None,
+    cursor: str = "",
+    limit: int = 50,
+) -> list[models.SyncOutbox]:
+    """Página del tablero de la cola híbrida paginada por cursor.
+
+    Mantiene el orden de ``list_sync_outbox`` y continúa después del evento
+    codificado en ``cursor`` (cadena vacía para la primera página).
+    """
+
+    statement = _OUTBOX_KEYSET.apply(select(models.SyncOutbox), cursor).limit(limit)
+    status_tuple = tuple(statuses or ())
+    if status_tuple:
+        statement = statement.where(models.SyncOutbox.status.in_(status_tuple))
+    return list(db.scalars(statement))
+
+
+def fetch_due_sync_queue_entries(
+    db: Session,
+    *,
+    limit: int,
+    max_attempts: int,
+    retry_delays: Sequence[int],
+    now: datetime | None = None,
+) -> list[models.SyncQueue]:
+    """Entradas de `sync_queue` que ya pueden enviarse, las más antiguas primero.
+
+    ``retry_delays[n - 1]`` es la espera en segundos tras ``n`` intentos; el
+    último valor se aplica a los intentos posteriores. Las entradas agotadas
+    o que aún esperan su reintento se descartan en la consulta, de modo que
+    no ocupan el lugar de las pendientes más recientes.
+    """
+
+    queue = models.SyncQueue
+    now = now or datetime.now(timezone.utc)
+    reference = func.coalesce(queue.updated_at, queue.created_at)
+    due = [and_(queue.status == models.SyncQueueStatus.PENDING, queue.attempts == 0)]
+    last = len(retry_delays)
+    for attempts, delay in enumerate(retry_delays, start=1):
+        bounds = []
+        if attempts > 1:
+            bounds.append(queue.attempts >= attempts)
+        if attempts < last:
+            bounds.append(queue.attempts <= attempts)
+        due.append(and_(*bounds, reference <= now - timedelta(seconds=delay)))
+    statement = (
+        select(queue)
+        .where(
+            queue.status.in_(
+                (models.SyncQueueStatus.PENDING, models.SyncQueueStatus.FAILED)
+            ),
+            or_(
+                queue.status != models.SyncQueueStatus.FAILED,
+                queue.attempts < max_attempts,
+            ),
+            or_(*due),
+        )
+        .order_by(queue.updated_at.asc(), queue.id.asc())
+        .limit(limit)
+    )
+    return list(db.scalars(statement))
+
+
+def record_sync_dispatch_results(
+    db: Session,
+    results: Sequence[
+        tuple[models.SyncQueue, models.SyncQueueStatus, bool, str | None]
+    ],
+) -> None:
+    """Actualiza entradas de `sync_queue` y registra sus intentos en un solo flush."""
+
+    if not results:
+        return
+    now = datetime.now(timezone.utc)
+    with transactional_session(db):
+        attempts: list[models.SyncAttempt] = []
+        for entry, status, success, error_message in results:
+            entry.attempts += 1
+            entry.status = status
+            entry.last_error = error_message
+            entry.updated_at = now
+            attempts.append(
+                models.SyncAttempt(
+                    queue_id=entry.id,
+                    success=success,
+                    error_message=error_message,
+                    attempted_at=now,
+                )
+            )
+        db.add_all(attempts)
+        flush_session(db)
+
+
 def get_sync_outbox_statistics(
     db: Session, *, limit: int | None = None, offset: int = 0
 ) -> list[dict[str, object]]:
@@ -212,6 +626,15 @@ def get_sync_outbox_statistics(
 
 
 __all__ = [
+    "SyncOutboxItem",
+    "buffer_sync_outbox_item",
+    "coalesce_sync_outbox",
+    "encode_sync_outbox_cursor",
     "enqueue_sync_outbox",
+    "enqueue_sync_outbox_bulk",
     "get_sync_outbox_statistics",
+    "list_sync_outbox_by_cursor",
+    "list_sync_outbox_page",
+    "fetch_due_sync_queue_entries",
+    "record_sync_dispatch_results",
 ]
@@ -7,7 +7,7 @@ from collections.abc import Iterable, Sequence
 from datetime import datetime, timedelta, timezone
 from typing import Literal, cast
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import bindparam, func, or_, select, update
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.orm import Session, joinedload
 
@@ -15,13 +15,19 @@ from backend.app import models, schemas
 from backend.app.config import settings
 from backend.app.core.roles import ADMIN, GERENTE, INVITADO, OPERADOR
 from backend.app.core.constants import ROLE_MODULE_PERMISSION_MATRIX
+from backend.app.core.principal_cache import principal_cache, session_activity
 from backend.app.core.transactions import flush_session, transactional_session
 from backend.app import security_tokens as token_protection
 from backend.app.utils import audit as audit_utils
 from backend.app.utils import audit_trail as audit_trail_utils
 from backend.app.utils.sql_helpers import token_filter
 
-from .audit import log_audit_event as log_action, get_last_audit_entries, get_persistent_audit_alerts
+from .audit import (
+    get_last_audit_entries,
+    get_persistent_audit_alerts,
+    invalidate_audit_username_cache,
+    log_audit_event as log_action,
+)
 from .stores import get_store
 
 
@@ -235,6 +241,7 @@ def create_user(
             flush_session(db)
         except IntegrityError as exc:
             raise ValueError("user_already_exists") from exc
+        invalidate_audit_username_cache(user.id)
 
         assignments = _build_role_assignments(db, normalized_roles)
         user.roles.extend(assignments)
@@ -381,6 +388,7 @@ def soft_delete_user(
         )
         flush_session(db)
         db.refresh(user)
+    principal_cache.invalidate_user(user.id)
     return user
 
 
@@ -419,6 +427,7 @@ def set_user_roles(
 
         flush_session(db)
         db.refresh(user)
+    principal_cache.invalidate_user(user.id)
     return user
 
 
@@ -453,6 +462,7 @@ def set_user_status(
 
         flush_session(db)
         db.refresh(user)
+    principal_cache.invalidate_user(user.id)
     return user
 
 
@@ -550,6 +560,7 @@ def update_user(
 
         flush_session(db)
         db.refresh(user)
+    principal_cache.invalidate_user(user.id)
     return user
 
 
@@ -659,6 +670,7 @@ def update_role_permissions(
 
         flush_session(db)
 
+    principal_cache.clear()
     return list_role_permissions(db, role_name=role.name)[0]
 
 
@@ -1226,6 +1238,7 @@ def reset_user_password(
             performed_by_id=performed_by_id,
         )
     db.refresh(user)
+    principal_cache.invalidate_user(user.id)
     return user
 
 
@@ -1255,6 +1268,7 @@ def update_active_session_token(
         session.session_token = protected_token
         flush_session(db)
     db.refresh(session)
+    principal_cache.invalidate_session(session.id)
     return session
 
 
@@ -1283,14 +1297,59 @@ def mark_session_used(db: Session, session_token: str) -> models.ActiveSession |
                 session.revoke_reason = session.revoke_reason or "expired"
                 flush_session(db)
             db.refresh(session)
+            principal_cache.invalidate_session(session.id)
         return None
     with transactional_session(db):
         session.last_used_at = datetime.now(timezone.utc)
         flush_session(db)
     db.refresh(session)
+    session_activity.discard(session.id)
     return session
 
 
+def record_session_activity(
+    db: Session,
+    session_id: int,
+    *,
+    used_at: datetime | None = None,
+) -> int:
+    """Registra el uso de una sesión en el búfer diferido de actividad.
+
+    La marca ``last_used_at`` se persiste en lote cuando el búfer alcanza el
+    tamaño o la antigüedad configurados; devuelve cuántas sesiones se
+    escribieron en esta llamada.
+    """
+
+    session_activity.record(session_id, used_at or datetime.now(timezone.utc))
+    if not session_activity.is_due():
+        return 0
+    return flush_session_activity(db)
+
+
+def flush_session_activity(db: Session) -> int:
+    """Escribe en una sola sentencia las marcas ``last_used_at`` acumuladas."""
+
+    pending = session_activity.drain()
+    if not pending:
+        return 0
+    try:
+        with transactional_session(db):
+            sessions_table = models.ActiveSession.__table__
+            db.execute(
+                update(sessions_table)
+                .where(sessions_table.c.id == bindparam("b_session_id"))
+                .values(last_used_at=bindparam("b_last_used_at")),
+                [
+                    {"b_session_id": session_id, "b_last_used_at": used_at}
+                    for session_id, used_at in pending.items()
+                ],
+            )
+    except Exception:
+        session_activity.restore(pending)
+        raise
+    return len(pending)
+
+
 def add_jwt_to_blacklist(
     db: Session,
     *,
@@ -1311,6 +1370,7 @@ def add_jwt_to_blacklist(
         db.add(record)
         flush_session(db)
     db.refresh(record)
+    principal_cache.invalidate_token(jti)
     return record
 
 
@@ -1348,6 +1408,8 @@ def revoke_session(
         session.revoke_reason = reason
         flush_session(db)
     db.refresh(session)
+    principal_cache.invalidate_session(session.id)
+    session_activity.discard(session.id)
     return session
 
 
@@ -1457,6 +1519,7 @@ def update_role_permissions(
 
         flush_session(db)
 
+    principal_cache.clear()
     return list_role_permissions(db, role_name=role.name)[0]
 
 
@@ -1746,6 +1809,7 @@ __all__ = [
     "deactivate_totp_secret",
     "ensure_role",
     "ensure_role_permissions",
+    "flush_session_activity",
     "get_active_session_by_token",
     "get_password_reset_token",
     "get_role",
@@ -1763,6 +1827,7 @@ __all__ = [
     "mark_password_reset_token_used",
     "mark_session_used",
     "provision_totp_secret",
+    "record_session_activity",
     "register_failed_login",
     "register_successful_login",
     "reset_user_password",
@@ -40,10 +40,14 @@ from .core.constants import (
 from .core.transactions import flush_session, transactional_session
 # // [PACK30-31-BACKEND]
 from .services import (
+    catalog_search_index,
     credit,
+    customer_search_index,
     inventory_accounting,
     inventory_audit,
     inventory_availability,
+    inventory_movement_rollup,
+    pos_receipt_cache,
     purchase_documents,
     promotions,
 )
@@ -55,6 +59,8 @@ from .crud.customers import _validate_customer_credit, _ensure_debt_respects_lim
 from .crud.devices import _ensure_unique_identifier_payload
 from .crud.inventory import _hydrate_movement_references
 from .crud.loyalty import apply_loyalty_for_sale
+from .crud import inventory as _inventory_crud
+from .crud.sync import SyncOutboxItem, buffer_sync_outbox_item
 from .crud.purchases import _register_purchase_status_event
 from backend.app.crud.users import (
     get_user,
@@ -74,7 +80,6 @@ from .core.settings import inventory_alert_settings, return_policy_settings
 from . import security_tokens as token_protection
 from .utils import audit as audit_utils
 from .utils import audit_trail as audit_trail_utils
-from .utils.cache import TTLCache
 from .utils.decimal_helpers import (
     to_decimal,
     quantize_currency,
@@ -182,13 +187,9 @@ logger = core_logger.bind(component=__name__)
 # ============================================================================
 # ============================================================================
 
-_INVENTORY_MOVEMENTS_CACHE: TTLCache[schemas.InventoryMovementsReport] = TTLCache(
-    ttl_seconds=60.0
-)
-
-_PERSISTENT_ALERTS_CACHE: TTLCache[list[dict[str, object]]] = TTLCache(
-    ttl_seconds=300.0
-)
+# Instancias compartidas con los módulos especializados: una sola cache por
+# reporte para que las invalidaciones de ambas rutas surtan efecto.
+_INVENTORY_MOVEMENTS_CACHE = _inventory_crud._INVENTORY_MOVEMENTS_CACHE
 
 
 def persistent_alerts_cache_key(
@@ -917,6 +918,7 @@ def create_customer(
                 raise ValueError("customer_tax_id_duplicate") from exc
             raise ValueError("customer_already_exists") from exc
         db.refresh(customer)
+        customer_search_index.sync_customer_search_index(db, customer)
 
         _log_action(
             db,
@@ -1063,6 +1065,7 @@ def update_customer(
                 raise ValueError("customer_tax_id_duplicate") from exc
             raise
         db.refresh(customer)
+        customer_search_index.sync_customer_search_index(db, customer)
 
         if ledger_entry is not None:
             _sync_customer_ledger_entry(db, ledger_entry)
@@ -1109,6 +1112,7 @@ def delete_customer(
         not has_dependencies or is_superadmin)
     with transactional_session(db):
         if should_hard_delete:
+            customer_search_index.remove_customer_search_document(db, customer_id)
             db.delete(customer)
             flush_session(db)
             _log_action(
@@ -1132,6 +1136,7 @@ def delete_customer(
         customer.is_deleted = True
         customer.deleted_at = datetime.now(timezone.utc)
         flush_session(db)
+        customer_search_index.remove_customer_search_document(db, customer_id)
         _log_action(
             db,
             action="customer_archived",
@@ -1958,6 +1963,7 @@ def create_customer_privacy_request(
         db.add(request)
         flush_session(db)
         db.refresh(customer)
+        customer_search_index.sync_customer_search_index(db, customer)
         db.refresh(request)
 
         enqueue_sync_outbox(
@@ -3163,6 +3169,7 @@ def create_device(
         except IntegrityError as exc:
             raise ValueError("device_already_exists") from exc
         db.refresh(device)
+        catalog_search_index.sync_device_search_document(db, device)
 
         _log_action(
             db,
@@ -4174,6 +4181,7 @@ def update_device(
             recalculate_sale_price(device)
         flush_session(db)
         db.refresh(device)
+        catalog_search_index.sync_device_search_document(db, device)
 
         fields_changed = list(updated_fields.keys())
         if manual_price is not None:
@@ -5208,6 +5216,7 @@ def create_inventory_movement(
         flush_session(db)
         db.refresh(device)
         db.refresh(movement)
+        inventory_movement_rollup.record_inventory_movement_rollup(db, movement)
         reference_segments: list[str] = []
         if reference_type:
             reference_segments.append(reference_type)
@@ -5357,8 +5366,12 @@ def create_inventory_movement(
                 "ultima_accion",
                 audit_trail_utils.to_audit_trail(latest_log),
             )
-    inventory_availability.invalidate_inventory_availability_cache()
-    invalidate_inventory_movements_cache()
+    inventory_availability.invalidate_inventory_availability_cache(
+        movement.store_id,
+        sku=movement.device.sku if movement.device is not None else None,
+        device_id=movement.device_id,
+    )
+    invalidate_inventory_movements_cache(movement.store_id, movement.created_at)
     return movement
 
 
@@ -5947,145 +5960,17 @@ def get_inventory_movements_report(
     limit: int | None = None,
     offset: int = 0,
 ) -> schemas.InventoryMovementsReport:
-    store_filter = normalize_store_ids(store_ids)
-    start_dt, end_dt = normalize_date_range(date_from, date_to)
-
-    cache_key = inventory_movements_report_cache_key(
-        store_filter, start_dt, end_dt, movement_type, limit, offset
-    )
-    cached_report = _INVENTORY_MOVEMENTS_CACHE.get(cache_key)
-    if cached_report is not None:
-        return cached_report.model_copy(deep=True)
-
-    movement_stmt = (
-        select(models.InventoryMovement)
-        .options(
-            joinedload(models.InventoryMovement.store),
-            joinedload(models.InventoryMovement.source_store),
-            joinedload(models.InventoryMovement.device),
-            joinedload(models.InventoryMovement.performed_by),
-        )
-        .order_by(models.InventoryMovement.created_at.desc())
-    )
-
-    if store_filter:
-        movement_stmt = movement_stmt.where(
-            models.InventoryMovement.store_id.in_(store_filter)
-        )
-    movement_stmt = movement_stmt.where(
-        models.InventoryMovement.created_at >= start_dt
-    )
-    movement_stmt = movement_stmt.where(
-        models.InventoryMovement.created_at <= end_dt
-    )
-    if movement_type is not None:
-        movement_stmt = movement_stmt.where(
-            models.InventoryMovement.movement_type == movement_type
-        )
+    """Delegado al reporte agregado y cacheado por sucursal de ``crud.inventory``."""
 
-    if offset:
-        movement_stmt = movement_stmt.offset(offset)
-    if limit is not None:
-        movement_stmt = movement_stmt.limit(limit)
-
-    movements = list(db.scalars(movement_stmt).unique())
-
-    _hydrate_movement_references(db, movements)
-
-    movement_ids = [
-        movement.id for movement in movements if movement.id is not None]
-    audit_logs = get_last_audit_entries(
+    return _inventory_crud.get_inventory_movements_report(
         db,
-        entity_type="inventory_movement",
-        entity_ids=movement_ids,
-    )
-    audit_trails = {
-        key: audit_trail_utils.to_audit_trail(log)
-        for key, log in audit_logs.items()
-    }
-
-    totals_by_type: dict[models.MovementType, dict[str, Decimal | int]] = {}
-    period_map: dict[tuple[date, models.MovementType],
-                     dict[str, Decimal | int]] = {}
-    total_units = 0
-    total_value = Decimal("0")
-    report_entries: list[schemas.MovementReportEntry] = []
-
-    for movement in movements:
-        value = movement_value(movement)
-        total_units += movement.quantity
-        total_value += value
-
-        type_data = totals_by_type.setdefault(
-            movement.movement_type,
-            {"quantity": 0, "value": Decimal("0")},
-        )
-        type_data["quantity"] = int(type_data["quantity"]) + movement.quantity
-        type_data["value"] = to_decimal(type_data["value"]) + value
-
-        period_key = (movement.created_at.date(), movement.movement_type)
-        period_data = period_map.setdefault(
-            period_key,
-            {"quantity": 0, "value": Decimal("0")},
-        )
-        period_data["quantity"] = int(
-            period_data["quantity"]) + movement.quantity
-        period_data["value"] = to_decimal(period_data["value"]) + value
-
-        report_entries.append(
-            schemas.MovementReportEntry(
-                id=movement.id,
-                tipo_movimiento=movement.movement_type,
-                cantidad=movement.quantity,
-                valor_total=value,
-                sucursal_destino_id=movement.store_id,
-                sucursal_destino=movement.tienda_destino,
-                sucursal_origen_id=movement.source_store_id,
-                sucursal_origen=movement.tienda_origen,
-                comentario=movement.comment,
-                usuario=movement.usuario,
-                referencia_tipo=getattr(movement, "reference_type", None),
-                referencia_id=getattr(movement, "reference_id", None),
-                fecha=movement.created_at,
-                ultima_accion=audit_trails.get(str(movement.id)),
-            )
-        )
-
-    period_summaries = [
-        schemas.MovementPeriodSummary(
-            periodo=str(period),
-            total_movimientos=1,
-            total_unidades=int(data["quantity"]),
-            total_valor=to_decimal(data["value"]),
-        )
-        for (period, movement_type), data in sorted(period_map.items())
-    ]
-
-    summary_by_type = [
-        schemas.MovementTypeSummary(
-            tipo_movimiento=movement_enum,
-            total_cantidad=int(totals_by_type.get(
-                movement_enum, {}).get("quantity", 0)),
-            total_valor=to_decimal(totals_by_type.get(
-                movement_enum, {}).get("value", 0)),
-        )
-        for movement_enum in models.MovementType
-    ]
-
-    resumen = schemas.InventoryMovementsSummary(
-        total_movimientos=len(movements),
-        total_unidades=total_units,
-        total_valor=total_value,
-        por_tipo=summary_by_type,
-    )
-
-    report = schemas.InventoryMovementsReport(
-        resumen=resumen,
-        periodos=period_summaries,
-        movimientos=report_entries,
+        store_ids=store_ids,
+        date_from=date_from,
+        date_to=date_to,
+        movement_type=movement_type,
+        limit=limit,
+        offset=offset,
     )
-    _INVENTORY_MOVEMENTS_CACHE.set(cache_key, report.model_copy(deep=True))
-    return report
 
 
 def get_top_selling_products(
@@ -7300,7 +7185,19 @@ def enqueue_sync_outbox(
     operation: str,
     payload: dict[str, object],
     priority: models.SyncOutboxPriority | None = None,
-) -> models.SyncOutbox:
+) -> models.SyncOutbox | None:
+    if buffer_sync_outbox_item(
+        db,
+        SyncOutboxItem(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            operation=operation,
+            payload=payload,
+            priority=resolve_outbox_priority(entity_type, priority),
+            mirror_queue=True,
+        ),
+    ):
+        return None
     with transactional_session(db):
         normalized_payload = json.loads(
             json.dumps(payload or {}, ensure_ascii=False, default=str)
@@ -7385,6 +7282,34 @@ def enqueue_sync_outbox(
     return entry
 
 
+def mirror_sync_queue_events(
+    db: Session, items: Sequence[SyncOutboxItem]
+) -> None:
+    """Refleja en ``sync_queue`` los eventos encolados en lote en la cola híbrida."""
+
+    events = [
+        schemas.SyncQueueEvent(
+            event_type=f"{item.entity_type}.{item.operation}",
+            payload={
+                "entity_type": item.entity_type,
+                "entity_id": item.entity_id,
+                "operation": item.operation,
+                "payload": json.loads(
+                    json.dumps(item.payload or {}, ensure_ascii=False, default=str)
+                ),
+            },
+            idempotency_key=f"outbox:{item.entity_type}:{item.entity_id}:{item.operation}",
+        )
+        for item in items
+    ]
+    try:
+        enqueue_sync_queue_events(db, events)
+    except Exception as exc:  # pragma: no cover - no interrumpir flujo principal
+        logger.warning(
+            "No se pudieron reflejar los eventos en sync_queue", total=len(events), error=str(exc)
+        )
+
+
 # // [PACK35-backend]
 def enqueue_sync_queue_events(
     db: Session,
@@ -8763,6 +8688,8 @@ def _apply_transfer_reception(
                 origin_device.quantity = 0
                 flush_session(db)
                 destination_device = origin_device
+                catalog_search_index.sync_device_search_document(
+                    db, origin_device)
             else:
                 destination_statement = select(models.Device).where(
                     models.Device.store_id == order.destination_store_id,
@@ -8802,6 +8729,8 @@ def _apply_transfer_reception(
                     db.add(clone)
                     flush_session(db)
                     destination_device = clone
+                    catalog_search_index.sync_device_search_document(
+                        db, clone)
                 else:
                     flush_session(db)
 
@@ -8953,7 +8882,7 @@ def create_backup_job(
     db: Session,
     *,
     mode: models.BackupMode,
-    pdf_path: str,
+    pdf_path: str | None,
     archive_path: str,
     json_path: str,
     sql_path: str,
@@ -8965,6 +8894,9 @@ def create_backup_job(
     notes: str | None,
     triggered_by_id: int | None,
     reason: str | None = None,
+    backup_type: models.BackupType = models.BackupType.FULL,
+    parent_id: int | None = None,
+    snapshot_at: datetime | None = None,
 ) -> models.BackupJob:
     archive_file = Path(archive_path)
     filename = archive_file.name
@@ -8987,6 +8919,9 @@ def create_backup_job(
         triggered_by_id=triggered_by_id,
         executed_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
+        backup_type=backup_type,
+        parent_id=parent_id,
+        snapshot_at=snapshot_at,
     )
     with transactional_session(db):
         db.add(job)
@@ -8994,8 +8929,10 @@ def create_backup_job(
 
         componentes = ",".join(components)
         detalles = (
-            f"modo={mode.value}; tamaño={total_size_bytes}; componentes={componentes}; archivos={archive_path}"
+            f"modo={mode.value}; tipo={backup_type.value}; tamaño={total_size_bytes}; componentes={componentes}; archivos={archive_path}"
         )
+        if parent_id is not None:
+            detalles = f"{detalles}; base={parent_id}"
         if reason:
             detalles = f"{detalles}; motivo={reason}"
         _log_action(
@@ -9014,6 +8951,18 @@ def get_backup_job(db: Session, backup_id: int) -> models.BackupJob | None:
     return db.get(models.BackupJob, backup_id)
 
 
+def get_latest_backup_job(db: Session) -> models.BackupJob | None:
+    """Último respaldo con marca de corte, punto de partida del siguiente incremental."""
+
+    statement = (
+        select(models.BackupJob)
+        .where(models.BackupJob.snapshot_at.is_not(None))
+        .order_by(models.BackupJob.id.desc())
+        .limit(1)
+    )
+    return db.scalars(statement).first()
+
+
 def register_backup_restore(
     db: Session,
     *,
@@ -13137,6 +13086,7 @@ def register_sale_return(
             )
             if ledger_entry:
                 _sync_customer_ledger_entry(db, ledger_entry)
+        pos_receipt_cache.invalidate_sale(db, sale.id)
     return returns
 
 
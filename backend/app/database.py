@@ -1,13 +1,18 @@
 """Inicialización de la base de datos y utilidades comunes."""
 from __future__ import annotations
 
+import time
 from collections.abc import Generator
+from dataclasses import dataclass
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.sql.dml import UpdateBase
 
+from . import telemetry
 from .config import settings
 
 Base = declarative_base()
@@ -17,27 +22,180 @@ Base = declarative_base()
 # Nota: la variable importada no se usa directamente; el efecto deseado es el side-effect de los imports.
 from .db import base as _models  # noqa: F401
 
-
-def create_engine_from_url(url: str) -> Engine:
-    """Crea un motor de SQLAlchemy listo para usarse."""
-
+READ_ONLY_SESSION_KEY = "read_only"
+_PRIMARY_PINNED_KEY = "primary_pinned"
+
+
+@dataclass(frozen=True, slots=True)
+class EngineProfile:
+    """Parámetros de pool y ``PRAGMA`` aplicados al crear un motor."""
+
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268_435_456
+    read_only: bool = False
+    metrics_label: str = "primary"
+
+    @classmethod
+    def from_settings(cls, *, read_only: bool = False) -> "EngineProfile":
+        return cls(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout_seconds,
+            pool_recycle=settings.database_pool_recycle_seconds,
+            pool_pre_ping=settings.database_pool_pre_ping,
+            sqlite_journal_mode=settings.sqlite_journal_mode,
+            sqlite_synchronous=settings.sqlite_synchronous,
+            sqlite_busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+            sqlite_mmap_size=settings.sqlite_mmap_size_bytes,
+            read_only=read_only,
+            metrics_label="replica" if read_only else "primary",
+        )
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` que publica esperas, desbordes y agotamientos del pool."""
+
+    metrics_label = "primary"
+
+    def _do_get(self):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            telemetry.record_db_pool_timeout(self.metrics_label)
+            raise
+        telemetry.record_db_pool_checkout(
+            self.metrics_label,
+            wait_seconds=time.perf_counter() - started,
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+        )
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics_label = self.metrics_label
+        return pool
+
+
+def _is_memory_sqlite(database: str | None) -> bool:
+    return not database or database == ":memory:" or "mode=memory" in database
+
+
+def _install_sqlite_pragmas(engine: Engine, profile: EngineProfile, *, memory: bool) -> None:
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {int(profile.sqlite_busy_timeout_ms)}")
+            if not memory:
+                cursor.execute(f"PRAGMA journal_mode = {profile.sqlite_journal_mode}")
+                cursor.execute(f"PRAGMA synchronous = {profile.sqlite_synchronous}")
+                cursor.execute(f"PRAGMA mmap_size = {int(profile.sqlite_mmap_size)}")
+            if profile.read_only:
+                cursor.execute("PRAGMA query_only = ON")
+        finally:
+            cursor.close()
+
+
+def create_engine_from_url(url: str, profile: EngineProfile | None = None) -> Engine:
+    """Crea un motor de SQLAlchemy listo para usarse.
+
+    ``profile`` (por defecto el derivado de ``Settings``) fija el tamaño y
+    reciclaje del pool y, en SQLite, los ``PRAGMA`` de cada conexión: WAL,
+    ``synchronous``, ``busy_timeout`` y ``mmap_size``.
+    """
+
+    profile = profile or EngineProfile.from_settings()
     engine_kwargs: dict[str, object] = {"future": True}
     connect_args: dict[str, object] = {}
+    pooled = True
+    memory = False
 
     if url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
+        memory = _is_memory_sqlite(make_url(url).database)
         if url == "sqlite:///:memory:":
             engine_kwargs["poolclass"] = StaticPool
-
+        # SQLite en memoria usa pools de una sola conexión sin tamaño ajustable.
+        pooled = not memory
+
+    if pooled:
+        engine_kwargs.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+            pool_recycle=profile.pool_recycle or -1,
+            pool_pre_ping=profile.pool_pre_ping,
+        )
     if connect_args:
         engine_kwargs["connect_args"] = connect_args
 
-    return create_engine(url, **engine_kwargs)
+    engine = create_engine(url, **engine_kwargs)
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics_label = profile.metrics_label
+    if url.startswith("sqlite"):
+        _install_sqlite_pragmas(engine, profile, memory=memory)
+    return engine
+
+
+def create_read_engine(url: str, primary: Engine) -> Engine | None:
+    """Motor de lectura: el réplica configurado o una conexión de sólo lectura.
+
+    Con ``DATABASE_READ_URL`` se usa ese destino; con SQLite en archivo se abre
+    un pool independiente en modo ``query_only`` (WAL permite leer mientras se
+    escribe). En cualquier otro caso las lecturas permanecen en el primario.
+    """
+
+    profile = EngineProfile.from_settings(read_only=True)
+    if settings.database_read_url:
+        return create_engine_from_url(settings.database_read_url, profile)
+    if url.startswith("sqlite") and not _is_memory_sqlite(primary.url.database):
+        return create_engine_from_url(url, profile)
+    return None
+
+
+class RoutingSession(Session):
+    """Sesión que envía al motor de lectura las consultas de sólo lectura.
+
+    Sólo se enrutan sentencias ``SELECT`` de sesiones marcadas con
+    :func:`mark_read_only`; las escrituras (``flush`` o sentencias DML) fijan la
+    sesión al primario para que las lecturas posteriores vean sus cambios y el
+    SQL textual se ejecuta siempre en el primario.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):  # type: ignore[override]
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[_PRIMARY_PINNED_KEY] = True
+        elif (
+            read_engine is not None
+            and self.info.get(READ_ONLY_SESSION_KEY)
+            and not self.info.get(_PRIMARY_PINNED_KEY)
+            and getattr(clause, "is_select", False)
+        ):
+            return read_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def mark_read_only(db: Session) -> Session:
+    """Marca la sesión para que sus lecturas usen el motor de lectura."""
+
+    db.info[READ_ONLY_SESSION_KEY] = True
+    return db
 
 
 engine: Engine = create_engine_from_url(settings.database_url)
+read_engine: Engine | None = create_read_engine(settings.database_url, engine)
 SessionLocal = sessionmaker(
-    bind=engine, autocommit=False, autoflush=False, future=True)
+    bind=engine, class_=RoutingSession, autocommit=False, autoflush=False, future=True)
 
 
 def get_db() -> Generator:
@@ -0,0 +1,202 @@
+"""Índice de búsqueda del catálogo de dispositivos según el motor.
+
+`device_search_documents` guarda, por dispositivo activo, el texto
+normalizado (minúsculas y sin acentos) de los campos buscables. Sobre esa
+tabla se construye el índice propio de cada motor:
+
+- SQLite: dos tablas FTS5 de contenido externo sincronizadas por triggers;
+  `device_search_fts` (unicode61, índices de prefijo) para la búsqueda por
+  prefijo con ranking bm25 y `device_search_trigram` (tokenizador trigram)
+  para subcadenas y filtros `LIKE '%x%'`. `device_search_vocab` (fts5vocab)
+  expone los términos indexados para corregir errores de tipeo. La sucursal
+  se indexa como la columna `store_key` (`#<id>#`) para filtrar dentro del
+  propio `MATCH`.
+- PostgreSQL: extensión `pg_trgm` con índices GIN sobre `tsvector` y
+  trigramas del documento y de las columnas de filtro.
+"""
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTS_TABLE = "device_search_documents"
+SQLITE_FTS_TABLE = "device_search_fts"
+SQLITE_TRIGRAM_TABLE = "device_search_trigram"
+SQLITE_VOCAB_TABLE = "device_search_vocab"
+FILTER_COLUMNS: tuple[str, ...] = (
+    "marca",
+    "modelo",
+    "color",
+    "categoria",
+    "condicion",
+    "proveedor",
+    "estado",
+    "ubicacion",
+)
+
+_FTS_COLUMNS = ("document", "store_key")
+_TRIGRAM_COLUMNS = ("document", "store_key", *FILTER_COLUMNS)
+
+
+def _values(prefix: str, columns: tuple[str, ...]) -> str:
+    return ", ".join(f"{prefix}.{name}" for name in columns)
+
+
+def _sqlite_statements() -> list[str]:
+    fts_columns = ", ".join(_FTS_COLUMNS)
+    trigram_columns = ", ".join(_TRIGRAM_COLUMNS)
+    insert_new = f"""
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, {fts_columns})
+            VALUES (new.device_id, {_values("new", _FTS_COLUMNS)});
+        INSERT INTO {SQLITE_TRIGRAM_TABLE}(rowid, {trigram_columns})
+            VALUES (new.device_id, {_values("new", _TRIGRAM_COLUMNS)});
+    """
+    delete_old = f"""
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {fts_columns})
+            VALUES ('delete', old.device_id, {_values("old", _FTS_COLUMNS)});
+        INSERT INTO {SQLITE_TRIGRAM_TABLE}({SQLITE_TRIGRAM_TABLE}, rowid, {trigram_columns})
+            VALUES ('delete', old.device_id, {_values("old", _TRIGRAM_COLUMNS)});
+    """
+    return [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+            {fts_columns},
+            content='{DOCUMENTS_TABLE}',
+            content_rowid='device_id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='1 2 3'
+        )
+        """,
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TRIGRAM_TABLE} USING fts5(
+            {trigram_columns},
+            content='{DOCUMENTS_TABLE}',
+            content_rowid='device_id',
+            tokenize='trigram'
+        )
+        """,
+        # Vocabulario del índice de prefijos para la corrección de errores de tipeo.
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_VOCAB_TABLE}
+        USING fts5vocab({SQLITE_FTS_TABLE}, 'row')
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {DOCUMENTS_TABLE}_ai AFTER INSERT ON {DOCUMENTS_TABLE}
+        BEGIN {insert_new} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {DOCUMENTS_TABLE}_ad AFTER DELETE ON {DOCUMENTS_TABLE}
+        BEGIN {delete_old} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {DOCUMENTS_TABLE}_au AFTER UPDATE ON {DOCUMENTS_TABLE}
+        BEGIN {delete_old} {insert_new} END
+        """,
+        # Reindexa lo que ya exista en la tabla de documentos.
+        f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+        f"INSERT INTO {SQLITE_TRIGRAM_TABLE}({SQLITE_TRIGRAM_TABLE}) VALUES ('rebuild')",
+    ]
+
+
+def _postgresql_statements() -> list[str]:
+    filters = ", ".join(f"{name} gin_trgm_ops" for name in FILTER_COLUMNS)
+    return [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"""
+        CREATE INDEX IF NOT EXISTS ix_{DOCUMENTS_TABLE}_tsv
+        ON {DOCUMENTS_TABLE} USING gin (to_tsvector('simple'::regconfig, document))
+        """,
+        f"""
+        CREATE INDEX IF NOT EXISTS ix_{DOCUMENTS_TABLE}_trgm
+        ON {DOCUMENTS_TABLE} USING gin (document gin_trgm_ops)
+        """,
+        f"""
+        CREATE INDEX IF NOT EXISTS ix_{DOCUMENTS_TABLE}_filters_trgm
+        ON {DOCUMENTS_TABLE} USING gin ({filters})
+        """,
+    ]
+
+
+def _run(connection: Connection, statements: list[str]) -> None:
+    def _execute(conn: Connection) -> None:
+        for statement in statements:
+            conn.execute(text(statement))
+
+    if connection.in_transaction():
+        _execute(connection)
+    else:
+        with connection.begin():
+            _execute(connection)
+
+
+def create_catalog_search_index(connection: Connection) -> None:
+    """Crea el índice de búsqueda propio del motor sobre `device_search_documents`.
+
+    Si el motor no ofrece FTS5 (SQLite compilado sin la extensión) o
+    `pg_trgm`, se registra una advertencia y la búsqueda recurre a `LIKE`
+    sobre la tabla de documentos.
+    """
+
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = _sqlite_statements()
+    elif dialect == "postgresql":
+        statements = _postgresql_statements()
+    else:
+        return
+    try:
+        if dialect == "postgresql" and connection.in_transaction():
+            # Un punto de guardado evita que el fallo (p. ej. sin permisos para
+            # `CREATE EXTENSION`) invalide la transacción externa.
+            with connection.begin_nested():
+                _run(connection, statements)
+        else:
+            _run(connection, statements)
+    except DBAPIError:
+        logger.warning(
+            "No fue posible crear el índice de búsqueda del catálogo para %s; "
+            "se usará LIKE sobre %s.",
+            dialect,
+            DOCUMENTS_TABLE,
+            exc_info=True,
+        )
+
+
+def drop_catalog_search_index(connection: Connection) -> None:
+    """Elimina los objetos del índice (triggers, tablas FTS5 o índices GIN)."""
+
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = [
+            f"DROP TRIGGER IF EXISTS {DOCUMENTS_TABLE}_ai",
+            f"DROP TRIGGER IF EXISTS {DOCUMENTS_TABLE}_ad",
+            f"DROP TRIGGER IF EXISTS {DOCUMENTS_TABLE}_au",
+            f"DROP TABLE IF EXISTS {SQLITE_VOCAB_TABLE}",
+            f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}",
+            f"DROP TABLE IF EXISTS {SQLITE_TRIGRAM_TABLE}",
+        ]
+    elif dialect == "postgresql":
+        statements = [
+            f"DROP INDEX IF EXISTS ix_{DOCUMENTS_TABLE}_tsv",
+            f"DROP INDEX IF EXISTS ix_{DOCUMENTS_TABLE}_trgm",
+            f"DROP INDEX IF EXISTS ix_{DOCUMENTS_TABLE}_filters_trgm",
+        ]
+    else:
+        return
+    _run(connection, statements)
+
+
+__all__ = [
+    "DOCUMENTS_TABLE",
+    "FILTER_COLUMNS",
+    "SQLITE_FTS_TABLE",
+    "SQLITE_TRIGRAM_TABLE",
+    "SQLITE_VOCAB_TABLE",
+    "create_catalog_search_index",
+    "drop_catalog_search_index",
+]
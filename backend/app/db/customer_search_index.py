@@ -0,0 +1,136 @@
+"""Índice de búsqueda de clientes según el motor.
+
+`customer_search_documents` guarda, por cliente activo, el texto normalizado
+de los campos buscables junto con las claves exactas de RTN, teléfono y
+correo. Sobre el documento se construye el índice propio de cada motor:
+
+- SQLite: tabla FTS5 de contenido externo `customer_search_trigram`
+  (tokenizador trigram) sincronizada por triggers, que resuelve subcadenas
+  equivalentes a `LIKE '%x%'`.
+- PostgreSQL: índice GIN de `pg_trgm` sobre el documento.
+"""
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTS_TABLE = "customer_search_documents"
+SQLITE_TRIGRAM_TABLE = "customer_search_trigram"
+
+
+def _sqlite_statements() -> list[str]:
+    insert_new = f"""
+        INSERT INTO {SQLITE_TRIGRAM_TABLE}(rowid, document)
+            VALUES (new.customer_id, new.document);
+    """
+    delete_old = f"""
+        INSERT INTO {SQLITE_TRIGRAM_TABLE}({SQLITE_TRIGRAM_TABLE}, rowid, document)
+            VALUES ('delete', old.customer_id, old.document);
+    """
+    return [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TRIGRAM_TABLE} USING fts5(
+            document,
+            content='{DOCUMENTS_TABLE}',
+            content_rowid='customer_id',
+            tokenize='trigram'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {DOCUMENTS_TABLE}_ai AFTER INSERT ON {DOCUMENTS_TABLE}
+        BEGIN {insert_new} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {DOCUMENTS_TABLE}_ad AFTER DELETE ON {DOCUMENTS_TABLE}
+        BEGIN {delete_old} END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {DOCUMENTS_TABLE}_au AFTER UPDATE ON {DOCUMENTS_TABLE}
+        BEGIN {delete_old} {insert_new} END
+        """,
+        # Reindexa lo que ya exista en la tabla de documentos.
+        f"INSERT INTO {SQLITE_TRIGRAM_TABLE}({SQLITE_TRIGRAM_TABLE}) VALUES ('rebuild')",
+    ]
+
+
+def _postgresql_statements() -> list[str]:
+    return [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"""
+        CREATE INDEX IF NOT EXISTS ix_{DOCUMENTS_TABLE}_trgm
+        ON {DOCUMENTS_TABLE} USING gin (document gin_trgm_ops)
+        """,
+    ]
+
+
+def _run(connection: Connection, statements: list[str]) -> None:
+    def _execute(conn: Connection) -> None:
+        for statement in statements:
+            conn.execute(text(statement))
+
+    if connection.in_transaction():
+        _execute(connection)
+    else:
+        with connection.begin():
+            _execute(connection)
+
+
+def create_customer_search_index(connection: Connection) -> None:
+    """Crea el índice de subcadenas sobre `customer_search_documents`.
+
+    Si el motor no ofrece FTS5 o `pg_trgm` se registra una advertencia y la
+    búsqueda recurre a `LIKE` sobre la tabla de documentos.
+    """
+
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = _sqlite_statements()
+    elif dialect == "postgresql":
+        statements = _postgresql_statements()
+    else:
+        return
+    try:
+        if dialect == "postgresql" and connection.in_transaction():
+            with connection.begin_nested():
+                _run(connection, statements)
+        else:
+            _run(connection, statements)
+    except DBAPIError:
+        logger.warning(
+            "No fue posible crear el índice de búsqueda de clientes para %s; "
+            "se usará LIKE sobre %s.",
+            dialect,
+            DOCUMENTS_TABLE,
+            exc_info=True,
+        )
+
+
+def drop_customer_search_index(connection: Connection) -> None:
+    """Elimina los triggers y la tabla FTS5 o el índice GIN."""
+
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = [
+            f"DROP TRIGGER IF EXISTS {DOCUMENTS_TABLE}_ai",
+            f"DROP TRIGGER IF EXISTS {DOCUMENTS_TABLE}_ad",
+            f"DROP TRIGGER IF EXISTS {DOCUMENTS_TABLE}_au",
+            f"DROP TABLE IF EXISTS {SQLITE_TRIGRAM_TABLE}",
+        ]
+    elif dialect == "postgresql":
+        statements = [f"DROP INDEX IF EXISTS ix_{DOCUMENTS_TABLE}_trgm"]
+    else:
+        return
+    _run(connection, statements)
+
+
+__all__ = [
+    "DOCUMENTS_TABLE",
+    "SQLITE_TRIGRAM_TABLE",
+    "create_customer_search_index",
+    "drop_customer_search_index",
+]
@@ -44,6 +44,7 @@ from .routers import (
     inventory_import,
     inventory_variants,
     inventory_counts,
+    jobs,
     loyalty,
     monitoring,
     observability_admin,
@@ -71,7 +72,12 @@ from .routers import (
     users,
     wms_bins,
 )
+from .services import sync_queue as sync_queue_service
+from .services.audit_writer import start_audit_writer, stop_audit_writer
+from .services.job_queue import start_job_workers, stop_job_workers
+from .services.render_pool import start_render_pool, stop_render_pool
 from .services.scheduler import BackgroundScheduler
+from .utils.cache import start_cache_sweeper, stop_cache_sweeper
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +138,18 @@ def _bootstrap_defaults(session: Session = None) -> None:
             session.close()
 
 
+def _flush_pending_session_activity() -> None:
+    """Persiste las marcas de uso de sesiones pendientes antes de apagar."""
+
+    session = SessionLocal()
+    try:
+        crud.flush_session_activity(session)
+    except Exception:  # pragma: no cover - el apagado no debe fallar por esto
+        logger.exception("No se pudo persistir la actividad de sesiones pendiente")
+    finally:
+        session.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Obtiene la sesión a utilizar para bootstrap. En pruebas, usa el override
@@ -165,6 +183,10 @@ async def lifespan(app: FastAPI):
     finally:
         if created_local_session and session is not None:
             session.close()
+    start_cache_sweeper(settings.cache_sweep_interval_seconds)
+    start_audit_writer()
+    start_render_pool()
+    start_job_workers()
     global _scheduler
     if settings.enable_background_scheduler:
         _scheduler = BackgroundScheduler(session_provider=SessionLocal)
@@ -174,6 +196,12 @@ async def lifespan(app: FastAPI):
     finally:
         if _scheduler is not None:
             await _scheduler.stop()
+        _flush_pending_session_activity()
+        sync_queue_service.close_http_client()
+        stop_cache_sweeper()
+        stop_job_workers()
+        stop_render_pool()
+        stop_audit_writer()
 
 
 def create_app() -> FastAPI:
@@ -248,6 +276,7 @@ def create_app() -> FastAPI:
         transfers.router,
         updates.router,
         backups.router,
+        jobs.router,
         cloud.router,
         reports.router,
         reports_sales.router,
@@ -5,11 +5,12 @@ from .cloud_agent import (
 )
 from .config import (
     ConfigRate, ConfigXmlTemplate, ConfigParameter, BackupJob, BackupMode,
-    BackupComponent
+    BackupComponent, BackupType
 )
 from .operations import (
     RecurringOrder, RecurringOrderType
 )
+from .jobs import BackgroundJob, BackgroundJobStatus
 from .sync import (
     SyncSession, SyncOutbox, SyncMode, SyncStatus, SyncOutboxStatus,
     SyncOutboxPriority, SyncQueueStatus, SyncQueue, SyncAttempt
@@ -28,12 +29,13 @@ from .stores import (
 )
 from .products import (
     Device, ProductVariant, ProductBundle, ProductBundleItem, DeviceIdentifier,
-    CommercialState
+    CommercialState, DeviceSearchDocument
 )
 from .inventory import (
     InventoryMovement, InventoryReservation, StockMove, CostLedgerEntry,
     ImportValidation, InventoryImportTemp, MovementType, StockMoveType,
-    CostingMethod, InventoryState
+    CostingMethod, InventoryState, InventorySkuSummary, InventorySkuSummaryState,
+    InventoryMovementDaily
 )
 from .sales import (
     Sale, SaleItem, POSDocumentType, PaymentMethod, CashSession, CashEntry,
@@ -42,11 +44,12 @@ from .sales import (
     WarrantyAssignment, WarrantyClaim, RMARequest, RMAEvent, PriceList, PriceListItem,
     RETURN_DISPOSITION_ENUM, RETURN_REASON_CATEGORY_ENUM, RMA_STATUS_ENUM,
     WARRANTY_STATUS_ENUM, WARRANTY_CLAIM_STATUS_ENUM, WARRANTY_CLAIM_TYPE_ENUM,
-    DTEStatus, DTEDispatchStatus, POSConfig, SaleReturn, CashRegisterSession, DTEDocument,
+    DTEStatus, DTEDispatchStatus, POSConfig, POSReceiptCacheEntry, SaleReturn, CashRegisterSession, DTEDocument,
     CashRegisterEntry, DTEAuthorization, DTEDispatchQueue, POSDraftSale, FiscalDocument
 )
 from .customers import (
     Customer, LoyaltyAccount, StoreCredit, CustomerSegmentSnapshot,
+    CustomerSearchDocument, CustomerTag,
     CustomerPrivacyRequest, CustomerLedgerEntry, CustomerType, CustomerStatus,
     LoyaltyTransactionType, LOYALTY_TRANSACTION_TYPE_ENUM, CustomerLedgerEntryType,
     PrivacyRequestStatus, PrivacyRequestType, StoreCreditStatus,
@@ -75,10 +78,11 @@ __all__ = [
     "Store", "Warehouse", "WMSBin", "DeviceBinAssignment", "PriceList",
     "PriceListItem",
     "Device", "ProductVariant", "ProductBundle", "ProductBundleItem",
-    "DeviceIdentifier", "CommercialState",
+    "DeviceIdentifier", "CommercialState", "DeviceSearchDocument",
     "InventoryMovement", "InventoryReservation", "StockMove", "CostLedgerEntry",
     "ImportValidation", "InventoryImportTemp", "MovementType", "StockMoveType",
-    "CostingMethod", "InventoryState",
+    "CostingMethod", "InventoryState", "InventorySkuSummary",
+    "InventorySkuSummaryState", "InventoryMovementDaily",
     "Sale", "SaleItem", "POSDocumentType", "PaymentMethod", "CashSession",
     "CashEntry", "CashSessionStatus", "CashEntryType", "ReturnDisposition",
     "ReturnReasonCategory", "RMAStatus", "WarrantyStatus", "WarrantyClaimType",
@@ -88,6 +92,7 @@ __all__ = [
     "WARRANTY_CLAIM_TYPE_ENUM", "DTEStatus", "DTEDispatchStatus", "CashRegisterSession", "DTEDocument",
     "CashRegisterEntry", "DTEAuthorization", "DTEDispatchQueue",
     "Customer", "LoyaltyAccount", "StoreCredit", "CustomerSegmentSnapshot",
+    "CustomerSearchDocument", "CustomerTag",
     "CustomerPrivacyRequest", "CustomerLedgerEntry", "CustomerType",
     "CustomerStatus", "LoyaltyTransactionType", "LOYALTY_TRANSACTION_TYPE_ENUM",
     "CustomerLedgerEntryType", "PrivacyRequestStatus", "PrivacyRequestType",
@@ -104,8 +109,9 @@ __all__ = [
     "SyncSession", "SyncOutbox", "SyncMode", "SyncStatus", "SyncOutboxStatus",
     "SyncOutboxPriority", "SyncQueueStatus", "SyncQueue", "SyncAttempt",
     "RecurringOrder", "RecurringOrderType",
+    "BackgroundJob", "BackgroundJobStatus",
     "ConfigRate", "ConfigXmlTemplate", "ConfigParameter", "BackupJob",
-    "BackupMode", "BackupComponent",
+    "BackupMode", "BackupComponent", "BackupType",
     "CloudAgentTask", "CloudAgentTaskStatus", "CloudAgentTaskType",
-    "POSDraftSale", "FiscalDocument",
+    "POSDraftSale", "FiscalDocument", "POSReceiptCacheEntry",
 ]
@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -99,8 +100,26 @@ class SupportFeedback(Base):
     user: Mapped[User | None] = relationship("User")
 
 
+def _default_audit_severity(context: Any) -> str:
+    """Clasifica el evento al insertarlo cuando no se indicó ``severity``."""
+
+    from backend.app.utils.audit import classify_severity
+
+    parameters = context.get_current_parameters()
+    return classify_severity(parameters.get("action") or "", parameters.get("details"))
+
+
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Orden de la bitácora y de su paginación por cursor.
+        Index("ix_audit_logs_created_at_id", "created_at", "id"),
+        # Filtros por severidad y recordatorios de alertas críticas persistentes.
+        Index("ix_audit_logs_severity_created_at", "severity", "created_at"),
+        Index(
+            "ix_audit_logs_entity_created_at", "entity_type", "entity_id", "created_at"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     action: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -112,6 +131,13 @@ class AuditLog(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow)
+    # Severidad derivada de acción y detalle (`classify_severity`), fija al escribir.
+    severity: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=_default_audit_severity,
+        server_default="info",
+    )
 
     performed_by: Mapped[User | None] = relationship(
         "User", back_populates="logs")
@@ -31,6 +31,13 @@ class BackupMode(str, enum.Enum):
     MANUAL = "manual"
 
 
+class BackupType(str, enum.Enum):
+    """Alcance del volcado de datos incluido en el respaldo."""
+
+    FULL = "completo"
+    INCREMENTAL = "incremental"
+
+
 class BackupComponent(str, enum.Enum):
     """Componentes disponibles dentro de un respaldo corporativo."""
 
@@ -158,6 +165,17 @@ class BackupJob(Base):
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="completed")
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    backup_type: Mapped[BackupType] = mapped_column(
+        Enum(BackupType, name="backup_type"),
+        nullable=False,
+        default=BackupType.FULL,
+    )
+    parent_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("backup_jobs.id"), nullable=True, index=True
+    )
+    snapshot_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     triggered_by: Mapped[User | None] = relationship(
         "User", back_populates="backup_jobs", foreign_keys="BackupJob.triggered_by_id"
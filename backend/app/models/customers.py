@@ -16,10 +16,15 @@ from sqlalchemy import (
     Enum,
     JSON,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.database import Base
+from backend.app.db.customer_search_index import (
+    create_customer_search_index,
+    drop_customer_search_index,
+)
 from backend.app.models.users import User
 
 if TYPE_CHECKING:
@@ -575,5 +580,56 @@ class StoreCreditRedemption(Base):
     created_by: Mapped["User | None"] = relationship("User")
 
 
+class CustomerSearchDocument(Base):
+    """Texto normalizado y claves exactas de un cliente activo para la búsqueda.
+
+    Es la fuente de contenido del índice trigram (FTS5 en SQLite, `pg_trgm`
+    en PostgreSQL); ver `backend/app/db/customer_search_index.py`.
+    """
+
+    __tablename__ = "customer_search_documents"
+
+    customer_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("clientes.id_cliente", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    document: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    tax_id_key: Mapped[str] = mapped_column(
+        String(30), nullable=False, default="", index=True
+    )
+    phone_key: Mapped[str] = mapped_column(
+        String(40), nullable=False, default="", index=True
+    )
+    email_key: Mapped[str] = mapped_column(
+        String(120), nullable=False, default="", index=True
+    )
+
+
+event.listen(
+    CustomerSearchDocument.__table__,
+    "after_create",
+    lambda target, connection, **kw: create_customer_search_index(connection),
+)
+event.listen(
+    CustomerSearchDocument.__table__,
+    "before_drop",
+    lambda target, connection, **kw: drop_customer_search_index(connection),
+)
+
+
+class CustomerTag(Base):
+    """Etiqueta de segmentación de un cliente (espejo indexado de `tags`)."""
+
+    __tablename__ = "customer_tags"
+
+    customer_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("clientes.id_cliente", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tag: Mapped[str] = mapped_column(String(60), primary_key=True, index=True)
+
+
 # Export Enums for compatibility
 LOYALTY_TRANSACTION_TYPE_ENUM = LoyaltyTransactionType
@@ -1,11 +1,12 @@
 from __future__ import annotations
 import enum
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional, Any, List, Dict
 
 from sqlalchemy import (
     Boolean,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
@@ -374,3 +375,63 @@ class InventoryImportTemp(Base):
     duracion_segundos: Mapped[Decimal | None] = mapped_column(
         Numeric(10, 2), nullable=True
     )
+
+
+class InventorySkuSummary(Base):
+    """Resumen persistido de SKU con existencias distintas entre sucursales."""
+
+    __tablename__ = "inventory_sku_summaries"
+
+    sku: Mapped[str] = mapped_column(String(80), primary_key=True)
+    product_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    min_quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    max_quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    store_quantities: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON, nullable=False, default=list
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
+class InventorySkuSummaryState(Base):
+    """Marca de agua del detector incremental de discrepancias."""
+
+    __tablename__ = "inventory_sku_summary_state"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    watermark_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True)
+    rebuilt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True)
+
+
+class InventoryMovementDaily(Base):
+    """Acumulado diario de movimientos por sucursal, dispositivo y tipo."""
+
+    __tablename__ = "inventory_movement_daily"
+    __table_args__ = (
+        Index("ix_inventory_movement_daily_day_store", "day", "store_id"),
+    )
+
+    store_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("sucursales.id_sucursal", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    device_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("devices.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    movement_type: Mapped[MovementType] = mapped_column(
+        Enum(MovementType, name="movement_type"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    movement_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    units: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_value: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=Decimal("0")
+    )
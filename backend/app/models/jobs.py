@@ -0,0 +1,74 @@
+"""Cola persistente de trabajos en segundo plano."""
+from __future__ import annotations
+
+import enum
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..database import Base
+
+
+class BackgroundJobStatus(str, enum.Enum):
+    """Estados de un trabajo de la cola."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class BackgroundJob(Base):
+    """Trabajo pesado (reporte, exportación, respaldo) atendido por el pool de workers."""
+
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        # Orden en que los workers toman trabajos: prioridad y antigüedad.
+        Index(
+            "ix_background_jobs_claim", "status", "priority", "available_at", "created_at"
+        ),
+        Index("ix_background_jobs_expires_at", "expires_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    job_type: Mapped[str] = mapped_column(String(60), nullable=False, index=True)
+    status: Mapped[BackgroundJobStatus] = mapped_column(
+        Enum(BackgroundJobStatus, name="background_job_status"),
+        nullable=False,
+        default=BackgroundJobStatus.QUEUED,
+    )
+    # 1 = alta, 10 = baja, igual que las tareas del agente en la nube.
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    progress_message: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    result_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    result_filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    result_media_type: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[str | None] = mapped_column(String(80), nullable=True)
+    created_by_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("usuarios.id_usuario", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=datetime.utcnow
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+__all__ = ["BackgroundJob", "BackgroundJobStatus"]
@@ -16,12 +16,17 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
     func,
 )
 from sqlalchemy.sql import column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
+from ..db.catalog_search_index import (
+    create_catalog_search_index,
+    drop_catalog_search_index,
+)
 
 if TYPE_CHECKING:
     from .stores import Store, Warehouse
@@ -47,6 +52,8 @@ class Device(Base):
         UniqueConstraint("serial", name="uq_devices_serial"),
         Index("ix_devices_warehouse_id", "warehouse_id"),
         Index("ix_devices_sku_lower", func.lower(column("sku"))),
+        # Listado por sucursal y su paginación por cursor sobre (name, id).
+        Index("ix_devices_store_name_id", "sucursal_id", "name", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -184,6 +191,50 @@ class Device(Base):
         self.unit_price = value
 
 
+class DeviceSearchDocument(Base):
+    """Texto normalizado de un dispositivo activo para el índice de búsqueda.
+
+    La tabla es la fuente de contenido del índice FTS5 (SQLite) o de los
+    índices GIN de `pg_trgm` (PostgreSQL); ver `backend/app/db/catalog_search_index.py`.
+    """
+
+    __tablename__ = "device_search_documents"
+
+    device_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("devices.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    store_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("sucursales.id_sucursal", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    store_key: Mapped[str] = mapped_column(String(20), nullable=False, default="")
+    document: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    marca: Mapped[str] = mapped_column(String(80), nullable=False, default="")
+    modelo: Mapped[str] = mapped_column(String(120), nullable=False, default="")
+    color: Mapped[str] = mapped_column(String(60), nullable=False, default="")
+    categoria: Mapped[str] = mapped_column(String(80), nullable=False, default="")
+    condicion: Mapped[str] = mapped_column(String(60), nullable=False, default="")
+    proveedor: Mapped[str] = mapped_column(String(120), nullable=False, default="")
+    estado: Mapped[str] = mapped_column(String(40), nullable=False, default="")
+    ubicacion: Mapped[str] = mapped_column(String(120), nullable=False, default="")
+
+
+event.listen(
+    DeviceSearchDocument.__table__,
+    "after_create",
+    lambda target, connection, **kw: create_catalog_search_index(connection),
+)
+event.listen(
+    DeviceSearchDocument.__table__,
+    "before_drop",
+    lambda target, connection, **kw: drop_catalog_search_index(connection),
+)
+
+
 class ProductVariant(Base):
     __tablename__ = "product_variants"
     __table_args__ = (
@@ -97,6 +97,45 @@ class POSConfig(Base):
     store: Mapped[Store] = relationship("Store")
 
 
+class POSReceiptCacheEntry(Base):
+    """Recibo POS ya generado; el PDF vive en disco nombrado por su SHA-256."""
+
+    __tablename__ = "pos_receipt_cache"
+    __table_args__ = (
+        UniqueConstraint(
+            "sale_id",
+            "sale_version",
+            "config_version",
+            name="uq_pos_receipt_cache_version",
+        ),
+        Index("ix_pos_receipt_cache_last_used_at", "last_used_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    sale_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("ventas.id_venta", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    store_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    sale_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    config_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    escpos_ticket: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
 class DTEStatus(str, enum.Enum):
     """Estados operativos de un documento tributario electrónico."""
 
@@ -185,6 +224,10 @@ class CashEntryType(str, enum.Enum):
 
 class Sale(Base):
     __tablename__ = "ventas"
+    __table_args__ = (
+        # Orden de los listados de ventas y de su paginación por cursor.
+        Index("ix_ventas_fecha_id", "fecha", "id_venta"),
+    )
 
     id: Mapped[int] = mapped_column(
         "id_venta", Integer, primary_key=True, index=True)
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
@@ -92,10 +93,45 @@ class SyncSession(Base):
         "User", back_populates="sync_sessions")
 
 
+_OUTBOX_STORE_KEYS: tuple[str, ...] = (
+    "store_id",
+    "origin_store_id",
+    "destination_store_id",
+    "sucursal_id",
+)
+
+
+def resolve_outbox_store_id(payload: Any) -> int | None:
+    """Obtiene la sucursal de enrutamiento declarada en el payload de un evento.
+
+    Devuelve ``None`` cuando el evento es global (sin sucursal) o cuando el
+    identificador no es numérico.
+    """
+
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(payload, dict):
+        return None
+    for key in _OUTBOX_STORE_KEYS:
+        candidate = payload.get(key)
+        if candidate is None:
+            continue
+        try:
+            return int(candidate)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
 class SyncOutbox(Base):
     __tablename__ = "sync_outbox"
-    __table_args__ = (UniqueConstraint(
-        "entity_type", "entity_id", name="uq_outbox_entity"),)
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", name="uq_outbox_entity"),
+        Index("ix_sync_outbox_status_store_id", "status", "store_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     entity_type: Mapped[str] = mapped_column(
@@ -106,6 +142,9 @@ class SyncOutbox(Base):
     entity_id: Mapped[str] = mapped_column(String(80), nullable=False)
     operation: Mapped[str] = mapped_column(String(40), nullable=False)
     _payload: Mapped[str] = mapped_column("payload", Text, nullable=False)
+    # Sucursal de enrutamiento desnormalizada desde el payload; NULL = global.
+    store_id: Mapped[int | None] = mapped_column(
+        "store_id", Integer, nullable=True)
     attempts: Mapped[int] = mapped_column(
         "attempts", Integer, nullable=False, default=0)
     attempt_count = synonym("attempts")
@@ -151,6 +190,7 @@ class SyncOutbox(Base):
             return {}
 
     def _set_payload(self, value: dict[str, Any] | str | None) -> None:
+        self.store_id = resolve_outbox_store_id(value)
         if value is None:
             self._payload = json.dumps({}, ensure_ascii=False)
             return
@@ -3,16 +3,16 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from .. import crud, schemas
 from ..utils import audit as audit_utils
 from ..core.roles import ADMIN
 from ..database import get_db
-from ..routers.dependencies import require_reason
+from ..routers.dependencies import cursor_errors, require_reason
 from ..security import require_roles
+from ..services.streaming_exports import csv_response
 
 router = APIRouter(prefix="/audit", tags=["auditoría"])
 
@@ -23,6 +23,7 @@ router = APIRouter(prefix="/audit", tags=["auditoría"])
     dependencies=[Depends(require_roles(ADMIN))],
 )
 def list_audit_logs_endpoint(
+    response: Response,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     action: str | None = Query(default=None, max_length=120),
@@ -32,21 +33,31 @@ def list_audit_logs_endpoint(
     severity: audit_utils.AuditSeverity | None = Query(default=None),
     date_from: datetime | date | None = Query(default=None),
     date_to: datetime | date | None = Query(default=None),
+    cursor: str | None = Query(
+        default=None,
+        max_length=512,
+        description="Cursor de la página siguiente (encabezado X-Next-Cursor); reemplaza a offset",
+    ),
     db: Session = Depends(get_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
-    return crud.list_audit_logs(
-        db,
-        limit=limit,
-        offset=offset,
-        action=action,
-        entity_type=entity_type,
-        module=module,
-        performed_by_id=performed_by_id,
-        severity=severity,
-        date_from=date_from,
-        date_to=date_to,
-    )
+    with cursor_errors():
+        logs = crud.list_audit_logs(
+            db,
+            limit=limit,
+            offset=offset,
+            action=action,
+            entity_type=entity_type,
+            module=module,
+            performed_by_id=performed_by_id,
+            severity=severity,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+        )
+    if len(logs) == limit:
+        response.headers["X-Next-Cursor"] = crud.encode_audit_log_cursor(logs[-1])
+    return logs
 
 
 @router.get(
@@ -55,6 +66,7 @@ def list_audit_logs_endpoint(
     dependencies=[Depends(require_roles(ADMIN))],
 )
 def export_audit_logs(
+    request: Request,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     action: str | None = Query(default=None, max_length=120),
@@ -68,7 +80,7 @@ def export_audit_logs(
     current_user=Depends(require_roles(ADMIN)),
     _reason: str = Depends(require_reason),
 ):
-    csv_data = crud.export_audit_logs_csv(
+    rows = crud.iter_audit_log_export_rows(
         db,
         limit=limit,
         offset=offset,
@@ -84,10 +96,8 @@ def export_audit_logs(
         filename="bitacora_auditoria.csv",
         media_type="text/csv; charset=utf-8",
     )
-    return PlainTextResponse(
-        csv_data,
-        media_type=metadata.media_type,
-        headers=metadata.content_disposition(),
+    return csv_response(
+        request, rows, metadata=metadata, header=crud.AUDIT_EXPORT_HEADERS
     )
 
 
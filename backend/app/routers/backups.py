@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from .. import crud, models, schemas
@@ -12,7 +13,8 @@ from ..core.roles import ADMIN
 from ..database import get_db
 from ..routers.dependencies import require_reason
 from ..security import require_roles
-from ..services import backups as backup_services
+from ..services import backups as backup_services, job_queue
+from ..services.job_handlers import BACKUP
 
 router = APIRouter(prefix="/backups", tags=["respaldos"])
 _admin_backups = Depends(require_roles(ADMIN, module="respaldos"))
@@ -39,10 +41,34 @@ def run_backup(
         notes=notes,
         reason=reason,
         components=payload.componentes,
+        backup_type=payload.tipo,
     )
     return job
 
 
+@router.post(
+    "/run/async",
+    response_model=schemas.BackgroundJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[_admin_backups],
+)
+def enqueue_backup(
+    payload: schemas.BackupRunRequest,
+    db: Session = Depends(get_db),
+    current_user=_admin_backups,
+    reason: str = Depends(require_reason),
+):
+    """Encola el respaldo manual; el avance se consulta en ``/jobs``."""
+
+    return job_queue.enqueue_job(
+        db,
+        BACKUP,
+        {"request": payload.model_dump(mode="json"), "reason": reason},
+        priority=7,
+        created_by_id=current_user.id if current_user else None,
+    )
+
+
 @router.get(
     "/history",
     response_model=list[schemas.BackupJobResponse],
@@ -80,6 +106,7 @@ def restore_backup(
             components=payload.componentes,
             target_directory=payload.destino,
             apply_database=payload.aplicar_base_datos,
+            tables=payload.tablas,
             triggered_by_id=current_user.id if current_user else None,
             reason=reason,
         )
@@ -98,7 +125,7 @@ def download_backup(
     db: Session = Depends(get_db),
     current_user=_admin_backups,
     _reason: str = Depends(require_reason),
-) -> FileResponse:
+) -> StreamingResponse:
     job = crud.get_backup_job(db, job_id)
     if job is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Respaldo no encontrado")
@@ -118,12 +145,11 @@ def download_backup(
         filename=file_path.name,
         media_type=media_type,
     )
-    file_bytes = backup_services.read_backup_file(file_path)
     headers = {
         "Content-Disposition": f"attachment; filename=\"{metadata.filename}\"",
     }
-    return Response(
-        content=file_bytes,
+    return StreamingResponse(
+        backup_services.iter_backup_file(file_path),
         media_type=metadata.media_type,
         headers=headers,
     )
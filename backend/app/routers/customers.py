@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from .. import crud, schemas
 from ..core.roles import ADMIN, GESTION_ROLES
 from ..database import get_db
-from ..routers.dependencies import require_reason
+from ..routers.dependencies import cursor_errors, require_reason
 from ..security import require_roles
 from ..services import credit, customer_segments, pos_receipts
 from ..services import credit, customer_reports, pos_receipts
@@ -23,6 +23,7 @@ def _is_superadmin(user: Any, confirmation: bool) -> bool:
 
 @router.get("/", response_model=list[schemas.CustomerResponse], dependencies=[Depends(require_roles(*GESTION_ROLES))])
 def list_customers_endpoint(
+    response: Response,
     q: str | None = Query(default=None, description="Término de búsqueda"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
@@ -47,23 +48,29 @@ def list_customers_endpoint(
         default=None,
         description="Filtra clientes que contengan todas las etiquetas indicadas",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor de la página siguiente (encabezado X-Next-Cursor); reemplaza a offset",
+    ),
     db: Session = Depends(get_db),
     current_user=Depends(require_roles(*GESTION_ROLES)),
 ):
     status_value = status_filter or status_alias
     customer_type_value = customer_type_filter or customer_type_alias
     try:
-        customers = crud.list_customers(
-            db,
-            query=q,
-            limit=limit,
-            offset=offset,
-            status=status_value,
-            customer_type=customer_type_value,
-            has_debt=has_debt,
-            segment_category=segment_category,
-            tags=tags,
-        )
+        with cursor_errors():
+            customers = crud.list_customers(
+                db,
+                query=q,
+                limit=limit,
+                offset=offset,
+                status=status_value,
+                customer_type=customer_type_value,
+                has_debt=has_debt,
+                segment_category=segment_category,
+                tags=tags,
+                cursor=cursor,
+            )
     except ValueError as exc:
         detail = str(exc)
         if detail == "invalid_customer_status":
@@ -96,6 +103,8 @@ def list_customers_endpoint(
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=clientes.csv"},
         )
+    if len(customers) == limit:
+        response.headers["X-Next-Cursor"] = crud.encode_customer_cursor(customers[-1])
     return customers
 
 
@@ -4,9 +4,15 @@ Se agregan utilidades opcionales para permitir flujos iniciales (bootstrap) sin
 romper compatibilidad con dependencias estrictas en rutas protegidas.
 """
 
+from contextlib import contextmanager
+from typing import Any, Iterator
+
 from fastapi import Header, HTTPException, Request, status, Depends
 from fastapi import HTTPException as FastAPIHTTPException
-from typing import Any
+from sqlalchemy.orm import Session
+
+from ..database import get_db, mark_read_only
+from ..utils.keyset import INVALID_CURSOR
 
 try:
     # Importación perezosa para evitar ciclos si cambia la estructura.
@@ -47,6 +53,27 @@ def require_reason_optional(request: Request, x_reason: str | None = Header(defa
     return None
 
 
+@contextmanager
+def cursor_errors() -> Iterator[None]:
+    """Responde 422 cuando el cursor de paginación recibido no es válido."""
+
+    try:
+        yield
+    except ValueError as exc:
+        if str(exc) != INVALID_CURSOR:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Cursor de paginación inválido.",
+        ) from exc
+
+
+def get_read_db(db: Session = Depends(get_db)) -> Session:
+    """Sesión de la petición con lecturas dirigidas al réplica o conexión de sólo lectura."""
+
+    return mark_read_only(db)
+
+
 async def get_current_user_optional(request: Request) -> Any | None:
     """Devuelve el usuario autenticado si existe, o ``None`` si la solicitud no presenta credenciales válidas.
 
@@ -75,4 +102,5 @@ __all__ = [
     "require_reason",
     "require_reason_optional",
     "get_current_user_optional",
+    "get_read_db",
 ]
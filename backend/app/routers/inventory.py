@@ -550,6 +550,7 @@ def upsert_device_identifier(
     dependencies=[Depends(require_roles(ADMIN))],
 )
 def advanced_device_search(
+    q: str | None = Query(default=None, min_length=1, max_length=120),
     imei: str | None = Query(default=None, min_length=10, max_length=18),
     serial: str | None = Query(default=None, min_length=4, max_length=120),
     capacidad_gb: int | None = Query(default=None, ge=0),
@@ -575,6 +576,7 @@ def advanced_device_search(
                             detail="Funcionalidad no disponible")
     try:
         filters = schemas.DeviceSearchFilters(
+            q=q,
             imei=imei,
             serial=serial,
             capacidad_gb=capacidad_gb,
@@ -606,6 +608,7 @@ def advanced_device_search(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=serialized_errors) from exc
     if not any(
         [
+            filters.q,
             filters.imei,
             filters.serial,
             filters.color,
@@ -6,7 +6,7 @@ from datetime import date, datetime
 from io import BytesIO
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
@@ -16,7 +16,8 @@ from ..core.roles import ADMIN, MOVEMENT_ROLES
 from ..database import get_db
 from ..routers.dependencies import require_reason
 from ..security import require_roles
-from ..services import inventory_reports, audit as audit_service
+from ..services import inventory_reports, render_pool, audit as audit_service
+from ..services.streaming_exports import csv_response
 from ..utils import audit as audit_utils
 
 router = APIRouter(prefix="/inventory/counts", tags=["inventario"])
@@ -314,7 +315,9 @@ def inventory_adjustments_report(
         movement_type=models.MovementType.ADJUST,
     )
     if format == "pdf":
-        pdf_bytes = inventory_reports.render_inventory_adjustments_pdf(report)
+        pdf_bytes = render_pool.render(
+            inventory_reports.render_inventory_adjustments_pdf, report
+        )
         buffer = BytesIO(pdf_bytes)
         metadata = schemas.BinaryFileResponse(
             filename="softmobile_ajustes.pdf",
@@ -344,6 +347,7 @@ def inventory_adjustments_report(
     dependencies=[Depends(require_roles(ADMIN))],
 )
 def inventory_audit_report(
+    request: Request,
     format: Literal["pdf", "csv"] = Query(default="pdf"),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
@@ -354,16 +358,6 @@ def inventory_audit_report(
     current_user=Depends(require_roles(ADMIN)),
     _reason: str = Depends(require_reason),
 ):
-    logs = crud.list_audit_logs(
-        db,
-        limit=limit,
-        offset=offset,
-        action="inventory_movement",
-        entity_type="inventory_movement",
-        performed_by_id=performed_by_id,
-        date_from=date_from,
-        date_to=date_to,
-    )
     filters: dict[str, str] = {"Acción": "inventory_movement"}
     if performed_by_id is not None:
         filters["Usuario"] = str(performed_by_id)
@@ -373,6 +367,16 @@ def inventory_audit_report(
         filters["Hasta"] = str(date_to)
 
     if format == "pdf":
+        logs = crud.list_audit_logs(
+            db,
+            limit=limit,
+            offset=offset,
+            action="inventory_movement",
+            entity_type="inventory_movement",
+            performed_by_id=performed_by_id,
+            date_from=date_from,
+            date_to=date_to,
+        )
         summary = audit_utils.summarize_alerts(logs)
         pdf_bytes = audit_service.render_audit_pdf(logs, filters=filters, alerts=summary)
         buffer = BytesIO(pdf_bytes)
@@ -386,7 +390,7 @@ def inventory_audit_report(
             headers=metadata.content_disposition(),
         )
 
-    csv_data = crud.export_audit_logs_csv(
+    rows = crud.iter_audit_log_export_rows(
         db,
         limit=limit,
         offset=offset,
@@ -400,10 +404,8 @@ def inventory_audit_report(
         filename="softmobile_auditoria_inventario.csv",
         media_type="text/csv; charset=utf-8",
     )
-    return PlainTextResponse(
-        csv_data,
-        media_type=metadata.media_type,
-        headers=metadata.content_disposition(),
+    return csv_response(
+        request, rows, metadata=metadata, header=crud.AUDIT_EXPORT_HEADERS
     )
 
 
@@ -11,6 +11,7 @@ from fastapi import (
     HTTPException,
     Path,
     Query,
+    Request,
     Response,
     status,
 )
@@ -27,7 +28,10 @@ from ..services import (
     inventory_import as inventory_import_service,
     inventory_labels,
     hardware,
+    job_queue,
 )
+from ..services.job_handlers import CATALOG_PDF
+from ..services.streaming_exports import XLSX_MEDIA_TYPE, csv_response, file_response
 
 router = APIRouter(prefix="/inventory", tags=["inventario"])
 
@@ -49,6 +53,7 @@ def _parse_commercial_state(value: str | None) -> models.CommercialState | None:
 
 def _render_csv_response(
     *,
+    request: Request,
     db: Session,
     store_id: int,
     search: str | None,
@@ -62,7 +67,7 @@ def _render_csv_response(
     fecha_ingreso_hasta: date | None,
 ) -> Response:
     estado_enum = _parse_commercial_state(estado)
-    csv_data = inventory_import_service.export_devices_csv(
+    rows = inventory_import_service.iter_device_export_rows(
         db,
         store_id,
         search=search,
@@ -79,11 +84,11 @@ def _render_csv_response(
         filename=f"softmobile_catalogo_{store_id}.csv",
         media_type="text/csv",
     )
-    return Response(
-        content=csv_data,
-        media_type=metadata.media_type,
-        headers=metadata.content_disposition(),
-        status_code=status.HTTP_200_OK,
+    return csv_response(
+        request,
+        rows,
+        metadata=metadata,
+        header=inventory_import_service.EXPORT_HEADERS,
     )
 
 
@@ -123,6 +128,7 @@ def _resolve_label_connector(
     dependencies=[Depends(require_roles(ADMIN))],
 )
 def export_devices_legacy(
+    request: Request,
     store_id: int = Path(..., ge=1),
     search: str | None = Query(default=None),
     estado: str | None = Query(default=None),
@@ -140,6 +146,7 @@ def export_devices_legacy(
     """Mantiene la exportación CSV en la ruta histórica."""
 
     return _render_csv_response(
+        request=request,
         db=db,
         store_id=store_id,
         search=search,
@@ -160,6 +167,7 @@ def export_devices_legacy(
     dependencies=[Depends(require_roles(ADMIN))],
 )
 def export_devices_csv(
+    request: Request,
     store_id: int = Path(..., ge=1),
     search: str | None = Query(default=None),
     estado: str | None = Query(default=None),
@@ -177,6 +185,7 @@ def export_devices_csv(
     """Exporta el catálogo de dispositivos en formato CSV dedicado."""
 
     return _render_csv_response(
+        request=request,
         db=db,
         store_id=store_id,
         search=search,
@@ -239,12 +248,60 @@ def export_devices_pdf(
     )
 
 
+@router.post(
+    "/stores/{store_id}/devices/export/pdf/async",
+    response_model=schemas.BackgroundJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_roles(ADMIN))],
+)
+def enqueue_devices_pdf_export(
+    store_id: int = Path(..., ge=1),
+    search: str | None = Query(default=None),
+    estado: str | None = Query(default=None),
+    categoria: str | None = Query(default=None),
+    condicion: str | None = Query(default=None),
+    estado_inventario: str | None = Query(default=None),
+    ubicacion: str | None = Query(default=None),
+    proveedor: str | None = Query(default=None),
+    fecha_ingreso_desde: date | None = Query(default=None),
+    fecha_ingreso_hasta: date | None = Query(default=None),
+    db: Session = Depends(get_db),
+    reason: str = Depends(require_reason),
+    current_user=Depends(require_roles(ADMIN)),
+):
+    """Encola el catálogo PDF; se descarga desde ``/jobs``."""
+
+    estado_enum = _parse_commercial_state(estado)
+    return job_queue.enqueue_job(
+        db,
+        CATALOG_PDF,
+        {
+            "store_id": store_id,
+            "search": search,
+            "estado": estado_enum.value if estado_enum else None,
+            "categoria": categoria,
+            "condicion": condicion,
+            "estado_inventario": estado_inventario,
+            "ubicacion": ubicacion,
+            "proveedor": proveedor,
+            "fecha_ingreso_desde": (
+                fecha_ingreso_desde.isoformat() if fecha_ingreso_desde else None
+            ),
+            "fecha_ingreso_hasta": (
+                fecha_ingreso_hasta.isoformat() if fecha_ingreso_hasta else None
+            ),
+        },
+        created_by_id=current_user.id if current_user else None,
+    )
+
+
 @router.get(
     "/stores/{store_id}/devices/export/xlsx",
     response_model=schemas.BinaryFileResponse,
     dependencies=[Depends(require_roles(ADMIN))],
 )
 def export_devices_excel(
+    request: Request,
     store_id: int = Path(..., ge=1),
     search: str | None = Query(default=None),
     estado: str | None = Query(default=None),
@@ -262,7 +319,7 @@ def export_devices_excel(
     """Genera un catálogo Excel con filtros aplicados."""
 
     estado_enum = _parse_commercial_state(estado)
-    excel_bytes = inventory_catalog_export.render_devices_catalog_excel(
+    workbook = inventory_catalog_export.write_devices_catalog_excel(
         db,
         store_id,
         search=search,
@@ -277,14 +334,9 @@ def export_devices_excel(
     )
     metadata = schemas.BinaryFileResponse(
         filename=f"softmobile_catalogo_{store_id}.xlsx",
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    )
-    return StreamingResponse(
-        BytesIO(excel_bytes),
-        media_type=metadata.media_type,
-        headers=metadata.content_disposition(),
-        status_code=status.HTTP_200_OK,
+        media_type=XLSX_MEDIA_TYPE,
     )
+    return file_response(request, workbook, metadata=metadata, require_if_range=True)
 
 
 @router.get(
@@ -0,0 +1,88 @@
+"""Consulta y descarga de los trabajos en segundo plano."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+
+from .. import models, schemas
+from ..core.roles import ADMIN
+from ..database import get_db
+from ..security import get_current_user
+from ..services import job_queue
+from ..services.streaming_exports import file_response
+
+router = APIRouter(prefix="/jobs", tags=["trabajos"])
+
+
+def _is_admin(user: models.User) -> bool:
+    return any(ur.role.name == ADMIN for ur in user.roles)
+
+
+def _get_visible_job(db: Session, job_id: str, user: models.User) -> models.BackgroundJob:
+    try:
+        job = job_queue.get_job(db, job_id)
+    except LookupError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado"
+        ) from exc
+    # Los usuarios sin rol de administración sólo ven sus propios trabajos.
+    if not _is_admin(user) and job.created_by_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Trabajo no encontrado"
+        )
+    return job
+
+
+@router.get("", response_model=list[schemas.BackgroundJobResponse])
+def list_background_jobs(
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[models.User, Depends(get_current_user)],
+    job_type: str | None = Query(default=None, max_length=60),
+    status_filter: models.BackgroundJobStatus | None = Query(default=None, alias="status"),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+):
+    return job_queue.list_jobs(
+        db,
+        created_by_id=None if _is_admin(current_user) else current_user.id,
+        job_type=job_type,
+        status=status_filter,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.get("/{job_id}", response_model=schemas.BackgroundJobResponse)
+def get_background_job(
+    job_id: str,
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[models.User, Depends(get_current_user)],
+):
+    return _get_visible_job(db, job_id, current_user)
+
+
+@router.get("/{job_id}/download", response_model=schemas.BinaryFileResponse)
+def download_background_job(
+    job_id: str,
+    request: Request,
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[models.User, Depends(get_current_user)],
+):
+    job = _get_visible_job(db, job_id, current_user)
+    if job.status is not models.BackgroundJobStatus.COMPLETED or not job.result_path:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="El trabajo no tiene archivo disponible"
+        )
+    path = Path(job.result_path)
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE, detail="El archivo del trabajo ya no existe"
+        )
+    metadata = schemas.BinaryFileResponse(
+        filename=job.result_filename or path.name,
+        media_type=job.result_media_type or "application/octet-stream",
+    )
+    return file_response(request, open(path, "rb"), metadata=metadata)
@@ -34,6 +34,8 @@ from ..services import (
     credit,
     notifications,
     payments,
+    pos_config_cache,
+    pos_receipt_cache,
     pos_receipts,
     promotions,
 )
@@ -55,6 +57,36 @@ def _ensure_feature_enabled() -> None:
         )
 
 
+def _receipt_debt_context(
+    sale: models.Sale,
+) -> tuple[credit.DebtSnapshot | None, list[dict[str, object]]]:
+    """Resumen de crédito y calendario de una venta a crédito ya registrada."""
+
+    if not (sale.customer and sale.payment_method == models.PaymentMethod.CREDITO):
+        return None, []
+    remaining = Decimal(sale.customer.outstanding_debt or 0).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
+    new_charge = Decimal(sale.total_amount or 0).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
+    previous_balance = (remaining - new_charge).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
+    if previous_balance < Decimal("0"):
+        previous_balance = Decimal("0.00")
+    snapshot = credit.build_debt_snapshot(
+        previous_balance=previous_balance,
+        new_charges=new_charge,
+        payments_applied=Decimal("0"),
+    )
+    schedule_data = credit.build_credit_schedule(
+        base_date=sale.created_at,
+        remaining_balance=snapshot.remaining_balance,
+    )
+    return snapshot, schedule_data
+
+
 def _sale_display_payload(sale: object) -> dict[str, object]:
     items_payload: list[dict[str, object]] = []
     for item in getattr(sale, "items", []) or []:
@@ -184,42 +216,40 @@ def register_pos_sale_endpoint(
             return schemas.POSSaleResponse(status="draft", draft=draft, warnings=[])
 
         # // [PACK34-endpoints]
-        normalized_items: list[schemas.POSCartItem] = []
-        for item in payload.items:
-            try:
-                resolved_device = crud.resolve_device_for_pos(
-                    db,
-                    store_id=payload.store_id,
-                    device_id=item.device_id,
-                    imei=item.imei,
-                )
-            except LookupError as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Dispositivo no encontrado para la venta.",
-                ) from exc
-            normalized_items.append(
-                item.model_copy(
-                    update={
-                        "device_id": resolved_device.id,
-                        "imei": resolved_device.imei or item.imei,
-                    }
-                )
+        try:
+            resolved_devices = crud.resolve_devices_for_pos(
+                db,
+                store_id=payload.store_id,
+                lookups=[(item.device_id, item.imei) for item in payload.items],
             )
+        except LookupError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Dispositivo no encontrado para la venta.",
+            ) from exc
+        normalized_items: list[schemas.POSCartItem] = [
+            item.model_copy(
+                update={
+                    "device_id": resolved_device.id,
+                    "imei": resolved_device.imei or item.imei,
+                }
+            )
+            for item, resolved_device in zip(payload.items, resolved_devices)
+        ]
         normalized_payload = payload.model_copy(
             update={"items": normalized_items})
         config = crud.get_pos_config(db, normalized_payload.store_id)
-        promotions_config = promotions.load_config(config.promotions_config)
+        compiled_promotions = pos_config_cache.get_compiled(config).promotions
         global_enabled = settings.enable_pos_promotions
         switches = promotions.resolve_feature_switches(
             global_volume=global_enabled and settings.enable_pos_promotions_volume,
             global_combo=global_enabled and settings.enable_pos_promotions_combo,
             global_coupon=global_enabled and settings.enable_pos_promotions_coupons,
-            config_flags=promotions_config.feature_flags,
+            config_flags=compiled_promotions.config.feature_flags,
         )
         promo_result = promotions.apply_promotions(
             normalized_payload,
-            config=promotions_config,
+            config=compiled_promotions,
             switches=switches,
         )
         adjusted_payload = promo_result.sale_request
@@ -256,7 +286,6 @@ def register_pos_sale_endpoint(
             sale_schema,
             promo_result.applications,
         )
-        config = crud.get_pos_config(db, sale_detail.store_id)
         snapshot = None
         schedule_data: list[dict[str, object]] = []
         debt_summary: schemas.CustomerDebtSnapshot | None = None
@@ -313,18 +342,16 @@ def register_pos_sale_endpoint(
                     )
                 )
 
-        receipt_pdf = pos_receipts.render_receipt_base64(
-            sale_detail,
-            config,
-            debt_snapshot=snapshot,
-            schedule=schedule_data,
-        )
-        escpos_ticket = pos_receipts.render_receipt_escpos(
+        # Único render del recibo: reimpresiones y envíos lo leen de la caché.
+        receipt = pos_receipt_cache.render_receipt(
+            db,
             sale_detail,
             config,
             debt_snapshot=snapshot,
             schedule=schedule_data,
         )
+        receipt_pdf = receipt.pdf_base64
+        escpos_ticket = receipt.escpos
         if snapshot is not None:
             debt_receipt_pdf_base64 = receipt_pdf
         hardware_config = schemas.POSHardwareSettings.model_validate(
@@ -667,35 +694,14 @@ def download_pos_receipt(
                             detail="Venta no encontrada") from exc
 
     config = crud.get_pos_config(db, sale.store_id)
-    snapshot = None
-    schedule_data: list[dict[str, object]] = []
-    if sale.customer and sale.payment_method == models.PaymentMethod.CREDITO:
-        remaining = Decimal(sale.customer.outstanding_debt or 0).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        new_charge = Decimal(sale.total_amount or 0).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        previous_balance = (remaining - new_charge).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        if previous_balance < Decimal("0"):
-            previous_balance = Decimal("0.00")
-        snapshot = credit.build_debt_snapshot(
-            previous_balance=previous_balance,
-            new_charges=new_charge,
-            payments_applied=Decimal("0"),
-        )
-        schedule_data = credit.build_credit_schedule(
-            base_date=sale.created_at,
-            remaining_balance=snapshot.remaining_balance,
-        )
-    pdf_bytes = pos_receipts.render_receipt_pdf(
+    snapshot, schedule_data = _receipt_debt_context(sale)
+    pdf_bytes = pos_receipt_cache.get_receipt(
+        db,
         sale,
         config,
         debt_snapshot=snapshot,
         schedule=schedule_data,
-    )  # // [PACK34-receipt]
+    ).pdf  # // [PACK34-receipt]
     filename = f"recibo_{config.invoice_prefix}_{sale.id}.pdf"
 
     with transactional_session(db):
@@ -739,7 +745,14 @@ async def send_pos_receipt(
         ) from exc
 
     config = crud.get_pos_config(db, sale.store_id)
-    pdf_bytes = pos_receipts.render_receipt_pdf(sale, config)
+    snapshot, schedule_data = _receipt_debt_context(sale)
+    pdf_bytes = pos_receipt_cache.get_receipt(
+        db,
+        sale,
+        config,
+        debt_snapshot=snapshot,
+        schedule=schedule_data,
+    ).pdf
     document_number = f"{config.invoice_prefix}-{sale.id:06d}"
     receipt_filename = f"recibo_{document_number}.pdf"
     receipt_path = f"/pos/receipt/{sale.id}"
@@ -917,29 +930,27 @@ def register_pos_return_endpoint(
         ) from exc
 
     normalized_reason = payload.reason or "Devolución POS"
-    normalized_items: list[schemas.SaleReturnItem] = []
-    for item in payload.items:
-        try:
-            device = crud.resolve_device_for_pos(
-                db,
-                store_id=sale.store_id,
-                device_id=item.product_id,
-                imei=item.imei,
-            )
-        except LookupError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Dispositivo no localizado en la venta.",
-            ) from exc
-        normalized_items.append(
-            schemas.SaleReturnItem(
-                device_id=device.id,
-                quantity=item.qty,
-                reason=normalized_reason,
-                disposition=item.disposition,
-                warehouse_id=item.warehouse_id,
-            )
+    try:
+        devices = crud.resolve_devices_for_pos(
+            db,
+            store_id=sale.store_id,
+            lookups=[(item.product_id, item.imei) for item in payload.items],
         )
+    except LookupError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Dispositivo no localizado en la venta.",
+        ) from exc
+    normalized_items: list[schemas.SaleReturnItem] = [
+        schemas.SaleReturnItem(
+            device_id=device.id,
+            quantity=item.qty,
+            reason=normalized_reason,
+            disposition=item.disposition,
+            warehouse_id=item.warehouse_id,
+        )
+        for item, device in zip(payload.items, devices)
+    ]
 
     request_payload = schemas.SaleReturnCreate(
         sale_id=sale.id,
@@ -1064,42 +1075,22 @@ def read_pos_sale_detail_endpoint(
             detail="Venta no encontrada.",
         ) from exc
     config = crud.get_pos_config(db, sale.store_id)
-    snapshot = None
-    schedule_data: list[dict[str, object]] = []
+    snapshot, schedule_data = _receipt_debt_context(sale)
     debt_summary = None
-    if sale.customer and sale.payment_method == models.PaymentMethod.CREDITO:
-        remaining = Decimal(sale.customer.outstanding_debt or 0).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        new_charge = Decimal(sale.total_amount or 0).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        previous_balance = (remaining - new_charge).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        if previous_balance < Decimal("0"):
-            previous_balance = Decimal("0.00")
-        snapshot = credit.build_debt_snapshot(
-            previous_balance=previous_balance,
-            new_charges=new_charge,
-            payments_applied=Decimal("0"),
-        )
-        schedule_data = credit.build_credit_schedule(
-            base_date=sale.created_at,
-            remaining_balance=snapshot.remaining_balance,
-        )
+    if snapshot is not None:
         debt_summary = schemas.CustomerDebtSnapshot(
             previous_balance=snapshot.previous_balance,
             new_charges=snapshot.new_charges,
             payments_applied=snapshot.payments_applied,
             remaining_balance=snapshot.remaining_balance,
         )
-    receipt_pdf = pos_receipts.render_receipt_base64(
+    receipt_pdf = pos_receipt_cache.get_receipt(
+        db,
         sale,
         config,
         debt_snapshot=snapshot,
         schedule=schedule_data,
-    )
+    ).pdf_base64
     credit_schedule = [
         schemas.CreditScheduleEntry.model_validate(entry)
         for entry in schedule_data
@@ -1622,7 +1613,6 @@ def get_cash_register_report(
 def enqueue_cash_register_report(
     session_id: int,
     run_inline: bool = Query(default=False),
-    background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
     reason: str = Depends(require_reason),
     current_user=Depends(require_roles(*GESTION_ROLES)),
@@ -1635,11 +1625,13 @@ def enqueue_cash_register_report(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Caja no encontrada",
         ) from exc
-    job = async_jobs.enqueue_cash_report(session_id)
+    job = async_jobs.enqueue_cash_report(
+        db,
+        session_id,
+        created_by_id=current_user.id if current_user else None,
+    )
     if run_inline:
-        job = async_jobs.run_cash_report_job(job.id, db_session=db)
-    elif background_tasks is not None:
-        background_tasks.add_task(async_jobs.run_cash_report_job, job.id)
+        job = async_jobs.run_cash_report_job(db, job.id)
     _ = reason
     return schemas.AsyncJobResponse.model_validate(async_jobs.job_to_payload(job))
 
@@ -1656,11 +1648,11 @@ def get_cash_report_job_status(
 ):
     _ensure_feature_enabled()
     try:
-        job = async_jobs.get_job(job_id)
+        job = async_jobs.get_job(db, job_id)
     except LookupError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Trabajo no encontrado",
         ) from exc
-    _ = db, reason, current_user  # mantener auditoría y compatibilidad
+    _ = reason, current_user  # mantener auditoría y compatibilidad
     return schemas.AsyncJobResponse.model_validate(async_jobs.job_to_payload(job))
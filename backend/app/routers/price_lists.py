@@ -135,6 +135,25 @@ def resolve_device_price_endpoint(
         _raise_lookup(exc)
 
 
+@router.get("/resolve/batch", response_model=list[schemas.PriceResolution])
+def resolve_device_prices_endpoint(
+    device_id: list[int] = Query(min_length=1, max_length=500),
+    store_id: int | None = Query(default=None, ge=1),
+    customer_id: int | None = Query(default=None, ge=1),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_roles(*MOVEMENT_ROLES)),
+) -> list[schemas.PriceResolution]:
+    _ensure_feature_enabled()
+    _ = current_user
+    resolutions = pricing.resolve_device_prices(
+        db,
+        [value for value in device_id if value > 0],
+        store_id=store_id,
+        customer_id=customer_id,
+    )
+    return list(resolutions.values())
+
+
 @router.get("/{price_list_id}", response_model=schemas.PriceListResponse)
 def get_price_list_endpoint(
     price_list_id: int = Path(ge=1),
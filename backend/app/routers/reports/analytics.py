@@ -8,8 +8,7 @@ from sqlalchemy.orm import Session
 
 from backend.app import crud, schemas
 from backend.app.core.roles import ADMIN, REPORTE_ROLES
-from backend.app.database import get_db
-from backend.app.routers.dependencies import require_reason
+from backend.app.routers.dependencies import get_read_db, require_reason
 from backend.app.security import require_roles
 from backend.app.services import analytics as analytics_service
 from backend.app.services import risk_monitor
@@ -27,7 +26,7 @@ def analytics_rotation(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -53,7 +52,7 @@ def analytics_aging(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -79,7 +78,7 @@ def analytics_forecast(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -105,7 +104,7 @@ def analytics_comparative(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -133,7 +132,7 @@ def analytics_profit_margin(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -161,7 +160,7 @@ def analytics_sales_projection(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -184,7 +183,7 @@ def analytics_sales_projection(
 def analytics_categories(
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -201,7 +200,7 @@ def analytics_alerts(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -226,7 +225,7 @@ def analytics_risk(
     date_to: datetime | date | None = Query(default=None),
     discount_threshold: float = Query(default=25.0, ge=0, le=100),
     cancellation_threshold: int = Query(default=1, ge=1, le=50),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -250,7 +249,7 @@ def analytics_realtime(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -280,7 +279,7 @@ def analytics_store_sales_forecast(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(*REPORTE_ROLES)),
 ):
     ensure_analytics_enabled()
@@ -314,7 +313,7 @@ def analytics_reorder_suggestions(
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(*REPORTE_ROLES)),
 ):
     ensure_analytics_enabled()
@@ -347,7 +346,7 @@ def analytics_return_anomalies(
     min_returns: int = Query(default=3, ge=1, le=50),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(*REPORTE_ROLES)),
 ):
     ensure_analytics_enabled()
@@ -373,7 +372,7 @@ def analytics_pdf(
     date_to: date | None = Query(default=None),
     category: str | None = Query(default=None, min_length=1, max_length=120),
     supplier: str | None = Query(default=None, min_length=1, max_length=120),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
     _reason: str = Depends(require_reason),
 ):
@@ -8,10 +8,10 @@ from sqlalchemy.orm import Session
 
 from backend.app import crud, schemas
 from backend.app.core.roles import ADMIN
-from backend.app.database import get_db
-from backend.app.routers.dependencies import require_reason
+from backend.app.routers.dependencies import cursor_errors, get_read_db, require_reason
 from backend.app.security import require_roles
 from backend.app.services import audit as audit_service
+from backend.app.services import page_totals
 from backend.app.utils import audit as audit_utils
 from backend.schemas.common import Page, PageParams
 
@@ -30,39 +30,59 @@ def audit_logs(
     date_from: datetime | date | None = Query(default=None),
     date_to: datetime | date | None = Query(default=None),
     pagination: PageParams = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ) -> Page[schemas.AuditLogResponse]:
     page_offset = pagination.offset if (
         pagination.page > 1 and offset == 0) else offset
     page_size = min(pagination.size, limit)
-    total = crud.count_audit_logs(
+    filters = {
+        "action": action,
+        "entity_type": entity_type,
+        "module": module,
+        "performed_by_id": performed_by_id,
+        "severity": severity,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    total, total_estimated = page_totals.resolve_total(
         db,
-        action=action,
-        entity_type=entity_type,
-        module=module,
-        performed_by_id=performed_by_id,
-        severity=severity,
-        date_from=date_from,
-        date_to=date_to,
-    )
-    logs = crud.list_audit_logs(
-        db,
-        limit=page_size,
-        offset=page_offset,
-        action=action,
-        entity_type=entity_type,
-        module=module,
-        performed_by_id=performed_by_id,
-        severity=severity,
-        date_from=date_from,
-        date_to=date_to,
+        pagination.count,
+        table="audit_logs",
+        filters=filters,
+        count=lambda: crud.count_audit_logs(db, **filters),
     )
+    with cursor_errors():
+        logs = crud.list_audit_logs(
+            db,
+            limit=page_size,
+            offset=page_offset,
+            cursor=pagination.cursor,
+            **filters,
+        )
+    if pagination.keyset:
+        next_cursor = (
+            crud.encode_audit_log_cursor(logs[-1]) if len(logs) == page_size else None
+        )
+        return Page.from_cursor(
+            logs,
+            size=page_size,
+            cursor=pagination.cursor,
+            next_cursor=next_cursor,
+            total=total,
+            total_estimated=total_estimated,
+        )
     page_number = (
         pagination.page if offset == 0 else max(
             1, (page_offset // page_size) + 1)
     )
-    return Page.from_items(logs, page=page_number, size=page_size, total=total)
+    return Page(
+        items=logs,
+        total=total,
+        total_estimated=total_estimated,
+        page=page_number,
+        size=page_size,
+    )
 
 
 @router.get("/audit/pdf", response_model=schemas.BinaryFileResponse)
@@ -76,7 +96,7 @@ def audit_logs_pdf(
     severity: audit_utils.AuditSeverity | None = Query(default=None),
     date_from: datetime | date | None = Query(default=None),
     date_to: datetime | date | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
     _reason: str = Depends(require_reason),
 ):
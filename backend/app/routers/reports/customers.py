@@ -9,8 +9,7 @@ from sqlalchemy.orm import Session
 
 from backend.app import crud, schemas
 from backend.app.core.roles import ADMIN
-from backend.app.database import get_db
-from backend.app.routers.dependencies import require_reason
+from backend.app.routers.dependencies import get_read_db, require_reason
 from backend.app.security import require_roles
 from backend.app.services import customer_reports
 
@@ -26,7 +25,7 @@ def customer_portfolio_report(
     date_from: date | None = Query(default=None),
     date_to: date | None = Query(default=None),
     export: Literal["json", "pdf", "xlsx"] = Query(default="json"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
     x_reason: str | None = Header(default=None, alias="X-Reason"),
 ):
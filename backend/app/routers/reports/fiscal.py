@@ -1,19 +1,24 @@
 from __future__ import annotations
-import calendar
-from datetime import date, datetime
+from datetime import date
 from io import BytesIO
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from backend.app import crud, schemas
+from backend.app import schemas
 from backend.app.core.roles import ADMIN
 from backend.app.database import get_db
-from backend.app.routers.dependencies import require_reason_optional
+from backend.app.routers.dependencies import (
+    get_read_db,
+    require_reason,
+    require_reason_optional,
+)
 from backend.app.security import require_roles
-from backend.app.services import fiscal_books as fiscal_books_service
+from backend.app.services import fiscal_books as fiscal_books_service, job_queue, render_pool
+from backend.app.services.job_handlers import FISCAL_BOOK
+from backend.app.services.streaming_exports import XLSX_MEDIA_TYPE, file_response
 from .common import ensure_fiscal_reports_enabled
 
 router = APIRouter(tags=["reportes"])
@@ -21,45 +26,26 @@ router = APIRouter(tags=["reportes"])
 
 @router.get("/fiscal/books", response_model=schemas.FiscalBookReport)
 def get_fiscal_book_report(
+    request: Request,
     book_type: schemas.FiscalBookType = Query(
         default=schemas.FiscalBookType.SALES),
     year: int = Query(..., ge=2000, le=2100),
     month: int = Query(..., ge=1, le=12),
     export_format: Literal["json", "pdf", "xlsx", "xml"] = Query(
         default="json", alias="format"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
     reason: str | None = Depends(require_reason_optional),
 ):
     ensure_fiscal_reports_enabled()
     try:
-        start_date = date(year, month, 1)
+        date(year, month, 1)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Fecha inválida") from exc
-    last_day = calendar.monthrange(year, month)[1]
-    end_date = date(year, month, last_day)
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
-
-    filters = schemas.FiscalBookFilters(
-        year=year, month=month, book_type=book_type)
-    if book_type is schemas.FiscalBookType.SALES:
-        sales = crud.list_sales(
-            db,
-            date_from=start_dt,
-            date_to=end_dt,
-            limit=None,
-        )
-        report = fiscal_books_service.build_sales_fiscal_book(sales, filters)
-    else:
-        purchases = crud.list_purchase_records_for_report(
-            db,
-            date_from=start_dt,
-            date_to=end_dt,
-        )
-        report = fiscal_books_service.build_purchases_fiscal_book(
-            purchases, filters)
+    report = fiscal_books_service.build_fiscal_book_report(
+        db, book_type=book_type, year=year, month=month
+    )
 
     if export_format != "json" and not reason:
         raise HTTPException(
@@ -70,7 +56,7 @@ def get_fiscal_book_report(
 
     filename_base = f"libro_{book_type.value}_{year}_{month:02d}"
     if export_format == "pdf":
-        pdf_bytes = fiscal_books_service.render_fiscal_book_pdf(report)
+        pdf_bytes = render_pool.render(fiscal_books_service.render_fiscal_book_pdf, report)
         metadata = schemas.BinaryFileResponse(
             filename=f"{filename_base}.pdf",
             media_type="application/pdf",
@@ -81,16 +67,13 @@ def get_fiscal_book_report(
             headers=metadata.content_disposition(),
         )
     if export_format == "xlsx":
-        workbook = fiscal_books_service.render_fiscal_book_excel(report)
+        workbook = render_pool.render_file(
+            fiscal_books_service.render_fiscal_book_excel, report)
         metadata = schemas.BinaryFileResponse(
             filename=f"{filename_base}.xlsx",
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-        return StreamingResponse(
-            workbook,
-            media_type=metadata.media_type,
-            headers=metadata.content_disposition(),
+            media_type=XLSX_MEDIA_TYPE,
         )
+        return file_response(request, workbook, metadata=metadata, require_if_range=True)
     if export_format == "xml":
         xml_buffer = fiscal_books_service.render_fiscal_book_xml(report)
         metadata = schemas.BinaryFileResponse(
@@ -105,3 +88,35 @@ def get_fiscal_book_report(
 
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Formato de exportación no soportado")
+
+
+@router.post(
+    "/fiscal/books/async",
+    response_model=schemas.BackgroundJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def enqueue_fiscal_book_export(
+    book_type: schemas.FiscalBookType = Query(
+        default=schemas.FiscalBookType.SALES),
+    year: int = Query(..., ge=2000, le=2100),
+    month: int = Query(..., ge=1, le=12),
+    export_format: Literal["pdf", "xlsx", "xml"] = Query(
+        default="pdf", alias="format"),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_roles(ADMIN)),
+    _reason: str = Depends(require_reason),
+):
+    """Encola la exportación del libro fiscal; se descarga desde ``/jobs``."""
+
+    ensure_fiscal_reports_enabled()
+    return job_queue.enqueue_job(
+        db,
+        FISCAL_BOOK,
+        {
+            "book_type": book_type.value,
+            "year": year,
+            "month": month,
+            "format": export_format,
+        },
+        created_by_id=current_user.id if current_user else None,
+    )
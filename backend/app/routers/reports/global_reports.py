@@ -4,7 +4,7 @@ from decimal import Decimal
 from io import BytesIO
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
@@ -12,9 +12,16 @@ from backend.app import crud, schemas
 from backend.app.core.roles import ADMIN
 from backend.app.config import settings
 from backend.app.database import get_db
-from backend.app.routers.dependencies import require_reason
+from backend.app.routers.dependencies import get_read_db, require_reason
 from backend.app.security import require_roles
-from backend.app.services import global_reports_data, global_reports_renderers
+from backend.app.services import (
+    global_reports_data,
+    global_reports_renderers,
+    job_queue,
+    render_pool,
+)
+from backend.app.services.streaming_exports import XLSX_MEDIA_TYPE, file_response
+from backend.app.services.job_handlers import GLOBAL_REPORT
 from .common import ensure_analytics_enabled, coerce_datetime
 
 router = APIRouter(tags=["reportes"])
@@ -29,7 +36,7 @@ def global_report_overview(
     date_to: datetime | date | None = Query(default=None),
     module: str | None = Query(default=None, max_length=80),
     severity: schemas.SystemLogLevel | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -53,7 +60,7 @@ def global_report_dashboard(
     date_to: datetime | date | None = Query(default=None),
     module: str | None = Query(default=None, max_length=80),
     severity: schemas.SystemLogLevel | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -73,12 +80,13 @@ def global_report_dashboard(
     response_model=schemas.BinaryFileResponse
 )
 def export_global_report(
+    request: Request,
     format: Literal["pdf", "xlsx", "csv"] = Query(default="pdf"),
     date_from: datetime | date | None = Query(default=None),
     date_to: datetime | date | None = Query(default=None),
     module: str | None = Query(default=None, max_length=80),
     severity: schemas.SystemLogLevel | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
     _reason: str = Depends(require_reason),
 ):
@@ -95,8 +103,8 @@ def export_global_report(
     dashboard = dataset.dashboard
 
     if format == "pdf":
-        pdf_bytes = global_reports_renderers.render_global_report_pdf(
-            overview, dashboard)
+        pdf_bytes = render_pool.render(
+            global_reports_renderers.render_global_report_pdf, overview, dashboard)
         buffer = BytesIO(pdf_bytes)
         metadata = schemas.BinaryFileResponse(
             filename="softmobile_reporte_global.pdf",
@@ -108,17 +116,13 @@ def export_global_report(
             headers=metadata.content_disposition(),
         )
     if format == "xlsx":
-        workbook = global_reports_renderers.render_global_report_xlsx(
-            overview, dashboard)
+        workbook = render_pool.render_file(
+            global_reports_renderers.render_global_report_xlsx, overview, dashboard)
         metadata = schemas.BinaryFileResponse(
             filename="softmobile_reporte_global.xlsx",
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-        return StreamingResponse(
-            workbook,
-            media_type=metadata.media_type,
-            headers=metadata.content_disposition(),
+            media_type=XLSX_MEDIA_TYPE,
         )
+        return file_response(request, workbook, metadata=metadata, require_if_range=True)
     if format == "csv":
         csv_buffer = global_reports_renderers.render_global_report_csv(
             overview, dashboard)
@@ -137,12 +141,45 @@ def export_global_report(
     )
 
 
+@router.post(
+    "/global/export/async",
+    response_model=schemas.BackgroundJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def enqueue_global_report_export(
+    format: Literal["pdf", "xlsx", "csv"] = Query(default="pdf"),
+    date_from: datetime | date | None = Query(default=None),
+    date_to: datetime | date | None = Query(default=None),
+    module: str | None = Query(default=None, max_length=80),
+    severity: schemas.SystemLogLevel | None = Query(default=None),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_roles(ADMIN)),
+    _reason: str = Depends(require_reason),
+):
+    """Encola la exportación del reporte global; se descarga desde ``/jobs``."""
+
+    normalized_from = coerce_datetime(date_from)
+    normalized_to = coerce_datetime(date_to)
+    return job_queue.enqueue_job(
+        db,
+        GLOBAL_REPORT,
+        {
+            "format": format,
+            "date_from": normalized_from.isoformat() if normalized_from else None,
+            "date_to": normalized_to.isoformat() if normalized_to else None,
+            "module": module,
+            "severity": severity.value if severity else None,
+        },
+        created_by_id=current_user.id if current_user else None,
+    )
+
+
 @router.get(
     "/metrics",
     response_model=schemas.InventoryMetricsResponse,
 )
 def inventory_metrics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     metrics = crud.compute_inventory_metrics(
@@ -8,22 +8,21 @@ from sqlalchemy.orm import Session
 
 from backend.app import crud, schemas
 from backend.app.core.roles import ADMIN, GERENTE
-from backend.app.database import get_db
-from backend.app.routers.dependencies import require_reason
+from backend.app.routers.dependencies import get_read_db, require_reason
 from backend.app.security import require_roles
-from backend.app.services import inventory_reports
+from backend.app.services import inventory_reports, render_pool
 
 router = APIRouter(prefix="/inventory", tags=["reportes", "inventario"])
 
 
 @router.get("/pdf")
 def export_inventory_pdf(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN, GERENTE)),
     _reason: str = Depends(require_reason),
 ):
     report = crud.get_inventory_current_report(db)
-    pdf_bytes = inventory_reports.render_inventory_current_pdf(report)
+    pdf_bytes = render_pool.render(inventory_reports.render_inventory_current_pdf, report)
     metadata = schemas.BinaryFileResponse(
         filename="softmobile_inventario.pdf",
         media_type="application/pdf",
@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 
 from backend.app import crud, schemas
 from backend.app.core.roles import ADMIN
-from backend.app.database import get_db
+from backend.app.routers.dependencies import get_read_db
 from backend.app.security import require_roles
 from .common import ensure_analytics_enabled, normalize_sales_range, format_range_value
 
@@ -25,7 +25,7 @@ def get_sales_summary_report(
     date_from: datetime | date | None = Query(default=None, alias="from"),
     date_to: datetime | date | None = Query(default=None, alias="to"),
     branch_id: int | None = Query(default=None, alias="branchId", ge=1),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -53,7 +53,7 @@ def get_sales_by_product_report(
     branch_id: int | None = Query(default=None, alias="branchId", ge=1),
     limit: int = Query(default=20, ge=1, le=100),
     format: Literal["json", "csv"] = Query(default="json"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
@@ -114,7 +114,7 @@ def get_sales_by_product_report(
 def get_cash_close_report(
     target_date: date | None = Query(default=None, alias="date"),
     branch_id: int | None = Query(default=None, alias="branchId", ge=1),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(require_roles(ADMIN)),
 ):
     ensure_analytics_enabled()
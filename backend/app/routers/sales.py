@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 from io import BytesIO
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
@@ -14,7 +14,7 @@ from ..core.roles import MOVEMENT_ROLES
 from ..core.transactions import transactional_session
 from ..core.settings import return_policy_settings
 from ..database import get_db
-from ..routers.dependencies import require_reason
+from ..routers.dependencies import cursor_errors, require_reason
 from ..security import require_roles
 from ..services import audit_logger, sales_reports
 
@@ -76,6 +76,7 @@ def _prepare_sales_report(
     dependencies=[Depends(require_roles(*MOVEMENT_ROLES))],
 )
 def list_sales_endpoint(
+    response: Response,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     store_id: int | None = Query(default=None, ge=1),
@@ -85,22 +86,32 @@ def list_sales_endpoint(
     date_from: datetime | None = Query(default=None),
     date_to: datetime | None = Query(default=None),
     q: str | None = Query(default=None, min_length=1, max_length=120),
+    cursor: str | None = Query(
+        default=None,
+        max_length=512,
+        description="Cursor de la página siguiente (encabezado X-Next-Cursor); reemplaza a offset",
+    ),
     db: Session = Depends(get_db),
     current_user=Depends(require_roles(*MOVEMENT_ROLES)),
 ):
     _ensure_feature_enabled()
     search = q.strip() if q else None
-    return crud.list_sales(
-        db,
-        store_id=store_id,
-        limit=limit,
-        offset=offset,
-        start_date=date_from,
-        end_date=date_to,
-        customer_id=customer_id,
-        performed_by_id=performed_by_id,
-        search=search,
-    )
+    with cursor_errors():
+        sales = crud.list_sales(
+            db,
+            store_id=store_id,
+            limit=limit,
+            offset=offset,
+            start_date=date_from,
+            end_date=date_to,
+            customer_id=customer_id,
+            performed_by_id=performed_by_id,
+            search=search,
+            cursor=cursor,
+        )
+    if len(sales) == limit:
+        response.headers["X-Next-Cursor"] = crud.encode_sale_cursor(sales[-1])
+    return sales
 
 
 @router.get(
@@ -13,8 +13,9 @@ from ..config import settings
 from ..core.roles import ADMIN, GESTION_ROLES
 from ..database import get_db
 from ..models import CommercialState
-from ..routers.dependencies import require_reason
+from ..routers.dependencies import cursor_errors, require_reason
 from ..security import require_roles
+from ..services import page_totals
 
 router = APIRouter(prefix="/stores", tags=["stores"])
 
@@ -289,47 +290,87 @@ def list_devices(
                             "message": "Estado comercial inválido. Usa nuevo, A, B o C.",
                         },
                     ) from exc
+    filters = {
+        "store_id": store_id,
+        "search": search,
+        "estado": estado_enum,
+        "categoria": categoria,
+        "condicion": condicion,
+        "estado_inventario": estado_inventario,
+        "ubicacion": ubicacion,
+        "proveedor": proveedor,
+        "warehouse_id": warehouse_id,
+        "fecha_ingreso_desde": fecha_ingreso_desde,
+        "fecha_ingreso_hasta": fecha_ingreso_hasta,
+    }
     try:
         page_offset = pagination.offset if (
             pagination.page > 1 and offset == 0) else offset
         page_size = min(pagination.size, limit)
-        total = crud.count_store_devices(
-            db,
-            store_id,
-            search=search,
-            estado=estado_enum,
-            categoria=categoria,
-            condicion=condicion,
-            estado_inventario=estado_inventario,
-            ubicacion=ubicacion,
-            proveedor=proveedor,
-            warehouse_id=warehouse_id,
-            fecha_ingreso_desde=fecha_ingreso_desde,
-            fecha_ingreso_hasta=fecha_ingreso_hasta,
-        )
-        devices = crud.list_devices(
+        crud.get_store(db, store_id)
+        total, total_estimated = page_totals.resolve_total(
             db,
-            store_id,
-            search=search,
-            estado=estado_enum,
-            categoria=categoria,
-            condicion=condicion,
-            estado_inventario=estado_inventario,
-            ubicacion=ubicacion,
-            proveedor=proveedor,
-            warehouse_id=warehouse_id,
-            fecha_ingreso_desde=fecha_ingreso_desde,
-            fecha_ingreso_hasta=fecha_ingreso_hasta,
-            limit=page_size,
-            offset=page_offset,
+            pagination.count,
+            table="devices",
+            filters=filters,
+            count=lambda: crud.count_store_devices(
+                db,
+                store_id,
+                search=search,
+                estado=estado_enum,
+                categoria=categoria,
+                condicion=condicion,
+                estado_inventario=estado_inventario,
+                ubicacion=ubicacion,
+                proveedor=proveedor,
+                warehouse_id=warehouse_id,
+                fecha_ingreso_desde=fecha_ingreso_desde,
+                fecha_ingreso_hasta=fecha_ingreso_hasta,
+            ),
         )
-        return Page.from_items(devices, page=pagination.page, size=page_size, total=total)
+        with cursor_errors():
+            devices = crud.list_devices(
+                db,
+                store_id,
+                search=search,
+                estado=estado_enum,
+                categoria=categoria,
+                condicion=condicion,
+                estado_inventario=estado_inventario,
+                ubicacion=ubicacion,
+                proveedor=proveedor,
+                warehouse_id=warehouse_id,
+                fecha_ingreso_desde=fecha_ingreso_desde,
+                fecha_ingreso_hasta=fecha_ingreso_hasta,
+                limit=page_size,
+                offset=page_offset,
+                cursor=pagination.cursor,
+            )
     except LookupError as exc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"code": "store_not_found",
                     "message": "La sucursal solicitada no existe."},
         ) from exc
+    if pagination.keyset:
+        next_cursor = (
+            crud.encode_device_cursor(devices[-1]) if len(devices) == page_size else None
+        )
+        return Page.from_cursor(
+            devices,
+            size=page_size,
+            cursor=pagination.cursor,
+            next_cursor=next_cursor,
+            total=total,
+            total_estimated=total_estimated,
+        )
+    return Page(
+        items=devices,
+        total=total,
+        total_estimated=total_estimated,
+        page=pagination.page,
+        size=page_size,
+    )
 
 
 @router.get(
@@ -5,7 +5,7 @@ import csv
 from datetime import datetime, timezone
 from io import BytesIO, StringIO
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
@@ -16,7 +16,7 @@ from ..config import settings
 from ..core.roles import ADMIN, GESTION_ROLES
 from ..core.transactions import transactional_session
 from ..database import get_db
-from ..routers.dependencies import require_reason, require_reason_optional
+from ..routers.dependencies import cursor_errors, require_reason, require_reason_optional
 from ..security import require_roles
 from ..services import sync as sync_service
 from ..services import sync_conflict_reports
@@ -132,12 +132,13 @@ def enqueue_queue_events(
 )
 def dispatch_queue_events(
     limit: int = Query(default=25, ge=1, le=200),
+    rounds: int = Query(default=1, ge=1, le=500),
     db: Session = Depends(get_db),
     _current_user=Depends(require_roles(*GESTION_ROLES)),
     reason: str | None = Depends(require_reason_optional),
 ):
     _ensure_hybrid_enabled()
-    return sync_queue.dispatch_pending_events(db, limit=limit)
+    return sync_queue.dispatch_pending_events(db, limit=limit, rounds=rounds)
 
 
 # // [PACK35-backend]
@@ -384,16 +385,29 @@ def export_conflicts_excel(
 
 @router.get("/outbox", response_model=list[schemas.SyncOutboxEntryResponse], dependencies=[Depends(require_roles(*GESTION_ROLES))])
 def list_outbox_entries(
+    response: Response,
     status_filter: models.SyncOutboxStatus | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None,
+        max_length=512,
+        description="Cursor de la página siguiente (encabezado X-Next-Cursor); reemplaza a offset",
+    ),
     db: Session = Depends(get_db),
     current_user=Depends(require_roles(*GESTION_ROLES)),
 ):
     _ensure_hybrid_enabled()
     statuses = [status_filter] if status_filter else None
-    entries = crud.list_sync_outbox(
-        db, statuses=statuses, limit=limit, offset=offset)
+    if cursor is None:
+        entries = crud.list_sync_outbox(
+            db, statuses=statuses, limit=limit, offset=offset)
+    else:
+        with cursor_errors():
+            entries = crud.list_sync_outbox_by_cursor(
+                db, statuses=statuses, cursor=cursor, limit=limit)
+    if len(entries) == limit:
+        response.headers["X-Next-Cursor"] = crud.encode_sync_outbox_cursor(entries[-1])
     return entries
 
 
@@ -657,6 +657,7 @@ from .cloud_agent import (
     CloudAgentTaskListResponse,
     CloudAgentTaskStats,
 )
+from .jobs import BackgroundJobResponse
 
 __all__ = [
     "PaymentMethod",
@@ -1202,4 +1203,5 @@ __all__ = [
     "CloudAgentTaskResponse",
     "CloudAgentTaskListResponse",
     "CloudAgentTaskStats",
+    "BackgroundJobResponse",
 ]
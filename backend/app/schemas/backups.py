@@ -4,7 +4,7 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from ..models import BackupComponent, BackupMode
+from ..models import BackupComponent, BackupMode, BackupType
 
 
 class BackupRunRequest(BaseModel):
@@ -15,13 +15,23 @@ class BackupRunRequest(BaseModel):
             "Componentes específicos a incluir en el respaldo. Si se omite se respaldan todos."
         ),
     )
+    tipo: BackupType = Field(
+        default=BackupType.FULL,
+        description=(
+            "Tipo de respaldo. El incremental sólo incluye los cambios desde el último respaldo"
+            " y se genera completo si no existe una cadena válida."
+        ),
+    )
 
 
 class BackupJobResponse(BaseModel):
     id: int
     mode: BackupMode
+    backup_type: BackupType = BackupType.FULL
+    parent_id: int | None = None
+    snapshot_at: datetime | None = None
     executed_at: datetime
-    pdf_path: str
+    pdf_path: str | None
     archive_path: str
     json_path: str
     sql_path: str
@@ -54,6 +64,12 @@ class BackupRestoreRequest(BaseModel):
             "Cuando es verdadero ejecuta el volcado SQL directamente sobre la base de datos activa."
         ),
     )
+    tablas: list[str] | None = Field(
+        default=None,
+        description=(
+            "Tablas del volcado SQL a restaurar. Si no se especifica se restauran todas."
+        ),
+    )
 
 
 class BackupRestoreResponse(BaseModel):
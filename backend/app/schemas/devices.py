@@ -405,6 +405,7 @@ class CatalogProDeviceResponse(DeviceResponse):
 
 
 class DeviceSearchFilters(BaseModel):
+    q: str | None = Field(default=None, max_length=120)
     imei: str | None = Field(default=None, max_length=18)
     serial: str | None = Field(default=None, max_length=120)
     capacidad_gb: int | None = Field(default=None, ge=0)
@@ -422,7 +423,7 @@ class DeviceSearchFilters(BaseModel):
 
     model_config = ConfigDict(extra="forbid", use_enum_values=True)
 
-    @field_validator("imei", "serial", "color", "marca", "modelo", mode="before")
+    @field_validator("q", "imei", "serial", "color", "marca", "modelo", mode="before")
     @classmethod
     def _normalize_text(cls, value: str | None) -> str | None:
         if value is None:
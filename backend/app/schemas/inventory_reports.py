@@ -1,5 +1,5 @@
 from __future__ import annotations
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import Any, Literal
 
@@ -90,11 +90,14 @@ class InventoryValuation(BaseModel):
 
 
 class MovementPeriodSummary(BaseModel):
-    periodo: str
-    total_movimientos: int
-    total_unidades: int
+    periodo: date
+    tipo_movimiento: MovementType
+    total_movimientos: int = 0
+    total_cantidad: int
     total_valor: Decimal
 
+    model_config = ConfigDict(frozen=True)
+
     @field_serializer("total_valor")
     @classmethod
     def _serialize_total_value(cls, value: Decimal) -> float:
@@ -103,10 +106,12 @@ class MovementPeriodSummary(BaseModel):
 
 class MovementTypeSummary(BaseModel):
     tipo_movimiento: MovementType
-    total_movimientos: int
-    total_unidades: int
+    total_movimientos: int = 0
+    total_cantidad: int
     total_valor: Decimal
 
+    model_config = ConfigDict(frozen=True)
+
     @field_serializer("total_valor")
     @classmethod
     def _serialize_total_value(cls, value: Decimal) -> float:
@@ -129,7 +134,7 @@ class MovementReportEntry(BaseModel):
     fecha: datetime
     ultima_accion: AuditTrailInfo | None = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     @field_serializer("valor_total")
     @classmethod
@@ -147,7 +152,9 @@ class InventoryMovementsSummary(BaseModel):
     total_movimientos: int
     total_unidades: int
     total_valor: Decimal
-    por_tipo: list[MovementTypeSummary]
+    por_tipo: tuple[MovementTypeSummary, ...]
+
+    model_config = ConfigDict(frozen=True)
 
     @field_serializer("total_valor")
     @classmethod
@@ -156,9 +163,23 @@ class InventoryMovementsSummary(BaseModel):
 
 
 class InventoryMovementsReport(BaseModel):
-    resumen: InventoryMovementsSummary
-    periodos: list[MovementPeriodSummary]
-    movimientos: list[MovementReportEntry]
+    """Reporte inmutable: la caché lo comparte entre peticiones sin copiarlo.
+
+    ``resumen`` y ``periodos`` cubren todo el rango filtrado y son iguales en
+    cada página; sólo ``movimientos`` se pagina.
+    """
+
+    resumen: InventoryMovementsSummary = Field(
+        description=(
+            "Totales de todos los movimientos del rango filtrado, no sólo los "
+            "de la página de `movimientos`."
+        )
+    )
+    periodos: tuple[MovementPeriodSummary, ...]
+    movimientos: tuple[MovementReportEntry, ...]
+    siguiente_cursor: str | None = None
+
+    model_config = ConfigDict(frozen=True)
 
 
 class TopProductReportItem(BaseModel):
@@ -0,0 +1,36 @@
+"""Esquemas Pydantic de la cola de trabajos en segundo plano."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..models.jobs import BackgroundJobStatus
+
+
+class BackgroundJobResponse(BaseModel):
+    """Estado de un trabajo encolado y, al terminar, de su archivo resultante."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    job_type: str
+    status: BackgroundJobStatus
+    priority: int = Field(ge=1, le=10, description="Prioridad (1=alta, 10=baja)")
+    payload: dict[str, Any] = Field(default_factory=dict)
+    attempts: int = Field(ge=0)
+    max_attempts: int = Field(ge=1)
+    progress: int = Field(ge=0, le=100, description="Avance en porcentaje")
+    progress_message: str | None = None
+    result_filename: str | None = None
+    result_media_type: str | None = None
+    error: str | None = None
+    created_by_id: int | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    expires_at: datetime | None = None
+
+
+__all__ = ["BackgroundJobResponse"]
@@ -301,6 +301,9 @@ class SyncQueueDispatchResult(BaseModel):
     sent: int
     failed: int
     retried: int
+    batches: int = 0
+    duration_seconds: float = 0.0
+    events_per_second: float = 0.0
 
 
 class SyncSessionCompact(BaseModel):
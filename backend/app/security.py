@@ -23,6 +23,7 @@ from sqlalchemy import select
 from . import crud, models, schemas
 from .core.roles import ADMIN
 from .config import settings
+from .core.principal_cache import CachedPrincipal, detached_copy, principal_cache
 from .database import get_db
 
 logger = logging.getLogger(__name__)
@@ -326,6 +327,54 @@ def decode_token(token: str) -> schemas.TokenPayload:
         ) from exc
 
 
+def _build_principal(
+    session: models.ActiveSession,
+    user: models.User,
+    session_token: str,
+) -> CachedPrincipal:
+    return CachedPrincipal(
+        session_token=session_token,
+        session_id=session.id,
+        user_id=user.id,
+        username=user.username,
+        user=detached_copy(user),
+        roles=frozenset(_collect_user_roles(user)),
+        store_ids=frozenset(_collect_user_stores(user)),
+        session_expires_at=session.expires_at,
+    )
+
+
+def _resolve_cached_principal(
+    session_token: str, *, subject: str | None = None
+) -> CachedPrincipal | None:
+    principal = principal_cache.get(session_token)
+    if principal is None:
+        return None
+    if subject is not None and principal.username != subject:
+        principal_cache.invalidate_token(session_token)
+        return None
+    if crud.is_session_expired(principal.session_expires_at):
+        principal_cache.invalidate_token(session_token)
+        return None
+    return principal
+
+
+def _load_session_or_raise(db: Session, session_token: str) -> models.ActiveSession:
+    session = crud.get_active_session_by_token(db, session_token)
+    if session is None or session.revoked_at is not None:
+        logger.debug("Sesión inexistente o revocada para el token presentado")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Sesión inválida o revocada.",
+        )
+    if crud.is_session_expired(session.expires_at):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Sesión expirada.",
+        )
+    return session
+
+
 async def get_current_user(
     request: Request,
     token: str | None = Depends(oauth2_scheme),
@@ -337,41 +386,27 @@ async def get_current_user(
     if token is None and not has_session_cookie and normalized_path in _ANONYMOUS_PATHS:
         return None
 
-    session_token: str | None = None
+    principal: CachedPrincipal | None = None
+    session: models.ActiveSession | None = None
     if token:
         token_payload = decode_token(token)
-        print(
-            f"DEBUG: Token decoded. Sub: {token_payload.sub}, JTI: {token_payload.jti}")
-        if crud.is_jwt_blacklisted(db, token_payload.jti):
-            print("DEBUG: Token blacklisted")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token revocado.",
-            )
+        session_token = token_payload.jti
+        principal = _resolve_cached_principal(
+            session_token, subject=token_payload.sub)
+        if principal is None:
+            if crud.is_jwt_blacklisted(db, token_payload.jti):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token revocado.",
+                )
         if token_payload.token_type != "access":
-            print("DEBUG: Invalid token type")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Tipo de token inválido.",
             )
-        session_token = token_payload.jti
-        session = crud.get_active_session_by_token(db, session_token)
-        if session is None:
-            print(f"DEBUG: Session not found for token {session_token}")
-        elif session.revoked_at is not None:
-            print(f"DEBUG: Session revoked at {session.revoked_at}")
-
-        if session is None or session.revoked_at is not None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Sesión inválida o revocada.",
-            )
-        if crud.is_session_expired(session.expires_at):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Sesión expirada.",
-            )
-        user = crud.get_user_by_username(db, token_payload.sub)
+        if principal is None:
+            session = _load_session_or_raise(db, session_token)
+            user = crud.get_user_by_username(db, token_payload.sub)
     else:
         session_token = request.cookies.get(settings.session_cookie_name)
         if not session_token:
@@ -379,26 +414,30 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Autenticación requerida.",
             )
-        session = crud.get_active_session_by_token(db, session_token)
-        if session is None or session.revoked_at is not None:
+        principal = _resolve_cached_principal(session_token)
+        if principal is None:
+            session = _load_session_or_raise(db, session_token)
+            user = session.user
+
+    if principal is not None:
+        # La copia en cache se incorpora a la sesión actual sin consultar la base.
+        user = (
+            db.merge(principal.user, load=False)
+            if isinstance(db, Session)
+            else principal.user
+        )
+    else:
+        if user is None:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Sesión inválida o revocada.",
-            )
-        if crud.is_session_expired(session.expires_at):
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Usuario no encontrado.")
+        if not user.is_active:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Sesión expirada.",
-            )
-        user = session.user
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Usuario no encontrado.")
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Usuario inactivo.")
-    if session_token:
-        crud.mark_session_used(db, session_token)
+                status_code=status.HTTP_403_FORBIDDEN, detail="Usuario inactivo.")
+        principal = _build_principal(session, user, session_token)
+        principal_cache.put(principal)
+
+    request.state.principal = principal
+    crud.record_session_activity(db, principal.session_id)
     return user
 
 
@@ -525,6 +564,19 @@ def _collect_role_permissions(
     return _aggregate_permissions(records)
 
 
+def _request_principal(request: Request | None, user: Any) -> CachedPrincipal | None:
+    """Recupera el principal resuelto por ``get_current_user`` para la petición."""
+
+    if request is None:
+        return None
+    principal = getattr(request.state, "principal", None)
+    if not isinstance(principal, CachedPrincipal):
+        return None
+    if getattr(user, "id", None) != principal.user_id:
+        return None
+    return principal
+
+
 def _extract_store_scope(request: Request | None) -> int | None:
     if request is None:
         return None
@@ -582,7 +634,12 @@ def require_roles(
         current_user=Depends(get_current_user),
         db: Session | None = Depends(get_db),
     ):
-        user_roles = _collect_user_roles(current_user)
+        principal = _request_principal(request, current_user)
+        user_roles = (
+            set(principal.roles)
+            if principal is not None
+            else _collect_user_roles(current_user)
+        )
         if ADMIN in user_roles:
             return current_user
 
@@ -603,7 +660,11 @@ def require_roles(
         if enforce_store_scope:
             store_scope = _extract_store_scope(request)
             if store_scope is not None:
-                user_stores = _collect_user_stores(current_user)
+                user_stores = (
+                    set(principal.store_ids)
+                    if principal is not None
+                    else _collect_user_stores(current_user)
+                )
                 if user_stores and store_scope not in user_stores:
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
@@ -620,8 +681,12 @@ def require_roles(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="El usuario autenticado no tiene roles asignados.",
                 )
-            permissions = _collect_role_permissions(
-                current_user, db, user_roles)
+            permissions = principal.permissions if principal is not None else None
+            if permissions is None:
+                permissions = _collect_role_permissions(
+                    current_user, db, user_roles)
+                if principal is not None:
+                    principal.permissions = permissions
             if not _has_sensitive_permission(permissions, module_key, normalized_action):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -2,19 +2,18 @@
 from __future__ import annotations
 
 from io import BytesIO
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import cm
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
-from reportlab.graphics.shapes import Drawing, String
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.linecharts import HorizontalLineChart
+if TYPE_CHECKING:
+    from reportlab.graphics.shapes import Drawing
 
 
 def _build_bar_chart(title: str, values: list[float], labels: list[str]) -> Drawing:
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.lib import colors
+    from reportlab.lib.units import cm
+
     drawing = Drawing(400, 200)
     chart = VerticalBarChart()
     chart.data = [values]
@@ -38,6 +37,10 @@ def _build_bar_chart(title: str, values: list[float], labels: list[str]) -> Draw
 
 
 def _build_line_chart(title: str, values: list[float], labels: list[str]) -> Drawing:
+    from reportlab.graphics.charts.linecharts import HorizontalLineChart
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.lib import colors
+
     drawing = Drawing(400, 200)
     chart = HorizontalLineChart()
     chart.data = [values]
@@ -64,6 +67,11 @@ def render_analytics_pdf(
     profit: list[dict[str, Any]] | None = None,
     projection: list[dict[str, Any]] | None = None,
 ) -> bytes:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, title="Softmobile - Analítica avanzada")
     styles = getSampleStyleSheet()
@@ -5,11 +5,6 @@ from datetime import datetime, timezone
 from io import BytesIO
 from typing import Iterable, Mapping
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
-
 from ..models import AuditLog
 from ..utils import audit as audit_utils
 
@@ -22,6 +17,11 @@ def render_audit_pdf(
 ) -> bytes:
     """Construye un PDF en tema oscuro con filtros y alertas visibles."""
 
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
     logs = list(logs)
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, title="Softmobile - Auditoría consolidada")
@@ -0,0 +1,208 @@
+"""Seguimiento incremental de alertas críticas persistentes de auditoría.
+
+Los recordatorios de ``get_persistent_audit_alerts`` agrupan por entidad los
+eventos críticos de la ventana (48 h por omisión). En lugar de releer toda la
+ventana en cada consulta, :class:`PersistentAlertTracker` conserva en memoria
+las marcas de tiempo críticas de cada entidad y sólo lee los eventos nuevos:
+
+- la primera consulta (o una con ventana mayor a la conservada) recorre la
+  ventana completa con el índice ``(severity, created_at)``;
+- después se leen los críticos desde la última marca de agua menos
+  ``OVERLAP_SECONDS``, descartando los ids ya vistos; esto ocurre cuando el
+  propio proceso registró un evento crítico (:meth:`mark_dirty`) o cada
+  ``REFRESH_INTERVAL_SECONDS`` para recoger lo escrito por otros workers.
+
+Los acuses no forman parte del estado: se consultan por entidad al armar la
+respuesta, por lo que un acuse se refleja de inmediato.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .. import models
+
+# Margen hacia atrás de cada lectura incremental para cubrir transacciones tardías.
+OVERLAP_SECONDS = 60.0
+REFRESH_INTERVAL_SECONDS = 5.0
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _from_epoch(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+@dataclass
+class _EntityAlerts:
+    entity_type: str
+    entity_id: str
+    # Segundos epoch en UTC, ordenados; comparar flotantes es mucho más barato.
+    timestamps: list[float] = field(default_factory=list)
+    latest_action: str | None = None
+    latest_details: str | None = None
+
+    def add(self, created_at: float, action: str, details: str | None) -> None:
+        if not self.timestamps or created_at > self.timestamps[-1]:
+            self.latest_action = action
+            self.latest_details = details
+        bisect.insort(self.timestamps, created_at)
+
+    def prune(self, horizon_start: float) -> None:
+        del self.timestamps[: bisect.bisect_left(self.timestamps, horizon_start)]
+
+
+class PersistentAlertTracker:
+    """Estado por entidad de los eventos críticos recientes."""
+
+    def __init__(
+        self,
+        *,
+        overlap_seconds: float = OVERLAP_SECONDS,
+        refresh_interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        self._overlap = timedelta(seconds=overlap_seconds)
+        self._refresh_interval = refresh_interval_seconds
+        self._lock = threading.Lock()
+        self._entities: dict[tuple[str, str], _EntityAlerts] = {}
+        self._seen_ids: dict[int, datetime] = {}
+        self._horizon: timedelta | None = None
+        self._watermark: datetime | None = None
+        self._synced_at = 0.0
+        self._dirty = False
+
+    def mark_dirty(self) -> None:
+        """Pide releer los eventos nuevos en la siguiente consulta."""
+
+        self._dirty = True
+
+    def reset(self) -> None:
+        """Descarta el estado; la siguiente consulta recorre la ventana completa."""
+
+        with self._lock:
+            self._entities.clear()
+            self._seen_ids.clear()
+            self._horizon = None
+            self._watermark = None
+            self._dirty = False
+
+    def alerts(
+        self,
+        db: Session,
+        *,
+        threshold_minutes: int,
+        min_occurrences: int,
+        lookback_hours: int,
+        limit: int,
+        reference_time: datetime | None = None,
+    ) -> tuple[list[dict[str, object]], bool]:
+        """Alertas persistentes y si se resolvieron sin recorrer la ventana.
+
+        Produce el mismo resultado que ``identify_persistent_critical_alerts``
+        sobre los eventos críticos de las últimas ``lookback_hours`` horas.
+        """
+
+        now = _as_utc(reference_time or datetime.now(timezone.utc))
+        lookback = timedelta(hours=lookback_hours)
+        with self._lock:
+            hit = self._sync(db, now=now, lookback=lookback)
+            reference = now.timestamp()
+            lookback_start = reference - lookback.total_seconds()
+            threshold = threshold_minutes * 60.0
+            candidates: list[dict[str, object]] = []
+            for state in self._entities.values():
+                last_seen = state.timestamps[-1]
+                if last_seen < lookback_start:
+                    continue
+                if threshold_minutes > 0 and reference - last_seen > threshold:
+                    continue
+                start = bisect.bisect_left(state.timestamps, lookback_start)
+                occurrences = len(state.timestamps) - start
+                if occurrences < min_occurrences:
+                    continue
+                candidates.append(
+                    {
+                        "entity_type": state.entity_type,
+                        "entity_id": state.entity_id,
+                        "first_seen": _from_epoch(state.timestamps[start]),
+                        "last_seen": _from_epoch(last_seen),
+                        "occurrences": occurrences,
+                        "latest_action": state.latest_action,
+                        "latest_details": state.latest_details,
+                    }
+                )
+        candidates.sort(key=lambda item: item["last_seen"], reverse=True)
+        return candidates[:limit], hit
+
+    def _sync(self, db: Session, *, now: datetime, lookback: timedelta) -> bool:
+        if self._horizon is None or lookback > self._horizon:
+            self._entities.clear()
+            self._seen_ids.clear()
+            self._horizon = lookback
+            self._watermark = now - lookback
+            self._dirty = False
+            self._load(db, since=self._watermark)
+            self._synced_at = time.monotonic()
+            return False
+        if self._dirty or time.monotonic() - self._synced_at >= self._refresh_interval:
+            self._dirty = False
+            since = (self._watermark or now - lookback) - self._overlap
+            self._load(db, since=since)
+            self._prune((now - self._horizon).timestamp())
+            self._synced_at = time.monotonic()
+        return True
+
+    def _load(self, db: Session, *, since: datetime) -> None:
+        log = models.AuditLog
+        rows = db.execute(
+            select(
+                log.id, log.entity_type, log.entity_id, log.action, log.details, log.created_at
+            )
+            .where(log.severity == "critical", log.created_at >= since)
+            .order_by(log.created_at.asc(), log.id.asc())
+        ).all()
+        for row in rows:
+            if row.id in self._seen_ids:
+                continue
+            created_at = _as_utc(row.created_at)
+            self._seen_ids[row.id] = created_at
+            key = (row.entity_type, row.entity_id)
+            state = self._entities.get(key)
+            if state is None:
+                state = self._entities[key] = _EntityAlerts(row.entity_type, row.entity_id)
+            state.add(created_at.timestamp(), row.action, row.details)
+            if self._watermark is None or created_at > self._watermark:
+                self._watermark = created_at
+        # Los ids sólo sirven para descartar repetidos dentro del margen de lectura.
+        if self._watermark is not None:
+            overlap_start = self._watermark - self._overlap
+            stale = [row_id for row_id, seen in self._seen_ids.items() if seen < overlap_start]
+            for row_id in stale:
+                del self._seen_ids[row_id]
+
+    def _prune(self, horizon_start: float) -> None:
+        expired = [
+            key
+            for key, state in self._entities.items()
+            if not state.timestamps or state.timestamps[-1] < horizon_start
+        ]
+        for key in expired:
+            del self._entities[key]
+        for state in self._entities.values():
+            state.prune(horizon_start)
+
+
+persistent_alert_tracker = PersistentAlertTracker()
+
+
+__all__ = ["PersistentAlertTracker", "persistent_alert_tracker"]
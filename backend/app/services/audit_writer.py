@@ -0,0 +1,383 @@
+"""Escritura asíncrona y en lote de la bitácora de auditoría.
+
+``log_audit_event`` inserta el ``AuditLog`` y su ``SystemLog`` dentro de la
+transacción del llamador; es el modo estricto y lo siguen usando todas las
+mutaciones. Los eventos que no dependen de esa transacción (por ejemplo, cada
+búsqueda del catálogo) pueden enviarse con :func:`submit_audit_event`:
+
+1. el evento se normaliza con ``prepare_audit_entry`` y se anexa como una
+   línea JSON al diario local (``AUDIT_SPILL_PATH``) antes de encolarse;
+2. un hilo en segundo plano agrupa hasta ``AUDIT_BATCH_SIZE`` eventos (o lo
+   acumulado en ``AUDIT_FLUSH_INTERVAL_SECONDS``), los inserta con
+   ``write_audit_entries`` en su propia sesión y confirma;
+3. tras cada lote confirmado se guarda el desplazamiento del diario en
+   ``<diario>.offset``; cuando no queda nada pendiente el diario se trunca.
+
+Al iniciar, las líneas posteriores al último desplazamiento confirmado se
+reproducen, de modo que un cierre abrupto no pierde eventos aceptados (la
+entrega es "al menos una vez"). Si la cola está llena o el escritor no está
+activo, el evento se registra de forma síncrona como antes.
+
+Cada proceso escribe su propio diario (``audit_spill.<pid>.jsonl``) y lo
+mantiene bloqueado con ``flock`` mientras vive, así que varios workers no
+se truncan ni se pisan el desplazamiento. Al arrancar, un worker reproduce
+también los diarios que ya nadie bloquea (procesos terminados) y los borra.
+En plataformas sin ``fcntl`` sólo se reproduce el diario propio.
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:  # pragma: no cover - `fcntl` no existe en Windows
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+from sqlalchemy.orm import Session
+
+from backend.core.logging import logger as core_logger
+
+from .. import crud
+from ..config import settings
+
+logger = core_logger.bind(component=__name__)
+
+SessionFactory = Callable[[], Session]
+
+
+class AuditWriter(threading.Thread):
+    """Hilo que vacía la cola de auditoría en lotes."""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        spill_path: str | os.PathLike[str],
+        max_queue_size: int = 10_000,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 1.0,
+    ) -> None:
+        super().__init__(name="audit-writer", daemon=True)
+        self._session_factory = session_factory
+        self._spill_path = Path(spill_path)
+        self._offset_path = self._spill_path.with_name(self._spill_path.name + ".offset")
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(0.01, flush_interval_seconds)
+        self._queue: queue.Queue[tuple[int, dict[str, object]]] = queue.Queue(
+            maxsize=max(1, max_queue_size)
+        )
+        self._journal_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Tras abandonar un lote el desplazamiento ya no avanza: se reproduce todo.
+        self._abandoned = False
+        self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal = open(self._spill_path, "ab")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._journal.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Otro proceso vivo es dueño de este diario.
+                self._journal.close()
+                raise
+
+    @property
+    def spill_path(self) -> Path:
+        return self._spill_path
+
+    def submit(self, entry: Mapping[str, object]) -> bool:
+        """Anexa ``entry`` al diario y la encola; ``False`` si la cola está llena."""
+
+        line = json.dumps(entry, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+        with self._journal_lock:
+            if self._journal.closed:
+                return False
+            start = self._journal.tell()
+            self._journal.write(line)
+            self._journal.flush()
+            try:
+                self._queue.put_nowait((start + len(line), dict(entry)))
+            except queue.Full:
+                # El evento no se aceptó: se retira del diario para no duplicarlo.
+                self._journal.truncate(start)
+                self._journal.seek(start)
+                return False
+        return True
+
+    def recover(self) -> int:
+        """Escribe las líneas del diario posteriores al último lote confirmado."""
+
+        offset = self._read_offset()
+        with self._journal_lock:
+            self._journal.flush()
+            with open(self._spill_path, "rb") as journal:
+                journal.seek(offset)
+                pending = journal.read()
+        entries: list[dict[str, object]] = []
+        for raw in pending.splitlines():
+            try:
+                entries.append(json.loads(raw))
+            except ValueError:
+                # Una línea a medio escribir al caer el proceso no es un evento aceptado.
+                logger.warning("Línea inválida en el diario de auditoría omitida")
+        for start in range(0, len(entries), self._batch_size):
+            self._write(entries[start : start + self._batch_size])
+        with self._journal_lock:
+            if self._queue.unfinished_tasks == 0:
+                self._reset_journal()
+        return len(entries)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Espera a que todos los eventos encolados se hayan procesado."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._commit_batch(batch)
+            elif self._stop_event.is_set():
+                break
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Detiene el hilo después de vaciar la cola."""
+
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout=timeout)
+        with self._journal_lock:
+            self._journal.close()
+
+    def _next_batch(self) -> list[tuple[int, dict[str, object]]]:
+        try:
+            first = self._queue.get(timeout=self._flush_interval)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if self._stop_event.is_set() or remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _commit_batch(self, batch: list[tuple[int, dict[str, object]]]) -> None:
+        entries = [entry for _, entry in batch]
+        try:
+            while True:
+                try:
+                    self._write(entries)
+                except Exception:
+                    logger.exception(
+                        "No se pudo escribir el lote de auditoría", size=len(entries)
+                    )
+                    # Al detenerse, el lote queda en el diario y se reproduce al reiniciar.
+                    if self._stop_event.wait(self._flush_interval):
+                        self._abandoned = True
+                        return
+                    continue
+                self._checkpoint(batch[-1][0], in_flight=len(batch))
+                return
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, entries: list[dict[str, object]]) -> None:
+        with self._session_factory() as session:
+            crud.write_audit_entries(session, entries)
+            session.commit()
+
+    def _checkpoint(self, offset: int, *, in_flight: int) -> None:
+        with self._journal_lock:
+            if self._abandoned or self._journal.closed:
+                return
+            # Si el lote confirmado era lo único pendiente, el diario completo está escrito.
+            if self._queue.unfinished_tasks == in_flight and offset >= self._journal.tell():
+                self._reset_journal()
+            else:
+                self._write_offset(offset)
+
+    def _reset_journal(self) -> None:
+        self._journal.truncate(0)
+        self._journal.seek(0)
+        self._offset_path.unlink(missing_ok=True)
+
+    def _read_offset(self) -> int:
+        try:
+            return int(self._offset_path.read_text(encoding="utf-8").strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _write_offset(self, offset: int) -> None:
+        temporary = self._offset_path.with_name(self._offset_path.name + ".tmp")
+        temporary.write_text(str(offset), encoding="utf-8")
+        os.replace(temporary, self._offset_path)
+
+
+def process_spill_path(base: str | os.PathLike[str], pid: int | None = None) -> Path:
+    """Diario propio del proceso: ``audit_spill.jsonl`` → ``audit_spill.<pid>.jsonl``."""
+
+    path = Path(base)
+    return path.with_name(f"{path.stem}.{pid or os.getpid()}{path.suffix}")
+
+
+def replay_orphaned_journals(
+    session_factory: SessionFactory,
+    base: str | os.PathLike[str],
+    *,
+    batch_size: int = 200,
+) -> int:
+    """Reproduce y borra los diarios de procesos que ya terminaron.
+
+    Un diario cuyo bloqueo puede tomarse no tiene dueño vivo. Incluye el
+    diario compartido ``base`` de versiones anteriores.
+    """
+
+    if fcntl is None:
+        return 0
+    path = Path(base)
+    own = process_spill_path(path)
+    candidates = sorted(path.parent.glob(f"{path.stem}.*{path.suffix}"))
+    if path.exists():
+        candidates.append(path)
+    recovered = 0
+    for candidate in candidates:
+        if candidate == own:
+            continue
+        try:
+            orphan = AuditWriter(session_factory, spill_path=candidate, batch_size=batch_size)
+        except OSError:
+            continue
+        try:
+            recovered += orphan.recover()
+        finally:
+            orphan.stop()
+        if candidate.stat().st_size == 0:
+            candidate.unlink(missing_ok=True)
+    return recovered
+
+
+_writer: AuditWriter | None = None
+
+
+def get_audit_writer() -> AuditWriter | None:
+    """Escritor activo, o ``None`` si la auditoría asíncrona está apagada."""
+
+    if _writer is not None and _writer.is_alive():
+        return _writer
+    return None
+
+
+def start_audit_writer(
+    session_factory: SessionFactory | None = None,
+) -> AuditWriter | None:
+    """Reproduce el diario pendiente e inicia el escritor si está habilitado."""
+
+    global _writer
+    if not settings.audit_async_enabled:
+        return None
+    if get_audit_writer() is not None:
+        return _writer
+    if session_factory is None:
+        from ..database import SessionLocal
+
+        session_factory = SessionLocal
+    writer = AuditWriter(
+        session_factory,
+        spill_path=process_spill_path(settings.audit_spill_path),
+        max_queue_size=settings.audit_queue_max_size,
+        batch_size=settings.audit_batch_size,
+        flush_interval_seconds=settings.audit_flush_interval_seconds,
+    )
+    try:
+        recovered = writer.recover()
+        recovered += replay_orphaned_journals(
+            session_factory, settings.audit_spill_path, batch_size=settings.audit_batch_size
+        )
+    except Exception:
+        # Sin base disponible el diario se conserva para el siguiente arranque.
+        logger.exception("No se pudo reproducir el diario de auditoría")
+        writer.stop()
+        return None
+    if recovered:
+        logger.info("Eventos de auditoría reproducidos desde el diario", count=recovered)
+    writer.start()
+    _writer = writer
+    return writer
+
+
+def stop_audit_writer(timeout: float = 10.0) -> None:
+    """Vacía la cola pendiente y detiene el escritor."""
+
+    global _writer
+    if _writer is not None:
+        _writer.stop(timeout=timeout)
+        _writer = None
+
+
+def submit_audit_event(
+    db: Session,
+    *,
+    action: str,
+    entity_type: str,
+    entity_id: str | int,
+    performed_by_id: int | None,
+    details: str | Mapping[str, object] | None = None,
+) -> bool:
+    """Registra un evento que no depende de la transacción de ``db``.
+
+    Devuelve ``True`` si quedó encolado para el escritor en segundo plano y
+    ``False`` si se registró de forma síncrona con ``log_audit_event``.
+    """
+
+    writer = get_audit_writer()
+    if writer is not None:
+        entry = crud.prepare_audit_entry(
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            performed_by_id=performed_by_id,
+            details=details,
+        )
+        entry["created_at"] = datetime.now(timezone.utc).isoformat()
+        if writer.submit(entry):
+            return True
+    crud.log_audit_event(
+        db,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        performed_by_id=performed_by_id,
+        details=details,
+    )
+    return False
+
+
+__all__ = [
+    "AuditWriter",
+    "get_audit_writer",
+    "process_spill_path",
+    "replay_orphaned_journals",
+    "start_audit_writer",
+    "stop_audit_writer",
+    "submit_audit_event",
+]
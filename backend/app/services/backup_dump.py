@@ -0,0 +1,725 @@
+"""Volcado SQL por flujo para los respaldos empresariales.
+
+El volcado se escribe en disco como una secuencia de bloques de tamaño fijo:
+cada bloque contiene sentencias SQL completas, se comprime con ``zlib`` y, si
+el respaldo está cifrado, se sella con Fernet de forma independiente. Cada
+tabla inicia en un bloque nuevo, de modo que el manifiesto puede registrar su
+desplazamiento y longitud en bytes y la restauración puede leer únicamente
+las tablas solicitadas sin descifrar el archivo completo.
+
+Los volcados incrementales usan el mismo formato, pero sólo contienen las
+filas modificadas desde un corte previo (``INSERT ... ON CONFLICT DO UPDATE``)
+y las bajas registradas en el historial de cambios, de modo que se aplican
+sobre un volcado completo sin vaciar las tablas.
+
+Formato del archivo::
+
+    SMSQLDUMP1\\n <flags:1 byte> ( <longitud:uint32 big-endian> <bloque> )*
+"""
+from __future__ import annotations
+
+import enum
+import itertools
+import re
+import struct
+import zlib
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from cryptography.fernet import Fernet
+from sqlalchemy import Table, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..database import Base as DatabaseBase
+
+DUMP_MAGIC = b"SMSQLDUMP1\n"
+DUMP_FORMAT = "chunked-v1"
+DUMP_KIND_FULL = "full"
+DUMP_KIND_INCREMENTAL = "incremental"
+EXCLUDED_TABLES: frozenset[str] = frozenset({"backup_jobs"})
+
+_FLAG_COMPRESSED = 0x01
+_FLAG_ENCRYPTED = 0x02
+_FRAME_HEADER = struct.Struct(">I")
+_SQL_TOKEN = re.compile(r"['\";]")
+_TRANSACTION_STATEMENTS = frozenset({"BEGIN TRANSACTION", "BEGIN", "COMMIT"})
+_UPDATE_TRACKING_COLUMNS = ("updated_at", "fecha_actualizacion")
+# Bitácoras de sólo inserción: la marca de alta basta para detectar cambios.
+APPEND_ONLY_TABLES: dict[str, str] = {
+    "audit_logs": "created_at",
+    "audit_ui": "ts",
+    "cost_ledger": "timestamp",
+    "customer_ledger_entries": "created_at",
+    "errores_sistema": "fecha",
+    "logs_sistema": "fecha",
+    "purchase_order_status_events": "created_at",
+    "rma_events": "created_at",
+    "stock_moves": "timestamp",
+    "supplier_ledger_entries": "created_at",
+    "sync_attempts": "attempted_at",
+}
+
+
+@dataclass(slots=True)
+class DumpSegment:
+    """Rango de bytes dentro del archivo de volcado."""
+
+    offset: int
+    length: int
+    chunks: int
+
+
+@dataclass(slots=True)
+class TableDumpEntry:
+    """Ubicación y volumen de una tabla dentro del volcado."""
+
+    name: str
+    rows: int
+    offset: int
+    length: int
+    chunks: int
+
+
+@dataclass(slots=True)
+class SqlDumpManifest:
+    """Índice del volcado que se guarda en los metadatos del respaldo."""
+
+    chunk_size: int
+    encrypted: bool
+    compression: str = "zlib"
+    format: str = DUMP_FORMAT
+    kind: str = DUMP_KIND_FULL
+    since: str | None = None
+    preamble: DumpSegment | None = None
+    epilogue: DumpSegment | None = None
+    tables: list[TableDumpEntry] = field(default_factory=list)
+    deletions: list[TableDumpEntry] = field(default_factory=list)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(entry.rows for entry in self.tables)
+
+    @property
+    def is_incremental(self) -> bool:
+        return self.kind == DUMP_KIND_INCREMENTAL
+
+    def table(self, name: str) -> TableDumpEntry | None:
+        for entry in self.tables:
+            if entry.name == name:
+                return entry
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["total_rows"] = self.total_rows
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "SqlDumpManifest":
+        def _segment(raw: dict[str, Any] | None) -> DumpSegment | None:
+            return DumpSegment(**raw) if raw else None
+
+        return cls(
+            chunk_size=int(payload.get("chunk_size", 0)),
+            encrypted=bool(payload.get("encrypted", False)),
+            compression=str(payload.get("compression", "zlib")),
+            format=str(payload.get("format", DUMP_FORMAT)),
+            kind=str(payload.get("kind", DUMP_KIND_FULL)),
+            since=payload.get("since"),
+            preamble=_segment(payload.get("preamble")),
+            epilogue=_segment(payload.get("epilogue")),
+            tables=[TableDumpEntry(**entry) for entry in payload.get("tables", [])],
+            deletions=[
+                TableDumpEntry(**entry) for entry in payload.get("deletions", [])
+            ],
+        )
+
+
+def to_sql_literal(value: Any) -> str:
+    """Convierte un valor Python en un literal SQL portable."""
+
+    if value is None:
+        return "NULL"
+    if isinstance(value, enum.Enum):
+        return to_sql_literal(value.name)
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return f"'{value.isoformat()}'"
+    if isinstance(value, date):
+        return f"'{value.isoformat()}'"
+    if isinstance(value, bytes):
+        return "X'" + value.hex() + "'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class _ChunkWriter:
+    """Agrupa texto SQL en bloques comprimidos y cifrados de tamaño fijo."""
+
+    def __init__(
+        self,
+        handle: BinaryIO,
+        *,
+        cipher: Fernet | None,
+        chunk_size: int,
+        offset: int,
+    ) -> None:
+        self._handle = handle
+        self._cipher = cipher
+        self._chunk_size = max(int(chunk_size), 1024)
+        self._buffer = bytearray()
+        self.offset = offset
+        self.chunks = 0
+
+    def write(self, statement: str) -> None:
+        self._buffer.extend(statement.encode("utf-8"))
+        if len(self._buffer) >= self._chunk_size:
+            self._emit()
+
+    def flush(self) -> int:
+        if self._buffer:
+            self._emit()
+        return self.offset
+
+    def _emit(self) -> None:
+        payload = zlib.compress(bytes(self._buffer), 6)
+        if self._cipher is not None:
+            payload = self._cipher.encrypt(payload)
+        self._handle.write(_FRAME_HEADER.pack(len(payload)))
+        self._handle.write(payload)
+        self.offset += _FRAME_HEADER.size + len(payload)
+        self.chunks += 1
+        self._buffer.clear()
+
+
+def _insert_statement(
+    table: Table, columns: str, rows: Iterable[Any], *, upsert: bool = False
+) -> str:
+    values = ", ".join(
+        "(" + ", ".join(to_sql_literal(row[column.name]) for column in table.columns) + ")"
+        for row in rows
+    )
+    statement = f'INSERT INTO "{table.name}" ({columns}) VALUES {values}'
+    if upsert:
+        statement += _upsert_clause(table)
+    return statement + ";\n"
+
+
+def _upsert_clause(table: Table) -> str:
+    keys = [column.name for column in table.primary_key.columns]
+    conflict = ", ".join(f'"{name}"' for name in keys)
+    updates = ", ".join(
+        f'"{column.name}" = excluded."{column.name}"'
+        for column in table.columns
+        if column.name not in keys
+    )
+    if not updates:
+        return f" ON CONFLICT ({conflict}) DO NOTHING"
+    return f" ON CONFLICT ({conflict}) DO UPDATE SET {updates}"
+
+
+def _is_referenced(table: Table) -> bool:
+    return any(
+        foreign_key.column.table is table
+        for other in DatabaseBase.metadata.sorted_tables
+        if other is not table
+        for foreign_key in other.foreign_keys
+    )
+
+
+def _tracking_column(table: Table):
+    candidates = (APPEND_ONLY_TABLES.get(table.name), *_UPDATE_TRACKING_COLUMNS)
+    for name in candidates:
+        if name is not None and name in table.columns:
+            return table.columns[name]
+    return None
+
+
+class _DumpWriter:
+    """Escribe el encabezado, los segmentos por tabla y el cierre del volcado."""
+
+    def __init__(
+        self,
+        handle: BinaryIO,
+        manifest: SqlDumpManifest,
+        *,
+        cipher: Fernet | None,
+        chunk_size: int,
+    ) -> None:
+        flags = _FLAG_COMPRESSED | (_FLAG_ENCRYPTED if cipher is not None else 0)
+        handle.write(DUMP_MAGIC + bytes([flags]))
+        self.manifest = manifest
+        self._writer = _ChunkWriter(
+            handle,
+            cipher=cipher,
+            chunk_size=chunk_size,
+            offset=len(DUMP_MAGIC) + 1,
+        )
+        self._start = self._writer.offset
+        self._chunks_before = self._writer.chunks
+
+    def begin_segment(self) -> None:
+        self._start = self._writer.offset
+        self._chunks_before = self._writer.chunks
+
+    def write(self, statement: str) -> None:
+        self._writer.write(statement)
+
+    def end_segment(self) -> DumpSegment:
+        end = self._writer.flush()
+        return DumpSegment(
+            offset=self._start,
+            length=end - self._start,
+            chunks=self._writer.chunks - self._chunks_before,
+        )
+
+    def write_preamble(self) -> None:
+        self.begin_segment()
+        self.write("BEGIN TRANSACTION;\n")
+        self.manifest.preamble = self.end_segment()
+
+    def write_epilogue(self) -> None:
+        self.begin_segment()
+        self.write("COMMIT;\n")
+        self.manifest.epilogue = self.end_segment()
+
+    def write_rows(
+        self, db: Session, statement, table: Table, *, batch_size: int, upsert: bool
+    ) -> int:
+        columns = ", ".join(f'"{column.name}"' for column in table.columns)
+        row_count = 0
+        result = db.execute(statement.execution_options(yield_per=batch_size))
+        for partition in result.mappings().partitions():
+            self.write(_insert_statement(table, columns, partition, upsert=upsert))
+            row_count += len(partition)
+        return row_count
+
+
+def _table_entry(name: str, rows: int, segment: DumpSegment) -> TableDumpEntry:
+    return TableDumpEntry(
+        name=name,
+        rows=rows,
+        offset=segment.offset,
+        length=segment.length,
+        chunks=segment.chunks,
+    )
+
+
+def write_sql_dump(
+    db: Session,
+    destination: Path,
+    *,
+    cipher: Fernet | None,
+    chunk_size: int,
+    batch_rows: int,
+    excluded_tables: Iterable[str] = EXCLUDED_TABLES,
+) -> SqlDumpManifest:
+    """Genera el volcado SQL leyendo cada tabla por lotes con cursores de servidor."""
+
+    excluded = set(excluded_tables)
+    manifest = SqlDumpManifest(chunk_size=chunk_size, encrypted=cipher is not None)
+    batch_size = max(int(batch_rows), 1)
+
+    with destination.open("wb") as handle:
+        writer = _DumpWriter(handle, manifest, cipher=cipher, chunk_size=chunk_size)
+        writer.write_preamble()
+        for table in DatabaseBase.metadata.sorted_tables:
+            if table.name in excluded:
+                continue
+            writer.begin_segment()
+            writer.write(f'DELETE FROM "{table.name}";\n')
+            row_count = writer.write_rows(
+                db, select(table), table, batch_size=batch_size, upsert=False
+            )
+            manifest.tables.append(
+                _table_entry(table.name, row_count, writer.end_segment())
+            )
+        writer.write_epilogue()
+
+    return manifest
+
+
+def write_sql_delta(
+    db: Session,
+    destination: Path,
+    *,
+    since: datetime,
+    deleted_keys: Mapping[str, Iterable[Any]],
+    cipher: Fernet | None,
+    chunk_size: int,
+    batch_rows: int,
+    excluded_tables: Iterable[str] = EXCLUDED_TABLES,
+) -> SqlDumpManifest:
+    """Genera un volcado incremental con los cambios posteriores a ``since``.
+
+    Las tablas con ``updated_at`` (o las bitácoras de ``APPEND_ONLY_TABLES``)
+    aportan sólo las filas modificadas como *upserts*. Las tablas sin columna de seguimiento se
+    copian completas: se reemplazan si ninguna otra tabla las referencia y se
+    aplican como *upsert* en caso contrario. Las bajas llegan en
+    ``deleted_keys`` (tabla → claves primarias) y se aplican al final en
+    orden inverso de dependencias.
+    """
+
+    excluded = set(excluded_tables)
+    manifest = SqlDumpManifest(
+        chunk_size=chunk_size,
+        encrypted=cipher is not None,
+        kind=DUMP_KIND_INCREMENTAL,
+        since=since.isoformat(),
+    )
+    batch_size = max(int(batch_rows), 1)
+    tables = [
+        table
+        for table in DatabaseBase.metadata.sorted_tables
+        if table.name not in excluded
+    ]
+
+    with destination.open("wb") as handle:
+        writer = _DumpWriter(handle, manifest, cipher=cipher, chunk_size=chunk_size)
+        writer.write_preamble()
+        for table in tables:
+            tracking = _tracking_column(table)
+            has_key = bool(table.primary_key.columns)
+            writer.begin_segment()
+            if tracking is not None and has_key:
+                row_count = writer.write_rows(
+                    db,
+                    select(table).where(tracking >= since),
+                    table,
+                    batch_size=batch_size,
+                    upsert=True,
+                )
+                if not row_count:
+                    writer.end_segment()
+                    continue
+            else:
+                replace = not has_key or not _is_referenced(table)
+                if replace:
+                    writer.write(f'DELETE FROM "{table.name}";\n')
+                row_count = writer.write_rows(
+                    db, select(table), table, batch_size=batch_size, upsert=not replace
+                )
+            manifest.tables.append(
+                _table_entry(table.name, row_count, writer.end_segment())
+            )
+
+        for table in reversed(tables):
+            keys = list(dict.fromkeys(deleted_keys.get(table.name, ())))
+            primary_key = list(table.primary_key.columns)
+            if not keys or len(primary_key) != 1:
+                continue
+            writer.begin_segment()
+            for start in range(0, len(keys), batch_size):
+                batch = ", ".join(
+                    to_sql_literal(key) for key in keys[start: start + batch_size]
+                )
+                writer.write(
+                    f'DELETE FROM "{table.name}" WHERE "{primary_key[0].name}" IN ({batch});\n'
+                )
+            manifest.deletions.append(
+                _table_entry(table.name, len(keys), writer.end_segment())
+            )
+        writer.write_epilogue()
+
+    return manifest
+
+
+def is_chunked_dump(path: Path) -> bool:
+    """Indica si el archivo utiliza el formato de volcado por bloques."""
+
+    if not path.is_file():
+        return False
+    with path.open("rb") as handle:
+        return handle.read(len(DUMP_MAGIC)) == DUMP_MAGIC
+
+
+def iter_dump_chunks(
+    path: Path,
+    cipher: Fernet | None,
+    *,
+    segments: Iterable[DumpSegment | TableDumpEntry] | None = None,
+) -> Iterator[bytes]:
+    """Entrega el SQL descomprimido bloque a bloque.
+
+    Cuando se indican ``segments`` sólo se leen esos rangos del archivo.
+    """
+
+    with path.open("rb") as handle:
+        header = handle.read(len(DUMP_MAGIC) + 1)
+        if header[: len(DUMP_MAGIC)] != DUMP_MAGIC:
+            raise ValueError("El archivo no es un volcado SQL por bloques")
+        flags = header[-1]
+        if flags & _FLAG_ENCRYPTED and cipher is None:
+            raise ValueError("El volcado SQL está cifrado y no se encontró la llave")
+
+        def _read_frames(limit: int | None) -> Iterator[bytes]:
+            consumed = 0
+            while limit is None or consumed < limit:
+                raw_length = handle.read(_FRAME_HEADER.size)
+                if not raw_length:
+                    return
+                (frame_length,) = _FRAME_HEADER.unpack(raw_length)
+                payload = handle.read(frame_length)
+                consumed += _FRAME_HEADER.size + frame_length
+                if flags & _FLAG_ENCRYPTED:
+                    payload = cipher.decrypt(payload)  # type: ignore[union-attr]
+                if flags & _FLAG_COMPRESSED:
+                    payload = zlib.decompress(payload)
+                yield payload
+
+        if segments is None:
+            yield from _read_frames(None)
+            return
+        for segment in segments:
+            handle.seek(segment.offset)
+            yield from _read_frames(segment.length)
+
+
+def iter_sql_statements(chunks: Iterable[bytes | str]) -> Iterator[str]:
+    """Separa sentencias SQL respetando literales entre comillas."""
+
+    pending: list[str] = []
+    quote: str | None = None
+    for chunk in chunks:
+        text = chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+        start = 0
+        for match in _SQL_TOKEN.finditer(text):
+            token = match.group()
+            if quote is not None:
+                if token == quote:
+                    quote = None
+                continue
+            if token != ";":
+                quote = token
+                continue
+            pending.append(text[start: match.start()])
+            statement = "".join(pending).strip()
+            pending.clear()
+            start = match.end()
+            if statement:
+                yield statement
+        pending.append(text[start:])
+    tail = "".join(pending).strip()
+    if tail:
+        yield tail
+
+
+def _execute_statements(engine: Engine, statements: Iterable[str]) -> None:
+    with engine.begin() as connection:
+        with closing(connection.connection.cursor()) as cursor:
+            for statement in statements:
+                if statement.upper() in _TRANSACTION_STATEMENTS:
+                    continue
+                cursor.execute(statement)
+
+
+def _dependency_levels(tables: list[str]) -> list[list[str]]:
+    """Agrupa tablas en niveles que pueden cargarse en paralelo sin romper FKs."""
+
+    selected = set(tables)
+    metadata_tables = DatabaseBase.metadata.tables
+    depth: dict[str, int] = {}
+    for table in DatabaseBase.metadata.sorted_tables:
+        if table.name not in selected:
+            continue
+        parents = {
+            foreign_key.column.table.name
+            for foreign_key in metadata_tables[table.name].foreign_keys
+        }
+        depth[table.name] = 1 + max(
+            (depth[parent] for parent in parents if parent in depth and parent != table.name),
+            default=-1,
+        )
+    levels: dict[int, list[str]] = {}
+    for name in tables:
+        levels.setdefault(depth.get(name, 0), []).append(name)
+    return [levels[level] for level in sorted(levels)]
+
+
+def _resolve_tables(
+    manifest: SqlDumpManifest, tables: Iterable[str] | None
+) -> list[str] | None:
+    if tables is None:
+        return None
+    requested = list(dict.fromkeys(tables))
+    unknown = [name for name in requested if manifest.table(name) is None]
+    if unknown:
+        raise ValueError(
+            "Tablas no disponibles en el volcado: " + ", ".join(sorted(unknown))
+        )
+    return requested
+
+
+def _select_segments(
+    manifest: SqlDumpManifest,
+    tables: Iterable[str] | None,
+    *,
+    framing: bool,
+) -> list[DumpSegment | TableDumpEntry]:
+    """Rangos a leer para las tablas indicadas, en el orden de aplicación."""
+
+    selected = None if tables is None else set(tables)
+    segments: list[DumpSegment | TableDumpEntry] = [
+        entry
+        for entry in (*manifest.tables, *manifest.deletions)
+        if selected is None or entry.name in selected
+    ]
+    if framing:
+        segments = [
+            segment
+            for segment in (manifest.preamble, *segments, manifest.epilogue)
+            if segment is not None
+        ]
+    return segments
+
+
+def restore_sql_dump(
+    engine: Engine,
+    path: Path,
+    manifest: SqlDumpManifest,
+    cipher: Fernet | None,
+    *,
+    tables: Iterable[str] | None = None,
+    workers: int = 1,
+) -> list[str]:
+    """Aplica el volcado sobre la base activa y devuelve las tablas restauradas.
+
+    En SQLite (un solo escritor), con ``workers <= 1`` o para volcados
+    incrementales se aplica todo en una única transacción. En otros motores
+    las tablas se vacían primero en orden inverso de dependencias y después se
+    cargan en paralelo por niveles, cada tabla en su propia conexión y
+    transacción.
+    """
+
+    requested = _resolve_tables(manifest, tables)
+    entries = [
+        entry
+        for entry in manifest.tables
+        if requested is None or entry.name in requested
+    ]
+    names = [entry.name for entry in entries]
+
+    if (
+        engine.dialect.name == "sqlite"
+        or workers <= 1
+        or len(entries) <= 1
+        or manifest.is_incremental
+    ):
+        segments = _select_segments(manifest, requested, framing=False)
+        _execute_statements(
+            engine, iter_sql_statements(iter_dump_chunks(path, cipher, segments=segments))
+        )
+        return names
+
+    _execute_statements(
+        engine, (f'DELETE FROM "{name}"' for name in reversed(names))
+    )
+
+    def _load_table(entry: TableDumpEntry) -> None:
+        statements = iter_sql_statements(iter_dump_chunks(path, cipher, segments=[entry]))
+        _execute_statements(
+            engine,
+            (
+                statement
+                for statement in statements
+                if not statement.upper().startswith("DELETE FROM")
+            ),
+        )
+
+    by_name = {entry.name: entry for entry in entries}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for level in _dependency_levels(names):
+            list(executor.map(_load_table, (by_name[name] for name in level)))
+    return names
+
+
+def restore_sql_chain(
+    engine: Engine,
+    dumps: Sequence[tuple[Path, SqlDumpManifest]],
+    cipher: Fernet | None,
+    *,
+    tables: Iterable[str] | None = None,
+    workers: int = 1,
+) -> list[str]:
+    """Aplica un volcado completo seguido de sus incrementales.
+
+    Una cadena con incrementales se aplica en una sola transacción para que
+    una falla a mitad de la reproducción no deje la base en un estado
+    intermedio.
+    """
+
+    if not dumps:
+        raise ValueError("La cadena de respaldos está vacía")
+    base_path, base_manifest = dumps[0]
+    if base_manifest.is_incremental:
+        raise ValueError("La cadena de respaldos no inicia con un volcado completo")
+    if len(dumps) == 1:
+        return restore_sql_dump(
+            engine, base_path, base_manifest, cipher, tables=tables, workers=workers
+        )
+
+    requested = _resolve_tables(base_manifest, tables)
+    statements = itertools.chain.from_iterable(
+        iter_sql_statements(
+            iter_dump_chunks(
+                path,
+                cipher,
+                segments=_select_segments(manifest, requested, framing=False),
+            )
+        )
+        for path, manifest in dumps
+    )
+    _execute_statements(engine, statements)
+    return [
+        entry.name
+        for entry in base_manifest.tables
+        if requested is None or entry.name in requested
+    ]
+
+
+def write_plain_sql(
+    path: Path,
+    destination: Path,
+    manifest: SqlDumpManifest | None,
+    cipher: Fernet | None,
+    *,
+    tables: Iterable[str] | None = None,
+    append: bool = False,
+) -> None:
+    """Escribe el volcado como script SQL plano sin cargarlo completo en memoria."""
+
+    segments: list[DumpSegment | TableDumpEntry] | None = None
+    if tables is not None and manifest is not None:
+        segments = _select_segments(manifest, tables, framing=True)
+    with destination.open("ab" if append else "wb") as handle:
+        for chunk in iter_dump_chunks(path, cipher, segments=segments):
+            handle.write(chunk)
+
+
+__all__ = [
+    "DUMP_FORMAT",
+    "DUMP_KIND_FULL",
+    "DUMP_KIND_INCREMENTAL",
+    "APPEND_ONLY_TABLES",
+    "DumpSegment",
+    "SqlDumpManifest",
+    "TableDumpEntry",
+    "is_chunked_dump",
+    "iter_dump_chunks",
+    "iter_sql_statements",
+    "restore_sql_chain",
+    "restore_sql_dump",
+    "to_sql_literal",
+    "write_plain_sql",
+    "write_sql_delta",
+    "write_sql_dump",
+]
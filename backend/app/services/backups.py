@@ -4,28 +4,25 @@ from __future__ import annotations
 import enum
 import os
 import json
+import re
 import shutil
 from contextlib import closing
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any, Iterable, Tuple
+from typing import Any, Iterable, Iterator, Tuple
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from cryptography.fernet import Fernet
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
-from sqlalchemy import select, text
+from sqlalchemy import func, select, text
 from sqlalchemy.orm import Session
 
 from .. import crud, models
 from ..database import Base as DatabaseBase
 from ..config import settings as app_settings
 from ..core.transactions import transactional_session
-from . import encryption
+from . import backup_dump, encryption, render_pool
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -34,6 +31,10 @@ MANDATORY_COMPONENTS: set[models.BackupComponent] = {
     models.BackupComponent.CONFIGURATION,
     models.BackupComponent.CRITICAL_FILES,
 }
+INCREMENTAL_COMPONENTS: tuple[str, ...] = (
+    models.BackupComponent.CONFIGURATION.value,
+    models.BackupComponent.DATABASE.value,
+)
 CRITICAL_PATHS: tuple[Path, ...] = (
     PROJECT_ROOT / "backend" / "app" / "config.py",
     PROJECT_ROOT / "backend" / "app" / "main.py",
@@ -102,50 +103,6 @@ def _json_default(value: Any) -> Any:
     raise TypeError(f"Tipo no serializable para JSON: {type(value)!r}")
 
 
-def _to_sql_literal(value: Any) -> str:
-    if value is None:
-        return "NULL"
-    if isinstance(value, enum.Enum):
-        return _to_sql_literal(value.name)
-    if isinstance(value, bool):
-        return "1" if value else "0"
-    if isinstance(value, (int, float, Decimal)):
-        return str(value)
-    if isinstance(value, datetime):
-        return f"'{value.isoformat()}'"
-    if isinstance(value, date):
-        return f"'{value.isoformat()}'"
-    if isinstance(value, bytes):
-        return "X'" + value.hex() + "'"
-    return "'" + str(value).replace("'", "''") + "'"
-
-
-def _dump_database_sql(db: Session) -> bytes:
-    bind = db.get_bind()
-    if bind is None:
-        raise RuntimeError(
-            "No se pudo obtener la conexión activa para generar el volcado SQL")
-
-    statements: list[str] = ["BEGIN TRANSACTION;\n"]
-    metadata = DatabaseBase.metadata
-    for table in metadata.sorted_tables:
-        if table.name in {"backup_jobs"}:
-            continue
-        statements.append(f'DELETE FROM "{table.name}";\n')
-        rows = db.execute(select(table)).mappings().all()
-        if not rows:
-            continue
-        columns = ", ".join(f'"{column.name}"' for column in table.columns)
-        for row in rows:
-            values = ", ".join(_to_sql_literal(
-                row[column.name]) for column in table.columns)
-            statements.append(
-                f'INSERT INTO "{table.name}" ({columns}) VALUES ({values});\n'
-            )
-    statements.append("COMMIT;\n")
-    return "".join(statements).encode("utf-8")
-
-
 def _collect_critical_files(destination: Path) -> list[str]:
     copied: list[str] = []
     for critical_path in CRITICAL_PATHS:
@@ -179,6 +136,7 @@ def _write_metadata(
     encryption_enabled: bool,
     encryption_key_path: str | None,
     cipher: Fernet | None,
+    sql_dump: dict[str, Any] | None = None,
 ) -> None:
     metadata = {
         "timestamp": timestamp,
@@ -202,6 +160,7 @@ def _write_metadata(
             "algorithm": "fernet" if encryption_enabled else None,
             "key_path": encryption_key_path if encryption_enabled else None,
         },
+        "sql_dump": sql_dump,
     }
     serialized = json.dumps(
         metadata,
@@ -256,8 +215,59 @@ def load_backup_metadata(metadata_path: Path) -> dict[str, Any]:
 def read_backup_file(path: Path) -> bytes:
     """Devuelve el contenido descifrado de un artefacto de respaldo."""
 
+    return b"".join(iter_backup_file(path))
+
+
+def iter_backup_file(path: Path) -> Iterator[bytes]:
+    """Entrega el contenido descifrado por bloques.
+
+    Los volcados SQL por bloques se descifran y descomprimen de forma
+    incremental; el resto de artefactos se entrega en un único bloque.
+    """
+
     cipher = _resolve_cipher_for_path(path)
-    return _decrypt_file(path, cipher)
+    if backup_dump.is_chunked_dump(path):
+        yield from backup_dump.iter_dump_chunks(path, cipher)
+        return
+    yield _decrypt_file(path, cipher)
+
+
+def _load_sql_dump_manifest(
+    metadata_path: Path,
+) -> backup_dump.SqlDumpManifest | None:
+    if not metadata_path.exists():
+        return None
+    payload = load_backup_metadata(metadata_path).get("sql_dump")
+    if not payload:
+        return None
+    return backup_dump.SqlDumpManifest.from_dict(payload)
+
+
+def _load_sql_chain(
+    db: Session, job: models.BackupJob
+) -> list[tuple[Path, backup_dump.SqlDumpManifest | None]]:
+    """Volcados a reproducir para ``job``: el completo base y sus incrementales."""
+
+    if job.backup_type != models.BackupType.INCREMENTAL:
+        return [(Path(job.sql_path), _load_sql_dump_manifest(Path(job.metadata_path)))]
+
+    chain: list[tuple[Path, backup_dump.SqlDumpManifest | None]] = []
+    for link in resolve_backup_chain(db, job):
+        link_sql = Path(link.sql_path) if link.sql_path else None
+        link_manifest = (
+            _load_sql_dump_manifest(Path(link.metadata_path))
+            if link.metadata_path
+            else None
+        )
+        if (
+            link_sql is None
+            or link_manifest is None
+            or not backup_dump.is_chunked_dump(link_sql)
+        ):
+            raise ValueError(
+                f"El volcado SQL del respaldo {link.id} de la cadena no está disponible")
+        chain.append((link_sql, link_manifest))
+    return chain
 
 
 def _build_financial_table(devices: list[dict[str, Any]]) -> Tuple[list[list[str]], float]:
@@ -336,6 +346,11 @@ def _build_catalog_detail_table(devices: list[dict[str, Any]]) -> list[list[str]
 def render_snapshot_pdf(snapshot: dict[str, Any]) -> bytes:
     """Construye un PDF en tema oscuro con el estado del inventario."""
 
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4,
                             title="Softmobile - Inventario Consolidado")
@@ -481,18 +496,21 @@ def serialize_snapshot(snapshot: dict[str, Any]) -> bytes:
     return json.dumps(snapshot, ensure_ascii=False, indent=2).encode("utf-8")
 
 
+def _resolve_engine(db: Session):
+    bind = db.get_bind()
+    if bind is None:
+        raise RuntimeError(
+            "No se pudo obtener la conexión activa para restaurar la base de datos")
+    return bind.engine if hasattr(bind, "engine") else bind
+
+
 def _restore_database(
     db: Session, sql_path: Path, *, sql_content: str | None = None
 ) -> None:
     if not sql_path.exists() and sql_content is None:
         raise FileNotFoundError(str(sql_path))
 
-    bind = db.get_bind()
-    if bind is None:
-        raise RuntimeError(
-            "No se pudo obtener la conexión activa para restaurar la base de datos")
-
-    engine = bind.engine if hasattr(bind, "engine") else bind
+    engine = _resolve_engine(db)
     sql_script = sql_content or sql_path.read_text(encoding="utf-8")
     if engine.dialect.name == "sqlite":
         with engine.begin() as connection:
@@ -510,6 +528,110 @@ def _restore_database(
                 db.execute(text(statement))
 
 
+def _utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def resolve_backup_chain(
+    db: Session, job: models.BackupJob
+) -> list[models.BackupJob]:
+    """Devuelve la cadena desde el respaldo completo base hasta ``job``."""
+
+    chain = [job]
+    current = job
+    while current.backup_type == models.BackupType.INCREMENTAL:
+        parent_id = current.parent_id
+        if parent_id is None or any(item.id == parent_id for item in chain):
+            raise ValueError(
+                f"La cadena del respaldo incremental {job.id} está incompleta")
+        parent = crud.get_backup_job(db, parent_id)
+        if parent is None:
+            raise ValueError(
+                f"El respaldo base {parent_id} de la cadena no está disponible")
+        chain.append(parent)
+        current = parent
+    chain.reverse()
+    return chain
+
+
+def _incremental_parent(db: Session) -> models.BackupJob | None:
+    parent = crud.get_latest_backup_job(db)
+    if parent is None or parent.snapshot_at is None:
+        return None
+    try:
+        chain = resolve_backup_chain(db, parent)
+    except ValueError:
+        return None
+    if len(chain) > max(app_settings.backup_incremental_max_chain, 1):
+        return None
+    sql_path = Path(parent.sql_path) if parent.sql_path else None
+    if sql_path is None or not backup_dump.is_chunked_dump(sql_path):
+        return None
+    return parent
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _entity_tables() -> dict[str, Any]:
+    tables: dict[str, Any] = {}
+    for mapper in DatabaseBase.registry.mappers:
+        table = mapper.local_table
+        tables.setdefault(_snake_case(mapper.class_.__name__), table)
+        tables.setdefault(table.name, table)
+    return tables
+
+
+def _collect_deleted_keys(db: Session, since: datetime) -> dict[str, list[Any]]:
+    """Reúne las bajas físicas registradas en la outbox y la bitácora."""
+
+    outbox_deletes = select(
+        models.SyncOutbox.entity_type, models.SyncOutbox.entity_id
+    ).where(
+        func.upper(models.SyncOutbox.operation) == "DELETE",
+        models.SyncOutbox.updated_at >= since,
+    )
+    audit_deletes = select(
+        models.AuditLog.entity_type, models.AuditLog.entity_id
+    ).where(
+        models.AuditLog.action.like("%\\_deleted", escape="\\"),
+        models.AuditLog.action.not_like("%\\_soft\\_deleted", escape="\\"),
+        models.AuditLog.created_at >= since,
+    )
+    tables = _entity_tables()
+    deleted: dict[str, list[Any]] = {}
+    for entity_type, entity_id in (
+        *db.execute(outbox_deletes).all(),
+        *db.execute(audit_deletes).all(),
+    ):
+        table = tables.get(str(entity_type))
+        if table is None or len(table.primary_key.columns) != 1:
+            continue
+        key_column = next(iter(table.primary_key.columns))
+        try:
+            key = key_column.type.python_type(entity_id)
+        except (NotImplementedError, TypeError, ValueError):
+            continue
+        deleted.setdefault(table.name, []).append(key)
+    return deleted
+
+
+def _serialize_delta_summary(
+    manifest: backup_dump.SqlDumpManifest, *, parent_id: int
+) -> bytes:
+    summary = {
+        "tipo": models.BackupType.INCREMENTAL.value,
+        "respaldo_base": parent_id,
+        "desde": manifest.since,
+        "filas": {entry.name: entry.rows for entry in manifest.tables},
+        "bajas": {entry.name: entry.rows for entry in manifest.deletions},
+    }
+    return json.dumps(summary, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def generate_backup(
     db: Session,
     *,
@@ -519,31 +641,82 @@ def generate_backup(
     notes: str | None = None,
     components: Iterable[models.BackupComponent] | None = None,
     reason: str | None = None,
+    backup_type: models.BackupType = models.BackupType.FULL,
 ) -> models.BackupJob:
-    """Genera los archivos de respaldo y persiste el registro en la base."""
-
-    selected_components = _normalize_components(
-        components,
-        include_mandatory=True,
+    """Genera los archivos de respaldo y persiste el registro en la base.
+
+    Un respaldo incremental sólo vuelca los cambios posteriores al último
+    respaldo de la cadena y omite el PDF, el snapshot de inventario y los
+    archivos críticos. Si no existe un respaldo previo o la cadena alcanzó
+    ``backup_incremental_max_chain`` se genera un respaldo completo.
+    """
+
+    snapshot_at = datetime.now(timezone.utc)
+    parent = (
+        _incremental_parent(db)
+        if backup_type == models.BackupType.INCREMENTAL
+        else None
+    )
+    incremental = parent is not None
+    backup_type = (
+        models.BackupType.INCREMENTAL if incremental else models.BackupType.FULL
     )
-    snapshot = build_inventory_snapshot(db)
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    if incremental:
+        selected_components = list(INCREMENTAL_COMPONENTS)
+    else:
+        selected_components = _normalize_components(
+            components,
+            include_mandatory=True,
+        )
+
+    timestamp = snapshot_at.strftime("%Y%m%d_%H%M%S")
     directory = Path(base_dir)
     directory.mkdir(parents=True, exist_ok=True)
 
-    pdf_path = directory / f"softmobile_inventario_{timestamp}.pdf"
-    json_path = directory / f"softmobile_respaldo_{timestamp}.json"
-    sql_path = directory / f"softmobile_respaldo_{timestamp}.sql"
-    config_path = directory / f"softmobile_config_{timestamp}.json"
-    metadata_path = directory / f"softmobile_respaldo_{timestamp}.meta.json"
-    archive_path = directory / f"softmobile_respaldo_{timestamp}.zip"
-    critical_directory = directory / f"softmobile_criticos_{timestamp}"
+    prefix = "softmobile_incremental" if incremental else "softmobile"
+    pdf_path = directory / f"{prefix}_inventario_{timestamp}.pdf"
+    json_path = directory / f"{prefix}_respaldo_{timestamp}.json"
+    sql_path = directory / f"{prefix}_respaldo_{timestamp}.sql"
+    config_path = directory / f"{prefix}_config_{timestamp}.json"
+    metadata_path = directory / f"{prefix}_respaldo_{timestamp}.meta.json"
+    archive_path = directory / f"{prefix}_respaldo_{timestamp}.zip"
+    critical_directory = directory / f"{prefix}_criticos_{timestamp}"
     critical_directory.mkdir(parents=True, exist_ok=True)
 
-    pdf_path.write_bytes(render_snapshot_pdf(snapshot))
-    json_path.write_bytes(serialize_snapshot(snapshot))
-    sql_path.write_bytes(_dump_database_sql(db))
+    cipher = _get_backup_cipher()
+    encryption_enabled = cipher is not None
+
+    # El volcado SQL se escribe por bloques ya cifrados y no pasa por
+    # ``_encrypt_backup_files``, que necesita el archivo completo en memoria.
+    if incremental:
+        since = _utc_naive(parent.snapshot_at) - timedelta(
+            seconds=max(app_settings.backup_incremental_overlap_seconds, 0)
+        )
+        sql_manifest = backup_dump.write_sql_delta(
+            db,
+            sql_path,
+            since=since,
+            deleted_keys=_collect_deleted_keys(db, since),
+            cipher=cipher,
+            chunk_size=app_settings.backup_dump_chunk_bytes,
+            batch_rows=app_settings.backup_dump_batch_rows,
+        )
+        json_path.write_bytes(
+            _serialize_delta_summary(sql_manifest, parent_id=int(parent.id))
+        )
+    else:
+        snapshot = build_inventory_snapshot(db)
+        pdf_path.write_bytes(render_pool.render(render_snapshot_pdf, snapshot))
+        json_path.write_bytes(serialize_snapshot(snapshot))
+        sql_manifest = backup_dump.write_sql_dump(
+            db,
+            sql_path,
+            cipher=cipher,
+            chunk_size=app_settings.backup_dump_chunk_bytes,
+            batch_rows=app_settings.backup_dump_batch_rows,
+        )
+    sql_dump = sql_manifest.to_dict()
     config_path.write_text(
         json.dumps(
             _build_configuration_snapshot(),
@@ -554,10 +727,8 @@ def generate_backup(
         encoding="utf-8",
     )
 
-    copied_files = _collect_critical_files(critical_directory)
+    copied_files = [] if incremental else _collect_critical_files(critical_directory)
     normalized_reason = reason.strip() if reason else None
-    cipher = _get_backup_cipher()
-    encryption_enabled = cipher is not None
     encryption_key_path = (
         str(app_settings.backup_encryption_key_path) if encryption_enabled else None
     )
@@ -570,7 +741,7 @@ def generate_backup(
             local_key.write_bytes(key_bytes)
             os.chmod(local_key, 0o600)
 
-    component_files = [pdf_path, json_path, sql_path, config_path]
+    component_files = [pdf_path, json_path, config_path]
     _encrypt_backup_files(cipher, component_files, critical_directory)
 
     def _component_paths(
@@ -626,11 +797,13 @@ def generate_backup(
             encryption_enabled=encryption_enabled,
             encryption_key_path=encryption_key_path,
             cipher=cipher,
+            sql_dump=sql_dump,
         )
 
     def _build_archive() -> None:
         with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as zip_file:
-            zip_file.write(pdf_path, arcname=f"reportes/{pdf_path.name}")
+            if pdf_path.exists():
+                zip_file.write(pdf_path, arcname=f"reportes/{pdf_path.name}")
             zip_file.write(json_path, arcname=f"datos/{json_path.name}")
             zip_file.write(sql_path, arcname=f"datos/{sql_path.name}")
             zip_file.write(config_path, arcname=f"config/{config_path.name}")
@@ -707,6 +880,7 @@ def generate_backup(
         encryption_enabled=encryption_enabled,
         encryption_key_path=encryption_key_path,
         cipher=cipher,
+        sql_dump=sql_dump,
     )
 
     _build_archive()
@@ -756,11 +930,13 @@ def generate_backup(
             encryption_enabled=encryption_enabled,
             encryption_key_path=encryption_key_path,
             cipher=cipher,
+            sql_dump=sql_dump,
         )
 
     def _build_archive() -> None:
         with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as zip_file:
-            zip_file.write(pdf_path, arcname=f"reportes/{pdf_path.name}")
+            if pdf_path.exists():
+                zip_file.write(pdf_path, arcname=f"reportes/{pdf_path.name}")
             zip_file.write(json_path, arcname=f"datos/{json_path.name}")
             zip_file.write(sql_path, arcname=f"datos/{sql_path.name}")
             zip_file.write(config_path, arcname=f"config/{config_path.name}")
@@ -810,7 +986,7 @@ def generate_backup(
     job = crud.create_backup_job(
         db,
         mode=mode,
-        pdf_path=str(pdf_path.resolve()),
+        pdf_path=str(pdf_path.resolve()) if pdf_path.exists() else None,
         archive_path=str(archive_path.resolve()),
         json_path=str(json_path.resolve()),
         sql_path=str(sql_path.resolve()),
@@ -822,6 +998,9 @@ def generate_backup(
         notes=notes,
         triggered_by_id=triggered_by_id,
         reason=normalized_reason,
+        backup_type=backup_type,
+        parent_id=int(parent.id) if parent is not None else None,
+        snapshot_at=snapshot_at,
     )
     return job
 
@@ -835,6 +1014,7 @@ def restore_backup(
     apply_database: bool,
     triggered_by_id: int | None,
     reason: str | None = None,
+    tables: Iterable[str] | None = None,
 ) -> dict[str, Any]:
     if components:
         requested_components: set[models.BackupComponent] = set()
@@ -934,6 +1114,9 @@ def restore_backup(
 
     cipher = _resolve_cipher_for_path(metadata_file)
     results: dict[str, str] = {}
+    selected_tables = [
+        name.strip() for name in tables or [] if name and name.strip()
+    ] or None
 
     if json_file.exists():
         json_dest = restore_dir / json_file.name
@@ -943,6 +1126,44 @@ def restore_backup(
     if models.BackupComponent.DATABASE.value in selected_components:
         if not sql_file.exists():
             results["database"] = "Archivo SQL no disponible"
+        elif backup_dump.is_chunked_dump(sql_file):
+            sql_chain = _load_sql_chain(db, job)
+            if selected_tables is not None and any(
+                manifest is None for _, manifest in sql_chain
+            ):
+                raise ValueError(
+                    "El respaldo no incluye el índice de tablas del volcado SQL")
+            if apply_database:
+                if sql_chain[0][1] is None:
+                    _restore_database(
+                        db,
+                        sql_file,
+                        sql_content=read_backup_file(sql_file).decode("utf-8"),
+                    )
+                else:
+                    backup_dump.restore_sql_chain(
+                        _resolve_engine(db),
+                        sql_chain,
+                        cipher,
+                        tables=selected_tables,
+                        workers=app_settings.backup_restore_workers,
+                    )
+                results["database"] = "Base de datos restaurada en la instancia activa"
+            else:
+                sql_dest = restore_dir / sql_file.name
+                for position, (link_path, link_manifest) in enumerate(sql_chain):
+                    backup_dump.write_plain_sql(
+                        link_path,
+                        sql_dest,
+                        link_manifest,
+                        cipher,
+                        tables=selected_tables,
+                        append=position > 0,
+                    )
+                results["database"] = str(sql_dest)
+        elif selected_tables is not None:
+            raise ValueError(
+                "El respaldo no admite restauración por tablas; genera un respaldo nuevo")
         elif apply_database:
             sql_bytes = _decrypt_file(sql_file, cipher)
             _restore_database(
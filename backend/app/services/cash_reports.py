@@ -4,21 +4,19 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from hashlib import sha256
 from io import BytesIO
-from typing import Iterable, Sequence
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 from .. import models
 from .locale_helpers import format_dual_currency
 
-ACCENT_COLOR = colors.HexColor("#38bdf8")
-BASE_DARK = colors.HexColor("#0f172a")
-BASE_DIM = colors.HexColor("#111827")
-TEXT_LIGHT = colors.HexColor("#e2e8f0")
-BORDER_COLOR = colors.HexColor("#1e293b")
+if TYPE_CHECKING:
+    from reportlab.platypus import Table
+
+ACCENT_COLOR = "#38bdf8"
+BASE_DARK = "#0f172a"
+BASE_DIM = "#111827"
+TEXT_LIGHT = "#e2e8f0"
+BORDER_COLOR = "#1e293b"
 
 
 def _format_currency(value: Decimal | float | int) -> str:
@@ -26,18 +24,21 @@ def _format_currency(value: Decimal | float | int) -> str:
 
 
 def _build_table(data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
             [
-                ("BACKGROUND", (0, 0), (-1, 0), BASE_DARK),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(BASE_DARK)),
                 ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("BACKGROUND", (0, 1), (-1, -1), BASE_DIM),
-                ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_LIGHT),
-                ("LINEBEFORE", (0, 0), (0, -1), 1, BORDER_COLOR),
-                ("LINEAFTER", (-1, 0), (-1, -1), 1, BORDER_COLOR),
-                ("LINEABOVE", (0, 0), (-1, 0), 1.2, ACCENT_COLOR),
-                ("LINEBELOW", (0, -1), (-1, -1), 1.2, ACCENT_COLOR),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor(BASE_DIM)),
+                ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor(TEXT_LIGHT)),
+                ("LINEBEFORE", (0, 0), (0, -1), 1, colors.HexColor(BORDER_COLOR)),
+                ("LINEAFTER", (-1, 0), (-1, -1), 1, colors.HexColor(BORDER_COLOR)),
+                ("LINEABOVE", (0, 0), (-1, 0), 1.2, colors.HexColor(ACCENT_COLOR)),
+                ("LINEBELOW", (0, -1), (-1, -1), 1.2, colors.HexColor(ACCENT_COLOR)),
                 ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),
                 ("FONTSIZE", (0, 0), (-1, -1), 9),
@@ -68,13 +69,18 @@ def render_cash_close_pdf(
 ) -> bytes:
     """Genera un reporte PDF con el desglose del cierre de caja."""
 
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title="Reporte de cierre de caja POS")
     styles = getSampleStyleSheet()
     heading = ParagraphStyle(
         "HeadingSoftmobileCash",
         parent=styles["Heading1"],
-        textColor=ACCENT_COLOR,
+        textColor=colors.HexColor(ACCENT_COLOR),
         fontSize=18,
     )
 
@@ -0,0 +1,489 @@
+"""Índice de búsqueda del catálogo de dispositivos (``device_search_documents``).
+
+Cada alta, edición o baja de un dispositivo actualiza su documento dentro de
+la misma transacción; el índice propio del motor (FTS5 en SQLite, `pg_trgm`
+en PostgreSQL) se mantiene a partir de esa tabla. Las búsquedas de texto
+libre devuelven identificadores ordenados por relevancia en tres etapas:
+
+1. prefijo por palabra (``sams gal`` → «Samsung Galaxy»), ordenado por rango;
+2. subcadena, equivalente al antiguo ``ILIKE '%término%'``;
+3. sólo si lo anterior no encuentra nada, coincidencia aproximada para
+   tolerar errores de tipeo (vocabulario FTS5 en SQLite, `pg_trgm` en
+   PostgreSQL).
+
+La lista ordenada se recorta a ``MAX_MATCHES`` y sólo sirve para sugerir y
+ordenar; para filtrar, contar o exportar, :func:`device_search_clause` aplica
+las mismas etapas como subconsulta, sin límite.
+"""
+from __future__ import annotations
+
+import difflib
+import re
+import unicodedata
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Select,
+    and_,
+    column,
+    delete,
+    false,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    union,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.transactions import flush_session, transactional_session
+from ..db.catalog_search_index import (
+    FILTER_COLUMNS,
+    SQLITE_FTS_TABLE,
+    SQLITE_TRIGRAM_TABLE,
+    SQLITE_VOCAB_TABLE,
+)
+
+# Campos del dispositivo que alimentan la búsqueda de texto libre.
+SEARCH_FIELDS: tuple[str, ...] = (
+    "name",
+    "sku",
+    "imei",
+    "serial",
+    "marca",
+    "modelo",
+    "color",
+    "categoria",
+    "capacidad",
+)
+# Coincidencias de la búsqueda ordenada por relevancia (sugerencias y orden).
+MAX_MATCHES = 500
+REBUILD_BATCH_SIZE = 2_000
+# Coincidencias que se ordenan por bm25 en SQLite antes de recortar a `limit`.
+RANK_WINDOW = 2_000
+FUZZY_MIN_LENGTH = 4
+FUZZY_CANDIDATES = 5_000
+FUZZY_CUTOFF = 0.75
+
+_TOKEN_RE = re.compile(r"\w+")
+_STORE_KEY = "#{}#"
+
+
+def normalize_search_text(value: Any) -> str:
+    """Minúsculas, sin acentos y con espacios colapsados."""
+
+    if value is None:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(value))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def build_search_document(device: models.Device) -> dict[str, Any]:
+    """Fila de ``device_search_documents`` para el dispositivo."""
+
+    parts = (normalize_search_text(getattr(device, field, None)) for field in SEARCH_FIELDS)
+    row: dict[str, Any] = {
+        "device_id": device.id,
+        "store_id": device.store_id,
+        "store_key": _STORE_KEY.format(device.store_id),
+        "document": " ".join(part for part in parts if part),
+    }
+    for field in FILTER_COLUMNS:
+        row[field] = normalize_search_text(getattr(device, field, None))
+    return row
+
+
+def sync_device_search_document(db: Session, device: models.Device) -> None:
+    """Inserta, actualiza o elimina el documento según el estado del dispositivo."""
+
+    if device.id is None:
+        flush_session(db)
+    if device.is_deleted:
+        remove_device_search_document(db, device.id)
+        return
+    documents = models.DeviceSearchDocument.__table__
+    row = build_search_document(device)
+    result = db.execute(
+        update(documents)
+        .where(documents.c.device_id == device.id)
+        .values(**row)
+    )
+    if not result.rowcount:
+        db.execute(insert(documents).values(**row))
+
+
+def remove_device_search_document(db: Session, device_id: int) -> None:
+    documents = models.DeviceSearchDocument.__table__
+    db.execute(delete(documents).where(documents.c.device_id == device_id))
+
+
+def rebuild_device_search_index(
+    db: Session,
+    *,
+    store_id: int | None = None,
+    batch_size: int = REBUILD_BATCH_SIZE,
+) -> int:
+    """Regenera los documentos de todos los dispositivos activos (o de una sucursal).
+
+    Devuelve la cantidad de documentos escritos.
+    """
+
+    device = models.Device
+    documents = models.DeviceSearchDocument.__table__
+    fields = sorted({"id", "store_id", *SEARCH_FIELDS, *FILTER_COLUMNS})
+    columns = [getattr(device, field) for field in fields]
+    written = 0
+    with transactional_session(db):
+        cleanup = delete(documents)
+        if store_id is not None:
+            cleanup = cleanup.where(documents.c.store_id == store_id)
+        db.execute(cleanup)
+        last_id = 0
+        while True:
+            statement = (
+                select(*columns)
+                .where(device.is_deleted.is_(False), device.id > last_id)
+                .order_by(device.id)
+                .limit(batch_size)
+            )
+            if store_id is not None:
+                statement = statement.where(device.store_id == store_id)
+            batch = db.execute(statement).all()
+            if not batch:
+                break
+            rows = [build_search_document(row) for row in batch]  # type: ignore[arg-type]
+            db.execute(insert(documents), rows)
+            written += len(rows)
+            last_id = batch[-1].id
+        flush_session(db)
+    return written
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def _sqlite_fts_available(db: Session) -> bool:
+    found = db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SQLITE_TRIGRAM_TABLE},
+    ).first()
+    return found is not None
+
+
+def _tokens(term: str) -> list[str]:
+    return _TOKEN_RE.findall(normalize_search_text(term))
+
+
+def _fts_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _fts_prefix(tokens: list[str]) -> str:
+    return "document : (" + " ".join(f"{_fts_phrase(token)}*" for token in tokens) + ")"
+
+
+def _fts_substring(tokens: list[str]) -> str | None:
+    # El tokenizador trigram sólo resuelve subcadenas de tres o más caracteres.
+    if not all(len(token) >= 3 for token in tokens):
+        return None
+    return "document : (" + " AND ".join(_fts_phrase(token) for token in tokens) + ")"
+
+
+def _fts_scoped(match: str, store_id: int | None) -> str:
+    # La sucursal se resuelve dentro del propio MATCH (intersección de listas
+    # del índice); un `rowid IN (subconsulta)` obliga a FTS5 a evaluar la
+    # expresión por cada documento de la sucursal. Con unicode61 la frase
+    # `"#3#"` se reduce al término `3`; con trigram coincide literalmente.
+    if store_id is None:
+        return match
+    return f"({match}) AND store_key : {_fts_phrase(_STORE_KEY.format(store_id))}"
+
+
+def _sqlite_query(
+    db: Session,
+    virtual_table: str,
+    match: str,
+    store_id: int | None,
+    limit: int,
+) -> list[int]:
+    match = _fts_scoped(match, store_id)
+    # bm25 sólo se calcula sobre una ventana acotada de candidatos: con
+    # prefijos de una o dos letras ordenar todas las coincidencias cuesta más
+    # que la consulta misma.
+    statement = text(
+        f"SELECT rowid FROM (SELECT rowid, rank FROM {virtual_table} "
+        f"WHERE {virtual_table} MATCH :match LIMIT :window) "
+        "ORDER BY rank LIMIT :limit"
+    )
+    params = {"match": match, "window": max(RANK_WINDOW, limit), "limit": limit}
+    return [int(value) for value in db.scalars(statement, params)]
+
+
+def _sqlite_corrections(db: Session, token: str) -> list[str]:
+    """Términos del vocabulario cercanos a ``token`` (errores de tipeo)."""
+
+    if len(token) < FUZZY_MIN_LENGTH or token.isdigit():
+        return []
+    statement = text(
+        f"SELECT term FROM {SQLITE_VOCAB_TABLE} "
+        "WHERE term >= :low AND term < :high "
+        "AND length(term) BETWEEN :shortest AND :longest LIMIT :cap"
+    )
+    candidates: set[str] = set()
+    # Se toleran errores a partir de la segunda letra: se exploran los
+    # términos que comparten las dos primeras letras o la primera y la
+    # tercera (omisión o transposición de la segunda).
+    for prefix in {token[:2], token[0] + token[2]}:
+        candidates.update(
+            db.scalars(
+                statement,
+                {
+                    "low": prefix,
+                    "high": prefix + "\uffff",
+                    "shortest": len(token) - 2,
+                    "longest": len(token) + 2,
+                    "cap": FUZZY_CANDIDATES,
+                },
+            )
+        )
+    return difflib.get_close_matches(token, candidates, n=3, cutoff=FUZZY_CUTOFF)
+
+
+def _fts_approximate(db: Session, tokens: list[str]) -> str | None:
+    groups: list[str] = []
+    for token in tokens:
+        options = [token, *_sqlite_corrections(db, token)]
+        groups.append("(" + " OR ".join(f"{_fts_phrase(option)}*" for option in options) + ")")
+    if not any(" OR " in group for group in groups):
+        return None
+    return "document : (" + " AND ".join(groups) + ")"
+
+
+def _sqlite_search(
+    db: Session, tokens: list[str], store_id: int | None, limit: int, fuzzy: bool
+) -> list[int]:
+    found = _sqlite_query(db, SQLITE_FTS_TABLE, _fts_prefix(tokens), store_id, limit)
+    substring = _fts_substring(tokens)
+    if len(found) < limit and substring is not None:
+        found.extend(_sqlite_query(db, SQLITE_TRIGRAM_TABLE, substring, store_id, limit))
+    if not found and fuzzy:
+        approximate = _fts_approximate(db, tokens)
+        if approximate is not None:
+            found = _sqlite_query(db, SQLITE_FTS_TABLE, approximate, store_id, limit)
+    return found
+
+
+def _sqlite_rowids(
+    virtual_table: str, match: str, store_id: int | None, name: str
+) -> Select[Any]:
+    source = table(virtual_table, column("rowid"))
+    condition = text(f"{virtual_table} MATCH :{name}").bindparams(
+        **{name: _fts_scoped(match, store_id)}
+    )
+    return select(source.c.rowid).where(condition)
+
+
+def _sqlite_matches(
+    db: Session, tokens: list[str], store_id: int | None, fuzzy: bool
+) -> Select[Any] | CompoundSelect:
+    matches: Select[Any] | CompoundSelect = _sqlite_rowids(
+        SQLITE_FTS_TABLE, _fts_prefix(tokens), store_id, "prefix_match"
+    )
+    substring = _fts_substring(tokens)
+    if substring is not None:
+        matches = union(
+            matches,
+            _sqlite_rowids(SQLITE_TRIGRAM_TABLE, substring, store_id, "substring_match"),
+        )
+    if fuzzy and not db.scalar(select(matches.exists())):
+        approximate = _fts_approximate(db, tokens)
+        if approximate is not None:
+            matches = _sqlite_rowids(SQLITE_FTS_TABLE, approximate, store_id, "approximate_match")
+    return matches
+
+
+def _scoped_documents(store_id: int | None) -> Select[Any]:
+    documents = models.DeviceSearchDocument
+    scoped = select(documents.device_id)
+    if store_id is not None:
+        scoped = scoped.where(documents.store_id == store_id)
+    return scoped
+
+
+def _postgresql_prefix(tokens: list[str]) -> tuple[ColumnElement[Any], ColumnElement[Any]]:
+    documents = models.DeviceSearchDocument
+    vector = func.to_tsvector(literal_column("'simple'::regconfig"), documents.document)
+    query = func.to_tsquery(
+        literal_column("'simple'::regconfig"), " & ".join(f"{token}:*" for token in tokens)
+    )
+    return vector, query
+
+
+def _postgresql_search(
+    db: Session, tokens: list[str], store_id: int | None, limit: int, fuzzy: bool
+) -> list[int]:
+    documents = models.DeviceSearchDocument
+    scoped = _scoped_documents(store_id)
+    vector, query = _postgresql_prefix(tokens)
+    found = list(
+        db.scalars(
+            scoped.where(vector.op("@@")(query))
+            .order_by(func.ts_rank(vector, query).desc(), documents.device_id)
+            .limit(limit)
+        )
+    )
+    term = " ".join(tokens)
+    if len(found) < limit:
+        substring = scoped.where(
+            *(documents.document.like(f"%{token}%") for token in tokens)
+        ).order_by(func.similarity(documents.document, term).desc(), documents.device_id)
+        found.extend(db.scalars(substring.limit(limit)))
+    if not found and fuzzy:
+        found = list(
+            db.scalars(
+                scoped.where(literal(term).op("<%")(documents.document))
+                .order_by(func.word_similarity(term, documents.document).desc())
+                .limit(limit)
+            )
+        )
+    return [int(value) for value in found]
+
+
+def _postgresql_matches(
+    db: Session, tokens: list[str], store_id: int | None, fuzzy: bool
+) -> Select[Any]:
+    documents = models.DeviceSearchDocument
+    scoped = _scoped_documents(store_id)
+    vector, query = _postgresql_prefix(tokens)
+    matches = scoped.where(
+        or_(
+            vector.op("@@")(query),
+            and_(*(documents.document.like(f"%{token}%") for token in tokens)),
+        )
+    )
+    if fuzzy and not db.scalar(select(matches.exists())):
+        term = " ".join(tokens)
+        matches = scoped.where(literal(term).op("<%")(documents.document))
+    return matches
+
+
+def _like_search(
+    db: Session, tokens: list[str], store_id: int | None, limit: int
+) -> list[int]:
+    documents = models.DeviceSearchDocument
+    statement = select(documents.device_id).where(
+        *(documents.document.like(f"%{token}%") for token in tokens)
+    )
+    if store_id is not None:
+        statement = statement.where(documents.store_id == store_id)
+    return [int(value) for value in db.scalars(statement.order_by(documents.device_id).limit(limit))]
+
+
+def search_device_ids(
+    db: Session,
+    term: str,
+    *,
+    store_id: int | None = None,
+    limit: int = MAX_MATCHES,
+    fuzzy: bool = True,
+) -> list[int]:
+    """Identificadores de dispositivos activos que coinciden con ``term``.
+
+    El resultado está ordenado por relevancia (prefijo, luego subcadena) y sin
+    duplicados; las coincidencias aproximadas sólo se usan si no hubo otras.
+    """
+
+    tokens = _tokens(term)
+    if not tokens:
+        return []
+    dialect = _dialect(db)
+    if dialect == "sqlite" and _sqlite_fts_available(db):
+        found = _sqlite_search(db, tokens, store_id, limit, fuzzy)
+    elif dialect == "postgresql":
+        found = _postgresql_search(db, tokens, store_id, limit, fuzzy)
+    else:
+        found = _like_search(db, tokens, store_id, limit)
+    return list(dict.fromkeys(found))[:limit]
+
+
+def device_search_clause(
+    db: Session,
+    term: str,
+    *,
+    store_id: int | None = None,
+    fuzzy: bool = True,
+) -> ColumnElement[bool]:
+    """Condición ``Device.id IN (...)`` con todas las coincidencias de ``term``.
+
+    Aplica las mismas etapas que :func:`search_device_ids` como subconsulta,
+    sin ordenar ni recortar a ``MAX_MATCHES``: es la variante para paginar,
+    contar y exportar resultados de búsqueda.
+    """
+
+    tokens = _tokens(term)
+    if not tokens:
+        return false()
+    dialect = _dialect(db)
+    matches: Select[Any] | CompoundSelect
+    if dialect == "sqlite" and _sqlite_fts_available(db):
+        matches = _sqlite_matches(db, tokens, store_id, fuzzy)
+    elif dialect == "postgresql":
+        matches = _postgresql_matches(db, tokens, store_id, fuzzy)
+    else:
+        matches = _scoped_documents(store_id).where(
+            *(models.DeviceSearchDocument.document.like(f"%{token}%") for token in tokens)
+        )
+    return models.Device.id.in_(matches)
+
+
+def device_filter_clause(
+    db: Session, filters: Mapping[str, str | None]
+) -> ColumnElement[bool] | None:
+    """Condición ``Device.id IN (...)`` para filtros de subcadena por campo.
+
+    Replica ``columna ILIKE '%valor%'`` sobre las columnas normalizadas de
+    ``FILTER_COLUMNS`` usando el índice trigram del motor.
+    """
+
+    values = {
+        field: normalize_search_text(value)
+        for field, value in filters.items()
+        if field in FILTER_COLUMNS and value and normalize_search_text(value)
+    }
+    if not values:
+        return None
+    if _dialect(db) == "sqlite" and _sqlite_fts_available(db):
+        source = table(SQLITE_TRIGRAM_TABLE, column("rowid"), *(column(name) for name in values))
+        key = source.c.rowid
+    else:
+        source = models.DeviceSearchDocument.__table__
+        key = source.c.device_id
+    subquery = select(key).where(
+        *(source.c[field].like(f"%{value}%") for field, value in values.items())
+    )
+    return models.Device.id.in_(subquery)
+
+
+__all__ = [
+    "MAX_MATCHES",
+    "SEARCH_FIELDS",
+    "build_search_document",
+    "device_filter_clause",
+    "device_search_clause",
+    "normalize_search_text",
+    "rebuild_device_search_index",
+    "remove_device_search_document",
+    "search_device_ids",
+    "sync_device_search_document",
+]
@@ -2,24 +2,23 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from io import BytesIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING
 
 from .. import schemas
 from .locale_helpers import format_dual_currency
 
+if TYPE_CHECKING:
+    from reportlab.platypus import SimpleDocTemplate, Table
+
 
 def _format_currency(value: float) -> str:
     return format_dual_currency(value)
 
 
 def _build_pdf_table(data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
@@ -43,6 +42,11 @@ def _build_pdf_table(data: list[list[str]]) -> Table:
 
 
 def _build_pdf_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:  # type: ignore[type-arg]
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title=title)
     styles = getSampleStyleSheet()
@@ -65,6 +69,9 @@ def _build_pdf_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:
 
 
 def render_customer_portfolio_pdf(report: schemas.CustomerPortfolioReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_pdf_document("Softmobile - Reporte de clientes")
     styles = getSampleStyleSheet()
 
@@ -133,6 +140,9 @@ def render_customer_portfolio_pdf(report: schemas.CustomerPortfolioReport) -> by
 
 
 def render_customer_statement_pdf(report: schemas.CustomerStatementReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_pdf_document("Softmobile - Estado de cuenta")
     styles = getSampleStyleSheet()
 
@@ -203,6 +213,10 @@ def render_customer_statement_pdf(report: schemas.CustomerStatementReport) -> by
 
 
 def render_customer_portfolio_xlsx(report: schemas.CustomerPortfolioReport) -> BytesIO:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     workbook = Workbook()
     worksheet = workbook.active
     worksheet.title = "Clientes"
@@ -0,0 +1,242 @@
+"""Índice de búsqueda de clientes (``customer_search_documents`` y ``customer_tags``).
+
+Cada alta, edición o baja de un cliente actualiza su documento y sus
+etiquetas dentro de la misma transacción; el índice sólo cubre clientes
+activos. ``list_customers`` resuelve
+la búsqueda así:
+
+1. RTN, teléfono o correo completos se buscan por igualdad sobre claves
+   normalizadas e indexadas;
+2. el resto de los términos (o si la igualdad no encuentra nada) se buscan
+   como subcadenas con el índice trigram del motor; si el término es muy
+   frecuente se recorre la lista por nombre hasta completar la página;
+3. el filtro por etiquetas usa la tabla ``customer_tags`` en lugar de
+   ``LIKE`` sobre el JSON de ``segmento_etiquetas``.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, delete, func, insert, or_, select, text, update
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.transactions import flush_session, transactional_session
+from ..db.customer_search_index import SQLITE_TRIGRAM_TABLE
+from .catalog_search_index import normalize_search_text
+
+# Campos del cliente que alimentan la búsqueda de texto libre.
+SEARCH_FIELDS: tuple[str, ...] = (
+    "name",
+    "contact_name",
+    "email",
+    "phone",
+    "customer_type",
+    "status",
+    "segment_category",
+    "notes",
+    "tax_id",
+)
+EXACT_MATCH_LIMIT = 50
+# Hasta este número de coincidencias FTS5 se filtra por identificador.
+SELECTIVE_MATCH_LIMIT = 1_000
+REBUILD_BATCH_SIZE = 2_000
+
+_NON_DIGITS = re.compile(r"\D")
+_PHONE_LIKE = re.compile(r"^[\d\s()+.\-]+$")
+_MIN_EXACT_DIGITS = 8
+
+
+def _digits(value: str | None) -> str:
+    return _NON_DIGITS.sub("", value or "")
+
+
+def build_customer_search_document(customer: models.Customer) -> dict[str, object]:
+    """Fila de ``customer_search_documents`` para el cliente."""
+
+    parts = [normalize_search_text(getattr(customer, field, None)) for field in SEARCH_FIELDS]
+    parts.extend(normalize_search_text(tag) for tag in customer.tags or [])
+    # Los dígitos sueltos permiten encontrar `0801199912345` o `99887766`
+    # aunque el RTN o el teléfono se hayan guardado con separadores.
+    parts.extend([_digits(customer.tax_id), _digits(customer.phone)])
+    return {
+        "customer_id": customer.id,
+        "document": " ".join(part for part in parts if part),
+        "tax_id_key": _digits(customer.tax_id),
+        "phone_key": _digits(customer.phone),
+        "email_key": (customer.email or "").strip().lower(),
+    }
+
+
+def _customer_tag_rows(customer_id: int, tags: Sequence[str] | None) -> list[dict[str, object]]:
+    normalized = dict.fromkeys(
+        str(tag).strip().lower() for tag in tags or [] if str(tag).strip()
+    )
+    return [{"customer_id": customer_id, "tag": tag} for tag in normalized]
+
+
+def sync_customer_search_index(db: Session, customer: models.Customer) -> None:
+    """Actualiza documento y etiquetas del cliente; los elimina si está dado de baja."""
+
+    if customer.id is None:
+        flush_session(db)
+    remove_customer_search_document(db, customer.id)
+    if customer.is_deleted:
+        return
+    tag_rows = _customer_tag_rows(customer.id, customer.tags)
+    if tag_rows:
+        db.execute(insert(models.CustomerTag.__table__), tag_rows)
+    documents = models.CustomerSearchDocument.__table__
+    row = build_customer_search_document(customer)
+    result = db.execute(
+        update(documents).where(documents.c.customer_id == customer.id).values(**row)
+    )
+    if not result.rowcount:
+        db.execute(insert(documents).values(**row))
+
+
+def remove_customer_search_document(db: Session, customer_id: int) -> None:
+    """Quita al cliente del índice (documento y etiquetas)."""
+
+    documents = models.CustomerSearchDocument.__table__
+    tags = models.CustomerTag.__table__
+    db.execute(delete(documents).where(documents.c.customer_id == customer_id))
+    db.execute(delete(tags).where(tags.c.customer_id == customer_id))
+
+
+def rebuild_customer_search_index(
+    db: Session, *, batch_size: int = REBUILD_BATCH_SIZE
+) -> int:
+    """Regenera documentos y etiquetas de todos los clientes activos.
+
+    Devuelve la cantidad de documentos escritos.
+    """
+
+    customer = models.Customer
+    documents = models.CustomerSearchDocument.__table__
+    tags = models.CustomerTag.__table__
+    fields = sorted({"id", "tags", *SEARCH_FIELDS})
+    columns = [getattr(customer, field) for field in fields]
+    written = 0
+    with transactional_session(db):
+        db.execute(delete(documents))
+        db.execute(delete(tags))
+        last_id = 0
+        while True:
+            batch = db.execute(
+                select(*columns)
+                .where(customer.is_deleted.is_(False), customer.id > last_id)
+                .order_by(customer.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+            tag_rows = [row for item in batch for row in _customer_tag_rows(item.id, item.tags)]
+            if tag_rows:
+                db.execute(insert(tags), tag_rows)
+            rows = [build_customer_search_document(item) for item in batch]  # type: ignore[arg-type]
+            db.execute(insert(documents), rows)
+            written += len(rows)
+            last_id = batch[-1].id
+        flush_session(db)
+    return written
+
+
+def _sqlite_fts_available(db: Session) -> bool:
+    found = db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SQLITE_TRIGRAM_TABLE},
+    ).first()
+    return found is not None
+
+
+def _exact_match_ids(db: Session, query: str) -> list[int]:
+    documents = models.CustomerSearchDocument
+    term = query.strip().lower()
+    if "@" in term and " " not in term:
+        condition = documents.email_key == term
+    elif _PHONE_LIKE.match(term) and len(_digits(term)) >= _MIN_EXACT_DIGITS:
+        digits = _digits(term)
+        condition = or_(documents.tax_id_key == digits, documents.phone_key == digits)
+    else:
+        return []
+    statement = select(documents.customer_id).where(condition).limit(EXACT_MATCH_LIMIT)
+    return list(db.scalars(statement))
+
+
+def _fts_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def customer_search_clause(db: Session, query: str) -> ColumnElement[bool] | None:
+    """Condición para el término libre de ``list_customers``.
+
+    RTN, teléfono o correo completos se resuelven por igualdad; si no hay
+    coincidencias exactas, cada palabra del término debe aparecer como
+    subcadena en el documento (equivalente al antiguo ``lower(col) LIKE``).
+    """
+
+    tokens = normalize_search_text(query).split()
+    if not tokens:
+        return None
+    exact_ids = _exact_match_ids(db, query)
+    if exact_ids:
+        return models.Customer.id.in_(exact_ids)
+    # El tokenizador trigram sólo resuelve subcadenas de tres o más caracteres.
+    if (
+        db.get_bind().dialect.name == "sqlite"
+        and all(len(token) >= 3 for token in tokens)
+        and _sqlite_fts_available(db)
+    ):
+        match = " AND ".join(_fts_phrase(token) for token in tokens)
+        candidates = list(
+            db.scalars(
+                text(
+                    f"SELECT rowid FROM {SQLITE_TRIGRAM_TABLE} "
+                    f"WHERE {SQLITE_TRIGRAM_TABLE} MATCH :match LIMIT :limit"
+                ),
+                {"match": match, "limit": SELECTIVE_MATCH_LIMIT + 1},
+            )
+        )
+        if len(candidates) <= SELECTIVE_MATCH_LIMIT:
+            return models.Customer.id.in_(candidates)
+    # Términos muy frecuentes o cortos: el EXISTS correlacionado permite
+    # recorrer clientes en orden de nombre y detenerse al llenar la página en
+    # lugar de materializar todas las coincidencias.
+    documents = models.CustomerSearchDocument
+    return (
+        select(documents.customer_id)
+        .where(
+            documents.customer_id == models.Customer.id,
+            *(documents.document.like(f"%{token}%") for token in tokens),
+        )
+        .exists()
+    )
+
+
+def customer_tags_clause(tags: Sequence[str]) -> ColumnElement[bool] | None:
+    """Clientes que tienen todas las etiquetas indicadas (ya normalizadas)."""
+
+    wanted = list(dict.fromkeys(tags))
+    if not wanted:
+        return None
+    customer_tags = models.CustomerTag
+    subquery = (
+        select(customer_tags.customer_id)
+        .where(customer_tags.tag.in_(wanted))
+        .group_by(customer_tags.customer_id)
+        .having(func.count() == len(wanted))
+    )
+    return models.Customer.id.in_(subquery)
+
+
+__all__ = [
+    "SEARCH_FIELDS",
+    "build_customer_search_document",
+    "customer_search_clause",
+    "customer_tags_clause",
+    "rebuild_customer_search_index",
+    "remove_customer_search_document",
+    "sync_customer_search_index",
+]
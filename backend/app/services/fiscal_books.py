@@ -2,22 +2,18 @@
 
 from __future__ import annotations
 
+import calendar
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from io import BytesIO
-from typing import Iterable, Sequence
+from typing import IO, Iterable, Sequence
 from xml.etree.ElementTree import Element, SubElement, tostring
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import crud, models, schemas
+from .streaming_exports import XlsxCell, XlsxSheet, write_xlsx
 
 RATE_15 = Decimal("0.15")
 RATE_18 = Decimal("0.18")
@@ -198,7 +194,35 @@ def build_purchases_fiscal_book(
     return _build_entries(canonical, filters)
 
 
+def build_fiscal_book_report(
+    db: Session,
+    *,
+    book_type: schemas.FiscalBookType,
+    year: int,
+    month: int,
+) -> schemas.FiscalBookReport:
+    """Construye el libro fiscal del mes a partir de ventas o compras."""
+
+    start_date = date(year, month, 1)
+    end_date = date(year, month, calendar.monthrange(year, month)[1])
+    start_dt = datetime.combine(start_date, datetime.min.time())
+    end_dt = datetime.combine(end_date, datetime.max.time())
+    filters = schemas.FiscalBookFilters(year=year, month=month, book_type=book_type)
+    if book_type is schemas.FiscalBookType.SALES:
+        sales = crud.list_sales(db, start_date=start_dt, end_date=end_dt, limit=None)
+        return build_sales_fiscal_book(sales, filters)
+    purchases = crud.list_purchase_records_for_report(
+        db, date_from=start_dt, date_to=end_dt
+    )
+    return build_purchases_fiscal_book(purchases, filters)
+
+
 def render_fiscal_book_pdf(report: schemas.FiscalBookReport) -> bytes:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title="Libro fiscal")
     styles = getSampleStyleSheet()
@@ -304,10 +328,8 @@ def render_fiscal_book_pdf(report: schemas.FiscalBookReport) -> bytes:
     return buffer.read()
 
 
-def render_fiscal_book_excel(report: schemas.FiscalBookReport) -> BytesIO:
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Libro Fiscal"
+def render_fiscal_book_excel(report: schemas.FiscalBookReport) -> IO[bytes]:
+    """Libro fiscal en XLSX, escrito en modo ``write_only`` a un archivo temporal."""
 
     headers = [
         "#",
@@ -322,43 +344,47 @@ def render_fiscal_book_excel(report: schemas.FiscalBookReport) -> BytesIO:
         "Exento",
         "Total",
     ]
-    header_font = Font(color="FFFFFF", bold=True)
-    header_fill = PatternFill("solid", fgColor="0f172a")
-    for column, header in enumerate(headers, start=1):
-        cell = sheet.cell(row=1, column=column, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    for row_index, entry in enumerate(report.entries, start=2):
-        sheet.cell(row=row_index, column=1, value=entry.correlativo)
-        sheet.cell(row=row_index, column=2, value=entry.fecha.strftime("%Y-%m-%d"))
-        sheet.cell(row=row_index, column=3, value=entry.documento)
-        sheet.cell(row=row_index, column=4, value=entry.contraparte or "")
-        sheet.cell(row=row_index, column=5, value=entry.detalle or "")
-        sheet.cell(row=row_index, column=6, value=float(_quantize(entry.base_15)))
-        sheet.cell(row=row_index, column=7, value=float(_quantize(entry.impuesto_15)))
-        sheet.cell(row=row_index, column=8, value=float(_quantize(entry.base_18)))
-        sheet.cell(row=row_index, column=9, value=float(_quantize(entry.impuesto_18)))
-        sheet.cell(row=row_index, column=10, value=float(_quantize(entry.base_exenta)))
-        sheet.cell(row=row_index, column=11, value=float(_quantize(entry.total)))
-
-    total_row = len(report.entries) + 2
-    sheet.cell(row=total_row, column=5, value="Totales").font = Font(bold=True)
-    sheet.cell(row=total_row, column=6, value=float(report.totals.base_15))
-    sheet.cell(row=total_row, column=7, value=float(report.totals.impuesto_15))
-    sheet.cell(row=total_row, column=8, value=float(report.totals.base_18))
-    sheet.cell(row=total_row, column=9, value=float(report.totals.impuesto_18))
-    sheet.cell(row=total_row, column=10, value=float(report.totals.base_exenta))
-    sheet.cell(row=total_row, column=11, value=float(report.totals.total_general))
-
-    for column in range(1, len(headers) + 1):
-        sheet.column_dimensions[get_column_letter(column)].width = 18
 
-    buffer = BytesIO()
-    workbook.save(buffer)
-    buffer.seek(0)
-    return buffer
+    def rows() -> Iterable[list[object]]:
+        for entry in report.entries:
+            yield [
+                entry.correlativo,
+                entry.fecha.strftime("%Y-%m-%d"),
+                entry.documento,
+                entry.contraparte or "",
+                entry.detalle or "",
+                float(_quantize(entry.base_15)),
+                float(_quantize(entry.impuesto_15)),
+                float(_quantize(entry.base_18)),
+                float(_quantize(entry.impuesto_18)),
+                float(_quantize(entry.base_exenta)),
+                float(_quantize(entry.total)),
+            ]
+        yield [
+            None,
+            None,
+            None,
+            None,
+            XlsxCell("Totales", bold=True),
+            float(report.totals.base_15),
+            float(report.totals.impuesto_15),
+            float(report.totals.base_18),
+            float(report.totals.impuesto_18),
+            float(report.totals.base_exenta),
+            float(report.totals.total_general),
+        ]
+
+    return write_xlsx(
+        [
+            XlsxSheet(
+                title="Libro Fiscal",
+                header=headers,
+                rows=rows(),
+                column_width=18,
+                styled_header=True,
+            )
+        ]
+    )
 
 
 def render_fiscal_book_xml(report: schemas.FiscalBookReport) -> BytesIO:
@@ -399,6 +425,7 @@ def render_fiscal_book_xml(report: schemas.FiscalBookReport) -> BytesIO:
 
 
 __all__ = [
+    "build_fiscal_book_report",
     "build_sales_fiscal_book",
     "build_purchases_fiscal_book",
     "render_fiscal_book_pdf",
@@ -4,14 +4,7 @@ from __future__ import annotations
 import csv
 from datetime import datetime
 from io import BytesIO, StringIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING
 
 from .. import schemas
 from .global_reports_constants import (
@@ -22,6 +15,9 @@ from .global_reports_constants import (
     SECONDARY_BACKGROUND,
 )
 
+if TYPE_CHECKING:
+    from reportlab.platypus import Table
+
 __all__ = [
     "render_global_report_pdf",
     "render_global_report_xlsx",
@@ -36,6 +32,9 @@ def _format_datetime(value: datetime | None) -> str:
 
 
 def _build_pdf_table(data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
@@ -62,6 +61,11 @@ def render_global_report_pdf(
     overview: schemas.GlobalReportOverview,
     dashboard: schemas.GlobalReportDashboard,
 ) -> bytes:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title="Softmobile 2025 — Reporte global")
     styles = getSampleStyleSheet()
@@ -219,6 +223,10 @@ def render_global_report_xlsx(
     overview: schemas.GlobalReportOverview,
     dashboard: schemas.GlobalReportDashboard,
 ) -> BytesIO:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     workbook = Workbook()
     summary_sheet = workbook.active
     summary_sheet.title = "Resumen"
@@ -8,12 +8,6 @@ from io import BytesIO
 from time import perf_counter
 from typing import Any, Iterable, Sequence, TypedDict
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -267,6 +261,9 @@ def export_validations_to_excel(
 ) -> BytesIO:
     """Genera un libro de Excel con las validaciones registradas."""
 
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Validaciones"
@@ -336,6 +333,11 @@ def export_validations_to_pdf(
 ) -> BytesIO:
     """Genera un PDF con el detalle de las validaciones."""
 
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4)
     styles = getSampleStyleSheet()
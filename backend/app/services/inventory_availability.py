@@ -18,7 +18,9 @@ _MAX_LIMIT = 250
 _AvailabilityRecord = Mapping[str, Any]
 _AvailabilityResponse = Mapping[str, Any]
 
-_CACHE: TTLCache[_AvailabilityResponse] = TTLCache(_CACHE_TTL_SECONDS)
+_CACHE: TTLCache[_AvailabilityResponse] = TTLCache(
+    _CACHE_TTL_SECONDS, name="inventory_availability", shared=True
+)
 
 
 def _normalize_reference(sku: str | None, device_id: int) -> str:
@@ -28,6 +30,22 @@ def _normalize_reference(sku: str | None, device_id: int) -> str:
     return f"device:{device_id}"
 
 
+def _sku_tag(reference: str) -> str:
+    return f"inventory_availability:sku={reference}"
+
+
+def _store_tag(store_id: int) -> str:
+    return f"inventory_availability:store={store_id}"
+
+
+def _payload_tags(items: Sequence[_AvailabilityRecord]) -> list[str]:
+    """Etiquetas de una respuesta: cada referencia y cada sucursal que incluye."""
+
+    tags = {_sku_tag(item["reference"]) for item in items}
+    tags.update(_store_tag(store["store_id"]) for item in items for store in item["stores"])
+    return sorted(tags)
+
+
 def _sanitize_skus(skus: Sequence[str] | None) -> tuple[str, ...]:
     if not skus:
         return tuple()
@@ -183,14 +201,31 @@ def get_inventory_availability(
         "generated_at": datetime.now(timezone.utc),
         "items": items,
     }
-    _CACHE.set(cache_key, copy.deepcopy(payload))
+    _CACHE.set(cache_key, copy.deepcopy(payload), tags=_payload_tags(items))
     return copy.deepcopy(payload)
 
 
-def invalidate_inventory_availability_cache() -> None:
-    """Limpia el cache en memoria de disponibilidad."""
-
-    _CACHE.clear()
+def invalidate_inventory_availability_cache(
+    store_id: int | None = None,
+    *,
+    sku: str | None = None,
+    device_id: int | None = None,
+) -> None:
+    """Invalida las respuestas de disponibilidad afectadas por un cambio.
+
+    Un movimiento sólo altera las cantidades de su referencia (``sku`` o, sin
+    SKU, ``device_id``), así que basta con descartar las respuestas que la
+    incluyen; el conjunto de filas de una búsqueda no depende de las
+    existencias. Con sólo ``store_id`` se descartan las respuestas que
+    muestran esa sucursal y sin argumentos se limpia todo el cache.
+    """
+
+    if (sku and sku.strip()) or device_id is not None:
+        _CACHE.invalidate_tags(_sku_tag(_normalize_reference(sku, device_id or 0)))
+    elif store_id is not None:
+        _CACHE.invalidate_tags(_store_tag(store_id))
+    else:
+        _CACHE.clear()
 
 
 __all__ = [
@@ -6,17 +6,16 @@ endpoints nuevos para PDF y XLSX.
 """
 from __future__ import annotations
 
+import csv
 from datetime import datetime, timezone
-from io import BytesIO
-from typing import Iterable
+from io import BytesIO, StringIO
+from typing import IO, Any, Iterable, Iterator, Sequence
 
-from openpyxl import Workbook
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
 from sqlalchemy.orm import Session
 
 from .. import crud, models
+from . import render_pool
+from .streaming_exports import XlsxSheet, iter_csv, write_xlsx
 
 PDF_HEADER_FIELDS = [
     "SKU",
@@ -54,7 +53,7 @@ def _fetch_devices(
     fecha_ingreso_desde: datetime | None,
     fecha_ingreso_hasta: datetime | None,
 ) -> Iterable[models.Device]:
-    return crud.list_devices(
+    return crud.iter_devices(
         db,
         store_id,
         search=search,
@@ -66,25 +65,37 @@ def _fetch_devices(
         proveedor=proveedor,
         fecha_ingreso_desde=fecha_ingreso_desde,
         fecha_ingreso_hasta=fecha_ingreso_hasta,
-        limit=None,
     )
 
 
-def render_devices_catalog_pdf(
-    db: Session,
-    store_id: int,
-    *,
-    search: str | None = None,
-    estado: models.CommercialState | None = None,
-    categoria: str | None = None,
-    condicion: str | None = None,
-    estado_inventario: str | None = None,
-    ubicacion: str | None = None,
-    proveedor: str | None = None,
-    fecha_ingreso_desde: datetime | None = None,
-    fecha_ingreso_hasta: datetime | None = None,
-) -> bytes:
-    """Genera un PDF del catálogo filtrado en diseño simple compatible."""
+def _encode_rows(rows: Iterable[Sequence[object]]) -> bytes:
+    # Las filas viajan al proceso de generación como CSV: un solo bloque de
+    # bytes ocupa mucho menos que miles de tuplas de objetos Python.
+    return b"".join(iter_csv(rows))
+
+
+def _decode_rows(rows_csv: bytes) -> Iterator[list[str]]:
+    return csv.reader(StringIO(rows_csv.decode("utf-8")))
+
+
+def _pdf_row(device: models.Device) -> list[str]:
+    return [
+        device.sku,
+        (device.name or "")[:26],
+        (device.marca or "")[:14],
+        (device.modelo or "")[:16],
+        str(device.quantity),
+        f"{device.unit_price:.2f}" if device.unit_price else "0.00",
+        (device.imei or device.serial or "")[:17],
+    ]
+
+
+def draw_devices_catalog_pdf(store_id: int, rows_csv: bytes) -> bytes:
+    """Dibuja el PDF del catálogo a partir de las filas ya formateadas."""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
     buffer = BytesIO()
     c = canvas.Canvas(buffer, pagesize=A4)
     width, height = A4
@@ -106,29 +117,7 @@ def render_devices_catalog_pdf(
     y -= 12
     c.setFont("Helvetica", 7)
 
-    devices = _fetch_devices(
-        db,
-        store_id,
-        search=search,
-        estado=estado,
-        categoria=categoria,
-        condicion=condicion,
-        estado_inventario=estado_inventario,
-        ubicacion=ubicacion,
-        proveedor=proveedor,
-        fecha_ingreso_desde=fecha_ingreso_desde,
-        fecha_ingreso_hasta=fecha_ingreso_hasta,
-    )
-    for device in devices:
-        row_values = [
-            device.sku,
-            (device.name or "")[:26],
-            (device.marca or "")[:14],
-            (device.modelo or "")[:16],
-            str(device.quantity),
-            f"{device.unit_price:.2f}" if device.unit_price else "0.00",
-            (device.imei or device.serial or "")[:17],
-        ]
+    for row_values in _decode_rows(rows_csv):
         for idx, value in enumerate(row_values):
             c.drawString(margin_x + idx * 70, y, value)
         y -= 11
@@ -145,7 +134,7 @@ def render_devices_catalog_pdf(
     return buffer.getvalue()
 
 
-def render_devices_catalog_excel(
+def render_devices_catalog_pdf(
     db: Session,
     store_id: int,
     *,
@@ -159,11 +148,8 @@ def render_devices_catalog_excel(
     fecha_ingreso_desde: datetime | None = None,
     fecha_ingreso_hasta: datetime | None = None,
 ) -> bytes:
-    """Genera un XLSX del catálogo filtrado."""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Catalogo"
-    ws.append(EXCEL_HEADERS)
+    """Genera un PDF del catálogo filtrado en diseño simple compatible."""
+
     devices = _fetch_devices(
         db,
         store_id,
@@ -177,22 +163,92 @@ def render_devices_catalog_excel(
         fecha_ingreso_desde=fecha_ingreso_desde,
         fecha_ingreso_hasta=fecha_ingreso_hasta,
     )
-    for device in devices:
-        ws.append(
-            [
-                device.sku,
-                device.name,
-                device.marca,
-                device.modelo,
-                device.quantity,
-                float(device.unit_price or 0),
-                device.imei,
-                device.serial,
-            ]
+    rows_csv = _encode_rows(_pdf_row(device) for device in devices)
+    return render_pool.render(draw_devices_catalog_pdf, store_id, rows_csv)
+
+
+def _excel_row(device: models.Device) -> list[object]:
+    return [
+        device.sku,
+        device.name,
+        device.marca,
+        device.modelo,
+        device.quantity,
+        float(device.unit_price or 0),
+        device.imei,
+        device.serial,
+    ]
+
+
+def write_devices_catalog_xlsx(rows_csv: bytes) -> IO[bytes]:
+    """Escribe el XLSX del catálogo a partir de las filas codificadas."""
+
+    rows = (
+        [
+            sku,
+            name or None,
+            marca or None,
+            modelo or None,
+            int(quantity),
+            float(unit_price),
+            imei or None,
+            serial or None,
+        ]
+        for sku, name, marca, modelo, quantity, unit_price, imei, serial in _decode_rows(
+            rows_csv
         )
-    stream = BytesIO()
-    wb.save(stream)
-    return stream.getvalue()
+    )
+    return write_xlsx([XlsxSheet(title="Catalogo", header=EXCEL_HEADERS, rows=rows)])
+
+
+def write_devices_catalog_excel(
+    db: Session,
+    store_id: int,
+    *,
+    search: str | None = None,
+    estado: models.CommercialState | None = None,
+    categoria: str | None = None,
+    condicion: str | None = None,
+    estado_inventario: str | None = None,
+    ubicacion: str | None = None,
+    proveedor: str | None = None,
+    fecha_ingreso_desde: datetime | None = None,
+    fecha_ingreso_hasta: datetime | None = None,
+) -> IO[bytes]:
+    """Escribe el XLSX del catálogo filtrado en un archivo temporal."""
+
+    devices = _fetch_devices(
+        db,
+        store_id,
+        search=search,
+        estado=estado,
+        categoria=categoria,
+        condicion=condicion,
+        estado_inventario=estado_inventario,
+        ubicacion=ubicacion,
+        proveedor=proveedor,
+        fecha_ingreso_desde=fecha_ingreso_desde,
+        fecha_ingreso_hasta=fecha_ingreso_hasta,
+    )
+    rows_csv = _encode_rows(_excel_row(device) for device in devices)
+    return render_pool.render_file(write_devices_catalog_xlsx, rows_csv)
+
+
+def render_devices_catalog_excel(
+    db: Session,
+    store_id: int,
+    **filters: Any,
+) -> bytes:
+    """Genera un XLSX del catálogo filtrado."""
 
+    with write_devices_catalog_excel(db, store_id, **filters) as workbook:
+        return workbook.read()
 
-__all__ = ["render_devices_catalog_pdf", "render_devices_catalog_excel"]
+
+__all__ = [
+    "draw_devices_catalog_pdf",
+    "render_devices_catalog_pdf",
+    "render_devices_catalog_excel",
+    "write_devices_catalog_excel",
+    "write_devices_catalog_xlsx",
+]
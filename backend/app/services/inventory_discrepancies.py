@@ -0,0 +1,267 @@
+"""Detector incremental de discrepancias de inventario entre sucursales.
+
+Mantiene en ``inventory_sku_summaries`` los SKU cuyas existencias difieren
+entre dispositivos/sucursales (mínimo, máximo y cantidades por sucursal). En
+cada ciclo sólo se recalculan los SKU tocados desde la última marca de agua
+por eventos ``device`` de la cola híbrida o por movimientos de inventario; la
+reconstrucción completa se resuelve con ``GROUP BY sku HAVING MIN <> MAX``.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..config import settings
+from ..core.transactions import flush_session, transactional_session
+
+_STATE_ID = 1
+_IN_CHUNK_SIZE = 500
+# Margen hacia atrás para cubrir transacciones confirmadas tras la marca previa.
+_WATERMARK_OVERLAP = timedelta(seconds=60)
+_DEVICE_ENTITY_TYPES = ("device",)
+
+
+def _chunked(values: Sequence, size: int = _IN_CHUNK_SIZE) -> Iterator[Sequence]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _as_aware(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _discrepant_skus_statement(skus: Sequence[str] | None = None):
+    statement = (
+        select(models.Device.sku)
+        .join(models.Store, models.Store.id == models.Device.store_id)
+        .where(models.Device.sku != "")
+        .group_by(models.Device.sku)
+        .having(func.min(models.Device.quantity) != func.max(models.Device.quantity))
+    )
+    if skus is not None:
+        statement = statement.where(models.Device.sku.in_(skus))
+    return statement
+
+
+def _build_summaries(
+    db: Session, skus: Sequence[str] | None = None
+) -> list[models.InventorySkuSummary]:
+    """Calcula los resúmenes de los SKU con discrepancia (todos o los indicados)."""
+
+    detail = (
+        select(
+            models.Device.id.label("device_id"),
+            models.Device.sku.label("device_sku"),
+            models.Device.name.label("device_name"),
+            models.Device.store_id.label("store_id"),
+            models.Store.name.label("store_name"),
+            models.Device.quantity.label("quantity"),
+        )
+        .join(models.Store, models.Store.id == models.Device.store_id)
+        .where(models.Device.sku.in_(_discrepant_skus_statement(skus).scalar_subquery()))
+        .order_by(models.Device.sku, models.Store.name)
+    )
+    grouped: dict[str, list[dict[str, object]]] = defaultdict(list)
+    names: dict[str, str] = {}
+    for row in db.execute(detail):
+        mapping = row._mapping
+        sku = mapping["device_sku"]
+        names.setdefault(sku, mapping["device_name"])
+        grouped[sku].append(
+            {
+                "device_id": mapping["device_id"],
+                "store_id": mapping["store_id"],
+                "store_name": mapping["store_name"],
+                "quantity": int(mapping["quantity"] or 0),
+            }
+        )
+
+    now = datetime.now(timezone.utc)
+    summaries: list[models.InventorySkuSummary] = []
+    for sku, items in grouped.items():
+        quantities = [item["quantity"] for item in items]
+        summaries.append(
+            models.InventorySkuSummary(
+                sku=sku,
+                product_name=names[sku],
+                min_quantity=min(quantities),
+                max_quantity=max(quantities),
+                store_quantities=items,
+                updated_at=now,
+            )
+        )
+    return summaries
+
+
+def _touched_skus(db: Session, since: datetime) -> set[str]:
+    """SKU afectados por movimientos o eventos de dispositivo desde ``since``."""
+
+    device_ids: set[int] = set(
+        db.scalars(
+            select(models.InventoryMovement.device_id)
+            .where(models.InventoryMovement.created_at >= since)
+            .distinct()
+        )
+    )
+    outbox_ids = db.scalars(
+        select(models.SyncOutbox.entity_id).where(
+            models.SyncOutbox.entity_type.in_(_DEVICE_ENTITY_TYPES),
+            models.SyncOutbox.updated_at >= since,
+        )
+    )
+    for entity_id in outbox_ids:
+        try:
+            device_ids.add(int(entity_id))
+        except (TypeError, ValueError):
+            continue
+    if not device_ids:
+        return set()
+
+    ordered_ids = sorted(device_ids)
+    skus: set[str] = set()
+    for chunk in _chunked(ordered_ids):
+        skus.update(
+            db.scalars(
+                select(models.Device.sku)
+                .where(models.Device.id.in_(chunk))
+                .distinct()
+            )
+        )
+    # Dispositivos eliminados o con SKU modificado pueden cerrar una
+    # discrepancia registrada bajo su SKU anterior.
+    for sku, store_quantities in db.execute(
+        select(
+            models.InventorySkuSummary.sku,
+            models.InventorySkuSummary.store_quantities,
+        )
+    ):
+        if any(item.get("device_id") in device_ids for item in store_quantities or ()):
+            skus.add(sku)
+    skus.discard("")
+    return skus
+
+
+def _replace_summaries(
+    db: Session, skus: Iterable[str] | None, summaries: list[models.InventorySkuSummary]
+) -> None:
+    if skus is None:
+        db.execute(delete(models.InventorySkuSummary))
+    else:
+        for chunk in _chunked(sorted(skus)):
+            db.execute(
+                delete(models.InventorySkuSummary).where(
+                    models.InventorySkuSummary.sku.in_(chunk)
+                )
+            )
+    db.add_all(summaries)
+
+
+def _needs_full_rebuild(state: models.InventorySkuSummaryState, now: datetime) -> bool:
+    if state.watermark_at is None or state.rebuilt_at is None:
+        return True
+    interval = settings.inventory_discrepancy_full_rebuild_seconds
+    if interval <= 0:
+        return False
+    return now - _as_aware(state.rebuilt_at) >= timedelta(seconds=interval)
+
+
+def refresh_inventory_sku_summary(db: Session, *, full: bool = False) -> int:
+    """Actualiza el resumen persistido y devuelve el número de SKU recalculados.
+
+    Sin marca de agua previa, con ``full=True`` o al vencer
+    ``INVENTORY_DISCREPANCY_FULL_REBUILD_SECONDS`` se reconstruye por completo.
+    """
+
+    now = datetime.now(timezone.utc)
+    with transactional_session(db):
+        state = db.get(models.InventorySkuSummaryState, _STATE_ID)
+        if state is None:
+            state = models.InventorySkuSummaryState(id=_STATE_ID)
+            db.add(state)
+
+        if full or _needs_full_rebuild(state, now):
+            summaries = _build_summaries(db)
+            _replace_summaries(db, None, summaries)
+            state.rebuilt_at = now
+            refreshed = len(summaries)
+        else:
+            touched = sorted(
+                _touched_skus(db, _as_aware(state.watermark_at) - _WATERMARK_OVERLAP)
+            )
+            summaries = []
+            for chunk in _chunked(touched):
+                summaries.extend(_build_summaries(db, chunk))
+            _replace_summaries(db, touched, summaries)
+            refreshed = len(touched)
+        state.watermark_at = now
+        flush_session(db)
+    return refreshed
+
+
+def _summary_to_discrepancy(
+    sku: str,
+    product_name: str,
+    min_quantity: int,
+    max_quantity: int,
+    store_quantities: Sequence[dict[str, object]],
+) -> dict[str, object]:
+    def _stores_with(quantity: int) -> list[dict[str, object]]:
+        return [
+            {
+                "store_id": item["store_id"],
+                "store_name": item["store_name"],
+                "quantity": item["quantity"],
+            }
+            for item in store_quantities
+            if item["quantity"] == quantity
+        ]
+
+    return {
+        "sku": sku,
+        "product_name": product_name,
+        "diferencia": max_quantity - min_quantity,
+        "max": _stores_with(max_quantity),
+        "min": _stores_with(min_quantity),
+    }
+
+
+def list_inventory_discrepancies(db: Session) -> list[dict[str, object]]:
+    """Devuelve las discrepancias registradas en el resumen persistido."""
+
+    statement = select(
+        models.InventorySkuSummary.sku,
+        models.InventorySkuSummary.product_name,
+        models.InventorySkuSummary.min_quantity,
+        models.InventorySkuSummary.max_quantity,
+        models.InventorySkuSummary.store_quantities,
+    ).order_by(models.InventorySkuSummary.sku)
+    return [_summary_to_discrepancy(*row) for row in db.execute(statement)]
+
+
+def compute_inventory_discrepancies(db: Session) -> list[dict[str, object]]:
+    """Calcula las discrepancias con una consulta agregada sin persistirlas."""
+
+    return [
+        _summary_to_discrepancy(
+            summary.sku,
+            summary.product_name,
+            summary.min_quantity,
+            summary.max_quantity,
+            summary.store_quantities,
+        )
+        for summary in _build_summaries(db)
+    ]
+
+
+__all__ = [
+    "compute_inventory_discrepancies",
+    "list_inventory_discrepancies",
+    "refresh_inventory_sku_summary",
+]
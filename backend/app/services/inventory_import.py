@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterator
 from datetime import date
 from decimal import Decimal
 from io import StringIO
@@ -14,6 +15,7 @@ from sqlalchemy.orm import Session
 from ..core.transactions import transactional_session
 
 from .. import crud, models, schemas
+from .streaming_exports import render_csv
 
 EXPORT_HEADERS = [
     "sku",
@@ -52,6 +54,68 @@ DEVICE_ERROR_MESSAGES = {
 }
 
 
+def _device_export_row(device: models.Device) -> list[object]:
+    return [
+        device.sku,
+        device.name,
+        device.marca or "",
+        device.modelo or "",
+        device.categoria or "",
+        device.condicion or "",
+        device.color or "",
+        device.capacidad or "",
+        device.capacidad_gb or "",
+        device.estado,
+        device.estado_comercial.value if device.estado_comercial else "",
+        device.quantity,
+        _decimal_to_str(device.costo_unitario),
+        _decimal_to_str(device.precio_venta),
+        device.proveedor or "",
+        device.ubicacion or "",
+        device.fecha_compra.isoformat() if device.fecha_compra else "",
+        device.fecha_ingreso.isoformat() if device.fecha_ingreso else "",
+        device.garantia_meses,
+        device.lote or "",
+        (device.descripcion or "").replace("\n", " ").strip(),
+        device.imagen_url or "",
+        device.imei or "",
+        device.serial or "",
+    ]
+
+
+def iter_device_export_rows(
+    db: Session,
+    store_id: int,
+    *,
+    search: str | None = None,
+    estado: models.CommercialState | None = None,
+    categoria: str | None = None,
+    condicion: str | None = None,
+    estado_inventario: str | None = None,
+    ubicacion: str | None = None,
+    proveedor: str | None = None,
+    fecha_ingreso_desde: date | None = None,
+    fecha_ingreso_hasta: date | None = None,
+) -> Iterator[list[object]]:
+    """Filas del CSV de catálogo en el orden de ``EXPORT_HEADERS``, por lotes."""
+
+    devices = crud.iter_devices(
+        db,
+        store_id,
+        search=search,
+        estado=estado,
+        categoria=categoria,
+        condicion=condicion,
+        estado_inventario=estado_inventario,
+        ubicacion=ubicacion,
+        proveedor=proveedor,
+        fecha_ingreso_desde=fecha_ingreso_desde,
+        fecha_ingreso_hasta=fecha_ingreso_hasta,
+    )
+    for device in devices:
+        yield _device_export_row(device)
+
+
 def export_devices_csv(
     db: Session,
     store_id: int,
@@ -68,7 +132,7 @@ def export_devices_csv(
 ) -> str:
     """Genera un CSV con la ficha completa de los productos de la sucursal."""
 
-    devices = crud.list_devices(
+    rows = iter_device_export_rows(
         db,
         store_id,
         search=search,
@@ -80,41 +144,8 @@ def export_devices_csv(
         proveedor=proveedor,
         fecha_ingreso_desde=fecha_ingreso_desde,
         fecha_ingreso_hasta=fecha_ingreso_hasta,
-        limit=None,
     )
-    buffer = StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=EXPORT_HEADERS)
-    writer.writeheader()
-    for device in devices:
-        writer.writerow(
-            {
-                "sku": device.sku,
-                "name": device.name,
-                "marca": device.marca or "",
-                "modelo": device.modelo or "",
-                "categoria": device.categoria or "",
-                "condicion": device.condicion or "",
-                "color": device.color or "",
-                "capacidad": device.capacidad or "",
-                "capacidad_gb": device.capacidad_gb or "",
-                "estado": device.estado,
-                "estado_comercial": device.estado_comercial.value if device.estado_comercial else "",
-                "quantity": device.quantity,
-                "costo_compra": _decimal_to_str(device.costo_unitario),
-                "precio_venta": _decimal_to_str(device.precio_venta),
-                "proveedor": device.proveedor or "",
-                "ubicacion": device.ubicacion or "",
-                "fecha_compra": device.fecha_compra.isoformat() if device.fecha_compra else "",
-                "fecha_ingreso": device.fecha_ingreso.isoformat() if device.fecha_ingreso else "",
-                "garantia_meses": device.garantia_meses,
-                "lote": device.lote or "",
-                "descripcion": (device.descripcion or "").replace("\n", " ").strip(),
-                "imagen_url": device.imagen_url or "",
-                "imei": device.imei or "",
-                "serial": device.serial or "",
-            }
-        )
-    return buffer.getvalue()
+    return render_csv(rows, header=EXPORT_HEADERS)
 
 
 def import_devices_from_csv(
@@ -10,12 +10,6 @@ from decimal import Decimal
 from io import BytesIO
 from typing import NamedTuple
 
-from reportlab.lib import colors
-from reportlab.lib.units import mm
-from reportlab.pdfgen import canvas
-from reportlab.graphics.barcode import qr, code128
-from reportlab.graphics.shapes import Drawing
-from reportlab.graphics import renderPDF
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
@@ -174,6 +168,13 @@ def render_device_label_pdf(
 ) -> tuple[bytes, str]:
     """Construye una etiqueta compacta en PDF para un dispositivo."""
 
+    from reportlab.graphics import renderPDF
+    from reportlab.graphics.barcode import code128, qr
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib import colors
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
     context, _device = _build_label_context(db, store_id, device_id)
     template = _resolve_template(template_key)
     width = template.width_mm * mm
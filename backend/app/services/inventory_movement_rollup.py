@@ -0,0 +1,201 @@
+"""Acumulado diario de movimientos de inventario (``inventory_movement_daily``).
+
+Cada movimiento suma su cantidad, su valor (costo unitario × cantidad) y una
+unidad al contador de la fila sucursal × dispositivo × tipo × día dentro de la
+misma transacción en la que se registra. Los resúmenes por tipo y por periodo
+se leen de esta tabla (O(días)) en lugar de recorrer cada movimiento; la
+reconstrucción completa o por rango se expone para mantenimiento.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import ColumnElement, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.transactions import flush_session, transactional_session
+
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _movement_day(moment: datetime) -> date:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+def _utc_day(dialect_name: str, column: ColumnElement[datetime]) -> ColumnElement[date]:
+    """Equivalente SQL de :func:`_movement_day` para agrupar en la reconstrucción.
+
+    En PostgreSQL ``DATE(timestamptz)`` usa la zona de la sesión, así que se
+    convierte a UTC antes de truncar; SQLite guarda la hora UTC sin zona.
+    """
+
+    if dialect_name == "postgresql":
+        return func.date(func.timezone("UTC", column))
+    return func.date(column)
+
+
+def _movement_value(movement: models.InventoryMovement) -> Decimal:
+    if movement.unit_cost is None:
+        return Decimal("0.00")
+    value = Decimal(str(movement.unit_cost)) * movement.quantity
+    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def record_inventory_movement_rollup(
+    db: Session, movement: models.InventoryMovement
+) -> None:
+    """Acumula un movimiento recién registrado en su fila diaria."""
+
+    table = models.InventoryMovementDaily.__table__
+    moved_at = movement.created_at or datetime.now(timezone.utc)
+    row = {
+        "store_id": movement.store_id,
+        "device_id": movement.device_id,
+        "movement_type": movement.movement_type,
+        "day": _movement_day(moved_at),
+        "movement_count": 1,
+        "units": movement.quantity,
+        "total_value": _movement_value(movement),
+    }
+    dialect_insert = _UPSERT_DIALECTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        statement = dialect_insert(table).values(**row)
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    table.c.store_id,
+                    table.c.device_id,
+                    table.c.movement_type,
+                    table.c.day,
+                ],
+                set_={
+                    "movement_count": table.c.movement_count + 1,
+                    "units": table.c.units + statement.excluded.units,
+                    "total_value": table.c.total_value + statement.excluded.total_value,
+                },
+            )
+        )
+        return
+
+    result = db.execute(
+        update(table)
+        .where(
+            table.c.store_id == row["store_id"],
+            table.c.device_id == row["device_id"],
+            table.c.movement_type == row["movement_type"],
+            table.c.day == row["day"],
+        )
+        .values(
+            movement_count=table.c.movement_count + 1,
+            units=table.c.units + row["units"],
+            total_value=table.c.total_value + row["total_value"],
+        )
+    )
+    if not result.rowcount:
+        db.execute(insert(table).values(**row))
+
+
+def rebuild_inventory_movement_daily(
+    db: Session,
+    *,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> int:
+    """Recalcula el acumulado desde ``inventory_movements`` y devuelve las filas.
+
+    Sin límites se reconstruye la tabla completa; con ``date_from``/``date_to``
+    sólo los días del rango (ambos inclusive).
+    """
+
+    movement = models.InventoryMovement
+    daily = models.InventoryMovementDaily
+    day = _utc_day(db.get_bind().dialect.name, movement.created_at)
+    source = (
+        select(
+            movement.store_id,
+            movement.device_id,
+            movement.movement_type,
+            day,
+            func.count(movement.id),
+            func.sum(movement.quantity),
+            func.sum(func.coalesce(movement.unit_cost, 0) * movement.quantity),
+        )
+        .group_by(movement.store_id, movement.device_id, movement.movement_type, day)
+    )
+    cleanup = delete(daily)
+    if date_from is not None:
+        source = source.where(
+            movement.created_at >= datetime.combine(date_from, time.min, timezone.utc)
+        )
+        cleanup = cleanup.where(daily.day >= date_from)
+    if date_to is not None:
+        source = source.where(
+            movement.created_at
+            < datetime.combine(date_to + timedelta(days=1), time.min, timezone.utc)
+        )
+        cleanup = cleanup.where(daily.day <= date_to)
+
+    with transactional_session(db):
+        db.execute(cleanup)
+        result = db.execute(
+            insert(daily.__table__).from_select(
+                [
+                    "store_id",
+                    "device_id",
+                    "movement_type",
+                    "day",
+                    "movement_count",
+                    "units",
+                    "total_value",
+                ],
+                source,
+            )
+        )
+        flush_session(db)
+    return max(result.rowcount or 0, 0)
+
+
+def daily_movement_totals(
+    db: Session,
+    *,
+    store_ids: Iterable[int] | None = None,
+    day_from: date | None = None,
+    day_to: date | None = None,
+    movement_type: models.MovementType | None = None,
+) -> Sequence[tuple[date, models.MovementType, int, int, Decimal]]:
+    """Totales (día, tipo, movimientos, unidades, valor) leídos del acumulado."""
+
+    daily = models.InventoryMovementDaily
+    statement = (
+        select(
+            daily.day,
+            daily.movement_type,
+            func.sum(daily.movement_count),
+            func.sum(daily.units),
+            func.sum(daily.total_value),
+        )
+        .group_by(daily.day, daily.movement_type)
+        .order_by(daily.day, daily.movement_type)
+    )
+    if store_ids:
+        statement = statement.where(daily.store_id.in_(sorted(store_ids)))
+    if day_from is not None:
+        statement = statement.where(daily.day >= day_from)
+    if day_to is not None:
+        statement = statement.where(daily.day <= day_to)
+    if movement_type is not None:
+        statement = statement.where(daily.movement_type == movement_type)
+    return [tuple(row) for row in db.execute(statement)]
+
+
+__all__ = [
+    "daily_movement_totals",
+    "rebuild_inventory_movement_daily",
+    "record_inventory_movement_rollup",
+]
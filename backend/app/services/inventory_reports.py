@@ -6,18 +6,14 @@ import csv
 from datetime import datetime, timezone
 from decimal import Decimal
 from io import BytesIO, StringIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING
 
 from .. import schemas
 from .locale_helpers import format_dual_currency, format_units
 
+if TYPE_CHECKING:
+    from reportlab.platypus import SimpleDocTemplate, Table
+
 
 def _format_currency(value: Decimal | float | int) -> str:
     return format_dual_currency(value)
@@ -46,6 +42,9 @@ def _format_last_action(audit: schemas.AuditTrailInfo | None) -> str:
 
 
 def _build_table(table_data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(table_data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
@@ -65,6 +64,11 @@ def _build_table(table_data: list[list[str]]) -> Table:
 
 
 def _build_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:  # type: ignore[type-arg]
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title=title)
     styles = getSampleStyleSheet()
@@ -87,6 +91,9 @@ def _build_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:  # t
 
 
 def render_inventory_current_pdf(report: schemas.InventoryCurrentReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_document("Softmobile - Existencias actuales")
     styles = getSampleStyleSheet()
 
@@ -132,6 +139,9 @@ def render_inventory_current_pdf(report: schemas.InventoryCurrentReport) -> byte
 
 
 def render_inventory_value_pdf(report: schemas.InventoryValueReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_document("Softmobile - Valor de inventario")
     styles = getSampleStyleSheet()
     elements.append(
@@ -175,6 +185,9 @@ def render_inventory_value_pdf(report: schemas.InventoryValueReport) -> bytes:
 
 
 def render_inventory_movements_pdf(report: schemas.InventoryMovementsReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_document("Softmobile - Movimientos de inventario")
     styles = getSampleStyleSheet()
     elements.append(
@@ -266,6 +279,9 @@ def render_inventory_movements_pdf(report: schemas.InventoryMovementsReport) ->
 
 
 def render_inventory_adjustments_pdf(report: schemas.InventoryMovementsReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_document("Softmobile - Ajustes de inventario")
     styles = getSampleStyleSheet()
 
@@ -337,6 +353,9 @@ def serialize_inventory_adjustments_csv(report: schemas.InventoryMovementsReport
 
 
 def render_top_products_pdf(report: schemas.TopProductsReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_document("Softmobile - Productos más vendidos")
     styles = getSampleStyleSheet()
     elements.append(
@@ -380,12 +399,16 @@ def render_top_products_pdf(report: schemas.TopProductsReport) -> bytes:
 
 
 def _apply_header_style(cell) -> None:
+    from openpyxl.styles import Alignment, Font, PatternFill
+
     cell.font = Font(color="FFFFFF", bold=True)
     cell.fill = PatternFill("solid", fgColor="0f172a")
     cell.alignment = Alignment(horizontal="center")
 
 
 def _autosize_columns(sheet) -> None:
+    from openpyxl.utils import get_column_letter
+
     for column in sheet.columns:
         max_length = 0
         column_letter = get_column_letter(column[0].column)
@@ -397,6 +420,8 @@ def _autosize_columns(sheet) -> None:
 
 
 def build_inventory_current_excel(report: schemas.InventoryCurrentReport) -> BytesIO:
+    from openpyxl import Workbook
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Existencias"
@@ -431,6 +456,8 @@ def build_inventory_current_excel(report: schemas.InventoryCurrentReport) -> Byt
 
 
 def build_inventory_value_excel(report: schemas.InventoryValueReport) -> BytesIO:
+    from openpyxl import Workbook
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Valor"
@@ -464,6 +491,8 @@ def build_inventory_value_excel(report: schemas.InventoryValueReport) -> BytesIO
 
 
 def build_inventory_movements_excel(report: schemas.InventoryMovementsReport) -> BytesIO:
+    from openpyxl import Workbook
+
     workbook = Workbook()
     resumen_sheet = workbook.active
     resumen_sheet.title = "Resumen"
@@ -547,6 +576,8 @@ def build_inventory_movements_excel(report: schemas.InventoryMovementsReport) ->
 
 
 def build_top_products_excel(report: schemas.TopProductsReport) -> BytesIO:
+    from openpyxl import Workbook
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Top productos"
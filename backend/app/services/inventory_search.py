@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from .. import crud, models, schemas
 from ..audit_logger import audit_event
+from .audit_writer import submit_audit_event
 
 
 def _serialize_filters(filters: schemas.DeviceSearchFilters) -> dict[str, object]:
@@ -52,7 +53,8 @@ def advanced_catalog_search(
         f"catalog_search:{performed_by_id}" if performed_by_id is not None else "catalog_search:anon"
     )
 
-    crud.log_audit_event(
+    # La búsqueda no modifica datos: su auditoría puede escribirse en lote.
+    submit_audit_event(
         db,
         action="inventory_catalog_search",
         entity_type="inventory",
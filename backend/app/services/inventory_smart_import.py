@@ -21,7 +21,6 @@ from time import perf_counter
 from typing import Any, Iterable
 from zipfile import BadZipFile
 
-from openpyxl import load_workbook
 from sqlalchemy.orm import Session
 
 from ..core.transactions import transactional_session
@@ -222,6 +221,8 @@ def _read_tabular_file(file_bytes: bytes, filename: str) -> ParsedFile:
     ``ValueError`` que es propagado hasta la capa API para mostrar mensajes en la
     UI de importaciones inteligentes.
     """
+    from openpyxl import load_workbook
+
     if filename.lower().endswith(".csv"):
         return _parse_csv_bytes(file_bytes)
     # default excel
@@ -407,7 +408,7 @@ def _commit_import(
     duration = 0.0
     resumen = ""
     resumen_validacion: schemas.ImportValidationSummary | None = None
-    with transactional_session(db):
+    with transactional_session(db), crud.coalesce_sync_outbox(db):
         for row_index, row in enumerate(canonical_rows, start=1):
             total_processed += 1
             raw_quantity = row.get("cantidad")
@@ -0,0 +1,186 @@
+"""Manejadores de los trabajos pesados atendidos por la cola persistente.
+
+Cada manejador recibe un :class:`~.job_queue.JobContext` con los parámetros
+serializados en JSON por el router que lo encoló, publica su avance y devuelve
+el archivo generado (o ``None`` si el resultado vive en otro lugar, como los
+respaldos).
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from .. import crud, models, schemas
+from ..config import settings
+from ..core.transactions import transactional_session
+from . import (
+    backups as backup_services,
+    cash_reports,
+    fiscal_books,
+    global_reports_data,
+    global_reports_renderers,
+    inventory_catalog_export,
+    render_pool,
+)
+from .job_queue import JobContext, JobError, JobResult, register_job_handler
+from .streaming_exports import XLSX_MEDIA_TYPE
+
+CASH_REPORT = "cash_report"
+FISCAL_BOOK = "fiscal_book"
+GLOBAL_REPORT = "global_report"
+CATALOG_PDF = "catalog_pdf"
+BACKUP = "backup"
+
+
+def _optional_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _optional_date(value: str | None) -> date | None:
+    return date.fromisoformat(value) if value else None
+
+
+@register_job_handler(CASH_REPORT)
+def run_cash_report(context: JobContext) -> JobResult:
+    session_id = int(context.payload["session_id"])
+    try:
+        cash_session = crud.get_cash_session(context.db, session_id)
+    except LookupError as exc:
+        raise JobError("cash_session_not_found") from exc
+    entries = crud.list_cash_entries(context.db, session_id=cash_session.id)
+    context.progress(50, "Generando PDF de cierre")
+    pdf_bytes = cash_reports.render_cash_close_pdf(cash_session, entries)
+    return context.write_bytes(
+        f"cierre_caja_{session_id}.pdf", pdf_bytes, media_type="application/pdf"
+    )
+
+
+@register_job_handler(FISCAL_BOOK)
+def run_fiscal_book(context: JobContext) -> JobResult:
+    book_type = schemas.FiscalBookType(context.payload["book_type"])
+    year = int(context.payload["year"])
+    month = int(context.payload["month"])
+    export_format = context.payload.get("format", "pdf")
+    report = fiscal_books.build_fiscal_book_report(
+        context.db, book_type=book_type, year=year, month=month
+    )
+    context.progress(50, f"Generando libro {export_format.upper()}")
+    filename_base = f"libro_{book_type.value}_{year}_{month:02d}"
+    if export_format == "pdf":
+        return context.write_bytes(
+            f"{filename_base}.pdf",
+            render_pool.render(fiscal_books.render_fiscal_book_pdf, report),
+            media_type="application/pdf",
+        )
+    if export_format == "xlsx":
+        return context.write_file(
+            f"{filename_base}.xlsx",
+            render_pool.render_file(fiscal_books.render_fiscal_book_excel, report),
+            media_type=XLSX_MEDIA_TYPE,
+        )
+    if export_format == "xml":
+        return context.write_file(
+            f"{filename_base}.xml",
+            fiscal_books.render_fiscal_book_xml(report),
+            media_type="application/xml",
+        )
+    raise JobError("unsupported_format")
+
+
+@register_job_handler(GLOBAL_REPORT)
+def run_global_report(context: JobContext) -> JobResult:
+    severity = context.payload.get("severity")
+    export_format = context.payload.get("format", "pdf")
+    dataset = global_reports_data.build_dataset(
+        context.db,
+        date_from=_optional_datetime(context.payload.get("date_from")),
+        date_to=_optional_datetime(context.payload.get("date_to")),
+        module=context.payload.get("module"),
+        severity=schemas.SystemLogLevel(severity) if severity else None,
+    )
+    context.progress(50, f"Generando reporte {export_format.upper()}")
+    filename_base = "softmobile_reporte_global"
+    if export_format == "pdf":
+        return context.write_bytes(
+            f"{filename_base}.pdf",
+            render_pool.render(
+                global_reports_renderers.render_global_report_pdf,
+                dataset.overview,
+                dataset.dashboard,
+            ),
+            media_type="application/pdf",
+        )
+    if export_format == "xlsx":
+        return context.write_file(
+            f"{filename_base}.xlsx",
+            render_pool.render_file(
+                global_reports_renderers.render_global_report_xlsx,
+                dataset.overview,
+                dataset.dashboard,
+            ),
+            media_type=XLSX_MEDIA_TYPE,
+        )
+    if export_format == "csv":
+        csv_buffer = global_reports_renderers.render_global_report_csv(
+            dataset.overview, dataset.dashboard
+        )
+        return context.write_bytes(
+            f"{filename_base}.csv",
+            csv_buffer.getvalue().encode("utf-8"),
+            media_type="text/csv",
+        )
+    raise JobError("unsupported_format")
+
+
+@register_job_handler(CATALOG_PDF)
+def run_catalog_pdf(context: JobContext) -> JobResult:
+    payload = context.payload
+    store_id = int(payload["store_id"])
+    estado = payload.get("estado")
+    context.progress(10, "Generando catálogo PDF")
+    pdf_bytes = inventory_catalog_export.render_devices_catalog_pdf(
+        context.db,
+        store_id,
+        search=payload.get("search"),
+        estado=models.CommercialState(estado) if estado else None,
+        categoria=payload.get("categoria"),
+        condicion=payload.get("condicion"),
+        estado_inventario=payload.get("estado_inventario"),
+        ubicacion=payload.get("ubicacion"),
+        proveedor=payload.get("proveedor"),
+        fecha_ingreso_desde=_optional_date(payload.get("fecha_ingreso_desde")),
+        fecha_ingreso_hasta=_optional_date(payload.get("fecha_ingreso_hasta")),
+    )
+    return context.write_bytes(
+        f"softmobile_catalogo_{store_id}.pdf", pdf_bytes, media_type="application/pdf"
+    )
+
+
+@register_job_handler(BACKUP)
+def run_backup(context: JobContext) -> None:
+    request = schemas.BackupRunRequest.model_validate(context.payload.get("request", {}))
+    notes = (request.nota or "Respaldo manual").strip() or "Respaldo manual"
+    context.progress(5, "Generando respaldo")
+    with transactional_session(context.db):
+        backup = backup_services.generate_backup(
+            context.db,
+            base_dir=settings.backup_directory,
+            mode=models.BackupMode.MANUAL,
+            triggered_by_id=context.created_by_id,
+            notes=notes,
+            reason=context.payload.get("reason"),
+            components=request.componentes,
+            backup_type=request.tipo,
+        )
+        backup_id = backup.id
+    # El archivo queda en el directorio de respaldos; se descarga por /backups.
+    context.message = f"Respaldo #{backup_id} generado"
+    return None
+
+
+__all__ = [
+    "BACKUP",
+    "CASH_REPORT",
+    "CATALOG_PDF",
+    "FISCAL_BOOK",
+    "GLOBAL_REPORT",
+]
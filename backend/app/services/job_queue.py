@@ -0,0 +1,604 @@
+"""Cola persistente de trabajos en segundo plano con pool de workers.
+
+Los reportes y exportaciones pesadas (cierres de caja, libros fiscales,
+reporte global, catálogo PDF, respaldos) se encolan en ``background_jobs`` en
+lugar de generarse dentro de la petición:
+
+1. :func:`enqueue_job` inserta el trabajo con su tipo, parámetros y prioridad
+   (1 = alta, 10 = baja) y despierta a un worker del proceso;
+2. cada hilo de :class:`JobWorkerPool` toma el siguiente trabajo disponible
+   por prioridad y antigüedad con un ``UPDATE ... WHERE status = 'QUEUED'``
+   condicionado, de modo que varios procesos pueden compartir la cola;
+3. el manejador registrado para el tipo (``services/job_handlers.py``)
+   reporta su avance con :meth:`JobContext.progress` y deja el archivo
+   resultante en ``<logs>/jobs``;
+4. un error vuelve a encolar el trabajo con espera exponencial hasta
+   ``JOB_MAX_ATTEMPTS``; :class:`JobError` lo marca fallido sin reintentos;
+5. el hilo de mantenimiento renueva el latido de los trabajos en curso,
+   reencola los abandonados por un proceso caído y depura los terminados
+   (con sus archivos) al cumplirse ``JOB_RESULT_RETENTION_HOURS``;
+   :func:`run_job_now` renueva con un hilo propio el latido del trabajo que
+   ejecuta en la petición.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any
+from uuid import uuid4
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from backend.core.logging import logger as core_logger
+
+from .. import models
+from ..config import settings
+
+logger = core_logger.bind(component=__name__)
+
+SessionFactory = Callable[[], Session]
+
+# Candidatos leídos por intento de toma; otro worker puede ganar alguno.
+_CLAIM_CANDIDATES = 5
+_ERROR_MAX_LENGTH = 2_000
+
+
+class JobError(Exception):
+    """Error definitivo de un trabajo: se marca fallido sin reintentar."""
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Archivo generado por un trabajo."""
+
+    path: Path
+    filename: str
+    media_type: str
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def results_directory() -> Path:
+    """Directorio de archivos generados por los trabajos."""
+
+    base_directory = Path(settings.logs_directory or "logs")
+    if base_directory.exists() and base_directory.is_file():
+        base_directory = base_directory.parent / f"{base_directory.name}_dir"
+    directory = base_directory / "jobs"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+class JobContext:
+    """Lo que recibe un manejador: sesión, parámetros y avance del trabajo."""
+
+    def __init__(self, db: Session, job: models.BackgroundJob) -> None:
+        self.db = db
+        self.job_id = job.id
+        self.job_type = job.job_type
+        self.payload: dict[str, Any] = dict(job.payload or {})
+        self.created_by_id = job.created_by_id
+        self.message: str | None = None
+
+    def progress(self, percent: int, message: str | None = None) -> None:
+        """Publica el avance (0-100) y renueva el latido del trabajo."""
+
+        values: dict[str, object] = {
+            "progress": max(0, min(100, int(percent))),
+            "heartbeat_at": _utcnow(),
+        }
+        if message is not None:
+            self.message = message
+            values["progress_message"] = message[:255]
+        self.db.execute(
+            update(models.BackgroundJob)
+            .where(models.BackgroundJob.id == self.job_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+
+    def write_bytes(self, filename: str, data: bytes, *, media_type: str) -> JobResult:
+        path = results_directory() / f"{self.job_id}_{filename}"
+        path.write_bytes(data)
+        return JobResult(path=path, filename=filename, media_type=media_type)
+
+    def write_file(self, filename: str, source: IO[bytes], *, media_type: str) -> JobResult:
+        """Copia ``source`` al archivo resultante y lo cierra."""
+
+        path = results_directory() / f"{self.job_id}_{filename}"
+        with source, open(path, "wb") as target:
+            source.seek(0)
+            shutil.copyfileobj(source, target)
+        return JobResult(path=path, filename=filename, media_type=media_type)
+
+
+JobHandler = Callable[[JobContext], "JobResult | None"]
+
+_HANDLERS: dict[str, JobHandler] = {}
+
+
+def register_job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """Registra el manejador de ``job_type``."""
+
+    def decorator(handler: JobHandler) -> JobHandler:
+        _HANDLERS[job_type] = handler
+        return handler
+
+    return decorator
+
+
+def get_job_handler(job_type: str) -> JobHandler:
+    # Los tipos incorporados se registran al importar el módulo de manejadores.
+    from . import job_handlers  # noqa: F401
+
+    handler = _HANDLERS.get(job_type)
+    if handler is None:
+        raise LookupError("job_type_unknown")
+    return handler
+
+
+def enqueue_job(
+    db: Session,
+    job_type: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    priority: int = 5,
+    created_by_id: int | None = None,
+    max_attempts: int | None = None,
+) -> models.BackgroundJob:
+    """Encola un trabajo y despierta a un worker del proceso."""
+
+    get_job_handler(job_type)
+    now = _utcnow()
+    job = models.BackgroundJob(
+        id=str(uuid4()),
+        job_type=job_type,
+        status=models.BackgroundJobStatus.QUEUED,
+        priority=max(1, min(10, priority)),
+        payload=payload or {},
+        attempts=0,
+        max_attempts=max(1, max_attempts or settings.job_max_attempts),
+        progress=0,
+        created_by_id=created_by_id,
+        created_at=now,
+        available_at=now,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    pool = get_job_pool()
+    if pool is not None:
+        pool.wake()
+    return job
+
+
+def get_job(db: Session, job_id: str) -> models.BackgroundJob:
+    job = db.get(models.BackgroundJob, job_id)
+    if job is None:
+        raise LookupError("job_not_found")
+    return job
+
+
+def list_jobs(
+    db: Session,
+    *,
+    created_by_id: int | None = None,
+    job_type: str | None = None,
+    status: models.BackgroundJobStatus | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[models.BackgroundJob]:
+    statement = select(models.BackgroundJob)
+    if created_by_id is not None:
+        statement = statement.where(models.BackgroundJob.created_by_id == created_by_id)
+    if job_type is not None:
+        statement = statement.where(models.BackgroundJob.job_type == job_type)
+    if status is not None:
+        statement = statement.where(models.BackgroundJob.status == status)
+    statement = statement.order_by(
+        models.BackgroundJob.created_at.desc(), models.BackgroundJob.id
+    )
+    return list(db.scalars(statement.offset(offset).limit(limit)))
+
+
+def _claim(db: Session, job_id: str, *, worker_id: str, now: datetime) -> bool:
+    job = models.BackgroundJob
+    claimed = db.execute(
+        update(job)
+        .where(job.id == job_id, job.status == models.BackgroundJobStatus.QUEUED)
+        .values(
+            status=models.BackgroundJobStatus.RUNNING,
+            attempts=job.attempts + 1,
+            worker_id=worker_id,
+            started_at=now,
+            heartbeat_at=now,
+            progress=0,
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return bool(claimed)
+
+
+def claim_next_job(db: Session, *, worker_id: str) -> models.BackgroundJob | None:
+    """Toma el siguiente trabajo disponible por prioridad y antigüedad."""
+
+    job = models.BackgroundJob
+    now = _utcnow()
+    candidates = db.scalars(
+        select(job.id)
+        .where(job.status == models.BackgroundJobStatus.QUEUED, job.available_at <= now)
+        .order_by(job.priority, job.available_at, job.created_at)
+        .limit(_CLAIM_CANDIDATES)
+    ).all()
+    db.commit()
+    for job_id in candidates:
+        if _claim(db, job_id, worker_id=worker_id, now=now):
+            return db.get(job, job_id, populate_existing=True)
+    return None
+
+
+def claim_job(db: Session, job_id: str, *, worker_id: str) -> models.BackgroundJob | None:
+    """Toma un trabajo concreto si sigue en cola (ejecución inmediata)."""
+
+    if _claim(db, job_id, worker_id=worker_id, now=_utcnow()):
+        return db.get(models.BackgroundJob, job_id, populate_existing=True)
+    return None
+
+
+def _truncate_error(exc: BaseException) -> str:
+    message = f"{type(exc).__name__}: {exc}"
+    return message[:_ERROR_MAX_LENGTH]
+
+
+def execute_job(db: Session, job: models.BackgroundJob) -> models.BackgroundJob:
+    """Ejecuta un trabajo ya tomado y registra su resultado o su fallo."""
+
+    job_id = job.id
+    context = JobContext(db, job)
+    try:
+        result = get_job_handler(job.job_type)(context)
+    except Exception as exc:
+        db.rollback()
+        job = get_job(db, job_id)
+        now = _utcnow()
+        job.error = _truncate_error(exc)
+        job.worker_id = None
+        if isinstance(exc, (JobError, LookupError)) or job.attempts >= job.max_attempts:
+            logger.exception("Trabajo en segundo plano fallido", job_id=job_id)
+            job.status = models.BackgroundJobStatus.FAILED
+            job.finished_at = now
+            job.expires_at = now + timedelta(hours=settings.job_result_retention_hours)
+        else:
+            delay = settings.job_retry_backoff_seconds * 2 ** max(0, job.attempts - 1)
+            logger.warning(
+                "Trabajo en segundo plano reencolado tras un error",
+                job_id=job_id,
+                attempts=job.attempts,
+                error=job.error,
+            )
+            job.status = models.BackgroundJobStatus.QUEUED
+            job.available_at = now + timedelta(seconds=delay)
+    else:
+        job = get_job(db, job_id)
+        now = _utcnow()
+        job.status = models.BackgroundJobStatus.COMPLETED
+        job.progress = 100
+        job.error = None
+        job.worker_id = None
+        job.finished_at = now
+        job.expires_at = now + timedelta(hours=settings.job_result_retention_hours)
+        if context.message is not None:
+            job.progress_message = context.message[:255]
+        if result is not None:
+            job.result_path = str(result.path)
+            job.result_filename = result.filename
+            job.result_media_type = result.media_type
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def touch_jobs(db: Session, job_ids: Iterable[str]) -> None:
+    """Renueva el latido de los trabajos que este proceso sigue ejecutando."""
+
+    ids = list(job_ids)
+    if not ids:
+        return
+    db.execute(
+        update(models.BackgroundJob)
+        .where(
+            models.BackgroundJob.id.in_(ids),
+            models.BackgroundJob.status == models.BackgroundJobStatus.RUNNING,
+        )
+        .values(heartbeat_at=_utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """Devuelve a la cola los trabajos cuyo worker dejó de dar latidos."""
+
+    job = models.BackgroundJob
+    now = _utcnow()
+    cutoff = now - timedelta(seconds=settings.job_stale_after_seconds)
+    stale = (job.status == models.BackgroundJobStatus.RUNNING, job.heartbeat_at < cutoff)
+    failed = db.execute(
+        update(job)
+        .where(*stale, job.attempts >= job.max_attempts)
+        .values(
+            status=models.BackgroundJobStatus.FAILED,
+            error="worker_lost",
+            worker_id=None,
+            finished_at=now,
+            expires_at=now + timedelta(hours=settings.job_result_retention_hours),
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    requeued = db.execute(
+        update(job)
+        .where(*stale)
+        .values(status=models.BackgroundJobStatus.QUEUED, worker_id=None, available_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    if failed or requeued:
+        logger.warning(
+            "Trabajos abandonados recuperados", requeued=requeued, failed=failed
+        )
+    return int(requeued or 0)
+
+
+def prune_expired_jobs(db: Session) -> int:
+    """Elimina los trabajos terminados vencidos junto con sus archivos."""
+
+    job = models.BackgroundJob
+    expired = db.execute(
+        select(job.id, job.result_path).where(
+            job.status.in_(
+                (models.BackgroundJobStatus.COMPLETED, models.BackgroundJobStatus.FAILED)
+            ),
+            job.expires_at <= _utcnow(),
+        )
+    ).all()
+    if not expired:
+        db.commit()
+        return 0
+    for _, result_path in expired:
+        if result_path:
+            Path(result_path).unlink(missing_ok=True)
+    db.execute(
+        delete(job)
+        .where(job.id.in_([job_id for job_id, _ in expired]))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return len(expired)
+
+
+class _InlineHeartbeat:
+    """Hilo que renueva el latido de un trabajo ejecutado fuera del pool.
+
+    Usa su propia sesión sobre el mismo motor para no confirmar a mitad de la
+    transacción del manejador.
+    """
+
+    def __init__(self, db: Session, job_id: str) -> None:
+        self._bind = db.get_bind()
+        self._job_id = job_id
+        self._interval = max(0.1, min(60.0, settings.job_stale_after_seconds / 3))
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._beat, name=f"job-heartbeat-{job_id[:8]}", daemon=True
+        )
+
+    def __enter__(self) -> _InlineHeartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop_event.set()
+        self._thread.join()
+
+    def _beat(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                with Session(bind=self._bind) as db:
+                    touch_jobs(db, [self._job_id])
+            except Exception:
+                logger.exception("Error al renovar el latido del trabajo", job_id=self._job_id)
+
+
+def run_job_now(db: Session, job_id: str) -> models.BackgroundJob:
+    """Ejecuta en la sesión actual un trabajo que sigue en cola.
+
+    Ningún pool lo tiene entre sus trabajos en curso, así que un hilo propio
+    renueva su latido mientras dura; sin él, ``requeue_stale_jobs`` de otro
+    proceso lo devolvería a la cola y se ejecutaría dos veces.
+    """
+
+    job = claim_job(db, job_id, worker_id=f"{_PROCESS_ID}:inline")
+    if job is None:
+        return get_job(db, job_id)
+    with _InlineHeartbeat(db, job_id):
+        return execute_job(db, job)
+
+
+_PROCESS_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobWorkerPool:
+    """Hilos que atienden la cola y uno de mantenimiento."""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        workers: int = 2,
+        poll_interval_seconds: float = 2.0,
+        maintenance_interval_seconds: float | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._workers = max(1, workers)
+        self._poll_interval = max(0.05, poll_interval_seconds)
+        self._maintenance_interval = maintenance_interval_seconds or max(
+            1.0, min(60.0, settings.job_stale_after_seconds / 3)
+        )
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Condition()
+        self._running_lock = threading.Lock()
+        self._running: set[str] = set()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        for index in range(self._workers):
+            thread = threading.Thread(
+                target=self._work, name=f"job-worker-{index + 1}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        maintenance = threading.Thread(
+            target=self._maintain, name="job-maintenance", daemon=True
+        )
+        maintenance.start()
+        self._threads.append(maintenance)
+
+    def is_alive(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def wake(self) -> None:
+        with self._wakeup:
+            self._wakeup.notify()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Deja de tomar trabajos y espera a que terminen los que están en curso."""
+
+        self._stop_event.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads.clear()
+
+    def run_once(self, worker_id: str | None = None) -> bool:
+        """Toma y ejecuta un trabajo; ``False`` si no había ninguno disponible."""
+
+        worker_id = worker_id or f"{_PROCESS_ID}:{threading.current_thread().name}"
+        with self._session_factory() as db:
+            job = claim_next_job(db, worker_id=worker_id)
+            if job is None:
+                return False
+            with self._running_lock:
+                self._running.add(job.id)
+            try:
+                execute_job(db, job)
+            finally:
+                with self._running_lock:
+                    self._running.discard(job.id)
+        return True
+
+    def maintain(self) -> None:
+        with self._running_lock:
+            running = list(self._running)
+        with self._session_factory() as db:
+            touch_jobs(db, running)
+            requeue_stale_jobs(db)
+            prune_expired_jobs(db)
+
+    def _work(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                worked = self.run_once()
+            except Exception:
+                logger.exception("Error del worker de trabajos en segundo plano")
+                worked = False
+            if worked:
+                continue
+            with self._wakeup:
+                if self._stop_event.is_set():
+                    break
+                self._wakeup.wait(self._poll_interval)
+
+    def _maintain(self) -> None:
+        while True:
+            try:
+                self.maintain()
+            except Exception:
+                logger.exception("Error en el mantenimiento de la cola de trabajos")
+            if self._stop_event.wait(self._maintenance_interval):
+                break
+
+
+_pool: JobWorkerPool | None = None
+
+
+def get_job_pool() -> JobWorkerPool | None:
+    """Pool activo del proceso, o ``None`` si ``JOB_WORKERS`` es 0."""
+
+    if _pool is not None and _pool.is_alive():
+        return _pool
+    return None
+
+
+def start_job_workers(session_factory: SessionFactory | None = None) -> JobWorkerPool | None:
+    """Inicia el pool de workers si ``JOB_WORKERS`` es mayor que cero."""
+
+    global _pool
+    if settings.job_workers <= 0:
+        return None
+    if get_job_pool() is not None:
+        return _pool
+    if session_factory is None:
+        from ..database import SessionLocal
+
+        session_factory = SessionLocal
+    pool = JobWorkerPool(
+        session_factory,
+        workers=settings.job_workers,
+        poll_interval_seconds=settings.job_poll_interval_seconds,
+    )
+    pool.start()
+    _pool = pool
+    return pool
+
+
+def stop_job_workers(timeout: float = 10.0) -> None:
+    global _pool
+    if _pool is not None:
+        _pool.stop(timeout=timeout)
+        _pool = None
+
+
+__all__ = [
+    "JobContext",
+    "JobError",
+    "JobResult",
+    "JobWorkerPool",
+    "claim_job",
+    "claim_next_job",
+    "enqueue_job",
+    "execute_job",
+    "get_job",
+    "get_job_handler",
+    "get_job_pool",
+    "list_jobs",
+    "prune_expired_jobs",
+    "register_job_handler",
+    "requeue_stale_jobs",
+    "results_directory",
+    "run_job_now",
+    "start_job_workers",
+    "stop_job_workers",
+    "touch_jobs",
+]
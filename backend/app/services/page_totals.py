@@ -0,0 +1,125 @@
+"""Totales de los listados paginados: exactos, estimados u omitidos.
+
+Las respuestas ``Page[T]`` pueden pedir ``count=exact`` (``COUNT(*)`` en cada
+página, el comportamiento histórico), ``count=none`` (sin total) o
+``count=estimate``:
+
+- sin filtros se usan las estadísticas del motor (``pg_class.reltuples`` en
+  PostgreSQL, ``sqlite_stat1`` tras ``ANALYZE`` en SQLite);
+- con filtros, o si el motor aún no tiene estadísticas, se reutiliza durante
+  ``ESTIMATE_TTL_SECONDS`` el último conteo exacto de la misma combinación.
+"""
+from __future__ import annotations
+
+from typing import Callable, Hashable, Literal, Mapping
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ..utils.cache import TTLCache
+
+CountMode = Literal["exact", "estimate", "none"]
+
+ESTIMATE_TTL_SECONDS = 60.0
+
+_ESTIMATES: TTLCache[int] = TTLCache(
+    ESTIMATE_TTL_SECONDS, name="page_total_estimates", shared=True
+)
+
+
+def _filters_key(filters: Mapping[str, object]) -> tuple[tuple[str, Hashable], ...]:
+    active: list[tuple[str, Hashable]] = []
+    for name, value in sorted(filters.items()):
+        if value is None or value == "" or value is False:
+            continue
+        if isinstance(value, (list, set, tuple)):
+            value = tuple(sorted(str(item) for item in value))
+        active.append((name, value))  # type: ignore[arg-type]
+    return tuple(active)
+
+
+def table_statistics_rows(db: Session, table: str) -> int | None:
+    """Filas de ``table`` según las estadísticas del motor, si existen."""
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        estimate = db.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table},
+        )
+        # reltuples vale -1 mientras la tabla no se haya analizado.
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+    if dialect == "sqlite":
+        has_stats = db.scalar(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        )
+        if not has_stats:
+            return None
+        stat = db.scalar(
+            text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"),
+            {"table": table},
+        )
+        if not stat:
+            return None
+        # El primer número de `stat` es la cantidad aproximada de filas.
+        return int(str(stat).split()[0])
+    return None
+
+
+def estimate_total(
+    db: Session,
+    *,
+    table: str,
+    filters: Mapping[str, object],
+    count: Callable[[], int],
+) -> int:
+    """Total aproximado del listado de ``table`` con ``filters``."""
+
+    key = (table, _filters_key(filters))
+
+    def _load() -> int:
+        if not key[1]:
+            estimate = table_statistics_rows(db, table)
+            if estimate is not None:
+                return estimate
+        return count()
+
+    return _ESTIMATES.get_or_set(key, _load, tags=(f"table:{table}",))
+
+
+def resolve_total(
+    db: Session,
+    mode: CountMode,
+    *,
+    table: str,
+    filters: Mapping[str, object],
+    count: Callable[[], int],
+) -> tuple[int | None, bool]:
+    """Devuelve ``(total, es_estimado)`` según el modo de conteo pedido."""
+
+    if mode == "none":
+        return None, False
+    if mode == "estimate":
+        return estimate_total(db, table=table, filters=filters, count=count), True
+    return count(), False
+
+
+def invalidate_total_estimates(table: str | None = None) -> None:
+    """Descarta los totales estimados (de una tabla o de todas)."""
+
+    if table is None:
+        _ESTIMATES.clear()
+    else:
+        _ESTIMATES.invalidate_tags(f"table:{table}")
+
+
+__all__ = [
+    "CountMode",
+    "ESTIMATE_TTL_SECONDS",
+    "estimate_total",
+    "invalidate_total_estimates",
+    "resolve_total",
+    "table_statistics_rows",
+]
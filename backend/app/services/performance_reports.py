@@ -2,18 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from io import BytesIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING
 
 from .. import schemas
 
+if TYPE_CHECKING:
+    from reportlab.platypus import Table
+
 
 def _build_table(table_data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(table_data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
@@ -33,6 +33,11 @@ def _build_table(table_data: list[list[str]]) -> Table:
 
 
 def _build_paragraphs(title: str):
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title=title)
     styles = getSampleStyleSheet()
@@ -57,6 +62,8 @@ def _build_paragraphs(title: str):
 
 
 def render_financial_report_pdf(report: schemas.FinancialPerformanceReport) -> bytes:
+    from reportlab.platypus import Paragraph, Spacer
+
     buffer, document, subtitle_style, body_style, elements = _build_paragraphs(
         "Softmobile - Reporte financiero"
     )
@@ -162,6 +169,9 @@ def render_financial_report_pdf(report: schemas.FinancialPerformanceReport) -> b
 
 
 def render_financial_report_xlsx(report: schemas.FinancialPerformanceReport) -> BytesIO:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Resumen"
@@ -247,6 +257,8 @@ def render_financial_report_xlsx(report: schemas.FinancialPerformanceReport) ->
 
 
 def render_inventory_report_pdf(report: schemas.InventoryPerformanceReport) -> bytes:
+    from reportlab.platypus import Paragraph, Spacer
+
     buffer, document, subtitle_style, body_style, elements = _build_paragraphs(
         "Softmobile - Reporte operativo de inventario"
     )
@@ -332,6 +344,9 @@ def render_inventory_report_pdf(report: schemas.InventoryPerformanceReport) -> b
 
 
 def render_inventory_report_xlsx(report: schemas.InventoryPerformanceReport) -> BytesIO:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Inventario"
@@ -0,0 +1,77 @@
+"""Configuración POS compilada por sucursal.
+
+Cada cobro del POS necesita los ajustes de hardware normalizados y las reglas
+de promoción de la sucursal. Validarlos y compilarlos en cada venta cuesta más
+que la venta misma en carritos pequeños, así que se conservan en memoria por
+versión de la configuración (``POSConfig.updated_at``): si otro worker la
+modifica, la versión cambia y la siguiente lectura compila la nueva.
+``update_pos_config`` y ``update_pos_promotions`` descartan además la entrada
+de la sucursal con :func:`invalidate_store`.
+"""
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from typing import Any
+
+from .. import models
+from ..utils.cache import TTLCache
+from ..utils.json_helpers import normalize_hardware_settings
+from . import promotions
+
+_CACHE_TTL_SECONDS = 600.0
+
+
+@dataclass(frozen=True)
+class CompiledPOSConfig:
+    """Ajustes de una versión de la configuración POS listos para usarse."""
+
+    hardware_settings: dict[str, Any]
+    promotions: promotions.CompiledPromotions
+
+    def hardware_settings_copy(self) -> dict[str, Any]:
+        """Copia de los ajustes de hardware que el llamador puede modificar."""
+
+        return copy.deepcopy(self.hardware_settings)
+
+
+_CACHE: TTLCache[CompiledPOSConfig] = TTLCache(
+    _CACHE_TTL_SECONDS, name="pos_config", max_entries=1024
+)
+
+
+def _store_tag(store_id: int) -> str:
+    return f"store:{store_id}"
+
+
+def _compile(config: models.POSConfig) -> CompiledPOSConfig:
+    return CompiledPOSConfig(
+        hardware_settings=normalize_hardware_settings(
+            config.hardware_settings if isinstance(config.hardware_settings, dict) else None
+        ),
+        promotions=promotions.compile_promotions(
+            promotions.load_config(config.promotions_config)
+        ),
+    )
+
+
+def get_compiled(config: models.POSConfig) -> CompiledPOSConfig:
+    """Configuración compilada para la versión actual de ``config``."""
+
+    updated_at = config.updated_at
+    if updated_at is None:
+        # Filas previas a ``updated_at``: se compilan en cada lectura.
+        return _compile(config)
+    key = (config.store_id, config.id, updated_at.isoformat())
+    return _CACHE.get_or_set(
+        key, lambda: _compile(config), tags=(_store_tag(config.store_id),)
+    )
+
+
+def invalidate_store(store_id: int) -> int:
+    """Descarta la configuración compilada de la sucursal."""
+
+    return _CACHE.invalidate_tags(_store_tag(store_id))
+
+
+__all__ = ["CompiledPOSConfig", "get_compiled", "invalidate_store"]
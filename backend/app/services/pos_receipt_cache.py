@@ -0,0 +1,332 @@
+"""Caché de recibos POS ya generados.
+
+El recibo de una venta se genera una vez, al registrarla en el POS: el PDF se
+guarda en ``POS_RECEIPT_CACHE_DIR`` con su SHA-256 como nombre y la tabla
+``pos_receipt_cache`` lo relaciona con la venta, el ticket ESC/POS y las
+versiones de la venta y de la configuración POS con que se generó. Las
+reimpresiones, los envíos por correo y el detalle de la venta lo leen de ahí.
+
+* Si la venta o la configuración cambiaron, la versión ya no coincide y el
+  recibo se genera de nuevo, reemplazando la entrada anterior.
+* Modificar, cancelar o devolver una venta y actualizar la configuración POS
+  eliminan además sus entradas (:func:`invalidate_sale`,
+  :func:`invalidate_store`).
+* Los recibos sin uso durante ``POS_RECEIPT_CACHE_RETENTION_DAYS`` se depuran
+  con :func:`prune_receipt_cache`.
+
+Los aciertos, fallos y entradas retiradas se publican como la caché
+``pos_receipts`` en :mod:`backend.app.telemetry`.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import ColumnElement, delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.core.logging import logger as core_logger
+
+from .. import models, telemetry
+from ..config import settings
+from ..core.transactions import transactional_session
+from . import pos_receipts
+from .credit import DebtSnapshot
+
+logger = core_logger.bind(component=__name__)
+
+CACHE_NAME = "pos_receipts"
+# Las reimpresiones sólo renuevan ``last_used_at`` una vez por día.
+_TOUCH_INTERVAL = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class CachedReceipt:
+    """PDF y ticket ESC/POS de una venta."""
+
+    pdf: bytes
+    escpos: str
+
+    @property
+    def pdf_base64(self) -> str:
+        return base64.b64encode(self.pdf).decode("utf-8")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _amount(value: Decimal | float | int | None) -> str:
+    return f"{Decimal(str(value or 0)):.2f}"
+
+
+def _fingerprint(*parts: object) -> str:
+    joined = "\x1f".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:32]
+
+
+def sale_version(sale: models.Sale) -> str:
+    """Huella de los datos de la venta que aparecen en el recibo."""
+
+    updated_at = _naive_utc(sale.updated_at)
+    items = ";".join(
+        f"{item.id}:{item.device_id}:{item.quantity}:{_amount(item.total_line)}"
+        for item in sale.items
+    )
+    return _fingerprint(
+        updated_at.isoformat() if updated_at else None,
+        sale.status,
+        sale.customer_id,
+        sale.customer_name,
+        getattr(sale.payment_method, "value", sale.payment_method),
+        _amount(sale.total_amount),
+        items,
+    )
+
+
+def config_version(config: models.POSConfig) -> str:
+    """Huella de la configuración POS que se imprime en el recibo."""
+
+    return _fingerprint(
+        config.invoice_prefix,
+        _amount(config.tax_rate),
+        config.receipt_header,
+        config.receipt_footer,
+    )
+
+
+def cache_directory() -> Path:
+    directory = Path(settings.pos_receipt_cache_directory).expanduser()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _content_path(content_hash: str) -> Path:
+    return cache_directory() / content_hash[:2] / f"{content_hash}.pdf"
+
+
+def _write_content(pdf: bytes) -> str:
+    content_hash = hashlib.sha256(pdf).hexdigest()
+    path = _content_path(content_hash)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Escritura atómica: otro worker puede estar leyendo el mismo archivo.
+        partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        partial.write_bytes(pdf)
+        os.replace(partial, path)
+    return content_hash
+
+
+def _remove_unreferenced(db: Session, content_hashes: Iterable[str]) -> None:
+    for content_hash in set(content_hashes):
+        still_used = db.scalar(
+            select(models.POSReceiptCacheEntry.id)
+            .where(models.POSReceiptCacheEntry.content_hash == content_hash)
+            .limit(1)
+        )
+        if still_used is None:
+            _content_path(content_hash).unlink(missing_ok=True)
+
+
+def _delete_entries(db: Session, condition: ColumnElement[bool]) -> list[str]:
+    """Elimina las entradas que cumplen ``condition`` y devuelve sus hashes."""
+
+    content_hashes = list(
+        db.scalars(select(models.POSReceiptCacheEntry.content_hash).where(condition))
+    )
+    if content_hashes:
+        db.execute(delete(models.POSReceiptCacheEntry).where(condition))
+    return content_hashes
+
+
+def load_receipt(
+    db: Session, sale: models.Sale, config: models.POSConfig
+) -> CachedReceipt | None:
+    """Recibo guardado para la versión actual de la venta y la configuración."""
+
+    entry = db.scalar(
+        select(models.POSReceiptCacheEntry).where(
+            models.POSReceiptCacheEntry.sale_id == sale.id,
+            models.POSReceiptCacheEntry.sale_version == sale_version(sale),
+            models.POSReceiptCacheEntry.config_version == config_version(config),
+        )
+    )
+    if entry is None:
+        return None
+    try:
+        pdf = _content_path(entry.content_hash).read_bytes()
+    except FileNotFoundError:
+        # Se depuró el archivo o lo eliminó una transacción revertida.
+        return None
+    now = _utcnow()
+    last_used_at = _naive_utc(entry.last_used_at)
+    if last_used_at is None or now - last_used_at >= _TOUCH_INTERVAL:
+        with transactional_session(db):
+            db.execute(
+                update(models.POSReceiptCacheEntry)
+                .where(models.POSReceiptCacheEntry.id == entry.id)
+                .values(last_used_at=now)
+            )
+    return CachedReceipt(pdf=pdf, escpos=entry.escpos_ticket or "")
+
+
+def store_receipt(
+    db: Session,
+    sale: models.Sale,
+    config: models.POSConfig,
+    *,
+    pdf: bytes,
+    escpos: str,
+) -> CachedReceipt:
+    """Guarda el recibo generado y reemplaza las versiones anteriores de la venta.
+
+    Un fallo al guardar no interrumpe la venta: el recibo se devuelve igual y
+    se volverá a generar en la siguiente reimpresión.
+    """
+
+    receipt = CachedReceipt(pdf=pdf, escpos=escpos)
+    try:
+        content_hash = _write_content(pdf)
+    except OSError as exc:
+        logger.warning(
+            "No fue posible guardar el recibo en la caché",
+            sale_id=sale.id,
+            error=str(exc),
+        )
+        return receipt
+    replaced: list[str] = []
+    try:
+        with transactional_session(db):
+            replaced = _delete_entries(
+                db, models.POSReceiptCacheEntry.sale_id == sale.id
+            )
+            db.add(
+                models.POSReceiptCacheEntry(
+                    sale_id=sale.id,
+                    store_id=sale.store_id,
+                    sale_version=sale_version(sale),
+                    config_version=config_version(config),
+                    content_hash=content_hash,
+                    size_bytes=len(pdf),
+                    escpos_ticket=escpos,
+                )
+            )
+            db.flush()
+    except IntegrityError:
+        # Otra petición guardó el mismo recibo al mismo tiempo.
+        return receipt
+    if replaced:
+        telemetry.record_cache_eviction(CACHE_NAME, "replaced", len(replaced))
+        _remove_unreferenced(db, [value for value in replaced if value != content_hash])
+    return receipt
+
+
+def render_receipt(
+    db: Session,
+    sale: models.Sale,
+    config: models.POSConfig,
+    *,
+    debt_snapshot: DebtSnapshot | None = None,
+    schedule: Sequence[dict[str, object]] | None = None,
+) -> CachedReceipt:
+    """Genera el PDF y el ticket ESC/POS de la venta y los guarda en la caché."""
+
+    pdf = pos_receipts.render_receipt_pdf(
+        sale, config, debt_snapshot=debt_snapshot, schedule=schedule
+    )
+    escpos = pos_receipts.render_receipt_escpos(
+        sale, config, debt_snapshot=debt_snapshot, schedule=schedule
+    )
+    return store_receipt(db, sale, config, pdf=pdf, escpos=escpos)
+
+
+def get_receipt(
+    db: Session,
+    sale: models.Sale,
+    config: models.POSConfig,
+    *,
+    debt_snapshot: DebtSnapshot | None = None,
+    schedule: Sequence[dict[str, object]] | None = None,
+) -> CachedReceipt:
+    """Recibo de la venta desde la caché; si no está vigente se genera.
+
+    ``debt_snapshot`` y ``schedule`` sólo se usan al generar: una reimpresión
+    entrega el recibo tal como se emitió en el cobro.
+    """
+
+    receipt = load_receipt(db, sale, config)
+    if receipt is not None:
+        telemetry.record_cache_request(CACHE_NAME, "hit")
+        return receipt
+    telemetry.record_cache_request(CACHE_NAME, "miss")
+    return render_receipt(
+        db, sale, config, debt_snapshot=debt_snapshot, schedule=schedule
+    )
+
+
+def _invalidate(db: Session, condition: ColumnElement[bool]) -> int:
+    with transactional_session(db):
+        removed = _delete_entries(db, condition)
+    if removed:
+        telemetry.record_cache_eviction(CACHE_NAME, "invalidated", len(removed))
+        _remove_unreferenced(db, removed)
+    return len(removed)
+
+
+def invalidate_sale(db: Session, sale_id: int) -> int:
+    """Descarta los recibos guardados de la venta."""
+
+    return _invalidate(db, models.POSReceiptCacheEntry.sale_id == sale_id)
+
+
+def invalidate_store(db: Session, store_id: int) -> int:
+    """Descarta los recibos de la sucursal tras un cambio de configuración POS."""
+
+    return _invalidate(db, models.POSReceiptCacheEntry.store_id == store_id)
+
+
+def prune_receipt_cache(db: Session, *, older_than: datetime | None = None) -> int:
+    """Depura los recibos sin uso desde ``older_than``.
+
+    Por defecto usa ``POS_RECEIPT_CACHE_RETENTION_DAYS``; con ``0`` no depura.
+    """
+
+    if older_than is None:
+        if settings.pos_receipt_cache_retention_days <= 0:
+            return 0
+        older_than = _utcnow() - timedelta(days=settings.pos_receipt_cache_retention_days)
+    condition = models.POSReceiptCacheEntry.last_used_at < _naive_utc(older_than)
+    with transactional_session(db):
+        removed = _delete_entries(db, condition)
+    if removed:
+        telemetry.record_cache_eviction(CACHE_NAME, "expired", len(removed))
+        _remove_unreferenced(db, removed)
+    return len(removed)
+
+
+__all__ = [
+    "CachedReceipt",
+    "config_version",
+    "get_receipt",
+    "invalidate_sale",
+    "invalidate_store",
+    "load_receipt",
+    "prune_receipt_cache",
+    "render_receipt",
+    "sale_version",
+    "store_receipt",
+]
@@ -8,17 +8,14 @@ import json
 import re
 from decimal import Decimal, ROUND_HALF_UP
 from io import BytesIO
-from typing import Sequence
-
-from reportlab.graphics import renderPDF
-from reportlab.graphics.barcode import qr
-from reportlab.graphics.shapes import Drawing
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from typing import TYPE_CHECKING, Sequence
 
 from .. import models
 from .credit import DebtSnapshot
 
+if TYPE_CHECKING:
+    from reportlab.pdfgen import canvas
+
 
 _RTN_PATTERN = re.compile(r"(?:RTN|RFC|NIF|DOC(?:UMENTO)?)[\s:]*([A-Za-z0-9\-]+)", re.IGNORECASE)
 
@@ -27,6 +24,8 @@ def _ensure_page_space(pdf: canvas.Canvas, current_y: float, lines: int = 1) ->
     """Garantiza espacio suficiente en la página antes de dibujar más líneas."""
 
     # // [PACK34-receipt]
+    from reportlab.lib.pagesizes import letter
+
     required = 12 * lines
     if current_y - required < 40:
         pdf.showPage()
@@ -109,6 +108,12 @@ def render_receipt_pdf(
     """Genera el PDF del recibo POS y devuelve los bytes en memoria."""
 
     # // [PACK34-receipt]
+    from reportlab.graphics import renderPDF
+    from reportlab.graphics.barcode import qr
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = BytesIO()
     pdf = canvas.Canvas(buffer, pagesize=letter)
     width, height = letter
@@ -406,6 +411,9 @@ def render_debt_receipt_pdf(
     snapshot: DebtSnapshot,
     schedule: Sequence[dict[str, object]] | None = None,
 ) -> bytes:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = BytesIO()
     pdf = canvas.Canvas(buffer, pagesize=letter)
     width, height = letter
@@ -0,0 +1,287 @@
+"""Índice compilado de listas de precios.
+
+Resolver el precio de un dispositivo consultaba las listas aplicables y sus
+precios en cada llamada, por lo que una página de catálogo o una cotización
+grande costaba una o dos consultas por dispositivo. El índice carga en una
+sola consulta todos los precios de las listas activas para un alcance que
+están vigentes durante el día y los ordena como
+:func:`backend.app.services.pricing.resolve_price_for_device`: alcance más
+específico, menor prioridad y menor identificador. La vigencia exacta
+(``starts_at``/``ends_at``) se evalúa en memoria en cada búsqueda.
+
+El índice base contiene las listas globales y de sucursal y se compila una
+vez por ``(sucursal, fecha, versión)``. Las listas de un cliente, que suelen
+ser pocas, se cargan aparte en un índice propio que se consulta antes que el
+base: un cliente nuevo no vuelve a cargar los precios globales. La versión
+es el número de listas y su ``updated_at`` más reciente, de modo que un
+cambio hecho desde otro worker también genera índices nuevos. Las
+operaciones de listas de precios de :mod:`.pricing` descartan además los
+índices de este proceso con :func:`invalidate`.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from ..models import PriceList, PriceListItem
+from ..utils.cache import TTLCache
+
+_CACHE_TTL_SECONDS = 3600.0
+_TAG = "price_lists"
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@dataclass(frozen=True)
+class CompiledPrice:
+    """Precio de un dispositivo dentro de una lista, sin sesión asociada."""
+
+    price_list_id: int
+    price_list_name: str
+    priority: int
+    store_id: int | None
+    customer_id: int | None
+    currency: str
+    item_id: int
+    price: Decimal
+    discount_percentage: Decimal | None
+    starts_at: datetime | None
+    ends_at: datetime | None
+
+    def applies_at(self, moment: datetime) -> bool:
+        """Indica si la lista está vigente en ``moment`` (UTC sin zona)."""
+
+        if self.starts_at is not None and self.starts_at > moment:
+            return False
+        if self.ends_at is not None and self.ends_at < moment:
+            return False
+        return True
+
+
+def _scope_rank(entry: CompiledPrice) -> int:
+    if entry.store_id is not None and entry.customer_id is not None:
+        return 0
+    if entry.customer_id is not None:
+        return 1
+    if entry.store_id is not None:
+        return 2
+    return 3
+
+
+@dataclass(frozen=True)
+class PriceIndex:
+    """Precios candidatos por dispositivo, ya ordenados por preferencia.
+
+    Con ``customer_id`` sólo contiene las listas del cliente; los demás
+    precios se buscan en ``base``, el índice compartido de la sucursal.
+    """
+
+    store_id: int | None
+    customer_id: int | None
+    effective_date: date
+    candidates: Mapping[int, tuple[CompiledPrice, ...]]
+    base: PriceIndex | None = None
+
+    def lookup(self, device_id: int, moment: datetime) -> CompiledPrice | None:
+        """Precio que corresponde al dispositivo en ``moment``."""
+
+        naive_moment = _naive_utc(moment)
+        for entry in self.candidates.get(device_id, ()):
+            if entry.applies_at(naive_moment):
+                return entry
+        if self.base is not None:
+            return self.base.lookup(device_id, moment)
+        return None
+
+    def lookup_many(
+        self, device_ids: Iterable[int], moment: datetime
+    ) -> dict[int, CompiledPrice]:
+        """Precios de todos los dispositivos que tienen uno aplicable."""
+
+        resolved: dict[int, CompiledPrice] = {}
+        for device_id in device_ids:
+            entry = self.lookup(device_id, moment)
+            if entry is not None:
+                resolved[device_id] = entry
+        return resolved
+
+
+_CACHE: TTLCache[PriceIndex] = TTLCache(
+    _CACHE_TTL_SECONDS, name="price_index", max_entries=256
+)
+
+
+def _version(db: Session) -> tuple[int, str | None]:
+    count, latest = db.execute(
+        select(func.count(PriceList.id), func.max(PriceList.updated_at))
+    ).one()
+    if isinstance(latest, datetime):
+        latest = latest.isoformat()
+    return int(count or 0), latest
+
+
+def _compile(
+    db: Session,
+    *,
+    store_id: int | None,
+    customer_id: int | None,
+    effective_date: date,
+) -> PriceIndex:
+    """Precios de las listas del cliente o, sin cliente, de las globales y de sucursal."""
+
+    day_start = datetime.combine(effective_date, time.min, tzinfo=timezone.utc)
+    day_end = day_start + timedelta(days=1)
+    statement = (
+        select(
+            PriceListItem.device_id,
+            PriceListItem.id,
+            PriceListItem.price,
+            PriceListItem.discount_percentage,
+            PriceList.id,
+            PriceList.name,
+            PriceList.priority,
+            PriceList.store_id,
+            PriceList.customer_id,
+            PriceList.currency,
+            PriceList.starts_at,
+            PriceList.ends_at,
+        )
+        .join(PriceList, PriceListItem.price_list_id == PriceList.id)
+        .where(PriceList.is_active.is_(True))
+        .where(
+            or_(PriceList.starts_at.is_(None), PriceList.starts_at < day_end),
+            or_(PriceList.ends_at.is_(None), PriceList.ends_at >= day_start),
+        )
+    )
+    if store_id is None:
+        statement = statement.where(PriceList.store_id.is_(None))
+    else:
+        statement = statement.where(
+            or_(PriceList.store_id == store_id, PriceList.store_id.is_(None))
+        )
+    if customer_id is None:
+        statement = statement.where(PriceList.customer_id.is_(None))
+    else:
+        statement = statement.where(PriceList.customer_id == customer_id)
+
+    grouped: dict[int, list[CompiledPrice]] = {}
+    for row in db.execute(statement):
+        (
+            device_id,
+            item_id,
+            price,
+            discount_percentage,
+            price_list_id,
+            name,
+            priority,
+            list_store_id,
+            list_customer_id,
+            currency,
+            starts_at,
+            ends_at,
+        ) = row
+        grouped.setdefault(device_id, []).append(
+            CompiledPrice(
+                price_list_id=price_list_id,
+                price_list_name=name,
+                priority=priority,
+                store_id=list_store_id,
+                customer_id=list_customer_id,
+                currency=currency,
+                item_id=item_id,
+                price=price,
+                discount_percentage=discount_percentage,
+                starts_at=_naive_utc(starts_at),
+                ends_at=_naive_utc(ends_at),
+            )
+        )
+    return PriceIndex(
+        store_id=store_id,
+        customer_id=customer_id,
+        effective_date=effective_date,
+        candidates={
+            device_id: tuple(
+                sorted(
+                    entries,
+                    key=lambda entry: (_scope_rank(entry), entry.priority, entry.price_list_id),
+                )
+            )
+            for device_id, entries in grouped.items()
+        },
+    )
+
+
+def _cached_index(
+    db: Session,
+    *,
+    store_id: int | None,
+    customer_id: int | None,
+    effective_date: date,
+    version: tuple[int, str | None],
+) -> PriceIndex:
+    key = (store_id, customer_id, effective_date.isoformat(), version)
+    return _CACHE.get_or_set(
+        key,
+        lambda: _compile(
+            db,
+            store_id=store_id,
+            customer_id=customer_id,
+            effective_date=effective_date,
+        ),
+        tags=(_TAG,),
+    )
+
+
+def get_index(
+    db: Session,
+    *,
+    store_id: int | None = None,
+    customer_id: int | None = None,
+    moment: datetime | None = None,
+) -> PriceIndex:
+    """Índice vigente para el alcance y el día de ``moment`` (UTC).
+
+    Las listas del cliente (rangos 0 y 1) siempre preceden a las globales y de
+    sucursal (rangos 2 y 3), así que basta con buscar en su índice antes que
+    en el base.
+    """
+
+    moment = moment or datetime.now(timezone.utc)
+    effective_date = (_naive_utc(moment) or moment).date()
+    version = _version(db)
+    base = _cached_index(
+        db,
+        store_id=store_id,
+        customer_id=None,
+        effective_date=effective_date,
+        version=version,
+    )
+    if customer_id is None:
+        return base
+    own = _cached_index(
+        db,
+        store_id=store_id,
+        customer_id=customer_id,
+        effective_date=effective_date,
+        version=version,
+    )
+    # Se enlaza al llamar: la caché no retiene un índice base ya desalojado.
+    return replace(own, base=base)
+
+
+def invalidate() -> int:
+    """Descarta todos los índices compilados en este proceso."""
+
+    return _CACHE.invalidate_tags(_TAG)
+
+
+__all__ = ["CompiledPrice", "PriceIndex", "get_index", "invalidate"]
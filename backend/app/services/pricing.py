@@ -10,13 +10,16 @@ from sqlalchemy.orm import Session
 
 from datetime import date, datetime, timezone
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Iterable
+from typing import Iterable, Mapping
 
-from sqlalchemy import or_, select
+from sqlalchemy import or_, select, update
 from sqlalchemy.orm import Session
 
 from .. import crud, schemas
+from ..core.transactions import transactional_session
 from ..models import Device, PriceList, PriceListItem
+from . import price_index
+from .price_index import CompiledPrice
 
 _QUANTIZER = Decimal("0.01")
 
@@ -33,6 +36,17 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _touch_price_list(db: Session, price_list_id: int) -> None:
+    """Marca la lista como modificada para que los índices de precios se renueven."""
+
+    with transactional_session(db):
+        db.execute(
+            update(PriceList)
+            .where(PriceList.id == price_list_id)
+            .values(updated_at=_utc_now())
+        )
+
+
 def _scope_rank(price_list: PriceList) -> int:
     """Determina la prioridad de alcance de una lista de precios."""
 
@@ -46,7 +60,7 @@ def _scope_rank(price_list: PriceList) -> int:
 
 
 def _resolve_scope(
-    price_list: PriceList,
+    price_list: PriceList | CompiledPrice,
     store_id: int | None,
     customer_id: int | None,
 ) -> str:
@@ -137,6 +151,7 @@ def create_price_list(
     price_list = crud.create_price_list(
         db, payload, performed_by_id=performed_by_id
     )
+    price_index.invalidate()
     if include_items:
         price_list = crud.get_price_list(
             db, price_list.id, include_items=include_items
@@ -165,6 +180,7 @@ def update_price_list(
         payload,
         performed_by_id=performed_by_id,
     )
+    price_index.invalidate()
     if include_items:
         price_list = crud.get_price_list(
             db, price_list.id, include_items=include_items
@@ -194,6 +210,7 @@ def delete_price_list(
         allow_hard_delete=allow_hard_delete,
         is_superadmin=is_superadmin,
     )
+    price_index.invalidate()
 
 
 def get_price_list_item(
@@ -221,6 +238,8 @@ def create_price_list_item(
         payload,
         performed_by_id=performed_by_id,
     )
+    _touch_price_list(db, item.price_list_id)
+    price_index.invalidate()
     return schemas.PriceListItemResponse.model_validate(item, from_attributes=True)
 
 
@@ -239,6 +258,8 @@ def update_price_list_item(
         payload,
         performed_by_id=performed_by_id,
     )
+    _touch_price_list(db, item.price_list_id)
+    price_index.invalidate()
     return schemas.PriceListItemResponse.model_validate(item, from_attributes=True)
 
 
@@ -252,6 +273,7 @@ def delete_price_list_item(
 ) -> None:
     """Elimina un precio asociado a una lista."""
 
+    price_list_id = crud.get_price_list_item(db, item_id).price_list_id
     crud.delete_price_list_item(
         db,
         item_id,
@@ -259,6 +281,8 @@ def delete_price_list_item(
         allow_hard_delete=allow_hard_delete,
         is_superadmin=is_superadmin,
     )
+    _touch_price_list(db, price_list_id)
+    price_index.invalidate()
 
 
 def list_applicable_price_lists(
@@ -310,29 +334,26 @@ def resolve_price_for_device(
 ) -> tuple[PriceList, PriceListItem] | None:
     """Encuentra la mejor lista de precios para el dispositivo indicado."""
 
-    price_lists = list_applicable_price_lists(
-        db,
-        store_id=store_id,
-        customer_id=customer_id,
-        include_inactive=False,
-    )
-    if not price_lists:
-        return None
+    return resolve_prices_for_devices(
+        db, [device], store_id=store_id, customer_id=customer_id
+    ).get(device.id)
 
-    statement = (
-        select(PriceListItem)
-        .where(PriceListItem.price_list_id.in_([pl.id for pl in price_lists]))
-        .where(PriceListItem.device_id == device.id)
-    )
-    items = {item.price_list_id: item for item in db.scalars(statement)}
 
-    for price_list in sorted(
-        price_lists, key=lambda pl: (_scope_rank(pl), pl.priority, pl.id)
-    ):
-        item = items.get(price_list.id)
-        if item is not None:
-            return price_list, item
-    return None
+def resolve_compiled_prices(
+    db: Session,
+    device_ids: Iterable[int],
+    *,
+    store_id: int | None = None,
+    customer_id: int | None = None,
+) -> dict[int, CompiledPrice]:
+    """Precios aplicables de varios dispositivos resueltos desde el índice compilado.
+
+    Es la variante masiva para catálogos, exportaciones y el POS: el costo no
+    depende del número de dispositivos y no se cargan objetos ORM.
+    """
+
+    index = price_index.get_index(db, store_id=store_id, customer_id=customer_id)
+    return index.lookup_many(device_ids, _utc_now())
 
 
 def resolve_prices_for_devices(
@@ -344,14 +365,25 @@ def resolve_prices_for_devices(
 ) -> dict[int, tuple[PriceList, PriceListItem]]:
     """Determina precios aplicables para un conjunto de dispositivos."""
 
-    mapping: dict[int, tuple[PriceList, PriceListItem]] = {}
-    for device in devices:
-        resolved = resolve_price_for_device(
-            db, device, store_id=store_id, customer_id=customer_id
-        )
-        if resolved:
-            mapping[device.id] = resolved
-    return mapping
+    compiled = resolve_compiled_prices(
+        db,
+        [device.id for device in devices],
+        store_id=store_id,
+        customer_id=customer_id,
+    )
+    if not compiled:
+        return {}
+    statement = (
+        select(PriceListItem, PriceList)
+        .join(PriceList, PriceListItem.price_list_id == PriceList.id)
+        .where(PriceListItem.id.in_({entry.item_id for entry in compiled.values()}))
+    )
+    rows = {item.id: (price_list, item) for item, price_list in db.execute(statement)}
+    return {
+        device_id: rows[entry.item_id]
+        for device_id, entry in compiled.items()
+        if entry.item_id in rows
+    }
 
 
 def resolve_device_price(
@@ -423,6 +455,74 @@ def resolve_device_price(
         valid_until=price_list.valid_until,
     )
 
+def resolve_device_prices(
+    db: Session,
+    device_ids: Iterable[int],
+    *,
+    store_id: int | None = None,
+    customer_id: int | None = None,
+    default_prices: Mapping[int, Decimal] | None = None,
+    default_currency: str = "MXN",
+) -> dict[int, schemas.PriceResolution]:
+    """Resuelve en bloque los precios de varios dispositivos.
+
+    Usa el índice compilado, por lo que aplica las vigencias y el orden de
+    :func:`resolve_price_for_device`. Los dispositivos sin lista aplicable usan
+    ``default_prices`` si se indica su precio y, si no, se omiten.
+    """
+
+    requested = list(dict.fromkeys(device_ids))
+    compiled = resolve_compiled_prices(
+        db, requested, store_id=store_id, customer_id=customer_id
+    )
+    currency = (default_currency or "MXN").strip().upper() or "MXN"
+    resolutions: dict[int, schemas.PriceResolution] = {}
+    for device_id in requested:
+        entry = compiled.get(device_id)
+        if entry is None:
+            default_price = (default_prices or {}).get(device_id)
+            if default_price is None:
+                continue
+            normalized_price = _quantize(default_price)
+            resolutions[device_id] = schemas.PriceResolution(
+                device_id=device_id,
+                price_list_id=None,
+                price_list_name=None,
+                priority=None,
+                scope="fallback",
+                source="fallback",
+                currency=currency,
+                base_price=normalized_price,
+                discount_percentage=None,
+                final_price=normalized_price,
+            )
+            continue
+        base_price = _quantize(entry.price)
+        discount = (
+            _quantize(entry.discount_percentage)
+            if entry.discount_percentage is not None
+            else None
+        )
+        final_price = base_price
+        if discount is not None:
+            final_price = _quantize(
+                base_price * (Decimal("1") - (discount / Decimal("100")))
+            )
+        resolutions[device_id] = schemas.PriceResolution(
+            device_id=device_id,
+            price_list_id=entry.price_list_id,
+            price_list_name=entry.price_list_name,
+            priority=entry.priority,
+            scope=_resolve_scope(entry, store_id, customer_id),
+            source="price_list",
+            currency=entry.currency,
+            base_price=base_price,
+            discount_percentage=discount,
+            final_price=final_price,
+        )
+    return resolutions
+
+
 def compute_effective_price(
     db: Session,
     device: Device,
@@ -432,12 +532,11 @@ def compute_effective_price(
 ) -> Decimal:
     """Entrega el precio efectivo de un dispositivo considerando listas aplicables."""
 
-    resolved = resolve_price_for_device(
-        db, device, store_id=store_id, customer_id=customer_id
-    )
-    if resolved:
-        _, item = resolved
-        return item.price
+    entry = resolve_compiled_prices(
+        db, [device.id], store_id=store_id, customer_id=customer_id
+    ).get(device.id)
+    if entry is not None:
+        return entry.price
     return device.unit_price
 
 
@@ -455,5 +554,7 @@ __all__ = [
     "resolve_price_for_device",
     "resolve_device_price",
     "resolve_prices_for_devices",
+    "resolve_compiled_prices",
+    "resolve_device_prices",
     "compute_effective_price",
 ]
@@ -73,67 +73,121 @@ def resolve_feature_switches(
     )
 
 
+@dataclass(frozen=True)
+class CompiledPromotions:
+    """Reglas de promoción de una sucursal listas para evaluarse en cada venta.
+
+    Se compilan una vez por versión de la configuración POS (ver
+    :mod:`.pos_config_cache`): las reglas conservan su orden original y se
+    indexan por dispositivo para no recorrer el carrito completo por regla.
+    """
+
+    config: schemas.POSPromotionsConfig
+    volume_rules: tuple[schemas.POSVolumePromotion, ...]
+    volume_device_ids: frozenset[int]
+    # Cada combo con la cantidad mínima que exige de cada dispositivo.
+    combo_rules: tuple[tuple[schemas.POSComboPromotion, Mapping[int, int]], ...]
+    coupons: Mapping[str, schemas.POSCouponPromotion]
+
+
+def compile_promotions(config: schemas.POSPromotionsConfig) -> CompiledPromotions:
+    """Indexa las reglas de ``config`` para :func:`apply_promotions`."""
+
+    combo_rules: list[tuple[schemas.POSComboPromotion, Mapping[int, int]]] = []
+    for rule in config.combo_promotions:
+        if not rule.items:
+            continue
+        required: dict[int, int] = {}
+        for entry in rule.items:
+            required[entry.device_id] = max(entry.quantity, required.get(entry.device_id, 0))
+        combo_rules.append((rule, required))
+    return CompiledPromotions(
+        config=config,
+        volume_rules=tuple(config.volume_promotions),
+        volume_device_ids=frozenset(rule.device_id for rule in config.volume_promotions),
+        combo_rules=tuple(combo_rules),
+        coupons={coupon.code.upper(): coupon for coupon in config.coupons},
+    )
+
+
 def apply_promotions(
     sale_request: schemas.POSSaleRequest,
     *,
-    config: schemas.POSPromotionsConfig,
+    config: schemas.POSPromotionsConfig | CompiledPromotions,
     switches: PromotionFeatureSwitches,
 ) -> PromotionComputation:
-    """Aplica reglas de promociones sobre una venta POS previa a su registro."""
+    """Aplica reglas de promociones sobre una venta POS previa a su registro.
+
+    La solicitud original no se modifica: sólo se copian los artículos que
+    reciben descuento y se devuelve una copia superficial con los cambios.
+    """
 
     if not switches.any_enabled:
         return PromotionComputation(sale_request=sale_request, applications=[])
 
-    mutable_request = sale_request.model_copy(deep=True)
+    compiled = config if isinstance(config, CompiledPromotions) else compile_promotions(config)
+    items = list(sale_request.items)
+    positions: dict[int, list[int]] = {}
+    for index, item in enumerate(items):
+        if item.device_id is not None:
+            positions.setdefault(item.device_id, []).append(index)
+
     applications: dict[str, PromotionApplication] = {}
     assigned_discount: dict[int, Decimal] = {}
     device_promotions: dict[int, str] = {}
 
     _apply_volume_promotions(
-        mutable_request,
-        config,
+        items,
+        positions,
+        compiled,
         switches,
         applications,
         assigned_discount,
         device_promotions,
     )
     _apply_combo_promotions(
-        mutable_request,
-        config,
+        items,
+        positions,
+        compiled,
         switches,
         applications,
         assigned_discount,
         device_promotions,
     )
-    _apply_coupon_promotions(mutable_request, config, switches, applications, assigned_discount)
+    updates: dict[str, object] = {"items": items}
+    updates.update(
+        _apply_coupon_promotions(
+            sale_request, items, compiled, switches, applications, assigned_discount
+        )
+    )
 
     return PromotionComputation(
-        sale_request=mutable_request,
+        sale_request=sale_request.model_copy(update=updates),
         applications=list(applications.values()),
     )
 
 
 def _apply_volume_promotions(
-    sale_request: schemas.POSSaleRequest,
-    config: schemas.POSPromotionsConfig,
+    items: list[schemas.POSCartItem],
+    positions: Mapping[int, list[int]],
+    compiled: CompiledPromotions,
     switches: PromotionFeatureSwitches,
     applications: dict[str, PromotionApplication],
     assigned_discount: dict[int, Decimal],
     device_promotions: dict[int, str],
 ) -> None:
-    if not switches.volume:
+    if not switches.volume or compiled.volume_device_ids.isdisjoint(positions):
         return
 
-    for rule in config.volume_promotions:
-        for index, item in enumerate(sale_request.items):
-            if item.device_id is None or item.device_id != rule.device_id:
-                continue
+    for rule in compiled.volume_rules:
+        for index in positions.get(rule.device_id, ()):
+            item = items[index]
             if item.quantity < rule.min_quantity:
                 continue
             current_discount = assigned_discount.get(item.device_id, item.discount_percent or Decimal("0"))
             if current_discount >= rule.discount_percent:
                 continue
-            sale_request.items[index] = item.model_copy(update={"discount_percent": rule.discount_percent})
+            items[index] = item.model_copy(update={"discount_percent": rule.discount_percent})
             assigned_discount[item.device_id] = rule.discount_percent
             key = f"volume::{rule.id}"
             application = applications.get(key)
@@ -150,26 +204,24 @@ def _apply_volume_promotions(
 
 
 def _apply_combo_promotions(
-    sale_request: schemas.POSSaleRequest,
-    config: schemas.POSPromotionsConfig,
+    items: list[schemas.POSCartItem],
+    positions: Mapping[int, list[int]],
+    compiled: CompiledPromotions,
     switches: PromotionFeatureSwitches,
     applications: dict[str, PromotionApplication],
     assigned_discount: dict[int, Decimal],
     device_promotions: dict[int, str],
 ) -> None:
-    if not switches.combos or not config.combo_promotions:
+    if not switches.combos or not compiled.combo_rules:
         return
 
-    item_quantities: dict[int, int] = {}
-    for item in sale_request.items:
-        if item.device_id is None:
-            continue
-        item_quantities[item.device_id] = item_quantities.get(item.device_id, 0) + item.quantity
+    item_quantities: dict[int, int] = {
+        device_id: sum(items[index].quantity for index in indexes)
+        for device_id, indexes in positions.items()
+    }
 
-    for rule in config.combo_promotions:
-        if not rule.items:
-            continue
-        if not _combo_is_available(rule.items, item_quantities):
+    for rule, required_items in compiled.combo_rules:
+        if not _combo_is_available(required_items, item_quantities):
             continue
         key = f"combo::{rule.id}"
         application = PromotionApplication(
@@ -178,12 +230,11 @@ def _apply_combo_promotions(
             description="Combo calificado",
             discount_percent=rule.discount_percent,
         )
-        for index, item in enumerate(sale_request.items):
-            if item.device_id is None:
-                continue
-            required = next((entry.quantity for entry in rule.items if entry.device_id == item.device_id), None)
-            if required is None:
-                continue
+        combo_indexes = sorted(
+            index for device_id in required_items for index in positions.get(device_id, ())
+        )
+        for index in combo_indexes:
+            item = items[index]
             current_discount = assigned_discount.get(item.device_id, item.discount_percent or Decimal("0"))
             if current_discount >= rule.discount_percent:
                 continue
@@ -193,7 +244,7 @@ def _apply_combo_promotions(
                 previous_app.affected_items.pop(item.device_id, None)
                 if not previous_app.affected_items:
                     applications.pop(previous_key, None)
-            sale_request.items[index] = item.model_copy(update={"discount_percent": rule.discount_percent})
+            items[index] = item.model_copy(update={"discount_percent": rule.discount_percent})
             assigned_discount[item.device_id] = rule.discount_percent
             application.affected_items[item.device_id] = item.quantity
             device_promotions[item.device_id] = key
@@ -202,51 +253,50 @@ def _apply_combo_promotions(
 
 
 def _combo_is_available(
-    required_items: Sequence[schemas.POSComboPromotionItem],
+    required_items: Mapping[int, int],
     quantities: Mapping[int, int],
 ) -> bool:
-    for required in required_items:
-        available = quantities.get(required.device_id, 0)
-        if available < required.quantity:
+    for device_id, quantity in required_items.items():
+        if quantities.get(device_id, 0) < quantity:
             return False
     return True
 
 
 def _apply_coupon_promotions(
     sale_request: schemas.POSSaleRequest,
-    config: schemas.POSPromotionsConfig,
+    items: Sequence[schemas.POSCartItem],
+    compiled: CompiledPromotions,
     switches: PromotionFeatureSwitches,
     applications: dict[str, PromotionApplication],
     assigned_discount: dict[int, Decimal],
-) -> None:
+) -> dict[str, object]:
+    """Elige el mejor cupón válido y devuelve los campos de la venta a actualizar."""
+
     if not switches.coupons or not sale_request.coupons:
-        return
+        return {}
 
     normalized = [code.strip().upper() for code in sale_request.coupons if code.strip()]
     if not normalized:
-        sale_request.coupons = []
-        return
+        return {"coupons": []}
 
-    coupon_map = {coupon.code.upper(): coupon for coupon in config.coupons}
     chosen = None
     for code in normalized:
-        rule = coupon_map.get(code)
+        rule = compiled.coupons.get(code)
         if rule is None:
             continue
         if chosen is None or rule.discount_percent > chosen.discount_percent:
             chosen = rule
     if chosen is None:
-        sale_request.coupons = []
-        return
+        return {"coupons": []}
 
-    sale_request.coupons = [chosen.code]
+    updates: dict[str, object] = {"coupons": [chosen.code]}
     sale_discount = sale_request.discount_percent or Decimal("0")
     if sale_discount < chosen.discount_percent:
-        sale_request.discount_percent = chosen.discount_percent
+        updates["discount_percent"] = chosen.discount_percent
 
     unassigned_items = [
         item.device_id
-        for item in sale_request.items
+        for item in items
         if item.device_id is not None and item.device_id not in assigned_discount
     ]
     applications["coupon::" + chosen.code] = PromotionApplication(
@@ -257,6 +307,7 @@ def _apply_coupon_promotions(
         coupon_code=chosen.code,
         affected_items={device_id: 0 for device_id in unassigned_items},
     )
+    return updates
 
 
 def summarize_applications(
@@ -11,8 +11,6 @@ from uuid import uuid4
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 
 from ..config import settings
 from .. import models
@@ -160,6 +158,9 @@ def get_storage() -> PurchaseDocumentStorage:
 def render_purchase_order_pdf(order: models.PurchaseOrder) -> bytes:
     """Genera el PDF oficial de una orden de compra."""
 
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = BytesIO()
     pdf = canvas.Canvas(buffer, pagesize=letter)
     pdf.setTitle(f"OrdenCompra_{order.id}")
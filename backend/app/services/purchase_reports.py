@@ -1,26 +1,27 @@
 """Herramientas para generar reportes PDF/Excel del módulo de compras."""
+from __future__ import annotations
+
 from collections import defaultdict
 from datetime import datetime, timezone
 from decimal import Decimal
 from io import BytesIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING
 
 from .. import models, schemas
 from .locale_helpers import format_dual_currency
 
+if TYPE_CHECKING:
+    from reportlab.platypus import SimpleDocTemplate, Table
+
 
 def _format_currency(value: Decimal | float | int) -> str:
     return format_dual_currency(value)
 
 
 def _build_pdf_table(data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
@@ -40,6 +41,11 @@ def _build_pdf_table(data: list[list[str]]) -> Table:
 
 
 def _build_pdf_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:  # type: ignore[type-arg]
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title=title)
     styles = getSampleStyleSheet()
@@ -140,6 +146,9 @@ def build_purchase_report(
 
 
 def render_purchase_report_pdf(report: schemas.PurchaseReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_pdf_document("Softmobile - Reporte de compras")
     styles = getSampleStyleSheet()
 
@@ -216,6 +225,10 @@ def render_purchase_report_pdf(report: schemas.PurchaseReport) -> bytes:
 
 
 def render_purchase_report_excel(report: schemas.PurchaseReport) -> bytes:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Compras"
@@ -0,0 +1,324 @@
+"""Generación de PDF y XLSX en procesos separados.
+
+ReportLab y openpyxl son CPU intensivos y retienen el GIL: un catálogo PDF
+grande generado en un hilo de la petición frena al resto de peticiones del
+mismo worker (incluido el POS). :func:`render` y :func:`render_file` envían el
+generador y sus argumentos (esquemas y tipos simples, serializados con
+``pickle``) a un ``ProcessPoolExecutor`` de ``RENDER_WORKERS`` procesos:
+
+* el generador debe ser una función de módulo que devuelva ``bytes`` o un
+  archivo/buffer; :func:`render` entrega ``bytes`` y :func:`render_file` un
+  archivo temporal que se borra al cerrarse;
+* cada generación tiene un tiempo máximo (``RENDER_TIMEOUT_SECONDS``); al
+  agotarse se reinician los procesos y las generaciones que compartían el pool
+  se reintentan una vez;
+* con ``RENDER_WORKERS=0`` el generador se ejecuta en el hilo actual.
+
+La duración, los fallos y las generaciones pendientes se publican en
+:mod:`backend.app.telemetry`.
+"""
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import IO, Any
+
+from backend.core.logging import logger as core_logger
+
+from .. import telemetry
+from ..config import settings
+
+logger = core_logger.bind(component=__name__)
+
+Renderer = Callable[..., Any]
+
+
+class RenderError(RuntimeError):
+    """Los procesos de generación no pudieron completar el documento."""
+
+
+class RenderTimeoutError(RenderError):
+    """La generación superó ``RENDER_TIMEOUT_SECONDS``."""
+
+
+class _RenderedFile(io.BufferedReader):
+    """Archivo temporal generado por un proceso; se elimina al cerrarse."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(io.FileIO(path, "rb"))
+        self._path = path
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            try:
+                os.unlink(self._path)
+            except FileNotFoundError:
+                pass
+
+
+def _renderer_name(renderer: Renderer) -> str:
+    module = getattr(renderer, "__module__", "") or ""
+    return f"{module.rsplit('.', 1)[-1]}.{getattr(renderer, '__name__', 'render')}"
+
+
+def _as_bytes(result: Any) -> bytes:
+    if isinstance(result, (bytes, bytearray, memoryview)):
+        return bytes(result)
+    if isinstance(result, io.StringIO):
+        return result.getvalue().encode("utf-8")
+    if isinstance(result, io.BytesIO):
+        return result.getvalue()
+    with result:
+        result.seek(0)
+        return result.read()
+
+
+def _write_result(result: Any, path: str) -> None:
+    with open(path, "wb") as target:
+        if isinstance(result, (bytes, bytearray, memoryview, io.StringIO)):
+            target.write(_as_bytes(result))
+            return
+        with result:
+            result.seek(0)
+            shutil.copyfileobj(result, target)
+
+
+def _run_renderer(
+    renderer: Renderer,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    output_path: str | None,
+) -> bytes | None:
+    """Punto de entrada en el proceso de generación."""
+
+    result = renderer(*args, **kwargs)
+    if output_path is None:
+        return _as_bytes(result)
+    _write_result(result, output_path)
+    return None
+
+
+def _warm_up() -> None:
+    # Importa las bibliotecas de generación una sola vez por proceso.
+    import openpyxl  # noqa: F401
+    from reportlab.pdfgen import canvas  # noqa: F401
+    from reportlab.platypus import SimpleDocTemplate  # noqa: F401
+
+
+class RenderPool:
+    """Procesos de generación con tiempo máximo por documento."""
+
+    def __init__(self, workers: int, *, timeout_seconds: float) -> None:
+        self._workers = max(1, workers)
+        self._timeout = timeout_seconds
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # ``spawn`` evita heredar hilos y conexiones del proceso web.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_up,
+                )
+            return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """Termina los procesos de ``executor`` para liberar una generación colgada."""
+
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        for process in processes:
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _track(self, delta: int) -> None:
+        with self._lock:
+            self._pending += delta
+            depth = self._pending
+        telemetry.set_render_queue_depth(depth)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def warm_up(self) -> None:
+        """Arranca los procesos antes de la primera generación."""
+
+        executor = self._get_executor()
+        for _ in range(self._workers):
+            executor.submit(_warm_up)
+
+    def run(
+        self,
+        renderer: Renderer,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        output_path: str | None,
+        timeout: float | None = None,
+    ) -> bytes | None:
+        name = _renderer_name(renderer)
+        limit = timeout or self._timeout
+        for attempt in (1, 2):
+            executor = self._get_executor()
+            try:
+                future: Future[bytes | None] = executor.submit(
+                    _run_renderer, renderer, args, kwargs, output_path
+                )
+            except RuntimeError as exc:
+                # Otro hilo reinició el pool entre la obtención y el envío.
+                if attempt == 2:
+                    raise RenderError(
+                        f"{name}: procesos de generación no disponibles"
+                    ) from exc
+                continue
+            started = time.perf_counter()
+            self._track(1)
+            try:
+                result = future.result(timeout=limit)
+            except FutureTimeoutError as exc:
+                telemetry.record_render_failure(name, "timeout")
+                # Si aún esperaba turno basta con cancelarla; si se estaba
+                # generando hay que terminar los procesos para liberarlos.
+                if not future.cancel():
+                    logger.warning(
+                        "Generación de documento vencida; se reinician los procesos",
+                        renderer=name,
+                        timeout_seconds=limit,
+                    )
+                    self._recycle(executor)
+                raise RenderTimeoutError(f"{name} superó {limit:g} s") from exc
+            except BrokenProcessPool as exc:
+                # Otro documento agotó su tiempo y reinició el pool.
+                self._recycle(executor)
+                if attempt == 2:
+                    telemetry.record_render_failure(name, "error")
+                    raise RenderError(f"{name}: procesos de generación no disponibles") from exc
+                continue
+            except Exception:
+                # Los errores del generador llegan con su tipo original.
+                telemetry.record_render_failure(name, "error")
+                raise
+            finally:
+                self._track(-1)
+            telemetry.record_render(name, "process", time.perf_counter() - started)
+            return result
+        raise RenderError(name)  # pragma: no cover - el ciclo siempre retorna
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool: RenderPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> RenderPool | None:
+    """Pool de generación del proceso, o ``None`` con ``RENDER_WORKERS=0``."""
+
+    global _pool
+    if settings.render_workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = RenderPool(
+                settings.render_workers, timeout_seconds=settings.render_timeout_seconds
+            )
+        return _pool
+
+
+def start_render_pool() -> None:
+    pool = get_render_pool()
+    if pool is not None:
+        pool.warm_up()
+
+
+def stop_render_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _render_inline(renderer: Renderer, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    name = _renderer_name(renderer)
+    started = time.perf_counter()
+    try:
+        result = renderer(*args, **kwargs)
+    except Exception:
+        telemetry.record_render_failure(name, "error")
+        raise
+    telemetry.record_render(name, "inline", time.perf_counter() - started)
+    return result
+
+
+def render(renderer: Renderer, *args: Any, timeout: float | None = None, **kwargs: Any) -> bytes:
+    """Genera el documento en un proceso de generación y devuelve sus bytes."""
+
+    pool = get_render_pool()
+    if pool is None:
+        return _as_bytes(_render_inline(renderer, args, kwargs))
+    result = pool.run(renderer, args, kwargs, output_path=None, timeout=timeout)
+    assert result is not None
+    return result
+
+
+def render_file(
+    renderer: Renderer, *args: Any, timeout: float | None = None, **kwargs: Any
+) -> IO[bytes]:
+    """Genera el documento en un archivo temporal y lo devuelve abierto.
+
+    Se evita copiar documentos grandes entre procesos: el proceso de
+    generación escribe el archivo y el llamador lo lee o lo entrega con
+    :func:`~.streaming_exports.file_response`, que lo cierra (y borra).
+    """
+
+    pool = get_render_pool()
+    if pool is None:
+        result = _render_inline(renderer, args, kwargs)
+        if isinstance(result, (bytes, bytearray, memoryview, io.StringIO)):
+            return io.BytesIO(_as_bytes(result))
+        result.seek(0)
+        return result
+    handle, path = tempfile.mkstemp(prefix="render_")
+    os.close(handle)
+    try:
+        pool.run(renderer, args, kwargs, output_path=path, timeout=timeout)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return _RenderedFile(path)
+
+
+__all__ = [
+    "RenderError",
+    "RenderPool",
+    "RenderTimeoutError",
+    "get_render_pool",
+    "render",
+    "render_file",
+    "start_render_pool",
+    "stop_render_pool",
+]
@@ -4,15 +4,15 @@ from __future__ import annotations
 
 from io import BytesIO
 
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-
 from .. import models
 
 
 def render_repair_pdf(order: models.RepairOrder) -> bytes:  # // [PACK37-backend]
     """Genera un PDF con el resumen de una orden de reparación."""
 
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = BytesIO()
     pdf = canvas.Canvas(buffer, pagesize=letter)
     width, height = letter
@@ -5,25 +5,23 @@ from collections import defaultdict
 from datetime import date, datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from io import BytesIO
-from typing import Mapping
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING, Mapping
 
 from .. import models, schemas
 from .locale_helpers import format_dual_currency
 
+if TYPE_CHECKING:
+    from reportlab.platypus import SimpleDocTemplate, Table
+
 
 def _format_currency(value: Decimal | float | int) -> str:
     return format_dual_currency(value)
 
 
 def _build_pdf_table(data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
@@ -43,6 +41,11 @@ def _build_pdf_table(data: list[list[str]]) -> Table:
 
 
 def _build_pdf_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:  # type: ignore[type-arg]
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title=title)
     styles = getSampleStyleSheet()
@@ -272,6 +275,9 @@ def build_sales_report(
 
 
 def render_sales_report_pdf(report: schemas.SalesReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_pdf_document("Softmobile - Reporte de ventas")
     styles = getSampleStyleSheet()
 
@@ -402,6 +408,10 @@ def render_sales_report_pdf(report: schemas.SalesReport) -> bytes:
 
 
 def render_sales_report_excel(report: schemas.SalesReport) -> bytes:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Ventas"
@@ -13,11 +13,13 @@ from ..core.session_provider import SessionProvider
 from ..core.transactions import transactional_session
 from ..database import SessionLocal
 from . import accounts_receivable as receivable_service
-from . import customer_segments, sync as sync_service
+from . import customer_segments, pos_receipt_cache, sync as sync_service
 from .backups import generate_backup
 
 logger = core_logger.bind(component=__name__)
 
+_RECEIPT_CACHE_PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+
 
 class _PeriodicJob:
     """Ejecuta una función en segundo plano cada cierto intervalo."""
@@ -84,6 +86,16 @@ class BackgroundScheduler:
                 )
             )
 
+        incremental_interval = settings.backup_incremental_interval_seconds
+        if settings.enable_backup_scheduler and incremental_interval > 0:
+            self._jobs.append(
+                _PeriodicJob(
+                    name="respaldos_incrementales",
+                    interval_seconds=incremental_interval,
+                    callback=_incremental_backup_job,
+                )
+            )
+
         reservations_interval = settings.reservations_expiration_interval_seconds
         if reservations_interval > 0:
             self._jobs.append(
@@ -119,6 +131,15 @@ class BackgroundScheduler:
                 )
             )
 
+        if settings.pos_receipt_cache_retention_days > 0:
+            self._jobs.append(
+                _PeriodicJob(
+                    name="recibos_pos",
+                    interval_seconds=_RECEIPT_CACHE_PRUNE_INTERVAL_SECONDS,
+                    callback=partial(_receipt_cache_job, self._session_provider),
+                )
+            )
+
     async def start(self) -> None:
         for job in self._jobs:
             await job.start()
@@ -179,6 +200,19 @@ def _backup_job() -> None:
             )
 
 
+def _incremental_backup_job() -> None:
+    with SessionLocal() as session:
+        with transactional_session(session):
+            generate_backup(
+                session,
+                base_dir=settings.backup_directory,
+                mode=models.BackupMode.AUTOMATIC,
+                triggered_by_id=None,
+                notes="Respaldo incremental programado",
+                backup_type=models.BackupType.INCREMENTAL,
+            )
+
+
 def _reservation_cleanup_job() -> None:
     with SessionLocal() as session:
         with transactional_session(session):
@@ -190,6 +224,17 @@ def _reservation_cleanup_job() -> None:
                 )
 
 
+def _receipt_cache_job(session_provider: SessionProvider | None = None) -> None:
+    provider = session_provider or SessionLocal
+    with provider() as session:
+        removed = pos_receipt_cache.prune_receipt_cache(session)
+        if removed:
+            logger.info(
+                "Recibos POS sin uso depurados de la caché",
+                extra={"receipts_removed": removed},
+            )
+
+
 def _customer_segments_job(session_provider: SessionProvider | None = None) -> None:
     provider = session_provider or SessionLocal
     with provider() as session:
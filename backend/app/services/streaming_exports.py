@@ -0,0 +1,340 @@
+"""Exportaciones CSV/XLSX en flujo, con memoria constante.
+
+Capa común para los reportes descargables grandes:
+
+- :func:`stream_scalars` recorre la consulta con ``yield_per`` (cursor del
+  lado del servidor en PostgreSQL) en lugar de cargar todas las filas;
+- :func:`iter_csv` codifica el CSV por bloques de ``CSV_CHUNK_BYTES`` para
+  entregarlo en un ``StreamingResponse``;
+- :func:`write_xlsx` escribe el libro con openpyxl en modo ``write_only``
+  sobre un archivo temporal que pasa a disco al superar ``SPOOL_MAX_BYTES``;
+  las fechas del libro y del ZIP son fijas, de modo que los mismos datos
+  producen los mismos bytes (y el mismo ``ETag``);
+- :func:`csv_response` y :func:`file_response` responden ``Range: bytes=…``
+  con ``206 Partial Content`` para que una descarga interrumpida pueda
+  reanudarse. Toda respuesta lleva ``ETag`` y ``Content-Length``, y un
+  ``If-Range`` que no coincide recibe el archivo completo. El CSV y el XLSX
+  se generan de nuevo en cada petición, por lo que sólo atienden rangos con
+  un ``If-Range`` que coincide.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import re
+import shutil
+import tempfile
+import zipfile
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from io import StringIO
+from typing import IO, Any
+
+from fastapi import Request, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+
+from .. import schemas
+
+CSV_CHUNK_BYTES = 64 * 1024
+QUERY_BATCH_SIZE = 1_000
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+FILE_CHUNK_BYTES = 256 * 1024
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+# Fecha de las entradas del ZIP y de `docProps/core.xml` (época del formato
+# ZIP): openpyxl escribe la hora actual y dos descargas nunca coincidirían.
+_XLSX_TIMESTAMP = datetime(1980, 1, 1)
+
+
+def stream_scalar_batches(
+    db: Session, statement: Select[Any], *, batch_size: int = QUERY_BATCH_SIZE
+) -> Iterator[Sequence[Any]]:
+    """Lotes de ``batch_size`` entidades leídos con ``yield_per``."""
+
+    result = db.scalars(statement.execution_options(yield_per=batch_size))
+    yield from result.partitions()
+
+
+def stream_scalars(
+    db: Session, statement: Select[Any], *, batch_size: int = QUERY_BATCH_SIZE
+) -> Iterator[Any]:
+    """Entidades de ``statement`` sin materializar el resultado completo."""
+
+    for batch in stream_scalar_batches(db, statement, batch_size=batch_size):
+        yield from batch
+
+
+def iter_csv(
+    rows: Iterable[Sequence[object]],
+    *,
+    header: Sequence[str] | None = None,
+    chunk_size: int = CSV_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """Codifica ``rows`` como CSV UTF-8 en bloques de ``chunk_size`` bytes."""
+
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    if header is not None:
+        writer.writerow(header)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    tail = buffer.getvalue()
+    if tail:
+        yield tail.encode("utf-8")
+
+
+def render_csv(rows: Iterable[Sequence[object]], *, header: Sequence[str] | None = None) -> str:
+    """CSV completo como texto, para los llamadores que aún lo necesitan así."""
+
+    return b"".join(iter_csv(rows, header=header)).decode("utf-8")
+
+
+@dataclass(frozen=True)
+class XlsxCell:
+    """Valor con formato dentro de una fila de :class:`XlsxSheet`."""
+
+    value: object
+    bold: bool = False
+
+
+@dataclass(frozen=True)
+class XlsxSheet:
+    """Hoja de :func:`write_xlsx`; ``rows`` puede ser un generador."""
+
+    title: str
+    header: Sequence[str]
+    rows: Iterable[Sequence[object]]
+    column_width: float | None = None
+    # Encabezado en negritas blancas sobre el fondo oscuro de los reportes.
+    styled_header: bool = False
+
+
+class _StableZipFile(zipfile.ZipFile):
+    """``ZipFile`` que fecha todas las entradas con ``_XLSX_TIMESTAMP``."""
+
+    def _stable_info(self, arcname: str) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(arcname, date_time=_XLSX_TIMESTAMP.timetuple()[:6])
+        info.compress_type = self.compression
+        info.external_attr = 0o600 << 16
+        return info
+
+    def writestr(self, zinfo_or_arcname: Any, data: Any, *args: Any, **kwargs: Any) -> None:
+        if not isinstance(zinfo_or_arcname, zipfile.ZipInfo):
+            zinfo_or_arcname = self._stable_info(zinfo_or_arcname)
+        super().writestr(zinfo_or_arcname, data, *args, **kwargs)
+
+    def write(self, filename: Any, arcname: Any = None, *args: Any, **kwargs: Any) -> None:
+        # Las hojas en modo `write_only` llegan como archivos temporales.
+        info = zipfile.ZipInfo.from_file(filename, arcname)
+        info.date_time = _XLSX_TIMESTAMP.timetuple()[:6]
+        info.compress_type = self.compression
+        info.external_attr = 0o600 << 16
+        with open(filename, "rb") as source, self.open(info, "w") as target:
+            shutil.copyfileobj(source, target, FILE_CHUNK_BYTES)
+
+
+def write_xlsx(sheets: Iterable[XlsxSheet]) -> IO[bytes]:
+    """Escribe el libro en modo ``write_only`` sobre un archivo temporal.
+
+    Devuelve el archivo posicionado al inicio; quien lo recibe debe cerrarlo
+    (``file_response`` lo hace al terminar de enviarlo). El contenido sólo
+    depende de ``sheets``.
+    """
+
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+    from openpyxl.writer.excel import ExcelWriter
+
+    workbook = Workbook(write_only=True)
+    bold = Font(bold=True)
+    for sheet in sheets:
+        worksheet = workbook.create_sheet(title=sheet.title)
+        if sheet.column_width is not None:
+            for column in range(1, len(sheet.header) + 1):
+                worksheet.column_dimensions[get_column_letter(column)].width = sheet.column_width
+        if sheet.styled_header:
+            header_font = Font(color="FFFFFF", bold=True)
+            header_fill = PatternFill("solid", fgColor="0f172a")
+            header_cells = []
+            for title in sheet.header:
+                cell = WriteOnlyCell(worksheet, value=title)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = Alignment(horizontal="center", vertical="center")
+                header_cells.append(cell)
+            worksheet.append(header_cells)
+        else:
+            worksheet.append(list(sheet.header))
+        for row in sheet.rows:
+            values = []
+            for value in row:
+                if isinstance(value, XlsxCell):
+                    cell = WriteOnlyCell(worksheet, value=value.value)
+                    if value.bold:
+                        cell.font = bold
+                    values.append(cell)
+                else:
+                    values.append(value)
+            worksheet.append(values)
+    if not workbook.worksheets:
+        workbook.create_sheet()
+    # `Workbook.save` fija `modified` a la hora actual; se escribe con
+    # `ExcelWriter` directamente para conservar las fechas fijas.
+    workbook.properties.created = _XLSX_TIMESTAMP
+    workbook.properties.modified = _XLSX_TIMESTAMP
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    archive = _StableZipFile(spool, "w", zipfile.ZIP_DEFLATED, allowZip64=True)
+    ExcelWriter(workbook, archive).save()
+    spool.seek(0)
+    return spool
+
+
+def spool_chunks(chunks: Iterable[bytes]) -> IO[bytes]:
+    """Vuelca ``chunks`` en un archivo temporal y lo deja al inicio."""
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    for chunk in chunks:
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def _file_digest(file: IO[bytes]) -> str:
+    digest = hashlib.sha256()
+    file.seek(0)
+    while chunk := file.read(FILE_CHUNK_BYTES):
+        digest.update(chunk)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _iter_file(file: IO[bytes], start: int, end: int) -> Iterator[bytes]:
+    file.seek(start)
+    remaining = end - start + 1
+    while remaining > 0:
+        chunk = file.read(min(FILE_CHUNK_BYTES, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """``(inicio, fin)`` inclusivos; ``None`` si el rango no es satisfacible."""
+
+    match = _RANGE_PATTERN.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # `bytes=-N`: los últimos N bytes.
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            return None
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def file_response(
+    request: Request | None,
+    file: IO[bytes],
+    *,
+    metadata: schemas.BinaryFileResponse,
+    require_if_range: bool = False,
+) -> Response:
+    """Entrega ``file`` completo o el rango pedido y lo cierra al terminar.
+
+    Con ``require_if_range`` un ``Range`` sin ``If-Range`` recibe el archivo
+    completo: es para contenidos que se regeneran en cada petición y podrían
+    no coincidir con lo que el cliente ya descargó.
+    """
+
+    size = file.seek(0, 2)
+    etag = _file_digest(file)
+    headers = {
+        **metadata.content_disposition(),
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+    }
+    range_header = request.headers.get("range") if request is not None else None
+    if_range = request.headers.get("if-range") if request is not None else None
+    if if_range is None:
+        range_allowed = not require_if_range
+    else:
+        range_allowed = if_range == etag
+    # Varios rangos a la vez no se atienden: se responde el archivo completo.
+    if range_header and "," not in range_header and range_allowed:
+        requested = _parse_range(range_header, size)
+        if requested is None:
+            file.close()
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}", "Accept-Ranges": "bytes"},
+            )
+        start, end = requested
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            _iter_file(file, start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=metadata.media_type,
+            headers=headers,
+            background=BackgroundTask(file.close),
+        )
+    headers["Content-Length"] = str(size)
+    return StreamingResponse(
+        _iter_file(file, 0, size - 1),
+        media_type=metadata.media_type,
+        headers=headers,
+        background=BackgroundTask(file.close),
+    )
+
+
+def csv_response(
+    request: Request | None,
+    rows: Iterable[Sequence[object]],
+    *,
+    metadata: schemas.BinaryFileResponse,
+    header: Sequence[str] | None = None,
+) -> Response:
+    """Genera el CSV en un archivo temporal y lo entrega completo o por tramos.
+
+    El archivo temporal permite enviar ``ETag`` y ``Content-Length`` desde la
+    primera descarga, que el cliente usa después en ``If-Range`` para reanudar.
+    """
+
+    spool = spool_chunks(iter_csv(rows, header=header))
+    return file_response(request, spool, metadata=metadata, require_if_range=True)
+
+
+__all__ = [
+    "CSV_CHUNK_BYTES",
+    "QUERY_BATCH_SIZE",
+    "XLSX_MEDIA_TYPE",
+    "XlsxCell",
+    "XlsxSheet",
+    "csv_response",
+    "file_response",
+    "iter_csv",
+    "render_csv",
+    "spool_chunks",
+    "stream_scalar_batches",
+    "stream_scalars",
+    "write_xlsx",
+]
@@ -2,12 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Iterable
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from backend.core.logging import logger as core_logger
@@ -17,6 +14,7 @@ from ..config import settings
 from ..core.session_provider import SessionProvider
 from ..database import SessionLocal
 from ..core.transactions import transactional_session
+from . import inventory_discrepancies
 
 logger = core_logger.bind(component=__name__)
 
@@ -67,99 +65,17 @@ def requeue_failed_outbox_entries(db: Session) -> list[models.SyncOutbox]:
 
 
 def detect_inventory_discrepancies(db: Session) -> list[dict[str, object]]:
-    """Compara cantidades por SKU entre sucursales y detecta diferencias."""
+    """Compara cantidades por SKU entre sucursales y detecta diferencias.
 
-    stmt = (
-        select(
-            models.Device.sku.label("device_sku"),
-            models.Device.id.label("device_id"),
-            models.Device.name.label("device_name"),
-            models.Device.store_id.label("store_id"),
-            models.Store.name.label("store_name"),
-            models.Device.quantity.label("quantity"),
-        )
-        .join(models.Store, models.Store.id == models.Device.store_id)
-        .order_by(models.Device.sku, models.Store.name)
-    )
-    grouped: dict[str, list[dict[str, object]]] = defaultdict(list)
-    for row in db.execute(stmt):
-        mapping = row._mapping
-        sku = mapping["device_sku"] or f"device-{mapping['device_id']}"
-        grouped[sku].append(
-            {
-                "sku": sku,
-                "device_id": mapping["device_id"],
-                "product_name": mapping["device_name"],
-                "store_id": mapping["store_id"],
-                "store_name": mapping["store_name"],
-                "quantity": int(mapping["quantity"] or 0),
-            }
-        )
-
-    discrepancies: list[dict[str, object]] = []
-    for sku, items in grouped.items():
-        if len(items) < 2:
-            continue
-        quantities = [item["quantity"] for item in items]
-        if not quantities:
-            continue
-        max_qty = max(quantities)
-        min_qty = min(quantities)
-        if max_qty == min_qty:
-            continue
-        max_stores = [
-            {
-                "store_id": item["store_id"],
-                "store_name": item["store_name"],
-                "quantity": item["quantity"],
-            }
-            for item in items
-            if item["quantity"] == max_qty
-        ]
-        min_stores = [
-            {
-                "store_id": item["store_id"],
-                "store_name": item["store_name"],
-                "quantity": item["quantity"],
-            }
-            for item in items
-            if item["quantity"] == min_qty
-        ]
-        discrepancies.append(
-            {
-                "sku": sku,
-                "product_name": items[0]["product_name"],
-                "diferencia": max_qty - min_qty,
-                "max": max_stores,
-                "min": min_stores,
-            }
-        )
-    return discrepancies
+    En modo incremental (``INVENTORY_DISCREPANCY_INCREMENTAL``) sólo se
+    recalculan los SKU tocados desde el ciclo anterior sobre el resumen
+    persistido; en caso contrario se ejecuta la consulta agregada completa.
+    """
 
-
-def _entry_matches_store(entry: models.SyncOutbox, store_id: int | None) -> bool:
-    if store_id is None:
-        return True
-    payload = entry.payload
-    if not isinstance(payload, dict):
-        try:
-            raw_value = getattr(entry, "payload_raw", payload)
-            payload = json.loads(raw_value)
-        except (TypeError, json.JSONDecodeError):
-            return False
-    candidate: object | None = payload.get("store_id")
-    if candidate is None:
-        candidate = payload.get("origin_store_id")
-    if candidate is None:
-        candidate = payload.get("destination_store_id")
-    if candidate is None:
-        candidate = payload.get("sucursal_id")
-    if candidate is None:
-        return True
-    try:
-        return int(candidate) == int(store_id)
-    except (TypeError, ValueError):
-        return False
+    if settings.inventory_discrepancy_incremental:
+        inventory_discrepancies.refresh_inventory_sku_summary(db)
+        return inventory_discrepancies.list_inventory_discrepancies(db)
+    return inventory_discrepancies.compute_inventory_discrepancies(db)
 
 
 def run_sync_cycle(
@@ -173,29 +89,43 @@ def run_sync_cycle(
 
     selected_statuses = tuple(statuses) if statuses else (
         models.SyncOutboxStatus.PENDING,)
-    pending_entries = crud.list_sync_outbox(
-        db, statuses=selected_statuses, limit=500)
-    filtered = [
-        entry for entry in pending_entries if _entry_matches_store(entry, store_id)]
-    processed: list[models.SyncOutbox] = []
-    if filtered:
-        processed = crud.mark_outbox_entries_sent(
+    page_size = settings.sync_cycle_page_size
+    processed_count = 0
+    last_id = 0
+    # Paginación por clave (id) sobre el índice de enrutamiento por sucursal:
+    # recorre colas de cualquier tamaño sin ventanas fijas ni OFFSET.
+    while True:
+        page = crud.list_sync_outbox_page(
             db,
-            (entry.id for entry in filtered),
-            performed_by_id=performed_by_id,
+            statuses=selected_statuses,
+            store_id=store_id,
+            after_id=last_id,
+            limit=page_size,
+        )
+        if not page:
+            break
+        last_id = page[-1].id
+        processed_count += len(
+            crud.mark_outbox_entries_sent(
+                db,
+                (entry.id for entry in page),
+                performed_by_id=performed_by_id,
+            )
         )
+        if len(page) < page_size:
+            break
 
     discrepancies = detect_inventory_discrepancies(db)
     if discrepancies:
         logger.warning(
             "Discrepancias de inventario detectadas tras sincronización",
             discrepancies=discrepancies,
-            processed_entries=len(processed),
+            processed_entries=processed_count,
             store_filter=store_id,
         )
     crud.log_sync_discrepancies(
         db, discrepancies, performed_by_id=performed_by_id)
-    return {"processed": len(processed), "discrepancies": discrepancies}
+    return {"processed": processed_count, "discrepancies": discrepancies}
 
 
 class SyncScheduler:
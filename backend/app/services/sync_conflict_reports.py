@@ -4,20 +4,12 @@ from datetime import datetime, timezone
 from io import BytesIO
 from typing import Sequence
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
-
 from .. import schemas
 
-DARK_BACKGROUND = colors.HexColor("#0f172a")
-DARK_SURFACE = colors.HexColor("#111827")
-ACCENT = colors.HexColor("#38bdf8")
-TEXT_PRIMARY = colors.HexColor("#e2e8f0")
+DARK_BACKGROUND = "#0f172a"
+DARK_SURFACE = "#111827"
+ACCENT = "#38bdf8"
+TEXT_PRIMARY = "#e2e8f0"
 
 
 def _format_timestamp(value: datetime | None) -> str:
@@ -50,6 +42,11 @@ def build_conflict_report(
 
 
 def render_conflict_report_pdf(report: schemas.SyncConflictReport) -> bytes:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title="Conflictos de sincronización")
     styles = getSampleStyleSheet()
@@ -57,7 +54,7 @@ def render_conflict_report_pdf(report: schemas.SyncConflictReport) -> bytes:
     heading_style = ParagraphStyle(
         "HeadingSoftmobileConflicts",
         parent=styles["Heading1"],
-        textColor=ACCENT,
+        textColor=colors.HexColor(ACCENT),
     )
     now_label = datetime.now(timezone.utc).strftime("%d/%m/%Y %H:%M UTC")
 
@@ -102,12 +99,12 @@ def render_conflict_report_pdf(report: schemas.SyncConflictReport) -> bytes:
     summary_table.setStyle(
         TableStyle(
             [
-                ("BACKGROUND", (0, 0), (-1, 0), DARK_BACKGROUND),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(DARK_BACKGROUND)),
                 ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("BACKGROUND", (0, 1), (-1, -1), DARK_SURFACE),
-                ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_PRIMARY),
-                ("LINEABOVE", (0, 0), (-1, 0), 1, ACCENT),
-                ("LINEBELOW", (0, -1), (-1, -1), 1, ACCENT),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor(DARK_SURFACE)),
+                ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor(TEXT_PRIMARY)),
+                ("LINEABOVE", (0, 0), (-1, 0), 1, colors.HexColor(ACCENT)),
+                ("LINEBELOW", (0, -1), (-1, -1), 1, colors.HexColor(ACCENT)),
                 ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),
             ]
@@ -149,10 +146,10 @@ def render_conflict_report_pdf(report: schemas.SyncConflictReport) -> bytes:
     detail_table.setStyle(
         TableStyle(
             [
-                ("BACKGROUND", (0, 0), (-1, 0), DARK_BACKGROUND),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(DARK_BACKGROUND)),
                 ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("BACKGROUND", (0, 1), (-1, -1), DARK_SURFACE),
-                ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_PRIMARY),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor(DARK_SURFACE)),
+                ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor(TEXT_PRIMARY)),
                 ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),
                 ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#1f2937")),
@@ -166,6 +163,10 @@ def render_conflict_report_pdf(report: schemas.SyncConflictReport) -> bytes:
 
 
 def render_conflict_report_excel(report: schemas.SyncConflictReport) -> bytes:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Conflictos"
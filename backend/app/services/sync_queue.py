@@ -3,8 +3,13 @@
 
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Iterable
+from threading import Lock
+from time import perf_counter
+from typing import Any, Iterable, Sequence
 
 import httpx
 from sqlalchemy.orm import Session
@@ -62,89 +67,259 @@ def _friendly_module_label(module: str) -> str:
     return sanitized.title() if sanitized else "General"
 
 
-def _should_attempt(entry: models.SyncQueue, now: datetime) -> bool:
-    if (
-        entry.status is models.SyncQueueStatus.FAILED
-        and entry.attempts >= max(1, settings.sync_max_attempts)
-    ):
-        return False
-    if entry.status is models.SyncQueueStatus.PENDING and entry.attempts == 0:
-        return True
-    reference = _normalize_dt(entry.updated_at or entry.created_at)
-    delay_seconds = _retry_delay_seconds(max(1, entry.attempts))
-    return now >= reference + timedelta(seconds=delay_seconds)
+def _retry_delays(max_attempts: int) -> list[int]:
+    """Espera tras cada intento; el último valor se repite a partir de ahí."""
 
+    return [_retry_delay_seconds(attempt) for attempt in range(1, max(2, max_attempts))]
 
-def _dispatch_remote(entry: models.SyncQueue) -> tuple[bool, str | None]:
-    target_url = (settings.sync_remote_url or "").strip()
-    if not target_url:
-        return True, None
 
-    payload = {
-        "event_type": entry.event_type,
-        "payload": entry.payload,
-        "idempotency_key": entry.idempotency_key,
-    }
+_http_client: httpx.Client | None = None
+_http_client_lock = Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Cliente HTTP compartido para reutilizar conexiones entre despachos."""
+
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            concurrency = max(1, settings.sync_dispatch_concurrency)
+            _http_client = httpx.Client(
+                timeout=settings.sync_remote_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=concurrency,
+                    max_keepalive_connections=concurrency,
+                ),
+            )
+        return _http_client
+
+
+def close_http_client() -> None:
+    """Cierra el cliente HTTP compartido (apagado de la aplicación)."""
+
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+        _http_client = None
+
+
+@dataclass(slots=True)
+class _OutgoingEvent:
+    """Copia del evento a enviar, desacoplada de la sesión para los hilos."""
+
+    key: str
+    idempotency_key: str | None
+    body: dict[str, Any]
+
+
+@dataclass(slots=True)
+class _DispatchOutcome:
+    success: bool
+    error_message: str | None
+
+
+def _outgoing_event(entry: models.SyncQueue) -> _OutgoingEvent:
+    return _OutgoingEvent(
+        key=entry.idempotency_key or f"queue:{entry.id}",
+        idempotency_key=entry.idempotency_key,
+        body={
+            "event_type": entry.event_type,
+            "payload": entry.payload,
+            "idempotency_key": entry.idempotency_key,
+        },
+    )
+
+
+def _batch_idempotency_key(events: Sequence[_OutgoingEvent]) -> str:
+    digest = hashlib.sha256()
+    for event in events:
+        digest.update(event.key.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _parse_batch_results(
+    events: Sequence[_OutgoingEvent], response: httpx.Response
+) -> list[_DispatchOutcome]:
+    """Interpreta la respuesta de un lote.
+
+    El remoto puede responder ``{"results": [{"idempotency_key", "success",
+    "error"}]}`` para reportar fallos individuales; cualquier otra respuesta
+    2xx confirma el lote completo.
+    """
+
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    reported = body.get("results") if isinstance(body, dict) else None
+    if not isinstance(reported, list):
+        return [_DispatchOutcome(True, None) for _ in events]
+
+    by_key: dict[str, dict[str, Any]] = {}
+    for item in reported:
+        if isinstance(item, dict) and item.get("idempotency_key"):
+            by_key[str(item["idempotency_key"])] = item
+    outcomes: list[_DispatchOutcome] = []
+    for event in events:
+        item = by_key.get(event.idempotency_key or "")
+        if item is None or item.get("success", True):
+            outcomes.append(_DispatchOutcome(True, None))
+        else:
+            error = str(item.get("error") or "Evento rechazado por el remoto")
+            outcomes.append(_DispatchOutcome(False, error[:255]))
+    return outcomes
+
+
+def _dispatch_batch(
+    client: httpx.Client,
+    target_url: str,
+    events: Sequence[_OutgoingEvent],
+    *,
+    batched: bool,
+) -> list[_DispatchOutcome]:
+    if not batched:
+        event = events[0]
+        headers = (
+            {"Idempotency-Key": event.idempotency_key}
+            if event.idempotency_key
+            else None
+        )
+        request_body: dict[str, Any] = event.body
+    else:
+        headers = {"Idempotency-Key": _batch_idempotency_key(events)}
+        request_body = {"events": [event.body for event in events]}
     try:
-        response = httpx.post(target_url, json=payload, timeout=15.0)
+        response = client.post(target_url, json=request_body, headers=headers)
         response.raise_for_status()
-        return True, None
     except httpx.HTTPError as exc:  # pragma: no cover - depende de red externa
-        logger.warning("Error al despachar evento remoto", error=str(exc))
-        return False, str(exc)
+        logger.warning(
+            "Error al despachar eventos remotos", error=str(exc), events=len(events)
+        )
+        message = str(exc)[:255]
+        return [_DispatchOutcome(False, message) for _ in events]
+    if not batched:
+        return [_DispatchOutcome(True, None)]
+    return _parse_batch_results(events, response)
+
+
+def _dispatch_remote(
+    entries: Sequence[models.SyncQueue],
+) -> tuple[list[_DispatchOutcome], int]:
+    """Envía los eventos en lotes concurrentes.
+
+    Devuelve un resultado por entrada (en el mismo orden) y el número de
+    peticiones realizadas. Un mismo ``idempotency_key`` se envía una sola vez.
+    """
+
+    target_url = (settings.sync_remote_url or "").strip()
+    if not target_url:
+        return [_DispatchOutcome(True, None) for _ in entries], 0
+
+    events = [_outgoing_event(entry) for entry in entries]
+    unique: dict[str, _OutgoingEvent] = {}
+    for event in events:
+        unique.setdefault(event.key, event)
+    pending = list(unique.values())
+    batch_size = max(1, settings.sync_dispatch_batch_size)
+    batched = batch_size > 1
+    batches = [
+        pending[start: start + batch_size]
+        for start in range(0, len(pending), batch_size)
+    ]
+
+    client = _get_http_client()
+    workers = min(max(1, settings.sync_dispatch_concurrency), len(batches))
+    if workers <= 1:
+        results = [
+            _dispatch_batch(client, target_url, batch, batched=batched)
+            for batch in batches
+        ]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lambda batch: _dispatch_batch(
+                        client, target_url, batch, batched=batched
+                    ),
+                    batches,
+                )
+            )
+
+    by_key: dict[str, _DispatchOutcome] = {}
+    for batch, batch_outcomes in zip(batches, results):
+        for event, outcome in zip(batch, batch_outcomes):
+            by_key[event.key] = outcome
+    return [by_key[event.key] for event in events], len(batches)
 
 
 def dispatch_pending_events(
     db: Session,
     *,
     limit: int = 25,
+    rounds: int = 1,
 ) -> schemas.SyncQueueDispatchResult:
-    candidates = crud.fetch_sync_queue_candidates(db, limit=limit)
-    now = datetime.now(timezone.utc)
+    """Despacha la cola híbrida en lotes y reporta el rendimiento obtenido.
+
+    Cada ronda toma hasta ``limit`` eventos pendientes cuya espera de reintento
+    ya venció (los agotados y los que aún esperan se filtran en la consulta,
+    así que no bloquean a los más recientes), los envía agrupados en lotes
+    de ``sync_dispatch_batch_size`` con hasta ``sync_dispatch_concurrency``
+    peticiones simultáneas sobre un cliente HTTP compartido y registra los
+    resultados e intentos en una sola transacción.
+    """
+
+    started = perf_counter()
     processed = 0
     sent = 0
     failed = 0
     retried = 0
+    batches = 0
+    max_attempts = max(1, settings.sync_max_attempts)
 
-    for entry in candidates:
-        if not _should_attempt(entry, now):
-            continue
-
-        processed += 1
-        success, error_message = _dispatch_remote(entry)
-
-        next_status = models.SyncQueueStatus.SENT if success else models.SyncQueueStatus.PENDING
-        next_attempt_number = entry.attempts + 1
-
-        if not success and next_attempt_number >= max(1, settings.sync_max_attempts):
-            next_status = models.SyncQueueStatus.FAILED
-
-        updated_entry = crud.update_sync_queue_entry(
+    for _ in range(max(1, rounds)):
+        due = crud.fetch_due_sync_queue_entries(
             db,
-            entry,
-            status=next_status,
-            error_message=error_message,
-            increment_attempt=True,
+            limit=limit,
+            max_attempts=max_attempts,
+            retry_delays=_retry_delays(max_attempts),
         )
-        crud.record_sync_attempt(
-            db,
-            queue_entry=updated_entry,
-            success=success,
-            error_message=error_message,
-        )
-
-        if success:
-            sent += 1
-        else:
-            retried += 1
-            if next_status is models.SyncQueueStatus.FAILED:
-                failed += 1
-
+        if not due:
+            break
+
+        outcomes, round_batches = _dispatch_remote(due)
+        batches += round_batches
+        updates: list[
+            tuple[models.SyncQueue, models.SyncQueueStatus, bool, str | None]
+        ] = []
+        for entry, outcome in zip(due, outcomes):
+            next_status = (
+                models.SyncQueueStatus.SENT
+                if outcome.success
+                else models.SyncQueueStatus.PENDING
+            )
+            if not outcome.success and entry.attempts + 1 >= max_attempts:
+                next_status = models.SyncQueueStatus.FAILED
+            updates.append((entry, next_status, outcome.success, outcome.error_message))
+            processed += 1
+            if outcome.success:
+                sent += 1
+            else:
+                retried += 1
+                if next_status is models.SyncQueueStatus.FAILED:
+                    failed += 1
+        crud.record_sync_dispatch_results(db, updates)
+
+    duration = perf_counter() - started
     return schemas.SyncQueueDispatchResult(
         processed=processed,
         sent=sent,
         failed=failed,
         retried=retried,
+        batches=batches,
+        duration_seconds=round(duration, 4),
+        events_per_second=round(processed / duration, 2) if duration > 0 else 0.0,
     )
 
 
@@ -5,20 +5,12 @@ from datetime import datetime, timezone
 from io import BytesIO
 from typing import Mapping, Sequence
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
-
 from .. import models, schemas
 
-DARK_BACKGROUND = colors.HexColor("#0f172a")
-DARK_SURFACE = colors.HexColor("#111827")
-ACCENT = colors.HexColor("#38bdf8")
-TEXT_PRIMARY = colors.HexColor("#e2e8f0")
+DARK_BACKGROUND = "#0f172a"
+DARK_SURFACE = "#111827"
+ACCENT = "#38bdf8"
+TEXT_PRIMARY = "#e2e8f0"
 
 
 def _format_timestamp(value: datetime | None) -> str:
@@ -120,6 +112,11 @@ def build_transfer_report(
 
 
 def render_transfer_report_pdf(report: schemas.TransferReport) -> bytes:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title="Reporte de transferencias")
     styles = getSampleStyleSheet()
@@ -127,7 +124,7 @@ def render_transfer_report_pdf(report: schemas.TransferReport) -> bytes:
     heading_style = ParagraphStyle(
         "HeadingSoftmobileTransfers",
         parent=styles["Heading1"],
-        textColor=ACCENT,
+        textColor=colors.HexColor(ACCENT),
     )
     now_label = datetime.now(timezone.utc).strftime("%d/%m/%Y %H:%M UTC")
 
@@ -178,12 +175,12 @@ def render_transfer_report_pdf(report: schemas.TransferReport) -> bytes:
     summary_table.setStyle(
         TableStyle(
             [
-                ("BACKGROUND", (0, 0), (-1, 0), DARK_BACKGROUND),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(DARK_BACKGROUND)),
                 ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("BACKGROUND", (0, 1), (-1, -1), DARK_SURFACE),
-                ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_PRIMARY),
-                ("LINEABOVE", (0, 0), (-1, 0), 1, ACCENT),
-                ("LINEBELOW", (0, -1), (-1, -1), 1, ACCENT),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor(DARK_SURFACE)),
+                ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor(TEXT_PRIMARY)),
+                ("LINEABOVE", (0, 0), (-1, 0), 1, colors.HexColor(ACCENT)),
+                ("LINEBELOW", (0, -1), (-1, -1), 1, colors.HexColor(ACCENT)),
                 ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),
             ]
@@ -223,10 +220,10 @@ def render_transfer_report_pdf(report: schemas.TransferReport) -> bytes:
     detail_table.setStyle(
         TableStyle(
             [
-                ("BACKGROUND", (0, 0), (-1, 0), DARK_BACKGROUND),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(DARK_BACKGROUND)),
                 ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("BACKGROUND", (0, 1), (-1, -1), DARK_SURFACE),
-                ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_PRIMARY),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor(DARK_SURFACE)),
+                ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor(TEXT_PRIMARY)),
                 ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),
                 ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#1f2937")),
@@ -249,10 +246,10 @@ def render_transfer_report_pdf(report: schemas.TransferReport) -> bytes:
         devices_table.setStyle(
             TableStyle(
                 [
-                    ("BACKGROUND", (0, 0), (-1, 0), DARK_SURFACE),
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(DARK_SURFACE)),
                     ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
                     ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor("#0b1120")),
-                    ("TEXTCOLOR", (0, 1), (-1, -1), TEXT_PRIMARY),
+                    ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor(TEXT_PRIMARY)),
                     ("ALIGN", (0, 0), (-1, -1), "LEFT"),
                 ]
             )
@@ -264,6 +261,10 @@ def render_transfer_report_pdf(report: schemas.TransferReport) -> bytes:
 
 
 def render_transfer_report_excel(report: schemas.TransferReport) -> bytes:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Transferencias"
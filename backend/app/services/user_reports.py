@@ -2,19 +2,20 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from io import BytesIO
-
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils import get_column_letter
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from typing import TYPE_CHECKING
 
 from .. import schemas
 
+if TYPE_CHECKING:
+    from reportlab.platypus import SimpleDocTemplate, Table
+
 
 def _build_pdf_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:  # type: ignore[type-arg]
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     buffer = BytesIO()
     document = SimpleDocTemplate(buffer, pagesize=A4, title=title)
     styles = getSampleStyleSheet()
@@ -37,6 +38,9 @@ def _build_pdf_document(title: str) -> tuple[list, SimpleDocTemplate, BytesIO]:
 
 
 def _build_pdf_table(data: list[list[str]]) -> Table:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
     table = Table(data, hAlign="LEFT")
     table.setStyle(
         TableStyle(
@@ -68,6 +72,9 @@ def _format_last_action(audit: schemas.AuditTrailInfo | None) -> str:
 
 
 def render_user_directory_pdf(report: schemas.UserDirectoryReport) -> bytes:
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
     elements, document, buffer = _build_pdf_document("Softmobile - Directorio de usuarios")
     styles = getSampleStyleSheet()
 
@@ -143,6 +150,10 @@ def render_user_directory_pdf(report: schemas.UserDirectoryReport) -> bytes:
 
 
 def render_user_directory_xlsx(report: schemas.UserDirectoryReport) -> BytesIO:
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
     workbook = Workbook()
     worksheet = workbook.active
     worksheet.title = "Usuarios"
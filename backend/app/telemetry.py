@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Iterable, Mapping
 
-from prometheus_client import CollectorRegistry, Counter, Gauge
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 
 REGISTRY = CollectorRegistry()
 
@@ -35,6 +35,84 @@ _AUDIT_REMINDER_CACHE_SNAPSHOT = Gauge(
     registry=REGISTRY,
 )
 
+_CACHE_REQUESTS = Counter(
+    "softmobile_cache_requests_total",
+    "Consultas a caches de la aplicación por resultado.",
+    ["cache", "result"],
+    registry=REGISTRY,
+)
+
+_CACHE_EVICTIONS = Counter(
+    "softmobile_cache_evictions_total",
+    "Entradas retiradas de caches de la aplicación por motivo.",
+    ["cache", "reason"],
+    registry=REGISTRY,
+)
+
+_CACHE_ENTRIES = Gauge(
+    "softmobile_cache_entries",
+    "Entradas almacenadas en el nivel local de cada cache.",
+    ["cache"],
+    registry=REGISTRY,
+)
+
+_DB_POOL_CHECKOUTS = Counter(
+    "softmobile_db_pool_checkouts_total",
+    "Conexiones entregadas por el pool de base de datos.",
+    ["engine"],
+    registry=REGISTRY,
+)
+
+_DB_POOL_WAIT_SECONDS = Histogram(
+    "softmobile_db_pool_checkout_wait_seconds",
+    "Tiempo de espera para obtener una conexión del pool.",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    registry=REGISTRY,
+)
+
+_DB_POOL_TIMEOUTS = Counter(
+    "softmobile_db_pool_timeouts_total",
+    "Solicitudes de conexión que agotaron la espera del pool.",
+    ["engine"],
+    registry=REGISTRY,
+)
+
+_DB_POOL_CHECKED_OUT = Gauge(
+    "softmobile_db_pool_checked_out",
+    "Conexiones del pool en uso tras la última entrega.",
+    ["engine"],
+    registry=REGISTRY,
+)
+
+_DB_POOL_OVERFLOW = Gauge(
+    "softmobile_db_pool_overflow",
+    "Conexiones abiertas por encima del tamaño base del pool.",
+    ["engine"],
+    registry=REGISTRY,
+)
+
+
+_RENDER_SECONDS = Histogram(
+    "softmobile_render_seconds",
+    "Duración de la generación de documentos PDF/XLSX por generador.",
+    ["renderer", "mode"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 120.0),
+    registry=REGISTRY,
+)
+
+_RENDER_FAILURES = Counter(
+    "softmobile_render_failures_total",
+    "Generaciones de documentos fallidas o que agotaron el tiempo máximo.",
+    ["renderer", "reason"],
+    registry=REGISTRY,
+)
+
+_RENDER_QUEUE_DEPTH = Gauge(
+    "softmobile_render_queue_depth",
+    "Generaciones enviadas a los procesos de generación y aún sin terminar.",
+    registry=REGISTRY,
+)
 
 def _normalize_entity(entity_type: str | None) -> str:
     if not entity_type:
@@ -95,6 +173,58 @@ def record_reminder_cache_invalidation() -> None:
     _AUDIT_REMINDER_CACHE_SNAPSHOT.labels(state="acknowledged").set(0.0)
 
 
+def record_cache_request(cache: str, result: str) -> None:
+    """Registra un acierto, fallo o lectura coalescida de una cache."""
+
+    _CACHE_REQUESTS.labels(cache=cache, result=result).inc()
+
+
+def record_cache_eviction(cache: str, reason: str, count: int = 1) -> None:
+    """Registra entradas retiradas por LRU, expiración o invalidación."""
+
+    _CACHE_EVICTIONS.labels(cache=cache, reason=reason).inc(count)
+
+
+def set_cache_entries(cache: str, size: int) -> None:
+    """Actualiza el número de entradas locales de una cache."""
+
+    _CACHE_ENTRIES.labels(cache=cache).set(float(size))
+
+
+def record_db_pool_checkout(
+    engine: str, *, wait_seconds: float, checked_out: int, overflow: int
+) -> None:
+    """Registra una conexión entregada por el pool y su tiempo de espera."""
+
+    _DB_POOL_CHECKOUTS.labels(engine=engine).inc()
+    _DB_POOL_WAIT_SECONDS.labels(engine=engine).observe(wait_seconds)
+    _DB_POOL_CHECKED_OUT.labels(engine=engine).set(float(checked_out))
+    _DB_POOL_OVERFLOW.labels(engine=engine).set(float(overflow))
+
+
+def record_db_pool_timeout(engine: str) -> None:
+    """Registra una solicitud de conexión que agotó ``pool_timeout``."""
+
+    _DB_POOL_TIMEOUTS.labels(engine=engine).inc()
+
+
+def record_render(renderer: str, mode: str, seconds: float) -> None:
+    """Registra la duración de una generación de documento."""
+
+    _RENDER_SECONDS.labels(renderer=renderer, mode=mode).observe(seconds)
+
+
+def record_render_failure(renderer: str, reason: str) -> None:
+    """Registra una generación fallida (``error``) o vencida (``timeout``)."""
+
+    _RENDER_FAILURES.labels(renderer=renderer, reason=reason).inc()
+
+
+def set_render_queue_depth(depth: int) -> None:
+    """Actualiza el número de generaciones pendientes en los procesos."""
+
+    _RENDER_QUEUE_DEPTH.set(float(depth))
+
 def get_metric_value(metric_name: str, labels: Mapping[str, str] | None = None) -> float | None:
     """Obtiene el valor actual de una métrica registrada."""
 
@@ -108,7 +238,15 @@ __all__ = [
     "get_metric_value",
     "record_audit_acknowledgement",
     "record_audit_acknowledgement_failure",
+    "record_cache_eviction",
+    "record_cache_request",
+    "record_db_pool_checkout",
+    "record_db_pool_timeout",
     "record_reminder_cache_hit",
     "record_reminder_cache_invalidation",
     "record_reminder_cache_miss",
+    "record_render",
+    "record_render_failure",
+    "set_cache_entries",
+    "set_render_queue_depth",
 ]
@@ -1,46 +1,442 @@
-"""Utilidades ligeras de cache con TTL en memoria."""
+"""Cache en memoria con TTL, desalojo LRU, etiquetas y backend compartido.
+
+Cada instancia de :class:`TTLCache` mantiene un nivel local acotado
+(``max_entries``) con expiración por TTL y desalojo LRU. Las entradas pueden
+etiquetarse (por ejemplo ``store:5``) para invalidarlas de forma selectiva y
+``get_or_set`` evita estampidas ejecutando una sola carga por clave.
+
+Las caches creadas con ``shared=True`` consultan además el backend compartido
+configurado en ``CACHE_BACKEND_URL`` (Redis o ``fakeredis://`` en pruebas),
+de modo que varios workers de uvicorn reutilicen los mismos resultados.
+"""
 from __future__ import annotations
 
-from threading import Lock
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from time import monotonic
-from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Protocol,
+    Set,
+    TypeVar,
+)
+
+from backend.core.logging import logger as core_logger
 
+from .. import telemetry
+from ..config import settings
+
+logger = core_logger.bind(component=__name__)
 
 T = TypeVar("T")
 
+_KEY_PREFIX = "softmobile:cache"
 
-class TTLCache(Generic[T]):
-    """Cache en memoria con expiración basada en TTL."""
 
-    __slots__ = ("_ttl", "_lock", "_values")
+class CacheBackend(Protocol):
+    """Almacén compartido entre procesos para el segundo nivel de cache."""
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, ttl_seconds: float, tags: Iterable[str]) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None: ...
+
+    def clear(self, prefix: str) -> None: ...
+
+
+class RedisCacheBackend:
+    """Backend compartido sobre un cliente Redis síncrono (o ``fakeredis``)."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{_KEY_PREFIX}:tag:{tag}"
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float, tags: Iterable[str]) -> None:
+        ttl_ms = max(1, int(ttl_seconds * 1000))
+        pipeline = self._client.pipeline()
+        pipeline.set(key, value, px=ttl_ms)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipeline.sadd(tag_key, key)
+            # Todas las entradas de una cache comparten TTL: la última
+            # escritura siempre extiende la vida del índice de la etiqueta.
+            pipeline.pexpire(tag_key, ttl_ms)
+        pipeline.execute()
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            members = list(self._client.smembers(tag_key))
+            if members:
+                self._client.delete(*members)
+            self._client.delete(tag_key)
+
+    def clear(self, prefix: str) -> None:
+        keys = list(self._client.scan_iter(match=f"{prefix}*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+_backend_lock = threading.Lock()
+_shared_backend: CacheBackend | None = None
+_shared_backend_resolved = False
+
+
+def _build_backend(url: str) -> CacheBackend:
+    if url.startswith("fakeredis://"):
+        try:
+            import fakeredis  # type: ignore
+        except ModuleNotFoundError as exc:  # pragma: no cover - dependencia opcional
+            raise RuntimeError("fakeredis no está instalado") from exc
+        return RedisCacheBackend(fakeredis.FakeRedis())
+    try:
+        import redis  # type: ignore
+    except ModuleNotFoundError as exc:  # pragma: no cover - dependencia opcional
+        raise RuntimeError(
+            "CACHE_BACKEND_URL requiere el paquete redis instalado"
+        ) from exc
+    return RedisCacheBackend(redis.Redis.from_url(url))
+
+
+def get_shared_backend() -> CacheBackend | None:
+    """Obtiene (y crea la primera vez) el backend compartido configurado."""
+
+    global _shared_backend, _shared_backend_resolved
+    if _shared_backend_resolved:
+        return _shared_backend
+    with _backend_lock:
+        if not _shared_backend_resolved:
+            url = (settings.cache_backend_url or "").strip()
+            _shared_backend = _build_backend(url) if url else None
+            _shared_backend_resolved = True
+    return _shared_backend
+
+
+def configure_shared_backend(backend: CacheBackend | None) -> None:
+    """Reemplaza el backend compartido (pruebas o arranque personalizado)."""
+
+    global _shared_backend, _shared_backend_resolved
+    with _backend_lock:
+        _shared_backend = backend
+        _shared_backend_resolved = True
+
+
+@dataclass
+class _Entry(Generic[T]):
+    expires_at: float
+    value: T
+    tags: frozenset[str]
+
+
+@dataclass
+class _Flight:
+    event: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    loaded: bool = False
+
+
+_CACHES: "weakref.WeakSet[TTLCache[Any]]" = weakref.WeakSet()
+
+
+class TTLCache(Generic[T]):
+    """Cache LRU con expiración por TTL, etiquetas y métricas Prometheus."""
 
-    def __init__(self, ttl_seconds: float) -> None:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        *,
+        name: str | None = None,
+        max_entries: int | None = None,
+        shared: bool = False,
+    ) -> None:
         if ttl_seconds <= 0:
             raise ValueError("ttl_seconds must be greater than 0")
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
         self._ttl = float(ttl_seconds)
-        self._lock = Lock()
-        self._values: Dict[Hashable, Tuple[float, T]] = {}
+        self._name = name or f"cache-{id(self):x}"
+        self._max_entries = max_entries or settings.cache_max_entries
+        self._shared = shared
+        self._lock = threading.Lock()
+        self._values: "OrderedDict[Hashable, _Entry[T]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self._inflight: Dict[Hashable, _Flight] = {}
+        _CACHES.add(self)
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._values)
+
+    # -- nivel compartido -------------------------------------------------
+    def _backend(self) -> CacheBackend | None:
+        if not self._shared:
+            return None
+        return get_shared_backend()
+
+    def _shared_key(self, key: Hashable) -> str:
+        return f"{_KEY_PREFIX}:{self._name}:{key!r}"
+
+    def _local_ttl(self, backend: CacheBackend | None) -> float:
+        if backend is None:
+            return self._ttl
+        # Con backend compartido el nivel local sólo amortigua lecturas: un TTL
+        # corto acota la ventana en que otro worker ve datos ya invalidados.
+        return min(self._ttl, float(settings.cache_local_ttl_seconds))
+
+    # -- operaciones locales (requieren self._lock) -----------------------
+    def _drop(self, key: Hashable) -> None:
+        entry = self._values.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    self._tags.pop(tag, None)
+
+    def _store(self, key: Hashable, value: T, ttl: float, tags: frozenset[str]) -> int:
+        self._drop(key)
+        self._values[key] = _Entry(monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        evicted = 0
+        while len(self._values) > self._max_entries:
+            oldest = next(iter(self._values))
+            self._drop(oldest)
+            evicted += 1
+        return evicted
+
+    # -- API pública ------------------------------------------------------
     def get(self, key: Hashable) -> Optional[T]:
         now = monotonic()
+        expired = False
         with self._lock:
-            record = self._values.get(key)
-            if record is None:
-                return None
-            expires_at, value = record
-            if expires_at <= now:
-                self._values.pop(key, None)
-                return None
+            entry = self._values.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._values.move_to_end(key)
+                    telemetry.record_cache_request(self._name, "hit")
+                    return entry.value
+                self._drop(key)
+                expired = True
+        if expired:
+            telemetry.record_cache_eviction(self._name, "expired")
+            telemetry.set_cache_entries(self._name, len(self))
+
+        backend = self._backend()
+        if backend is not None:
+            raw = None
+            try:
+                raw = backend.get(self._shared_key(key))
+            except Exception:  # pragma: no cover - el backend no debe tumbar la app
+                logger.exception("No se pudo leer la cache compartida", cache=self._name)
+            if raw is not None:
+                value, shared_tags = pickle.loads(raw)
+                with self._lock:
+                    evicted = self._store(
+                        key, value, self._local_ttl(backend), frozenset(shared_tags)
+                    )
+                self._after_store(evicted)
+                telemetry.record_cache_request(self._name, "shared_hit")
+                return value
+
+        telemetry.record_cache_request(self._name, "miss")
+        return None
+
+    def _after_store(self, evicted: int) -> None:
+        if evicted:
+            telemetry.record_cache_eviction(self._name, "lru", evicted)
+        telemetry.set_cache_entries(self._name, len(self))
+
+    def set(self, key: Hashable, value: T, *, tags: Iterable[str] = ()) -> None:
+        normalized_tags = frozenset(tags)
+        backend = self._backend()
+        with self._lock:
+            evicted = self._store(key, value, self._local_ttl(backend), normalized_tags)
+        self._after_store(evicted)
+        if backend is not None:
+            try:
+                backend.set(
+                    self._shared_key(key),
+                    pickle.dumps(
+                        (value, tuple(normalized_tags)),
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    ),
+                    self._ttl,
+                    [f"{self._name}:{tag}" for tag in normalized_tags],
+                )
+            except Exception:  # pragma: no cover - el backend no debe tumbar la app
+                logger.exception("No se pudo escribir la cache compartida", cache=self._name)
+
+    def get_or_set(
+        self,
+        key: Hashable,
+        loader: Callable[[], T],
+        *,
+        tags: Iterable[str] = (),
+    ) -> T:
+        """Devuelve el valor en cache o lo calcula una sola vez por clave.
+
+        Las peticiones concurrentes para la misma clave esperan el resultado
+        de la primera carga en lugar de repetir la consulta.
+        """
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+        if not leader:
+            flight.event.wait()
+            if flight.loaded:
+                telemetry.record_cache_request(self._name, "coalesced")
+                return flight.value
+            return loader()
+        try:
+            value = loader()
+            self.set(key, value, tags=tags)
+            flight.value = value
+            flight.loaded = True
             return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._drop(key)
+        backend = self._backend()
+        if backend is not None:
+            backend.delete(self._shared_key(key))
+        telemetry.set_cache_entries(self._name, len(self))
 
-    def set(self, key: Hashable, value: T) -> None:
-        expires_at = monotonic() + self._ttl
+    def invalidate_tags(self, *tags: str) -> int:
+        """Elimina sólo las entradas asociadas a alguna de las etiquetas."""
+
+        removed = 0
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self._tags.get(tag, ()))
+            for key in keys:
+                self._drop(key)
+            removed = len(keys)
+        backend = self._backend()
+        if backend is not None:
+            backend.invalidate_tags(f"{self._name}:{tag}" for tag in tags)
+        if removed:
+            telemetry.record_cache_eviction(self._name, "invalidated", removed)
+        telemetry.set_cache_entries(self._name, len(self))
+        return removed
+
+    def sweep(self) -> int:
+        """Elimina las entradas expiradas del nivel local."""
+
+        now = monotonic()
         with self._lock:
-            self._values[key] = (expires_at, value)
+            expired = [key for key, entry in self._values.items() if entry.expires_at <= now]
+            for key in expired:
+                self._drop(key)
+        if expired:
+            telemetry.record_cache_eviction(self._name, "expired", len(expired))
+            telemetry.set_cache_entries(self._name, len(self))
+        return len(expired)
 
     def clear(self) -> None:
         with self._lock:
+            removed = len(self._values)
             self._values.clear()
+            self._tags.clear()
+        backend = self._backend()
+        if backend is not None:
+            backend.clear(f"{_KEY_PREFIX}:{self._name}:")
+        if removed:
+            telemetry.record_cache_eviction(self._name, "invalidated", removed)
+        telemetry.set_cache_entries(self._name, 0)
+
+
+def sweep_all_caches() -> int:
+    """Purga las entradas expiradas de todas las caches registradas."""
+
+    return sum(cache.sweep() for cache in list(_CACHES))
+
+
+class _CacheSweeper(threading.Thread):
+    def __init__(self, interval_seconds: float) -> None:
+        super().__init__(name="cache-sweeper", daemon=True)
+        self._interval = interval_seconds
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                sweep_all_caches()
+            except Exception:  # pragma: no cover - el barrido no debe detener el hilo
+                logger.exception("Fallo al purgar caches expiradas")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+_sweeper: _CacheSweeper | None = None
+
+
+def start_cache_sweeper(interval_seconds: float) -> None:
+    """Inicia el barrido periódico de expirados en segundo plano."""
+
+    global _sweeper
+    if interval_seconds <= 0 or (_sweeper is not None and _sweeper.is_alive()):
+        return
+    _sweeper = _CacheSweeper(interval_seconds)
+    _sweeper.start()
+
+
+def stop_cache_sweeper() -> None:
+    global _sweeper
+    if _sweeper is not None:
+        _sweeper.stop()
+        _sweeper.join(timeout=5)
+        _sweeper = None
 
 
-__all__ = ["TTLCache"]
+__all__ = [
+    "CacheBackend",
+    "RedisCacheBackend",
+    "TTLCache",
+    "configure_shared_backend",
+    "get_shared_backend",
+    "start_cache_sweeper",
+    "stop_cache_sweeper",
+    "sweep_all_caches",
+]
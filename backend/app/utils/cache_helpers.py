@@ -1,10 +1,14 @@
 """Utilidades para gestión de caché del sistema."""
+from datetime import date, datetime
 from typing import Any
 
-def invalidate_inventory_movements_cache() -> None:
-    """Invalida la caché de movimientos de inventario."""
-    from ..crud_legacy import _INVENTORY_MOVEMENTS_CACHE
-    _INVENTORY_MOVEMENTS_CACHE.clear()
+def invalidate_inventory_movements_cache(
+    store_id: int | None = None,
+    moved_at: date | datetime | None = None,
+) -> None:
+    """Invalida la caché de movimientos de inventario (por sucursal y mes si se indican)."""
+    from ..crud.inventory import invalidate_inventory_movements_cache as _invalidate
+    _invalidate(store_id, moved_at)
 
 
 def inventory_movements_report_cache_key(
@@ -55,5 +59,5 @@ def persistent_alerts_cache_key(
 
 def invalidate_persistent_audit_alerts_cache() -> None:
     """Invalida la caché de alertas de auditoría persistentes."""
-    from ..crud_legacy import _PERSISTENT_ALERTS_CACHE
-    _PERSISTENT_ALERTS_CACHE.clear()
+    from ..crud.audit import invalidate_persistent_audit_alerts_cache as _invalidate
+    _invalidate()
@@ -0,0 +1,146 @@
+"""Paginación por cursor (keyset) sobre claves de orden estables.
+
+Un :class:`Keyset` describe el orden de un listado como una secuencia de
+:class:`SortKey` que termina en una clave única (normalmente el ``id``). El
+cursor codifica los valores de esas claves para el último elemento entregado
+y la página siguiente se filtra con ``(k1, k2, …) > (v1, v2, …)`` en lugar de
+usar ``OFFSET``, por lo que el costo no crece con la profundidad de la página
+y las altas concurrentes no desplazan resultados entre páginas.
+
+Las claves deben ser no nulas; el cursor es opaco para el cliente (JSON en
+base64 URL-safe) y cualquier alteración produce ``ValueError("invalid_cursor")``.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import ColumnElement, Select, and_, or_
+
+INVALID_CURSOR = "invalid_cursor"
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """Clave de orden del listado.
+
+    ``value`` extrae el valor de un elemento ya cargado; por omisión se usa el
+    atributo ORM con el mismo nombre que ``expression``.
+    """
+
+    expression: Any
+    descending: bool = False
+    value: Callable[[Any], Any] | None = None
+
+    def extract(self, item: Any) -> Any:
+        if self.value is not None:
+            return self.value(item)
+        return getattr(item, self.expression.key)
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Valor de cursor no soportado: {type(value).__name__}")
+
+
+def _load_value(raw: Any) -> Any:
+    if isinstance(raw, dict):
+        if len(raw) != 1:
+            raise ValueError(INVALID_CURSOR)
+        (kind, text), = raw.items()
+        if not isinstance(text, str):
+            raise ValueError(INVALID_CURSOR)
+        if kind == "dt":
+            return datetime.fromisoformat(text)
+        if kind == "d":
+            return date.fromisoformat(text)
+        if kind == "n":
+            return Decimal(text)
+        raise ValueError(INVALID_CURSOR)
+    if raw is None or isinstance(raw, (bool, int, float, str)):
+        return raw
+    raise ValueError(INVALID_CURSOR)
+
+
+class Keyset:
+    """Orden estable de un listado y su cursor asociado."""
+
+    def __init__(self, *keys: SortKey) -> None:
+        if not keys:
+            raise ValueError("Keyset requiere al menos una clave de orden")
+        self.keys = keys
+
+    def order_by(self) -> list[ColumnElement[Any]]:
+        return [
+            key.expression.desc() if key.descending else key.expression.asc()
+            for key in self.keys
+        ]
+
+    def encode(self, item: Any) -> str:
+        """Cursor que continúa el listado después de ``item``."""
+
+        values = [_dump_value(key.extract(item)) for key in self.keys]
+        raw = json.dumps(values, separators=(",", ":"), ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def decode(self, cursor: str) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.keys):
+                raise ValueError(INVALID_CURSOR)
+            decoded = [_load_value(value) for value in values]
+        except (binascii.Error, UnicodeError, InvalidOperation, ValueError) as exc:
+            raise ValueError(INVALID_CURSOR) from exc
+        if any(value is None for value in decoded):
+            raise ValueError(INVALID_CURSOR)
+        return decoded
+
+    def after(self, values: Sequence[Any]) -> ColumnElement[bool]:
+        """Condición de las filas que siguen a ``values`` en el orden del keyset.
+
+        Se expande como ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR …`` para que
+        funcione igual en SQLite y PostgreSQL con claves de sentido mixto, y
+        se acompaña de ``k1 >= v1`` para que el planificador recorra el índice
+        desde el cursor en lugar de filtrar desde el inicio.
+        """
+
+        branches = []
+        for position, key in enumerate(self.keys):
+            value = values[position]
+            step = key.expression < value if key.descending else key.expression > value
+            equals = [
+                previous.expression == values[index]
+                for index, previous in enumerate(self.keys[:position])
+            ]
+            branches.append(and_(*equals, step) if equals else step)
+        leading = self.keys[0]
+        bound = (
+            leading.expression <= values[0]
+            if leading.descending
+            else leading.expression >= values[0]
+        )
+        return and_(bound, or_(*branches))
+
+    def apply(self, statement: Select[Any], cursor: str | None) -> Select[Any]:
+        """Ordena ``statement`` por el keyset y lo filtra desde ``cursor``."""
+
+        statement = statement.order_by(*self.order_by())
+        if cursor:
+            statement = statement.where(self.after(self.decode(cursor)))
+        return statement
+
+
+__all__ = ["INVALID_CURSOR", "Keyset", "SortKey"]
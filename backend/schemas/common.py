@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from math import ceil
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, Literal, Sequence, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
@@ -20,6 +20,18 @@ class PageParams(BaseModel):
         le=200,
         description="Cantidad de registros por página",
     )
+    cursor: str | None = Field(
+        default=None,
+        max_length=512,
+        description=(
+            "Activa la paginación por cursor: vacío para la primera página o el "
+            "`next_cursor` de la respuesta anterior"
+        ),
+    )
+    count: Literal["exact", "estimate", "none"] = Field(
+        default="exact",
+        description="Total exacto, estimado desde estadísticas en cache u omitido",
+    )
 
     model_config = ConfigDict(extra="forbid")
 
@@ -28,26 +40,41 @@ class PageParams(BaseModel):
     def offset(self) -> int:
         return (self.page - 1) * self.size
 
+    @property
+    def keyset(self) -> bool:
+        """Indica si se pidió la paginación por cursor."""
+
+        return self.cursor is not None
+
 
 class Page(BaseModel, Generic[T]):
     """Respuesta paginada genérica."""
 
     items: list[T]
-    total: int = Field(..., ge=0)
+    total: int | None = Field(default=None, ge=0)
+    total_estimated: bool = False
     page: int = Field(..., ge=1)
     size: int = Field(..., ge=1)
+    cursor: str | None = None
+    next_cursor: str | None = None
 
     model_config = ConfigDict(extra="forbid")
 
     @computed_field
     @property
-    def pages(self) -> int:
+    def pages(self) -> int | None:
+        if self.total is None:
+            return None
         return ceil(self.total / self.size)
 
     @computed_field
     @property
     def has_next(self) -> bool:
-        return self.page < self.pages
+        if self.cursor is not None:
+            return self.next_cursor is not None
+        if self.total is None:
+            return len(self.items) >= self.size
+        return self.page < (self.pages or 0)
 
     @classmethod
     def from_items(
@@ -61,6 +88,29 @@ class Page(BaseModel, Generic[T]):
         effective_total = total if total is not None else len(items)
         return cls(items=list(items), total=effective_total, page=page, size=size)
 
+    @classmethod
+    def from_cursor(
+        cls,
+        items: Sequence[T],
+        *,
+        size: int,
+        cursor: str | None,
+        next_cursor: str | None,
+        total: int | None = None,
+        total_estimated: bool = False,
+    ) -> "Page[T]":
+        """Página obtenida por cursor; ``cursor`` es el recibido en la petición."""
+
+        return cls(
+            items=list(items),
+            total=total,
+            total_estimated=total_estimated,
+            page=1,
+            size=size,
+            cursor=cursor if cursor is not None else "",
+            next_cursor=next_cursor,
+        )
+
 
 class ErrorResponse(BaseModel):
     """Formato unificado para respuestas de error."""
@@ -0,0 +1,650 @@
+#!/usr/bin/env python3
+"""
+Generación de datos masivos para la suite de benchmarks de Softmobile.
+
+A diferencia de `performance_dataset.py`, que recorre la API para poblar unos
+cientos de registros, este módulo inserta directamente en la base de datos
+por lotes (`INSERT` de varias filas) y escala a perfiles de 1k, 100k y 1M
+dispositivos con sus ventas, movimientos, listas de precios y bitácoras de
+auditoría.
+
+Uso:
+  python backend/scripts/benchmark_dataset.py --profile 1k [--reset] [--seed 2025]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, replace
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# Defaults seguros para un entorno de benchmark independiente; deben
+# definirse antes de importar la configuración del backend.
+os.environ.setdefault("DATABASE_URL", "sqlite:///./benchmark.db")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "1")
+os.environ.setdefault("CORS_ORIGINS", "[\"http://localhost\"]")
+os.environ.setdefault("SOFTMOBILE_ENABLE_CATALOG_PRO", "1")
+os.environ.setdefault("SOFTMOBILE_ENABLE_TRANSFERS", "1")
+os.environ.setdefault("SOFTMOBILE_ENABLE_PURCHASES_SALES", "1")
+os.environ.setdefault("SOFTMOBILE_ENABLE_ANALYTICS_ADV", "1")
+os.environ.setdefault("SOFTMOBILE_ENABLE_HYBRID_PREP", "1")
+os.environ.setdefault("SOFTMOBILE_ENABLE_2FA", "0")
+os.environ.setdefault("SOFTMOBILE_ENABLE_SCHEDULER", "0")
+os.environ.setdefault("SOFTMOBILE_ENABLE_BACKUP_SCHEDULER", "0")
+os.environ.setdefault("ENABLE_BACKGROUND_SCHEDULER", "0")
+
+from sqlalchemy import func, insert, select, text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from backend.app import models  # type: ignore  # noqa: E402
+from backend.app.database import Base, SessionLocal, engine  # type: ignore  # noqa: E402
+from backend.app.db.movimientos_inventario_view import (  # type: ignore  # noqa: E402
+    create_movimientos_inventario_view,
+    drop_movimientos_inventario_view,
+)
+from backend.app.db.valor_inventario_view import (  # type: ignore  # noqa: E402
+    create_valor_inventario_view,
+    drop_valor_inventario_view,
+)
+from backend.app.services.catalog_search_index import (  # type: ignore  # noqa: E402
+    rebuild_device_search_index,
+)
+from backend.app.services.customer_search_index import (  # type: ignore  # noqa: E402
+    rebuild_customer_search_index,
+)
+from backend.app.services.inventory_movement_rollup import (  # type: ignore  # noqa: E402
+    rebuild_inventory_movement_daily,
+)
+
+CHUNK_SIZE = 5_000
+
+BRANDS = ("Samsung", "Apple", "Xiaomi", "Motorola", "Huawei", "Oppo", "Nokia", "Realme")
+_MODELS = ("Lite", "Pro", "Max", "Plus", "Ultra", "Mini", "Neo", "Edge")
+_COLORS = ("Negro", "Plata", "Azul", "Rojo", "Verde", "Dorado")
+_CATEGORIES = ("Smartphones", "Tablets", "Accesorios", "Wearables")
+_PAYMENT_METHODS = (
+    models.PaymentMethod.EFECTIVO,
+    models.PaymentMethod.TARJETA,
+    models.PaymentMethod.TRANSFERENCIA,
+    models.PaymentMethod.CREDITO,
+)
+_MOVEMENT_TYPES = (
+    models.MovementType.IN,
+    models.MovementType.OUT,
+    models.MovementType.OUT,
+    models.MovementType.ADJUST,
+)
+_AUDIT_ACTIONS = (
+    ("sale_registered", "sale"),
+    ("inventory_movement", "device"),
+    ("device_updated", "device"),
+    ("customer_updated", "customer"),
+    ("login_failed", "user"),
+    ("sync_conflict", "sync"),
+)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Volumen de cada entidad generada para un perfil de benchmark."""
+
+    name: str
+    stores: int
+    devices: int
+    customers: int
+    sales: int
+    movements: int
+    audit_logs: int
+    price_lists: int
+    price_list_items: int
+    days: int = 90
+
+
+PROFILES: dict[str, DatasetSpec] = {
+    "1k": DatasetSpec(
+        name="1k",
+        stores=5,
+        devices=1_000,
+        customers=200,
+        sales=2_000,
+        movements=5_000,
+        audit_logs=5_000,
+        price_lists=12,
+        price_list_items=3_000,
+    ),
+    "100k": DatasetSpec(
+        name="100k",
+        stores=20,
+        devices=100_000,
+        customers=10_000,
+        sales=200_000,
+        movements=500_000,
+        audit_logs=500_000,
+        price_lists=40,
+        price_list_items=60_000,
+    ),
+    "1m": DatasetSpec(
+        name="1m",
+        stores=50,
+        devices=1_000_000,
+        customers=100_000,
+        sales=2_000_000,
+        movements=5_000_000,
+        audit_logs=5_000_000,
+        price_lists=60,
+        price_list_items=300_000,
+    ),
+}
+
+
+@dataclass
+class DatasetSummary:
+    """Identificadores y conteos del conjunto generado."""
+
+    spec: DatasetSpec
+    store_ids: list[int]
+    device_id_range: tuple[int, int]
+    customer_id_range: tuple[int, int]
+    rows: dict[str, int]
+    duration_seconds: float
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "spec": asdict(self.spec),
+            "store_ids": self.store_ids,
+            "device_id_range": list(self.device_id_range),
+            "customer_id_range": list(self.customer_id_range),
+            "rows": self.rows,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+def _chunks(rows: Iterable[dict[str, Any]], size: int = CHUNK_SIZE) -> Iterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _next_id(db: Session, model: type[Any]) -> int:
+    current = db.scalar(select(func.max(model.id)))
+    return int(current or 0) + 1
+
+
+def _sync_sequence(db: Session, model: type[Any]) -> None:
+    """Alinea la secuencia de PostgreSQL tras insertar identificadores explícitos."""
+
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    table = model.__table__
+    column = next(iter(table.primary_key.columns)).name
+    db.execute(
+        text(
+            "SELECT setval(pg_get_serial_sequence(:table, :column), "
+            f"COALESCE((SELECT MAX({column}) FROM {table.name}), 1))"
+        ),
+        {"table": table.name, "column": column},
+    )
+
+
+def _bulk_insert(
+    db: Session,
+    model: type[Any],
+    rows: Iterable[dict[str, Any]],
+    *,
+    on_chunk: Callable[[int], None] | None = None,
+) -> int:
+    inserted = 0
+    for batch in _chunks(rows):
+        db.execute(insert(model), batch)
+        db.commit()
+        inserted += len(batch)
+        if on_chunk is not None:
+            on_chunk(inserted)
+    _sync_sequence(db, model)
+    db.commit()
+    return inserted
+
+
+def reset_schema(bind: Engine) -> None:
+    """Elimina y recrea todas las tablas (y vistas) del esquema."""
+
+    with bind.begin() as connection:
+        drop_movimientos_inventario_view(connection)
+        drop_valor_inventario_view(connection)
+    Base.metadata.drop_all(bind=bind)
+    Base.metadata.create_all(bind=bind)
+    with bind.begin() as connection:
+        create_valor_inventario_view(connection)
+        create_movimientos_inventario_view(connection)
+
+
+def _store_rows(spec: DatasetSpec, first_id: int) -> Iterator[dict[str, Any]]:
+    for index in range(spec.stores):
+        yield {
+            "id": first_id + index,
+            "name": f"Sucursal Benchmark {first_id + index:03d}",
+            "code": f"BM-{first_id + index:05d}",
+            "location": f"Zona {index % 7}",
+            "timezone": "America/Tegucigalpa",
+        }
+
+
+def _device_rows(
+    spec: DatasetSpec, rng: random.Random, first_id: int, store_ids: list[int], today: date
+) -> Iterator[dict[str, Any]]:
+    for index in range(spec.devices):
+        device_id = first_id + index
+        brand = BRANDS[index % len(BRANDS)]
+        model_name = f"{_MODELS[(index // len(BRANDS)) % len(_MODELS)]} {index % 40}"
+        cost = Decimal(rng.randint(1_500, 25_000))
+        yield {
+            "id": device_id,
+            "store_id": store_ids[index % len(store_ids)],
+            "sku": f"BM-{device_id:08d}",
+            "name": f"{brand} {model_name}",
+            "quantity": rng.randint(0, 60),
+            "unit_price": cost * Decimal("1.25"),
+            "costo_unitario": cost,
+            "margen_porcentaje": Decimal("25"),
+            "minimum_stock": 2,
+            "reorder_point": 5,
+            "imei": f"35{device_id:013d}" if index % 2 == 0 else None,
+            "serial": f"BMSN{device_id:010d}" if index % 3 == 0 else None,
+            "marca": brand,
+            "modelo": model_name,
+            "categoria": _CATEGORIES[index % len(_CATEGORIES)],
+            "color": _COLORS[index % len(_COLORS)],
+            "capacidad_gb": 64 * (1 + index % 4),
+            "estado_comercial": models.CommercialState.NUEVO,
+            "proveedor": f"Proveedor {index % 25:02d}",
+            "fecha_ingreso": today - timedelta(days=rng.randint(0, spec.days)),
+        }
+
+
+def _customer_rows(spec: DatasetSpec, first_id: int) -> Iterator[dict[str, Any]]:
+    for index in range(spec.customers):
+        customer_id = first_id + index
+        digits = f"{customer_id:014d}"
+        yield {
+            "id": customer_id,
+            "name": f"Cliente Benchmark {customer_id:07d}",
+            "contact_name": f"Contacto {customer_id:07d}",
+            "email": f"cliente{customer_id}@benchmark.local",
+            "phone": f"504-{customer_id:08d}",
+            "customer_type": "corporativo" if index % 5 == 0 else "minorista",
+            "tax_id": f"{digits[:4]}-{digits[4:8]}-{digits[8:]}",
+            "credit_limit": Decimal(5_000 if index % 5 == 0 else 0),
+        }
+
+
+def _sale_rows(
+    spec: DatasetSpec,
+    rng: random.Random,
+    first_sale_id: int,
+    first_item_id: int,
+    store_ids: list[int],
+    device_range: tuple[int, int],
+    customer_range: tuple[int, int],
+    now: datetime,
+) -> tuple[Iterator[dict[str, Any]], Iterator[dict[str, Any]]]:
+    """Genera ventas y sus líneas de forma determinista y en paralelo."""
+
+    items: list[dict[str, Any]] = []
+
+    def sales() -> Iterator[dict[str, Any]]:
+        item_id = first_item_id
+        first_device, last_device = device_range
+        for index in range(spec.sales):
+            sale_id = first_sale_id + index
+            store_position = index % len(store_ids)
+            created_at = now - timedelta(minutes=rng.randint(0, spec.days * 24 * 60))
+            subtotal = Decimal("0")
+            for _ in range(1 + index % 3):
+                # Dispositivo de la misma sucursal (los dispositivos se reparten en ronda).
+                offset = rng.randrange(0, last_device - first_device + 1)
+                offset += store_position - offset % len(store_ids)
+                if offset > last_device - first_device:
+                    offset -= len(store_ids)
+                device_id = first_device + max(offset, 0)
+                quantity = 1 + rng.randint(0, 2)
+                unit_price = Decimal(rng.randint(2_000, 30_000))
+                line_total = unit_price * quantity
+                subtotal += line_total
+                items.append(
+                    {
+                        "id": item_id,
+                        "sale_id": sale_id,
+                        "device_id": device_id,
+                        "quantity": quantity,
+                        "unit_price": unit_price,
+                        "total_line": line_total,
+                    }
+                )
+                item_id += 1
+            tax = (subtotal * Decimal("0.15")).quantize(Decimal("0.01"))
+            customer_id: int | None = None
+            if spec.customers and index % 3 == 0:
+                customer_id = rng.randint(*customer_range)
+            yield {
+                "id": sale_id,
+                "store_id": store_ids[store_position],
+                "customer_id": customer_id,
+                "payment_method": _PAYMENT_METHODS[index % len(_PAYMENT_METHODS)],
+                "subtotal_amount": subtotal,
+                "tax_amount": tax,
+                "total_amount": subtotal + tax,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def sale_items() -> Iterator[dict[str, Any]]:
+        while items:
+            yield items.pop()
+
+    return sales(), sale_items()
+
+
+def _movement_rows(
+    spec: DatasetSpec,
+    rng: random.Random,
+    first_id: int,
+    store_ids: list[int],
+    device_range: tuple[int, int],
+    now: datetime,
+) -> Iterator[dict[str, Any]]:
+    first_device, last_device = device_range
+    for index in range(spec.movements):
+        device_id = rng.randint(first_device, last_device)
+        created_at = now - timedelta(minutes=rng.randint(0, spec.days * 24 * 60))
+        yield {
+            "id": first_id + index,
+            # La sucursal del dispositivo sigue el mismo reparto en ronda.
+            "store_id": store_ids[(device_id - first_device) % len(store_ids)],
+            "device_id": device_id,
+            "movement_type": _MOVEMENT_TYPES[index % len(_MOVEMENT_TYPES)],
+            "quantity": 1 + rng.randint(0, 9),
+            "unit_cost": Decimal(rng.randint(1_500, 25_000)),
+            "comment": "Movimiento de benchmark",
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def _price_list_rows(
+    spec: DatasetSpec,
+    first_id: int,
+    store_ids: list[int],
+    customer_range: tuple[int, int],
+    now: datetime,
+) -> Iterator[dict[str, Any]]:
+    # Se alternan los cuatro alcances (global, sucursal, cliente y ambos) y
+    # sólo los primeros clientes tienen listas propias, como en producción.
+    first_customer, last_customer = customer_range
+    customers = list(range(first_customer, min(first_customer + 5, last_customer + 1)))
+    for index in range(spec.price_lists):
+        scope = index % 4
+        store_id = store_ids[index % len(store_ids)] if scope in (1, 3) else None
+        customer_id = (
+            customers[index % len(customers)] if scope in (2, 3) and spec.customers else None
+        )
+        starts_at = ends_at = None
+        if index % 5 == 3:
+            starts_at, ends_at = now - timedelta(days=7), now + timedelta(days=7)
+        elif index % 5 == 4:
+            ends_at = now - timedelta(days=1)
+        yield {
+            "id": first_id + index,
+            "name": f"Lista Benchmark {first_id + index:04d}",
+            "priority": (10, 50, 100)[index % 3],
+            "is_active": index % 7 != 6,
+            "store_id": store_id,
+            "customer_id": customer_id,
+            "currency": "MXN",
+            "starts_at": starts_at,
+            "ends_at": ends_at,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def _price_list_item_rows(
+    spec: DatasetSpec,
+    rng: random.Random,
+    first_id: int,
+    first_price_list: int,
+    device_range: tuple[int, int],
+) -> Iterator[dict[str, Any]]:
+    first_device, last_device = device_range
+    device_count = last_device - first_device + 1
+    per_list = min(device_count, spec.price_list_items // max(spec.price_lists, 1))
+    item_id = first_id
+    for index in range(spec.price_lists):
+        for device_id in rng.sample(range(first_device, last_device + 1), per_list):
+            yield {
+                "id": item_id,
+                "price_list_id": first_price_list + index,
+                "device_id": device_id,
+                "price": Decimal(rng.randint(2_000, 30_000)),
+                "currency": "MXN",
+                "discount_percentage": Decimal("5") if item_id % 4 == 0 else None,
+            }
+            item_id += 1
+
+
+def _audit_rows(
+    spec: DatasetSpec, rng: random.Random, first_id: int, now: datetime
+) -> Iterator[dict[str, Any]]:
+    for index in range(spec.audit_logs):
+        action, entity_type = _AUDIT_ACTIONS[index % len(_AUDIT_ACTIONS)]
+        yield {
+            "id": first_id + index,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": str(rng.randint(1, max(spec.devices, 1))),
+            "details": "Evento generado por la suite de benchmarks",
+            "created_at": now - timedelta(minutes=rng.randint(0, spec.days * 24 * 60)),
+        }
+
+
+def generate_dataset(
+    spec: DatasetSpec,
+    *,
+    seed: int = 2025,
+    reset: bool = False,
+    log: Callable[[str], None] | None = None,
+) -> DatasetSummary:
+    """Puebla la base configurada con el volumen indicado en `spec`."""
+
+    emit = log or (lambda message: None)
+    started = perf_counter()
+    if reset:
+        reset_schema(engine)
+    else:
+        Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    rows: dict[str, int] = {}
+
+    def progress(label: str) -> Callable[[int], None]:
+        return lambda count: emit(f"  {label}: {count} filas")
+
+    with SessionLocal() as db:
+        first_store = _next_id(db, models.Store)
+        rows["stores"] = _bulk_insert(db, models.Store, _store_rows(spec, first_store))
+        store_ids = list(range(first_store, first_store + spec.stores))
+
+        first_device = _next_id(db, models.Device)
+        rows["devices"] = _bulk_insert(
+            db,
+            models.Device,
+            _device_rows(spec, rng, first_device, store_ids, now.date()),
+            on_chunk=progress("devices"),
+        )
+        device_range = (first_device, first_device + max(spec.devices - 1, 0))
+        # Las inserciones por lotes no pasan por crud: se indexa al final.
+        rows["device_search_documents"] = rebuild_device_search_index(db)
+        db.commit()
+
+        first_customer = _next_id(db, models.Customer)
+        rows["customers"] = _bulk_insert(
+            db, models.Customer, _customer_rows(spec, first_customer), on_chunk=progress("customers")
+        )
+        customer_range = (first_customer, first_customer + max(spec.customers - 1, 0))
+        rows["customer_search_documents"] = rebuild_customer_search_index(db)
+        db.commit()
+
+        if spec.devices:
+            sales, sale_items = _sale_rows(
+                spec,
+                rng,
+                _next_id(db, models.Sale),
+                _next_id(db, models.SaleItem),
+                store_ids,
+                device_range,
+                customer_range,
+                now,
+            )
+            rows["sales"] = 0
+            rows["sale_items"] = 0
+            # Las líneas se escriben después de cada lote de ventas para
+            # respetar la llave foránea sin retener todo el volumen en memoria.
+            for batch in _chunks(sales):
+                db.execute(insert(models.Sale), batch)
+                rows["sales"] += len(batch)
+                rows["sale_items"] += _bulk_insert(db, models.SaleItem, sale_items)
+                emit(f"  sales: {rows['sales']} filas")
+            _sync_sequence(db, models.Sale)
+            db.commit()
+
+            rows["inventory_movements"] = _bulk_insert(
+                db,
+                models.InventoryMovement,
+                _movement_rows(
+                    spec, rng, _next_id(db, models.InventoryMovement), store_ids, device_range, now
+                ),
+                on_chunk=progress("inventory_movements"),
+            )
+            rows["inventory_movement_daily"] = rebuild_inventory_movement_daily(db)
+            db.commit()
+
+        if spec.devices and spec.price_lists:
+            first_price_list = _next_id(db, models.PriceList)
+            rows["price_lists"] = _bulk_insert(
+                db,
+                models.PriceList,
+                _price_list_rows(spec, first_price_list, store_ids, customer_range, now),
+            )
+            rows["price_list_items"] = _bulk_insert(
+                db,
+                models.PriceListItem,
+                _price_list_item_rows(
+                    spec,
+                    rng,
+                    _next_id(db, models.PriceListItem),
+                    first_price_list,
+                    device_range,
+                ),
+                on_chunk=progress("price_list_items"),
+            )
+
+        rows["audit_logs"] = _bulk_insert(
+            db,
+            models.AuditLog,
+            _audit_rows(spec, rng, _next_id(db, models.AuditLog), now),
+            on_chunk=progress("audit_logs"),
+        )
+
+    return DatasetSummary(
+        spec=spec,
+        store_ids=store_ids,
+        device_id_range=device_range,
+        customer_id_range=customer_range,
+        rows=rows,
+        duration_seconds=perf_counter() - started,
+    )
+
+
+def resolve_spec(profile: str, **overrides: int | None) -> DatasetSpec:
+    """Obtiene el perfil solicitado aplicando los conteos indicados explícitamente."""
+
+    try:
+        spec = PROFILES[profile]
+    except KeyError as exc:
+        raise ValueError(
+            f"Perfil desconocido: {profile}. Opciones: {', '.join(PROFILES)}"
+        ) from exc
+    changes = {key: value for key, value in overrides.items() if value is not None}
+    return replace(spec, **changes) if changes else spec
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="1k")
+    parser.add_argument("--seed", type=int, default=2025)
+    for field_name in (
+        "stores",
+        "devices",
+        "customers",
+        "sales",
+        "movements",
+        "audit-logs",
+        "price-lists",
+        "price-list-items",
+    ):
+        parser.add_argument(f"--{field_name}", type=int, default=None)
+
+
+def spec_from_args(args: argparse.Namespace) -> DatasetSpec:
+    return resolve_spec(
+        args.profile,
+        stores=args.stores,
+        devices=args.devices,
+        customers=args.customers,
+        sales=args.sales,
+        movements=args.movements,
+        audit_logs=args.audit_logs,
+        price_lists=args.price_lists,
+        price_list_items=args.price_list_items,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Genera un conjunto de datos masivo para los benchmarks."
+    )
+    add_dataset_arguments(parser)
+    parser.add_argument(
+        "--reset", action="store_true", help="Recrea el esquema antes de insertar."
+    )
+    args = parser.parse_args(argv)
+
+    spec = spec_from_args(args)
+    summary = generate_dataset(spec, seed=args.seed, reset=args.reset, log=print)
+    print(
+        f"Conjunto '{spec.name}' generado en {summary.duration_seconds:.1f} s: "
+        + ", ".join(f"{table}={count}" for table, count in summary.rows.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,590 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks repetible para las rutas críticas de Softmobile.
+
+Genera (o reutiliza) un conjunto de datos con `benchmark_dataset.py`, ejecuta
+un conjunto fijo de escenarios contra la aplicación en proceso y registra
+latencia p50/p95/p99, consultas SQL por petición y memoria residente máxima
+en un archivo JSON. Cada corrida se compara con una línea base almacenada
+para detectar regresiones antes de que lleguen a las sucursales.
+
+Uso:
+  python backend/scripts/benchmark_suite.py --profile 1k --reset
+  python backend/scripts/benchmark_suite.py --profile 1k --skip-dataset --scenarios pos_sale,catalog_search
+  python backend/scripts/benchmark_suite.py --profile 1k --reset --update-baseline
+  python backend/scripts/benchmark_suite.py --profile 100k --skip-dataset --scenarios pricing_legacy,pricing_compiled
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+RESULTS_DIR = PROJECT_ROOT / "tools" / "performance" / "results"
+BASELINES_DIR = PROJECT_ROOT / "tools" / "performance" / "baselines"
+
+# Los respaldos del escenario `backup` no deben mezclarse con los reales.
+os.environ.setdefault(
+    "BACKUP_DIR", str(Path(tempfile.gettempdir()) / "softmobile-benchmark-backups")
+)
+
+from benchmark_dataset import (  # noqa: E402  # configura el entorno antes del backend
+    BRANDS,
+    add_dataset_arguments,
+    generate_dataset,
+    spec_from_args,
+)
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, select  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+
+from backend.app import crud, models  # type: ignore  # noqa: E402
+from backend.app.database import SessionLocal  # type: ignore  # noqa: E402
+from backend.app.main import app  # type: ignore  # noqa: E402
+from backend.app.services import pricing  # type: ignore  # noqa: E402
+
+try:  # pragma: no cover - `resource` no existe en Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+ADMIN_USERNAME = "benchmark_admin"
+ADMIN_PASSWORD = "Benchmark123!"
+REASON_HEADER = {"X-Reason": "Benchmark de rendimiento"}
+
+# Iteraciones por defecto; los escenarios costosos usan menos.
+DEFAULT_ITERATIONS = 50
+SCENARIO_ITERATIONS = {"backup": 3, "global_report": 10}
+# Dispositivos por página en los escenarios de precios (una página de catálogo).
+PRICING_PAGE_SIZE = 50
+
+
+class BenchmarkError(RuntimeError):
+    """Error al preparar o ejecutar la suite de benchmarks."""
+
+
+@dataclass
+class ScenarioContext:
+    """Datos compartidos por los escenarios durante una corrida."""
+
+    client: TestClient
+    headers: dict[str, str]
+    store_ids: list[int]
+    sellable_devices: list[tuple[int, int]]
+    price_pages: list[tuple[int, list[int]]] = field(default_factory=list)
+    price_customers: list[int | None] = field(default_factory=lambda: [None])
+    counter: int = 0
+
+    def next_index(self) -> int:
+        self.counter += 1
+        return self.counter
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    iterations: int
+    errors: int
+    latencies_ms: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    peak_rss_mb: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "iterations": self.iterations,
+            "errors": self.errors,
+            "p50_ms": percentile(self.latencies_ms, 50),
+            "p95_ms": percentile(self.latencies_ms, 95),
+            "p99_ms": percentile(self.latencies_ms, 99),
+            "max_ms": round(max(self.latencies_ms), 3) if self.latencies_ms else None,
+            "queries_per_request": (
+                round(sum(self.queries) / len(self.queries), 2) if self.queries else None
+            ),
+            "peak_rss_mb": self.peak_rss_mb,
+        }
+
+
+def percentile(values: list[float], rank: float) -> float | None:
+    """Percentil por rango más cercano (sin interpolación)."""
+
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = max(math.ceil(rank / 100 * len(ordered)) - 1, 0)
+    return round(ordered[position], 3)
+
+
+def peak_rss_mb() -> float | None:
+    """Memoria residente máxima del proceso en MiB (`None` si no es medible)."""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KiB y macOS bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class QueryCounter:
+    """Cuenta las sentencias enviadas a cualquier motor de SQLAlchemy."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def _on_execute(self, *_: Any) -> None:
+        self.count += 1
+
+    @contextmanager
+    def listening(self) -> Iterator[None]:
+        event.listen(Engine, "before_cursor_execute", self._on_execute)
+        try:
+            yield
+        finally:
+            event.remove(Engine, "before_cursor_execute", self._on_execute)
+
+
+def _ok(response: Any) -> bool:
+    return 200 <= response.status_code < 300
+
+
+def _scenario_pos_sale(context: ScenarioContext) -> bool:
+    if not context.sellable_devices:
+        return False
+    device_id, store_id = context.sellable_devices[
+        context.next_index() % len(context.sellable_devices)
+    ]
+    response = context.client.post(
+        "/pos/sale",
+        json={
+            "store_id": store_id,
+            "items": [{"device_id": device_id, "quantity": 1}],
+            "payment_method": "EFECTIVO",
+            "confirm": True,
+        },
+        headers=context.headers,
+    )
+    return _ok(response)
+
+
+def _scenario_catalog_search(context: ScenarioContext) -> bool:
+    brand = BRANDS[context.next_index() % len(BRANDS)]
+    response = context.client.get(
+        "/inventory/devices/search",
+        params={"marca": brand, "limit": 50},
+        headers=context.headers,
+    )
+    return _ok(response)
+
+
+def _scenario_movements_report(context: ScenarioContext) -> bool:
+    # No existe una ruta pública para el reporte; se mide la función de crud
+    # que consumen las exportaciones.
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        crud.get_inventory_movements_report(
+            db,
+            store_ids=context.store_ids[:1],
+            date_from=now - timedelta(days=30),
+            date_to=now,
+            limit=50,
+        )
+    return True
+
+
+def _scenario_sync_cycle(context: ScenarioContext) -> bool:
+    store_id = context.store_ids[context.next_index() % len(context.store_ids)]
+    response = context.client.post(
+        "/sync/run", json={"store_id": store_id}, headers=context.headers
+    )
+    return _ok(response)
+
+
+def _scenario_backup(context: ScenarioContext) -> bool:
+    response = context.client.post(
+        "/backups/run",
+        json={"nota": "Respaldo de benchmark"},
+        headers=context.headers,
+    )
+    return _ok(response)
+
+
+def _scenario_global_report(context: ScenarioContext) -> bool:
+    response = context.client.get("/reports/global/overview", headers=context.headers)
+    return _ok(response)
+
+
+def _legacy_resolve_price(
+    db: Any, device_id: int, *, store_id: int, customer_id: int | None
+) -> tuple[models.PriceList, models.PriceListItem] | None:
+    """Resolución previa al índice compilado: dos consultas por dispositivo.
+
+    Se conserva aquí para poder repetir la comparación con la línea base.
+    """
+
+    price_lists = pricing.list_applicable_price_lists(
+        db, store_id=store_id, customer_id=customer_id, include_inactive=False
+    )
+    if not price_lists:
+        return None
+    items = {
+        item.price_list_id: item
+        for item in db.scalars(
+            select(models.PriceListItem)
+            .where(models.PriceListItem.price_list_id.in_([pl.id for pl in price_lists]))
+            .where(models.PriceListItem.device_id == device_id)
+        )
+    }
+    for price_list in sorted(
+        price_lists, key=lambda pl: (pricing._scope_rank(pl), pl.priority, pl.id)
+    ):
+        item = items.get(price_list.id)
+        if item is not None:
+            return price_list, item
+    return None
+
+
+def _price_target(context: ScenarioContext) -> tuple[int, int | None, list[int]]:
+    index = context.next_index()
+    store_id, device_ids = context.price_pages[index % len(context.price_pages)]
+    customer_id = context.price_customers[index % len(context.price_customers)]
+    return store_id, customer_id, device_ids
+
+
+def _scenario_pricing_legacy(context: ScenarioContext) -> bool:
+    if not context.price_pages:
+        return False
+    store_id, customer_id, device_ids = _price_target(context)
+    with SessionLocal() as db:
+        for device_id in device_ids:
+            _legacy_resolve_price(db, device_id, store_id=store_id, customer_id=customer_id)
+    return True
+
+
+def _scenario_pricing_batch(context: ScenarioContext) -> bool:
+    if not context.price_pages:
+        return False
+    store_id, customer_id, device_ids = _price_target(context)
+    with SessionLocal() as db:
+        devices = db.scalars(select(models.Device).where(models.Device.id.in_(device_ids)))
+        pricing.resolve_prices_for_devices(
+            db, devices, store_id=store_id, customer_id=customer_id
+        )
+    return True
+
+
+def _scenario_pricing_compiled(context: ScenarioContext) -> bool:
+    if not context.price_pages:
+        return False
+    store_id, customer_id, device_ids = _price_target(context)
+    with SessionLocal() as db:
+        pricing.resolve_compiled_prices(
+            db, device_ids, store_id=store_id, customer_id=customer_id
+        )
+    return True
+
+
+SCENARIOS: dict[str, Callable[[ScenarioContext], bool]] = {
+    "pos_sale": _scenario_pos_sale,
+    "catalog_search": _scenario_catalog_search,
+    "movements_report": _scenario_movements_report,
+    "sync_cycle": _scenario_sync_cycle,
+    "backup": _scenario_backup,
+    "global_report": _scenario_global_report,
+    "pricing_legacy": _scenario_pricing_legacy,
+    "pricing_batch": _scenario_pricing_batch,
+    "pricing_compiled": _scenario_pricing_compiled,
+}
+
+
+def run_scenario(
+    name: str,
+    context: ScenarioContext,
+    *,
+    iterations: int,
+    warmup: int = 1,
+) -> ScenarioResult:
+    """Ejecuta un escenario `iterations` veces tras `warmup` corridas no medidas."""
+
+    action = SCENARIOS[name]
+    for _ in range(warmup):
+        action(context)
+    result = ScenarioResult(name=name, iterations=iterations, errors=0)
+    counter = QueryCounter()
+    with counter.listening():
+        for _ in range(iterations):
+            counter.count = 0
+            started = perf_counter()
+            try:
+                succeeded = action(context)
+            except Exception:  # pragma: no cover - se reporta como error
+                succeeded = False
+            result.latencies_ms.append((perf_counter() - started) * 1000)
+            result.queries.append(counter.count)
+            if not succeeded:
+                result.errors += 1
+    result.peak_rss_mb = peak_rss_mb()
+    return result
+
+
+def compare_with_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    max_regression: float,
+    min_delta_ms: float = 1.0,
+) -> list[dict[str, Any]]:
+    """Lista las métricas que empeoraron más que la tolerancia permitida.
+
+    Se comparan el p95 (ignorando diferencias menores a `min_delta_ms`, que
+    suelen ser ruido) y las consultas por petición de cada escenario presente
+    en ambas corridas.
+    """
+
+    regressions: list[dict[str, Any]] = []
+    baseline_scenarios = baseline.get("scenarios", {})
+    for name, metrics in current.get("scenarios", {}).items():
+        reference = baseline_scenarios.get(name)
+        if not reference:
+            continue
+        for metric, floor in (("p95_ms", min_delta_ms), ("queries_per_request", 0.0)):
+            value = metrics.get(metric)
+            expected = reference.get(metric)
+            if value is None or expected is None:
+                continue
+            limit = expected * (1 + max_regression)
+            if value > limit and value - expected > floor:
+                regressions.append(
+                    {
+                        "scenario": name,
+                        "metric": metric,
+                        "baseline": expected,
+                        "current": value,
+                        "change_percent": (
+                            round((value - expected) / expected * 100, 1) if expected else None
+                        ),
+                    }
+                )
+    return regressions
+
+
+def _authenticate(client: TestClient) -> dict[str, str]:
+    # El bootstrap sólo procede sobre una base sin usuarios; en corridas con
+    # `--skip-dataset` el administrador ya existe y basta con iniciar sesión.
+    client.post(
+        "/auth/bootstrap",
+        json={
+            "username": ADMIN_USERNAME,
+            "password": ADMIN_PASSWORD,
+            "full_name": "Administrador Benchmark",
+            "roles": ["ADMIN"],
+        },
+    )
+    response = client.post(
+        "/auth/token",
+        data={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    if not _ok(response):
+        raise BenchmarkError(
+            f"No fue posible autenticar al usuario de benchmark: {response.text}"
+        )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _load_targets(limit: int) -> tuple[list[int], list[tuple[int, int]]]:
+    with SessionLocal() as db:
+        store_ids = list(db.scalars(select(models.Store.id).order_by(models.Store.id)))
+        sellable = [
+            (int(device_id), int(store_id))
+            for device_id, store_id in db.execute(
+                select(models.Device.id, models.Device.store_id)
+                .where(models.Device.quantity > 0, models.Device.is_deleted.is_(False))
+                .order_by(models.Device.id)
+                .limit(limit)
+            )
+        ]
+    if not store_ids:
+        raise BenchmarkError("La base no tiene sucursales; ejecute sin --skip-dataset.")
+    return store_ids, sellable
+
+
+def _load_price_targets() -> tuple[list[tuple[int, list[int]]], list[int | None]]:
+    """Una página de dispositivos por sucursal y los clientes con listas propias."""
+
+    with SessionLocal() as db:
+        pages: list[tuple[int, list[int]]] = []
+        for store_id in db.scalars(select(models.Store.id).order_by(models.Store.id)):
+            device_ids = list(
+                db.scalars(
+                    select(models.Device.id)
+                    .where(
+                        models.Device.store_id == store_id,
+                        models.Device.is_deleted.is_(False),
+                    )
+                    .order_by(models.Device.id)
+                    .limit(PRICING_PAGE_SIZE)
+                )
+            )
+            if device_ids:
+                pages.append((int(store_id), device_ids))
+        customers = db.scalars(
+            select(models.PriceList.customer_id)
+            .where(models.PriceList.customer_id.is_not(None))
+            .distinct()
+            .order_by(models.PriceList.customer_id)
+        )
+        return pages, [None, *(int(customer_id) for customer_id in customers)]
+
+
+def run_suite(
+    scenario_names: list[str],
+    *,
+    iterations: int | None = None,
+    warmup: int = 1,
+) -> dict[str, ScenarioResult]:
+    results: dict[str, ScenarioResult] = {}
+    # Los errores del servidor se contabilizan por escenario en lugar de abortar.
+    with TestClient(app, raise_server_exceptions=False) as client:
+        # Varias rutas de reportes también exigen `X-Reason`.
+        headers = {**_authenticate(client), **REASON_HEADER}
+        planned = iterations or DEFAULT_ITERATIONS
+        store_ids, sellable = _load_targets(planned + warmup)
+        price_pages, price_customers = _load_price_targets()
+        context = ScenarioContext(
+            client=client,
+            headers=headers,
+            store_ids=store_ids,
+            sellable_devices=sellable,
+            price_pages=price_pages,
+            price_customers=price_customers,
+        )
+        for name in scenario_names:
+            count = iterations or SCENARIO_ITERATIONS.get(name, DEFAULT_ITERATIONS)
+            results[name] = run_scenario(name, context, iterations=count, warmup=warmup)
+    return results
+
+
+def _parse_scenarios(raw: str | None) -> list[str]:
+    if not raw:
+        return list(SCENARIOS)
+    names = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(
+            f"Escenarios desconocidos: {', '.join(unknown)}. Opciones: {', '.join(SCENARIOS)}"
+        )
+    return names
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    print(f"{'escenario':<18}{'p50':>10}{'p95':>10}{'p99':>10}{'consultas':>11}{'errores':>9}")
+    for name, metrics in results["scenarios"].items():
+        print(
+            f"{name:<18}"
+            f"{metrics['p50_ms'] or 0:>10.1f}"
+            f"{metrics['p95_ms'] or 0:>10.1f}"
+            f"{metrics['p99_ms'] or 0:>10.1f}"
+            f"{metrics['queries_per_request'] or 0:>11.1f}"
+            f"{metrics['errors']:>9}"
+        )
+    print(f"RSS máximo: {results['peak_rss_mb']} MiB")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Ejecuta los escenarios de benchmark y los compara con la línea base."
+    )
+    add_dataset_arguments(parser)
+    parser.add_argument("--reset", action="store_true", help="Recrea el esquema antes de generar datos.")
+    parser.add_argument(
+        "--skip-dataset",
+        action="store_true",
+        help="Reutiliza los datos existentes en lugar de generarlos.",
+    )
+    parser.add_argument("--scenarios", default=None, help="Lista separada por comas.")
+    parser.add_argument("--iterations", type=int, default=None)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Tolerancia relativa antes de marcar una regresión (0.2 = 20 %%).",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Guarda esta corrida como nueva línea base del perfil.",
+    )
+    args = parser.parse_args(argv)
+
+    scenario_names = _parse_scenarios(args.scenarios)
+    spec = spec_from_args(args)
+    dataset: dict[str, Any] | None = None
+    if not args.skip_dataset:
+        summary = generate_dataset(spec, seed=args.seed, reset=args.reset, log=print)
+        dataset = summary.as_dict()
+
+    scenario_results = run_suite(
+        scenario_names, iterations=args.iterations, warmup=args.warmup
+    )
+    started_at = datetime.now(timezone.utc)
+    results: dict[str, Any] = {
+        "profile": spec.name,
+        "generated_at": started_at.isoformat(),
+        "database": os.environ.get("DATABASE_URL", "").split("://", 1)[0],
+        "python": sys.version.split()[0],
+        "dataset": dataset,
+        "peak_rss_mb": peak_rss_mb(),
+        "scenarios": {name: result.as_dict() for name, result in scenario_results.items()},
+    }
+
+    output = args.output or RESULTS_DIR / f"benchmark-{spec.name}-{started_at:%Y%m%dT%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    _print_results(results)
+    print(f"Resultados guardados en {output}")
+
+    baseline_path = args.baseline or BASELINES_DIR / f"{spec.name}.json"
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(
+            json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        print(f"Línea base actualizada en {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"Sin línea base en {baseline_path}; use --update-baseline para registrarla.")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    regressions = compare_with_baseline(
+        results, baseline, max_regression=args.max_regression
+    )
+    if regressions:
+        print("Regresiones respecto a la línea base:", file=sys.stderr)
+        for item in regressions:
+            print(
+                f"  {item['scenario']}.{item['metric']}: "
+                f"{item['baseline']} → {item['current']} ({item['change_percent']} %)",
+                file=sys.stderr,
+            )
+        return 1
+    print("Sin regresiones respecto a la línea base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Genera `backend/app/crud/_index.py`, el índice símbolo → módulo que usa el
+espacio de nombres perezoso `backend.app.crud`.
+
+El índice reproduce la precedencia de los antiguos `import *`: primero
+`crud_legacy` y después los módulos especializados, de modo que el último
+módulo que exporta un nombre es el que se resuelve.
+
+Uso:
+  python backend/scripts/generate_crud_index.py          # reescribe el índice
+  python backend/scripts/generate_crud_index.py --check  # falla si está desactualizado
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parents[1] / "app"
+CRUD_DIR = APP_DIR / "crud"
+INDEX_PATH = CRUD_DIR / "_index.py"
+
+# Orden de resolución: los módulos posteriores sobrescriben a los anteriores.
+SOURCES: tuple[str, ...] = (
+    "..crud_legacy",
+    ".users",
+    ".devices",
+    ".stores",
+    ".warehouses",
+    ".audit",
+    ".inventory",
+    ".customers",
+    ".suppliers",
+    ".sync",
+    ".sales",
+    ".purchases",
+    ".loyalty",
+    ".pos",
+    ".analytics",
+    ".transfers",
+    ".invoicing",
+)
+
+# Símbolos expuestos explícitamente por compatibilidad.
+EXTRA_SYMBOLS: dict[str, str] = {
+    "purge_system_logs": "..utils.system_log_helpers",
+}
+
+_DEF_RE = re.compile(r"^(?:async\s+)?(?:def|class)\s+([A-Za-z_]\w*)")
+_ASSIGN_RE = re.compile(r"^([A-Za-z_]\w*(?:\s*,\s*[A-Za-z_]\w*)*)\s*(?::[^=]*)?=(?!=)")
+_IMPORT_RE = re.compile(r"^import\s+(.+)$")
+_FROM_RE = re.compile(r"^from\s+(\S+)\s+import\s+(.+)$")
+
+
+def _module_path(relative: str) -> Path:
+    """Traduce un nombre relativo al paquete `crud` a su archivo fuente."""
+
+    if relative.startswith(".."):
+        return APP_DIR.joinpath(*relative[2:].split(".")).with_suffix(".py")
+    return CRUD_DIR.joinpath(*relative[1:].split(".")).with_suffix(".py")
+
+
+def _declared_all(source: str) -> list[str] | None:
+    """Devuelve el `__all__` literal del módulo, si existe y es analizable."""
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets
+        ):
+            return [str(item) for item in ast.literal_eval(node.value)]
+    return None
+
+
+def _imported_names(clause: str) -> list[str]:
+    names: list[str] = []
+    for part in clause.replace("(", "").replace(")", "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        tokens = part.split()
+        names.append(tokens[-1] if len(tokens) == 3 and tokens[1] == "as" else tokens[0])
+    return names
+
+
+def _public_bindings(source: str) -> list[str]:
+    """Nombres públicos ligados en el nivel superior, como los vería `import *`.
+
+    Se analiza por líneas (sin `ast`) para tolerar módulos heredados muy
+    extensos y sólo se consideran sentencias en la columna cero.
+    """
+
+    names: list[str] = []
+    lines = source.splitlines()
+    index = 0
+    in_string = False
+    while index < len(lines):
+        line = lines[index]
+        index += 1
+        starts_in_string = in_string
+        if (line.count('"""') + line.count("'''")) % 2:
+            in_string = not in_string
+        if starts_in_string or not line or line[0] in " \t#@)\"'":
+            continue
+        match = _FROM_RE.match(line.split("#", 1)[0].rstrip())
+        if match:
+            module, clause = match.groups()
+            if clause.startswith("(") and ")" not in clause:
+                while index < len(lines) and ")" not in lines[index]:
+                    clause += " " + lines[index].split("#", 1)[0]
+                    index += 1
+                if index < len(lines):
+                    clause += " " + lines[index].split("#", 1)[0]
+                    index += 1
+            if module != "__future__" and clause.strip() != "*":
+                names.extend(_imported_names(clause))
+            continue
+        match = _IMPORT_RE.match(line.split("#", 1)[0].rstrip())
+        if match:
+            for part in match.group(1).split(","):
+                tokens = part.split()
+                if len(tokens) == 3 and tokens[1] == "as":
+                    names.append(tokens[2])
+                elif tokens:
+                    names.append(tokens[0].split(".")[0])
+            continue
+        match = _DEF_RE.match(line) or _ASSIGN_RE.match(line)
+        if match:
+            names.extend(name.strip() for name in match.group(1).split(","))
+    return [name for name in names if not name.startswith("_")]
+
+
+def module_exports(relative: str) -> list[str]:
+    """Lista los nombres que `from <módulo> import *` expondría."""
+
+    source = _module_path(relative).read_text(encoding="utf-8")
+    declared = _declared_all(source)
+    if declared is not None:
+        return declared
+    return _public_bindings(source)
+
+
+def build_index() -> dict[str, str]:
+    symbols: dict[str, str] = {}
+    for relative in SOURCES:
+        for name in module_exports(relative):
+            symbols[name] = relative
+    symbols.update(EXTRA_SYMBOLS)
+    return dict(sorted(symbols.items()))
+
+
+def list_submodules() -> list[str]:
+    return sorted(
+        path.stem
+        for path in CRUD_DIR.glob("*.py")
+        if not path.stem.startswith("_")
+    )
+
+
+def render_index(symbols: dict[str, str], submodules: list[str]) -> str:
+    lines = [
+        '"""Índice símbolo → módulo del espacio de nombres `crud`.',
+        "",
+        "Archivo generado por `backend/scripts/generate_crud_index.py`; no editar a mano.",
+        '"""',
+        "",
+        "SYMBOLS: dict[str, str] = {",
+    ]
+    lines.extend(f'    "{name}": "{module}",' for name, module in symbols.items())
+    lines.append("}")
+    lines.append("")
+    lines.append("SUBMODULES: frozenset[str] = frozenset(")
+    lines.append("    {")
+    lines.extend(f'        "{name}",' for name in submodules)
+    lines.append("    }")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Genera el índice perezoso de backend.app.crud."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="No escribe; termina con código 1 si el índice está desactualizado.",
+    )
+    args = parser.parse_args(argv)
+
+    symbols = build_index()
+    rendered = render_index(symbols, list_submodules())
+    current = INDEX_PATH.read_text(encoding="utf-8") if INDEX_PATH.exists() else ""
+    if args.check:
+        if current != rendered:
+            print(
+                "backend/app/crud/_index.py está desactualizado; "
+                "ejecute backend/scripts/generate_crud_index.py",
+                file=sys.stderr,
+            )
+            return 1
+        print("Índice de crud al día.")
+        return 0
+    if current != rendered:
+        INDEX_PATH.write_text(rendered, encoding="utf-8")
+    print(f"Índice de crud generado: {len(symbols)} símbolos.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
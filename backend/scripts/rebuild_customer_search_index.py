@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Reconstrucción del índice de búsqueda de clientes (customer_search_documents,
+customer_tags y su tabla FTS5/índice pg_trgm) a partir de clientes.
+
+Uso:
+  PYTHONPATH=/workspaces/inventario /workspaces/inventario/.venv/bin/python backend/scripts/rebuild_customer_search_index.py
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.app.database import SessionLocal  # type: ignore  # noqa: E402
+from backend.app.services.customer_search_index import (  # type: ignore  # noqa: E402
+    rebuild_customer_search_index,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Reconstruye el índice de búsqueda de clientes."
+    )
+    parser.parse_args(argv)
+
+    with SessionLocal() as session:
+        rows = rebuild_customer_search_index(session)
+        session.commit()
+    print(f"Índice de búsqueda de clientes reconstruido: {rows} documentos.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Reconstrucción del índice de búsqueda del catálogo (device_search_documents
+y sus tablas FTS5/índices pg_trgm) a partir de devices, completa o para una
+sucursal.
+
+Uso:
+  PYTHONPATH=/workspaces/inventario /workspaces/inventario/.venv/bin/python backend/scripts/rebuild_device_search_index.py [--store-id 3]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.app.database import SessionLocal  # type: ignore  # noqa: E402
+from backend.app.services.catalog_search_index import (  # type: ignore  # noqa: E402
+    rebuild_device_search_index,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Reconstruye el índice de búsqueda del catálogo de dispositivos."
+    )
+    parser.add_argument("--store-id", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as session:
+        rows = rebuild_device_search_index(session, store_id=args.store_id)
+        session.commit()
+    scope = f"sucursal {args.store_id}" if args.store_id is not None else "completo"
+    print(f"Índice de búsqueda del catálogo reconstruido ({scope}): {rows} documentos.")
+
+
+if __name__ == "__main__":
+    main()
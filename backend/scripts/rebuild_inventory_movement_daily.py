@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Reconstrucción del acumulado diario de movimientos (inventory_movement_daily)
+a partir de inventory_movements, completa o para un rango de días.
+
+Uso:
+  PYTHONPATH=/workspaces/inventario /workspaces/inventario/.venv/bin/python backend/scripts/rebuild_inventory_movement_daily.py [--from 2026-01-01] [--to 2026-01-31]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.app.database import SessionLocal  # type: ignore  # noqa: E402
+from backend.app.services.inventory_movement_rollup import (  # type: ignore  # noqa: E402
+    rebuild_inventory_movement_daily,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Reconstruye el acumulado diario de movimientos de inventario."
+    )
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, default=None)
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as session:
+        rows = rebuild_inventory_movement_daily(
+            session, date_from=args.date_from, date_to=args.date_to
+        )
+        session.commit()
+    scope = "completo"
+    if args.date_from or args.date_to:
+        scope = f"{args.date_from or '...'} → {args.date_to or '...'}"
+    print(f"Acumulado diario reconstruido ({scope}): {rows} filas.")
+
+
+if __name__ == "__main__":
+    main()
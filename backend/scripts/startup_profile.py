@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Reporte de tiempo de arranque: importa el módulo indicado en un intérprete
+nuevo con `-X importtime` y resume el costo de importación por módulo y por
+paquete raíz.
+
+Uso:
+  python backend/scripts/startup_profile.py [--module backend.app.main] [--top 25] [--json]
+  python backend/scripts/startup_profile.py --budget-ms 1500  # falla si se excede
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Convierte la salida de `-X importtime` en una lista de tiempos.
+
+    Las importaciones del arranque del intérprete (`site` y sus dependencias)
+    se descartan para que el reporte sólo refleje el módulo solicitado.
+    """
+
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_ms=int(self_us) / 1000,
+                cumulative_ms=int(cumulative_us) / 1000,
+                depth=max(len(indent) - 1, 0) // 2,
+            )
+        )
+    for position in range(len(timings) - 1, -1, -1):
+        if timings[position].module == "site" and timings[position].depth == 0:
+            return timings[position + 1 :]
+    return timings
+
+
+def summarize_by_package(timings: list[ImportTiming]) -> dict[str, float]:
+    """Suma el tiempo propio de importación agrupado por paquete raíz.
+
+    Los módulos de `backend.app` se agrupan por su subpaquete
+    (`backend.app.routers`, `backend.app.services`, ...).
+    """
+
+    totals: dict[str, float] = {}
+    for timing in timings:
+        parts = timing.module.split(".")
+        key = ".".join(parts[:3]) if parts[:2] == ["backend", "app"] else parts[0]
+        totals[key] = totals.get(key, 0.0) + timing.self_ms
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def profile_imports(module: str) -> list[ImportTiming]:
+    env = os.environ.copy()
+    # Defaults seguros para importar la aplicación sin un .env completo.
+    env.setdefault("DATABASE_URL", "sqlite:///./startup_profile.db")
+    env.setdefault("JWT_SECRET_KEY", "dummy_startup_profile_secret")
+    env.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+    env.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "1")
+    env.setdefault("CORS_ORIGINS", "[\"http://localhost\"]")
+    env.setdefault("ENABLE_BACKGROUND_SCHEDULER", "0")
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")])
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+        check=False,
+    )
+    timings = parse_importtime(proc.stderr)
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"No fue posible importar {module}:\n" + "\n".join(errors[-20:]))
+    return timings
+
+
+def build_report(module: str, timings: list[ImportTiming], top: int) -> dict[str, object]:
+    total_ms = sum(timing.cumulative_ms for timing in timings if timing.depth == 0)
+    by_cumulative = sorted(
+        (timing for timing in timings if timing.depth > 0),
+        key=lambda timing: timing.cumulative_ms,
+        reverse=True,
+    )
+    by_self = sorted(timings, key=lambda timing: timing.self_ms, reverse=True)
+    return {
+        "module": module,
+        "total_ms": round(total_ms, 3),
+        "modules_imported": len(timings),
+        "packages": {
+            name: round(value, 3)
+            for name, value in list(summarize_by_package(timings).items())[:top]
+        },
+        "top_cumulative": [asdict(timing) for timing in by_cumulative[:top]],
+        "top_self": [asdict(timing) for timing in by_self[:top]],
+    }
+
+
+def _print_report(report: dict[str, object]) -> None:
+    print(
+        f"Arranque de {report['module']}: {report['total_ms']:.1f} ms "
+        f"({report['modules_imported']} módulos)"
+    )
+    print("\nPor paquete (tiempo propio):")
+    for name, value in report["packages"].items():  # type: ignore[union-attr]
+        print(f"  {value:10.1f} ms  {name}")
+    print("\nMódulos con mayor tiempo acumulado:")
+    for entry in report["top_cumulative"]:  # type: ignore[union-attr]
+        print(f"  {entry['cumulative_ms']:10.1f} ms  {entry['module']}")
+    print("\nMódulos con mayor tiempo propio:")
+    for entry in report["top_self"]:  # type: ignore[union-attr]
+        print(f"  {entry['self_ms']:10.1f} ms  {entry['module']}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Desglosa el tiempo de importación del backend por módulo."
+    )
+    parser.add_argument("--module", default="backend.app.main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", dest="as_json", action="store_true")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Termina con código 1 si el arranque supera este tiempo.",
+    )
+    args = parser.parse_args(argv)
+
+    timings = profile_imports(args.module)
+    report = build_report(args.module, timings, args.top)
+    if args.as_json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        _print_report(report)
+    if args.budget_ms is not None and float(report["total_ms"]) > args.budget_ms:  # type: ignore[arg-type]
+        print(
+            f"El arranque ({report['total_ms']} ms) supera el presupuesto de {args.budget_ms} ms.",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from collections.abc import Iterator
+from pathlib import Path
 from urllib.parse import urlsplit
 import tempfile
 
@@ -16,6 +17,8 @@ os.environ.setdefault("CORS_ORIGINS", "[\"http://testserver\"]")
 # // [PACK28-tests]
 os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
 os.environ.setdefault("SOFTMOBILE_BOOTSTRAP_TOKEN", "test-bootstrap-token")
+# Los PDF/XLSX se generan en el proceso de pruebas salvo que una prueba cree su pool.
+os.environ.setdefault("RENDER_WORKERS", "0")
 
 # Ahora sí importar desde el backend después de configurar el entorno
 from backend.app.main import create_app
@@ -29,6 +32,11 @@ from backend.app.db.movimientos_inventario_view import (
 )
 from backend.app.database import Base, create_engine_from_url, get_db, engine as app_engine
 from backend.app.config import settings
+from backend.app.core.principal_cache import principal_cache, session_activity
+from backend.app.crud.audit import (
+    invalidate_audit_username_cache,
+    invalidate_persistent_audit_alerts_cache,
+)
 from sqlalchemy.orm import Session, sessionmaker
 from fastapi.testclient import TestClient
 import pytest
@@ -85,6 +93,9 @@ def db_session(db_engine) -> Iterator[Session]:
         create_movimientos_inventario_view(connection)
 
     _reset_database_schema()
+    # Los ids se reutilizan entre pruebas al reconstruir el esquema.
+    invalidate_audit_username_cache()
+    invalidate_persistent_audit_alerts_cache()
 
     session_factory = sessionmaker(
         bind=connection,
@@ -126,11 +137,16 @@ def app(app_schema) -> Iterator:
     original_scheduler = settings.enable_background_scheduler
     original_backup_scheduler = settings.enable_backup_scheduler
     original_backup_dir = settings.backup_directory
+    original_receipt_cache_dir = settings.pos_receipt_cache_directory
+    original_job_workers = settings.job_workers
     backup_tmp_dir = tempfile.TemporaryDirectory()
 
     settings.enable_background_scheduler = False
     settings.enable_backup_scheduler = False
     settings.backup_directory = backup_tmp_dir.name
+    settings.pos_receipt_cache_directory = str(Path(backup_tmp_dir.name) / "pos_receipts")
+    # Los trabajos se ejecutan explícitamente en las pruebas, sin hilos.
+    settings.job_workers = 0
 
     application = create_app()
 
@@ -140,6 +156,8 @@ def app(app_schema) -> Iterator:
     settings.enable_background_scheduler = original_scheduler
     settings.enable_backup_scheduler = original_backup_scheduler
     settings.backup_directory = original_backup_dir
+    settings.pos_receipt_cache_directory = original_receipt_cache_dir
+    settings.job_workers = original_job_workers
     backup_tmp_dir.cleanup()
 
 
@@ -196,6 +214,8 @@ def client(app, db_session: Session) -> Iterator[TestClient]:
             db_session.expunge_all()
 
     _with_override(app, override_get_db)
+    principal_cache.clear()
+    session_activity.drain()
 
     with TestClient(app) as test_client:
         if settings.bootstrap_token:
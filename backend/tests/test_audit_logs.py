@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from fastapi import status
 
 from backend.app.core.roles import ADMIN
-from backend.app import models
+from backend.app import crud, models, telemetry
 
 
 def _bootstrap_admin(client):
@@ -136,3 +136,105 @@ def test_audit_acknowledgement_flow(client, db_session):
     )
     assert pdf_response.status_code == status.HTTP_200_OK
     assert pdf_response.headers["content-type"].startswith("application/pdf")
+
+
+def test_audit_severity_is_stored_at_write_time(db_session):
+    db_session.add_all(
+        [
+            models.AuditLog(action="login", entity_type="user", entity_id="1"),
+            models.AuditLog(
+                action="sync_session",
+                entity_type="sync_session",
+                entity_id="2",
+                details="Reintento programado",
+            ),
+            models.AuditLog(
+                action="inventory_adjusted",
+                entity_type="device",
+                entity_id="3",
+                details="STOCK BAJO en sucursal",
+            ),
+        ]
+    )
+    db_session.commit()
+    logged = crud.log_audit_event(
+        db_session,
+        action="login_failed",
+        entity_type="user",
+        entity_id=4,
+        performed_by_id=None,
+        details={"description": "Contraseña inválida"},
+    )
+    db_session.commit()
+    assert logged.severity == "critical"
+
+    by_severity = {
+        severity: sorted(
+            log.entity_id
+            for log in crud.list_audit_logs(db_session, severity=severity)
+        )
+        for severity in ("info", "warning", "critical")
+    }
+    assert by_severity == {"info": ["1"], "warning": ["2"], "critical": ["3", "4"]}
+    assert crud.count_audit_logs(db_session, severity="critical") == 2
+    assert crud.count_audit_logs(db_session, severity="warning", entity_type="device") == 0
+
+
+def _reminder_events(event: str) -> float:
+    return telemetry.get_metric_value(
+        "softmobile_audit_reminder_cache_events_total", {"event": event}
+    ) or 0.0
+
+
+def test_persistent_alerts_tracker_reads_only_new_events(db_session):
+    now = datetime.utcnow()
+    db_session.add_all(
+        [
+            models.AuditLog(
+                action="sync_fail", entity_type="sync_session", entity_id="s-1",
+                created_at=now - timedelta(minutes=5),
+            ),
+            models.AuditLog(
+                action="sync_fail", entity_type="sync_session", entity_id="s-1",
+                details="Reintento fallido", created_at=now - timedelta(minutes=2),
+            ),
+            # Fuera de la ventana de 48 h.
+            models.AuditLog(
+                action="login_failed", entity_type="user", entity_id="u-1",
+                created_at=now - timedelta(hours=60),
+            ),
+            models.AuditLog(action="login", entity_type="user", entity_id="u-2"),
+        ]
+    )
+    db_session.commit()
+    hits, misses = _reminder_events("hit"), _reminder_events("miss")
+
+    first = crud.get_persistent_audit_alerts(db_session, threshold_minutes=30)
+    assert [(alert["entity_id"], alert["occurrences"]) for alert in first] == [("s-1", 2)]
+    assert first[0]["latest_details"] == "Reintento fallido"
+    assert first[0]["status"] == "pending"
+    assert _reminder_events("miss") == misses + 1
+
+    crud.log_audit_event(
+        db_session,
+        action="intrusion_detected",
+        entity_type="store",
+        entity_id="7",
+        performed_by_id=None,
+    )
+    db_session.commit()
+    crud.acknowledge_audit_alert(
+        db_session, entity_type="sync_session", entity_id="s-1", acknowledged_by_id=None
+    )
+    db_session.commit()
+
+    second = crud.get_persistent_audit_alerts(db_session, threshold_minutes=30)
+    assert [alert["entity_id"] for alert in second] == ["7", "s-1"]
+    assert [alert["status"] for alert in second] == ["pending", "acknowledged"]
+    assert _reminder_events("hit") == hits + 1
+    assert _reminder_events("miss") == misses + 1
+
+    # Una ventana mayor a la conservada vuelve a recorrer la bitácora.
+    wider = crud.get_persistent_audit_alerts(db_session, threshold_minutes=0, lookback_hours=72)
+    assert {alert["entity_id"] for alert in wider} == {"7", "s-1", "u-1"}
+    assert _reminder_events("miss") == misses + 2
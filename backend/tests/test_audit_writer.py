@@ -0,0 +1,135 @@
+"""Pruebas del escritor asíncrono y en lote de auditoría."""
+from __future__ import annotations
+
+import json
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import models
+from backend.app.crud import audit as audit_crud
+from backend.app.services import audit_writer
+
+
+def _entry(action: str, user_id: int | None, entity_id: int) -> dict[str, object]:
+    entry = audit_crud.prepare_audit_entry(
+        action=action,
+        entity_type="inventory",
+        entity_id=entity_id,
+        performed_by_id=user_id,
+        details={"description": f"Búsqueda {entity_id}", "results": entity_id},
+    )
+    entry["created_at"] = "2026-10-16T12:00:00+00:00"
+    return entry
+
+
+def _writer(db_session, tmp_path, **options) -> audit_writer.AuditWriter:
+    return audit_writer.AuditWriter(
+        sessionmaker(bind=db_session.get_bind()),
+        spill_path=tmp_path / "audit_spill.jsonl",
+        **options,
+    )
+
+
+def test_writer_batches_audit_and_system_logs(db_session, tmp_path):
+    user = models.User(username="auditor_lote", password_hash="x", rol="ADMIN", estado="ACTIVO")
+    db_session.add(user)
+    db_session.commit()
+
+    writer = _writer(db_session, tmp_path, batch_size=2, flush_interval_seconds=0.05)
+    writer.start()
+    try:
+        for index in range(5):
+            assert writer.submit(_entry("inventory_catalog_search", user.id, index))
+        assert writer.flush(timeout=5)
+    finally:
+        writer.stop()
+
+    logs = list(db_session.scalars(select(models.AuditLog).order_by(models.AuditLog.id)))
+    assert [log.entity_id for log in logs] == ["0", "1", "2", "3", "4"]
+    assert json.loads(logs[2].details)["results"] == 2
+    system_logs = list(db_session.scalars(select(models.SystemLog)))
+    assert {entry.audit_log_id for entry in system_logs} == {log.id for log in logs}
+    assert {entry.usuario for entry in system_logs} == {"auditor_lote"}
+    assert {entry.modulo for entry in system_logs} == {"inventario"}
+    assert {entry.descripcion for entry in system_logs} >= {"Búsqueda 3"}
+    # Todo quedó confirmado: el diario se trunca y no hay desplazamiento pendiente.
+    assert writer.spill_path.stat().st_size == 0
+    assert not writer.spill_path.with_name("audit_spill.jsonl.offset").exists()
+
+
+def test_writer_replays_unconfirmed_journal_lines(db_session, tmp_path):
+    spill = tmp_path / "audit_spill.jsonl"
+    lines = [
+        json.dumps(_entry("inventory_catalog_search", None, index)).encode("utf-8") + b"\n"
+        for index in range(3)
+    ]
+    # La primera línea ya se confirmó; la última quedó a medio escribir.
+    spill.write_bytes(b"".join(lines) + b'{"action": "inc')
+    spill.with_name("audit_spill.jsonl.offset").write_text(str(len(lines[0])))
+
+    writer = _writer(db_session, tmp_path)
+    try:
+        assert writer.recover() == 2
+    finally:
+        writer.stop()
+
+    entity_ids = db_session.scalars(select(models.AuditLog.entity_id).order_by(models.AuditLog.id))
+    assert list(entity_ids) == ["1", "2"]
+    assert spill.stat().st_size == 0
+
+
+def test_submit_falls_back_to_synchronous_logging(db_session, tmp_path):
+    assert audit_writer.get_audit_writer() is None
+    assert not audit_writer.submit_audit_event(
+        db_session,
+        action="inventory_catalog_search",
+        entity_type="inventory",
+        entity_id="catalog_search:anon",
+        performed_by_id=None,
+        details={"results": 0},
+    )
+    log = db_session.scalars(select(models.AuditLog)).one()
+    assert log.system_log is not None and log.system_log.usuario is None
+
+    writer = _writer(db_session, tmp_path, max_queue_size=1)
+    try:
+        assert writer.submit(_entry("inventory_catalog_search", None, 1))
+        # Con la cola llena el evento no se acepta ni queda en el diario.
+        size = writer.spill_path.stat().st_size
+        assert not writer.submit(_entry("inventory_catalog_search", None, 2))
+        assert writer.spill_path.stat().st_size == size
+    finally:
+        writer.stop()
+
+
+def test_each_process_keeps_its_journal_and_replays_orphans(db_session, tmp_path):
+    base = tmp_path / "audit_spill.jsonl"
+    assert audit_writer.process_spill_path(base, pid=41) == tmp_path / "audit_spill.41.jsonl"
+
+    def _lines(*entity_ids: int) -> bytes:
+        return b"".join(
+            json.dumps(_entry("inventory_catalog_search", None, index)).encode("utf-8") + b"\n"
+            for index in entity_ids
+        )
+
+    # Diario de un worker terminado y diario compartido de versiones anteriores.
+    orphan = audit_writer.process_spill_path(base, pid=42)
+    orphan.write_bytes(_lines(1, 2))
+    base.write_bytes(_lines(3))
+    factory = sessionmaker(bind=db_session.get_bind())
+    live = audit_writer.AuditWriter(
+        factory, spill_path=audit_writer.process_spill_path(base, pid=43)
+    )
+    try:
+        # El diario de un worker vivo está bloqueado: no se reproduce ni se trunca.
+        assert live.submit(_entry("inventory_catalog_search", None, 9))
+        size = live.spill_path.stat().st_size
+        assert audit_writer.replay_orphaned_journals(factory, base) == 3
+        assert live.spill_path.stat().st_size == size
+    finally:
+        live.stop()
+
+    assert not orphan.exists() and not base.exists()
+    entity_ids = db_session.scalars(select(models.AuditLog.entity_id).order_by(models.AuditLog.id))
+    assert sorted(entity_ids) == ["1", "2", "3"]
@@ -317,6 +317,114 @@ def test_backup_restore_sql_without_applying_database(client, tmp_path) -> None:
     shutil.rmtree(restore_destination, ignore_errors=True)
 
 
+
+def test_backup_restore_selected_tables_from_chunked_dump(client, tmp_path) -> None:
+    headers = _auth_headers(client)
+    settings.backup_directory = str(tmp_path / "respaldos")
+
+    store_response = client.post(
+        "/stores",
+        json={"name": "Sucursal Volcado", "location": "CDMX", "timezone": "America/Mexico_City"},
+        headers=headers,
+    )
+    assert store_response.status_code == status.HTTP_201_CREATED, store_response.json()
+
+    backup_response = client.post(
+        "/backups/run",
+        json={},
+        headers=_with_reason(headers, "Respaldo con volcado por bloques"),
+    )
+    assert backup_response.status_code == status.HTTP_201_CREATED, backup_response.json()
+    backup_data = backup_response.json()
+
+    metadata = backup_services.load_backup_metadata(Path(backup_data["metadata_path"]))
+    sql_dump = metadata["sql_dump"]
+    indexed_tables = {entry["name"]: entry for entry in sql_dump["tables"]}
+    assert indexed_tables["sucursales"]["rows"] >= 1
+    assert "backup_jobs" not in indexed_tables
+
+    restore_response = client.post(
+        f"/backups/{backup_data['id']}/restore",
+        json={
+            "componentes": ["database"],
+            "aplicar_base_datos": False,
+            "destino": str(tmp_path / "restauracion_tablas"),
+            "tablas": ["sucursales"],
+        },
+        headers=_with_reason(headers, "Restaurar solo sucursales"),
+    )
+    assert restore_response.status_code == status.HTTP_200_OK, restore_response.json()
+    sql_content = Path(restore_response.json()["resultados"]["database"]).read_text(
+        encoding="utf-8"
+    )
+    assert 'INSERT INTO "sucursales"' in sql_content
+    assert 'DELETE FROM "users"' not in sql_content
+    assert sql_content.startswith("BEGIN TRANSACTION;")
+    assert sql_content.rstrip().endswith("COMMIT;")
+
+    unknown_response = client.post(
+        f"/backups/{backup_data['id']}/restore",
+        json={"componentes": ["database"], "tablas": ["tabla_inexistente"], "aplicar_base_datos": True},
+        headers=_with_reason(headers, "Restaurar tabla inexistente"),
+    )
+    assert unknown_response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_incremental_backup_chain_restores_over_full_backup(client, tmp_path) -> None:
+    headers = _auth_headers(client)
+    settings.backup_directory = str(tmp_path / "respaldos")
+
+    full_response = client.post(
+        "/backups/run",
+        json={},
+        headers=_with_reason(headers, "Respaldo base de la cadena"),
+    )
+    assert full_response.status_code == status.HTTP_201_CREATED, full_response.json()
+    full_backup = full_response.json()
+    assert full_backup["backup_type"] == "completo"
+
+    store_response = client.post(
+        "/stores",
+        json={"name": "Sucursal Incremental", "location": "QRO", "timezone": "America/Mexico_City"},
+        headers=headers,
+    )
+    assert store_response.status_code == status.HTTP_201_CREATED, store_response.json()
+
+    incremental_response = client.post(
+        "/backups/run",
+        json={"tipo": "incremental"},
+        headers=_with_reason(headers, "Respaldo incremental de prueba"),
+    )
+    assert incremental_response.status_code == status.HTTP_201_CREATED, incremental_response.json()
+    incremental = incremental_response.json()
+    assert incremental["backup_type"] == "incremental"
+    assert incremental["parent_id"] == full_backup["id"]
+    assert incremental["pdf_path"] is None
+    assert set(incremental["components"]) == {"database", "configuration"}
+
+    metadata = backup_services.load_backup_metadata(Path(incremental["metadata_path"]))
+    assert metadata["sql_dump"]["kind"] == "incremental"
+
+    restore_response = client.post(
+        f"/backups/{incremental['id']}/restore",
+        json={
+            "componentes": ["database"],
+            "aplicar_base_datos": False,
+            "destino": str(tmp_path / "restauracion_incremental"),
+        },
+        headers=_with_reason(headers, "Reproducir cadena incremental"),
+    )
+    assert restore_response.status_code == status.HTTP_200_OK, restore_response.json()
+    sql_content = Path(restore_response.json()["resultados"]["database"]).read_text(
+        encoding="utf-8"
+    )
+    assert sql_content.count("BEGIN TRANSACTION;") == 2
+    assert 'DELETE FROM "sucursales";' in sql_content
+    assert any(
+        "Sucursal Incremental" in line and "ON CONFLICT" in line
+        for line in sql_content.splitlines()
+    )
+
 def test_backup_download_formats(client, tmp_path) -> None:
     headers = _auth_headers(client)
     settings.backup_directory = str(tmp_path / "respaldos")
@@ -0,0 +1,74 @@
+"""Pruebas de los cálculos de la suite de benchmarks."""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+
+
+@pytest.fixture(scope="module")
+def benchmark_suite():
+    # Los scripts fijan variables de entorno por defecto al importarse; se
+    # restauran para no alterar la configuración del resto de las pruebas.
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    try:
+        with mock.patch.dict(os.environ):
+            import benchmark_suite
+    finally:
+        sys.path.remove(str(SCRIPTS_DIR))
+    return benchmark_suite
+
+
+def test_percentile_uses_nearest_rank(benchmark_suite) -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert benchmark_suite.percentile(values, 50) == 50.0
+    assert benchmark_suite.percentile(values, 95) == 95.0
+    assert benchmark_suite.percentile(values, 99) == 99.0
+    assert benchmark_suite.percentile([7.0], 99) == 7.0
+    assert benchmark_suite.percentile([], 50) is None
+
+
+def test_compare_with_baseline_flags_only_regressions(benchmark_suite) -> None:
+    baseline = {
+        "scenarios": {
+            "pos_sale": {"p95_ms": 100.0, "queries_per_request": 10},
+            "catalog_search": {"p95_ms": 2.0, "queries_per_request": 4},
+            "backup": {"p95_ms": 500.0, "queries_per_request": 30},
+        }
+    }
+    current = {
+        "scenarios": {
+            "pos_sale": {"p95_ms": 130.0, "queries_per_request": 10},
+            # +50 % pero por debajo del piso absoluto de ruido.
+            "catalog_search": {"p95_ms": 2.9, "queries_per_request": 6},
+            "backup": {"p95_ms": 450.0, "queries_per_request": 30},
+            "sync_cycle": {"p95_ms": 900.0, "queries_per_request": 90},
+        }
+    }
+
+    regressions = benchmark_suite.compare_with_baseline(
+        current, baseline, max_regression=0.2
+    )
+
+    assert [(item["scenario"], item["metric"]) for item in regressions] == [
+        ("pos_sale", "p95_ms"),
+        ("catalog_search", "queries_per_request"),
+    ]
+    assert regressions[0]["change_percent"] == 30.0
+
+
+def test_resolve_spec_applies_overrides(benchmark_suite) -> None:
+    import benchmark_dataset
+
+    spec = benchmark_dataset.resolve_spec("1k", devices=10, sales=None)
+
+    assert spec.devices == 10
+    assert spec.sales == benchmark_dataset.PROFILES["1k"].sales
+    with pytest.raises(ValueError):
+        benchmark_dataset.resolve_spec("10k")
@@ -0,0 +1,76 @@
+"""Pruebas del subsistema de cache con LRU, etiquetas y backend compartido."""
+from __future__ import annotations
+
+import threading
+import time
+
+import fakeredis
+
+from backend.app import telemetry
+from backend.app.utils import cache as cache_module
+from backend.app.utils.cache import RedisCacheBackend, TTLCache
+
+
+def test_cache_evicts_lru_and_invalidates_by_tag() -> None:
+    cache: TTLCache[str] = TTLCache(60, name="test_lru_tags", max_entries=2)
+    cache.set("a", "A", tags=("store:1",))
+    cache.set("b", "B", tags=("store:2",))
+    assert cache.get("a") == "A"
+    cache.set("c", "C", tags=("store:1",))
+
+    assert cache.get("b") is None
+    assert telemetry.get_metric_value(
+        "softmobile_cache_evictions_total", {"cache": "test_lru_tags", "reason": "lru"}
+    ) == 1.0
+
+    assert cache.invalidate_tags("store:1") == 2
+    assert len(cache) == 0
+    assert telemetry.get_metric_value(
+        "softmobile_cache_requests_total", {"cache": "test_lru_tags", "result": "hit"}
+    ) == 1.0
+
+
+def test_cache_sweep_and_single_flight() -> None:
+    cache: TTLCache[int] = TTLCache(0.05, name="test_single_flight")
+    cache.set("stale", 1)
+    time.sleep(0.06)
+    assert cache.sweep() == 1
+
+    calls: list[int] = []
+    release = threading.Event()
+
+    def loader() -> int:
+        calls.append(1)
+        release.wait(1)
+        return 42
+
+    results: list[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_set("key", loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.02)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 5
+    assert len(calls) == 1
+
+
+def test_shared_backend_is_visible_across_local_tiers() -> None:
+    cache_module.configure_shared_backend(RedisCacheBackend(fakeredis.FakeRedis()))
+    try:
+        worker_a: TTLCache[dict] = TTLCache(60, name="test_shared", shared=True)
+        worker_b: TTLCache[dict] = TTLCache(60, name="test_shared", shared=True)
+        worker_a.set(("report", 5), {"total": 3}, tags=("store:5",))
+
+        assert worker_b.get(("report", 5)) == {"total": 3}
+
+        worker_a.invalidate_tags("store:5")
+        fresh_worker: TTLCache[dict] = TTLCache(60, name="test_shared", shared=True)
+        assert fresh_worker.get(("report", 5)) is None
+    finally:
+        cache_module.configure_shared_backend(None)
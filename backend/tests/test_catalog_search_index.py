@@ -0,0 +1,146 @@
+"""Pruebas del índice de búsqueda del catálogo de dispositivos."""
+
+from sqlalchemy import select
+
+from backend.app import models, schemas
+from backend.app.crud import devices as devices_crud
+from backend.app.services import catalog_search_index
+
+
+def _create_store(db_session, code: str) -> models.Store:
+    store = models.Store(name=f"Sucursal {code}", location="Centro", code=code)
+    db_session.add(store)
+    db_session.commit()
+    return store
+
+
+def _create_device(db_session, store: models.Store, **fields) -> models.Device:
+    payload = schemas.DeviceCreate(quantity=1, unit_price=100, **fields)
+    return devices_crud.create_device(db_session, store.id, payload)
+
+
+def test_search_covers_prefix_substring_accents_and_typos(db_session):
+    store = _create_store(db_session, "IDX-001")
+    other = _create_store(db_session, "IDX-002")
+    galaxy = _create_device(
+        db_session,
+        store,
+        sku="SG-S24",
+        name="Samsung Galaxy S24",
+        marca="Samsung",
+        imei="356789012345678",
+    )
+    camera = _create_device(db_session, store, sku="CAM-01", name="Cámara Réflex", marca="Canon")
+    _create_device(db_session, other, sku="SG-A15", name="Samsung Galaxy A15", marca="Samsung")
+
+    search = catalog_search_index.search_device_ids
+    assert search(db_session, "sams gal", store_id=store.id) == [galaxy.id]
+    assert len(search(db_session, "galaxy")) == 2
+    # Subcadena dentro de un identificador, equivalente al antiguo ILIKE.
+    assert search(db_session, "7890123", store_id=store.id) == [galaxy.id]
+    assert search(db_session, "CAMARA") == [camera.id]
+    assert search(db_session, "samsnug", store_id=store.id) == [galaxy.id]
+    assert search(db_session, "samsnug", store_id=store.id, fuzzy=False) == []
+
+    listed = devices_crud.list_devices(db_session, store.id, search="galax")
+    assert [device.id for device in listed] == [galaxy.id]
+    assert devices_crud.count_store_devices(db_session, store.id, search="galax") == 1
+
+
+def test_index_follows_updates_deletes_and_rebuilds(db_session):
+    store = _create_store(db_session, "IDX-003")
+    device = _create_device(
+        db_session, store, sku="MOTO-G", name="Moto G", marca="Motorola", color="Azul"
+    )
+
+    devices_crud.update_device(
+        db_session, store.id, device.id, schemas.DeviceUpdate(name="Moto Edge", color="Negro")
+    )
+    assert catalog_search_index.search_device_ids(db_session, "edge") == [device.id]
+    assert catalog_search_index.search_device_ids(db_session, "azul", fuzzy=False) == []
+
+    filters = schemas.DeviceSearchFilters(marca="motor", color="NEG")
+    assert [item.id for item in devices_crud.search_devices(db_session, filters)] == [device.id]
+    assert devices_crud.count_devices_matching_filters(db_session, filters) == 1
+
+    devices_crud.delete_device(db_session, store.id, device.id)
+    assert catalog_search_index.search_device_ids(db_session, "edge") == []
+
+    documents = models.DeviceSearchDocument
+    db_session.execute(documents.__table__.delete())
+    db_session.commit()
+    survivor = _create_device(db_session, store, sku="NOKIA-1", name="Nokia 105")
+    db_session.execute(documents.__table__.delete())
+    db_session.commit()
+
+    assert catalog_search_index.rebuild_device_search_index(db_session, store_id=store.id) == 1
+    db_session.commit()
+    assert db_session.scalars(select(documents.device_id)).all() == [survivor.id]
+    assert catalog_search_index.search_device_ids(db_session, "nokia") == [survivor.id]
+
+
+def test_advanced_search_excludes_soft_deleted_devices(db_session):
+    store = _create_store(db_session, "IDX-004")
+    kept = _create_device(
+        db_session, store, sku="IP-15", name="iPhone 15", marca="Apple", imei="490154203237518"
+    )
+    removed = _create_device(
+        db_session, store, sku="IP-14", name="iPhone 14", marca="Apple", imei="490154203237519"
+    )
+    devices_crud.delete_device(db_session, store.id, removed.id)
+
+    def found(**filters) -> list[int]:
+        criteria = schemas.DeviceSearchFilters(**filters)
+        assert devices_crud.count_devices_matching_filters(db_session, criteria) == len(
+            devices_crud.search_devices(db_session, criteria)
+        )
+        return [item.id for item in devices_crud.search_devices(db_session, criteria)]
+
+    assert found(q="iphone") == [kept.id]
+    assert found(marca="apple") == [kept.id]
+    # Los filtros exactos tampoco devuelven bajas, aunque no pasen por el índice.
+    assert found(imei=removed.imei) == []
+    assert found(imei=kept.imei) == [kept.id]
+
+
+def test_search_pages_counts_and_exports_past_the_ranked_limit(db_session):
+    store = _create_store(db_session, "IDX-004")
+    total = catalog_search_index.MAX_MATCHES + 120
+    names = [f"Pixel {index}" for index in range(total)] + ["Nokia 105"]
+    db_session.add_all(
+        models.Device(
+            store_id=store.id, sku=f"IDX-{index:04d}", name=name, quantity=1, unit_price=100
+        )
+        for index, name in enumerate(names)
+    )
+    db_session.commit()
+    catalog_search_index.rebuild_device_search_index(db_session, store_id=store.id)
+    db_session.commit()
+
+    ranked = catalog_search_index.search_device_ids(db_session, "pixel", store_id=store.id)
+    assert len(ranked) == catalog_search_index.MAX_MATCHES
+    assert devices_crud.count_store_devices(db_session, store.id, search="pixel") == total
+    assert devices_crud.count_store_devices(db_session, store.id, search="pixle") == total
+
+    first = devices_crud.list_devices(
+        db_session, store.id, search="pixel", limit=catalog_search_index.MAX_MATCHES
+    )
+    rest = devices_crud.list_devices(
+        db_session, store.id, search="pixel", offset=catalog_search_index.MAX_MATCHES, limit=500
+    )
+    assert [device.id for device in first] == ranked
+    assert len(rest) == 120
+    assert {device.id for device in first} | {device.id for device in rest} == {
+        device.id for device in devices_crud.list_devices(db_session, store.id, limit=None)
+        if device.name.startswith("Pixel")
+    }
+    exported = list(devices_crud.iter_devices(db_session, store.id, search="pixel", batch_size=100))
+    assert [device.id for device in exported] == [device.id for device in first + rest]
+    by_cursor = devices_crud.list_devices(
+        db_session, store.id, search="pixel", cursor="", limit=None
+    )
+    assert len(by_cursor) == total
+
+    filters = schemas.DeviceSearchFilters(q="pixel")
+    assert devices_crud.count_devices_matching_filters(db_session, filters) == total
+    assert len(devices_crud.search_devices(db_session, filters, offset=500, limit=500)) == 120
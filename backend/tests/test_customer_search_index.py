@@ -0,0 +1,82 @@
+"""Pruebas del índice de búsqueda de clientes."""
+
+from sqlalchemy import select
+
+from backend.app import models, schemas
+from backend.app.crud import customers as customers_crud
+from backend.app.services import customer_search_index
+
+
+def _create_customer(db_session, **fields) -> models.Customer:
+    payload = schemas.CustomerCreate(**fields)
+    return customers_crud.create_customer(db_session, payload)
+
+
+def _ids(customers) -> list[int]:
+    return [customer.id for customer in customers]
+
+
+def test_search_uses_exact_keys_substrings_and_tags(db_session):
+    azul = _create_customer(
+        db_session,
+        name="Empresa Azul",
+        contact_name="Laura Campos",
+        email="Laura@EmpresaAzul.com",
+        phone="+504 9988-7766",
+        tax_id="0801-1999-000123",
+        tags=["VIP", "corporativo"],
+    )
+    norte = _create_customer(
+        db_session,
+        name="Distribuidora Del Norte",
+        phone="2233-4455",
+        notes="Pedidos de accesorios",
+        tags=["vip"],
+    )
+
+    def _search(**filters):
+        return _ids(customers_crud.list_customers(db_session, **filters))
+
+    assert _search(query="laura@empresaazul.com") == [azul.id]
+    assert _search(query="0801 1999 000123") == [azul.id]
+    assert _search(query="50499887766") == [azul.id]
+    # Teléfono parcial: sin coincidencia exacta se busca como subcadena.
+    assert _search(query="4455") == [norte.id]
+    assert _search(query="ACCESORIOS") == [norte.id]
+    assert _search(query="campos azul") == [azul.id]
+    # Términos de menos de tres caracteres recurren a LIKE sobre el documento.
+    assert _search(query="te") == [norte.id]
+    assert _search(tags=["vip"]) == [norte.id, azul.id]
+    assert _search(tags=["vip", "Corporativo"]) == [azul.id]
+
+    customers_crud.update_customer(
+        db_session, norte.id, schemas.CustomerUpdate(name="Distribuidora Sur", tags=[])
+    )
+    assert _search(query="norte") == []
+    assert _search(tags=["vip"]) == [azul.id]
+
+    customers_crud.delete_customer(db_session, azul.id)
+    assert _search(query="laura") == []
+    tags = db_session.scalars(select(models.CustomerTag.customer_id)).all()
+    assert tags == []
+
+
+def test_keyset_pagination_and_rebuild(db_session):
+    created = [
+        _create_customer(db_session, name=f"Cliente {index:02d}", phone=f"5550-00{index:02d}")
+        for index in range(5)
+    ]
+
+    first = customers_crud.list_customers(db_session, query="cliente", limit=2)
+    cursor = customers_crud.encode_customer_cursor(first[-1])
+    second = customers_crud.list_customers(db_session, query="cliente", limit=2, cursor=cursor)
+    cursor = customers_crud.encode_customer_cursor(second[-1])
+    third = customers_crud.list_customers(db_session, query="cliente", limit=2, cursor=cursor)
+    assert _ids(first + second + third) == _ids(created)
+
+    db_session.execute(models.CustomerSearchDocument.__table__.delete())
+    db_session.commit()
+    assert customers_crud.list_customers(db_session, query="cliente") == []
+    assert customer_search_index.rebuild_customer_search_index(db_session) == 5
+    db_session.commit()
+    assert len(customers_crud.list_customers(db_session, query="cliente 0")) == 5
@@ -0,0 +1,48 @@
+"""Pruebas de perfiles de motor y enrutamiento de lecturas."""
+
+from sqlalchemy import insert, select, text
+
+from backend.app import database, models
+from backend.app.telemetry import get_metric_value
+
+
+def test_sqlite_profile_applies_pragmas_and_routes_reads(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'sucursal.db'}"
+    primary = database.create_engine_from_url(
+        url, database.EngineProfile(sqlite_busy_timeout_ms=1234, metrics_label="test_primary")
+    )
+    reader = database.create_engine_from_url(
+        url, database.EngineProfile(read_only=True, metrics_label="test_replica")
+    )
+    try:
+        with primary.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 1234
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        models.Store.__table__.create(bind=primary)
+        assert get_metric_value(
+            "softmobile_db_pool_checkouts_total", {"engine": "test_primary"}
+        ) >= 1
+
+        monkeypatch.setattr(database, "read_engine", reader)
+        session = database.RoutingSession(bind=primary)
+        database.mark_read_only(session)
+        try:
+            statement = select(models.Store.id)
+            assert session.get_bind(clause=statement) is reader
+            assert session.get_bind(clause=text("SELECT 1")) is primary
+            session.execute(
+                insert(models.Store).values(name="Norte", location="N", code="ENG-001")
+            )
+            # Tras escribir, las lecturas permanecen en el primario.
+            assert session.get_bind(clause=statement) is primary
+            session.commit()
+        finally:
+            session.close()
+
+        with reader.connect() as connection:
+            assert connection.execute(select(models.Store.code)).scalar() == "ENG-001"
+            assert connection.exec_driver_sql("PRAGMA query_only").scalar() == 1
+    finally:
+        reader.dispose()
+        primary.dispose()
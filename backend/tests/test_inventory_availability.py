@@ -117,3 +117,34 @@ def test_inventory_availability_cache_invalidated_after_movement(client):
     assert refreshed_response.status_code == status.HTTP_200_OK
     refreshed_total = refreshed_response.json()["items"][0]["total_quantity"]
     assert refreshed_total == 5
+
+
+def test_invalidation_only_drops_responses_with_the_moved_reference(db_session):
+    from backend.app import models
+    from backend.app.services import inventory_availability
+
+    inventory_availability.invalidate_inventory_availability_cache()
+    store = models.Store(name="Sucursal Etiquetas", location="MX", code="AV-TAG")
+    db_session.add(store)
+    db_session.flush()
+    moved = models.Device(store_id=store.id, sku="SKU-TAG-01", name="Movido", quantity=4)
+    other = models.Device(store_id=store.id, sku="SKU-TAG-02", name="Intacto", quantity=9)
+    db_session.add_all([moved, other])
+    db_session.commit()
+
+    def total(sku: str) -> int:
+        payload = inventory_availability.get_inventory_availability(db_session, skus=[sku])
+        return payload["items"][0]["total_quantity"]
+
+    assert (total("SKU-TAG-01"), total("SKU-TAG-02")) == (4, 9)
+    moved.quantity, other.quantity = 1, 2
+    db_session.commit()
+
+    inventory_availability.invalidate_inventory_availability_cache(
+        store.id, sku=moved.sku, device_id=moved.id
+    )
+    # Sólo se recalcula la referencia movida; la otra sigue en cache.
+    assert (total("SKU-TAG-01"), total("SKU-TAG-02")) == (1, 9)
+
+    inventory_availability.invalidate_inventory_availability_cache(store.id)
+    assert total("SKU-TAG-02") == 2
@@ -0,0 +1,57 @@
+"""Pruebas del detector incremental de discrepancias de inventario."""
+
+from backend.app import models
+from backend.app.services import inventory_discrepancies
+
+
+def test_incremental_refresh_only_recomputes_touched_skus(db_session):
+    store_a = models.Store(name="Sucursal Norte", location="Norte", code="DIS-001")
+    store_b = models.Store(name="Sucursal Sur", location="Sur", code="DIS-002")
+    db_session.add_all([store_a, store_b])
+    db_session.commit()
+
+    def _device(sku: str, store: models.Store, quantity: int) -> models.Device:
+        return models.Device(
+            sku=sku,
+            name=f"Equipo {sku}",
+            quantity=quantity,
+            unit_price=100.0,
+            costo_unitario=50.0,
+            store_id=store.id,
+        )
+
+    a_north, a_south = _device("SKU-A", store_a, 5), _device("SKU-A", store_b, 2)
+    b_north, b_south = _device("SKU-B", store_a, 4), _device("SKU-B", store_b, 4)
+    db_session.add_all([a_north, a_south, b_north, b_south])
+    db_session.commit()
+
+    inventory_discrepancies.refresh_inventory_sku_summary(db_session)
+    discrepancies = inventory_discrepancies.list_inventory_discrepancies(db_session)
+    assert [item["sku"] for item in discrepancies] == ["SKU-A"]
+    assert discrepancies[0]["diferencia"] == 3
+    assert discrepancies[0]["max"] == [
+        {"store_id": store_a.id, "store_name": "Sucursal Norte", "quantity": 5}
+    ]
+
+    # Cambios sin evento asociado no se detectan hasta la reconstrucción completa.
+    a_south.quantity = 5
+    b_south.quantity = 1
+    db_session.add(
+        models.SyncOutbox(
+            entity_type="device",
+            entity_id=str(b_south.id),
+            operation="UPSERT",
+            payload={"store_id": store_b.id, "sku": "SKU-B"},
+        )
+    )
+    db_session.commit()
+
+    refreshed = inventory_discrepancies.refresh_inventory_sku_summary(db_session)
+    assert refreshed == 1
+    skus = [item["sku"] for item in inventory_discrepancies.list_inventory_discrepancies(db_session)]
+    assert skus == ["SKU-A", "SKU-B"]
+
+    inventory_discrepancies.refresh_inventory_sku_summary(db_session, full=True)
+    discrepancies = inventory_discrepancies.list_inventory_discrepancies(db_session)
+    assert [item["sku"] for item in discrepancies] == ["SKU-B"]
+    assert discrepancies == inventory_discrepancies.compute_inventory_discrepancies(db_session)
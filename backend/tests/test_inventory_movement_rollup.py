@@ -0,0 +1,127 @@
+"""Pruebas del acumulado diario de movimientos de inventario."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from backend.app import models
+from backend.app.crud import inventory as inventory_crud
+from backend.app.services import inventory_movement_rollup
+
+
+def test_rollup_matches_rebuild_and_feeds_paginated_report(db_session):
+    inventory_crud.invalidate_inventory_movements_cache()
+    store = models.Store(name="Sucursal Rollup", location="Centro", code="ROL-001")
+    db_session.add(store)
+    db_session.commit()
+    device = models.Device(
+        sku="ROL-SKU", name="Equipo", quantity=20, unit_price=100.0, store_id=store.id
+    )
+    db_session.add(device)
+    db_session.commit()
+
+    now = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+    specs = [
+        (models.MovementType.IN, 5, Decimal("10.00"), now - timedelta(days=1)),
+        (models.MovementType.IN, 2, Decimal("12.50"), now - timedelta(days=1)),
+        (models.MovementType.OUT, 3, None, now),
+        (models.MovementType.IN, 1, Decimal("9.99"), now),
+    ]
+    for movement_type, quantity, unit_cost, created_at in specs:
+        movement = models.InventoryMovement(
+            store_id=store.id,
+            device_id=device.id,
+            movement_type=movement_type,
+            quantity=quantity,
+            unit_cost=unit_cost,
+            created_at=created_at,
+        )
+        db_session.add(movement)
+        db_session.flush()
+        inventory_movement_rollup.record_inventory_movement_rollup(db_session, movement)
+    db_session.commit()
+
+    def _rows():
+        statement = select(
+            models.InventoryMovementDaily.day,
+            models.InventoryMovementDaily.movement_type,
+            models.InventoryMovementDaily.movement_count,
+            models.InventoryMovementDaily.units,
+            models.InventoryMovementDaily.total_value,
+        ).order_by(
+            models.InventoryMovementDaily.day,
+            models.InventoryMovementDaily.movement_type,
+        )
+        return [tuple(row) for row in db_session.execute(statement)]
+
+    incremental = _rows()
+    assert len(incremental) == 3
+    assert inventory_movement_rollup.rebuild_inventory_movement_daily(db_session) == 3
+    db_session.commit()
+    assert _rows() == incremental
+
+    def _page(cursor=None):
+        return inventory_crud.get_inventory_movements_report(
+            db_session,
+            store_ids=[store.id],
+            date_from=(now - timedelta(days=1)).date(),
+            date_to=now.date(),
+            limit=3,
+            cursor=cursor,
+        )
+
+    first = _page()
+    assert first.resumen.total_movimientos == 4
+    assert first.resumen.total_unidades == 11
+    assert first.resumen.total_valor == Decimal("84.99")
+    assert len(first.periodos) == 3
+    assert first.siguiente_cursor is not None
+
+    second = _page(first.siguiente_cursor)
+    assert second.siguiente_cursor is None
+    seen = [entry.id for entry in first.movimientos + second.movimientos]
+    assert len(seen) == len(set(seen)) == 4
+
+
+def test_rebuild_groups_by_utc_day_like_the_incremental_rollup(db_session):
+    store = models.Store(name="Sucursal Medianoche", location="Centro", code="ROL-002")
+    db_session.add(store)
+    db_session.commit()
+    device = models.Device(
+        sku="ROL-UTC", name="Equipo", quantity=20, unit_price=100.0, store_id=store.id
+    )
+    db_session.add(device)
+    db_session.commit()
+
+    midnight = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    for created_at in (midnight - timedelta(minutes=10), midnight + timedelta(minutes=10)):
+        movement = models.InventoryMovement(
+            store_id=store.id,
+            device_id=device.id,
+            movement_type=models.MovementType.IN,
+            quantity=1,
+            created_at=created_at,
+        )
+        db_session.add(movement)
+        db_session.flush()
+        inventory_movement_rollup.record_inventory_movement_rollup(db_session, movement)
+    db_session.commit()
+
+    day_column = models.InventoryMovementDaily.day
+    incremental = db_session.scalars(select(day_column).order_by(day_column)).all()
+    assert [day.isoformat() for day in incremental] == ["2026-03-01", "2026-03-02"]
+
+    rebuilt = inventory_movement_rollup.rebuild_inventory_movement_daily(
+        db_session, date_from=midnight.date(), date_to=midnight.date()
+    )
+    db_session.commit()
+    assert rebuilt == 1
+    assert db_session.scalars(select(day_column).order_by(day_column)).all() == incremental
+
+    # En PostgreSQL el día se trunca tras convertir a UTC, no en la zona de la sesión.
+    compiled = select(
+        inventory_movement_rollup._utc_day("postgresql", models.InventoryMovement.created_at)
+    ).compile(dialect=postgresql.dialect())
+    assert "date(timezone(" in str(compiled)
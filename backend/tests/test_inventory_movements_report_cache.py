@@ -0,0 +1,139 @@
+"""Pruebas de la caché por sucursal del reporte de movimientos de inventario."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from backend.app import models
+from backend.app.crud import inventory as inventory_crud
+from backend.app.services import inventory_movement_rollup
+
+
+def test_movements_report_cache_is_invalidated_per_store_and_month(db_session):
+    inventory_crud.invalidate_inventory_movements_cache()
+    store_a = models.Store(name="Sucursal Centro", location="Centro", code="MOV-001")
+    store_b = models.Store(name="Sucursal Oeste", location="Oeste", code="MOV-002")
+    db_session.add_all([store_a, store_b])
+    db_session.commit()
+    device = models.Device(
+        sku="MOV-SKU", name="Equipo", quantity=10, unit_price=100.0, store_id=store_a.id
+    )
+    db_session.add(device)
+    db_session.commit()
+
+    now = datetime.now(timezone.utc)
+    db_session.add_all(
+        [
+            models.InventoryMovement(
+                store_id=store_a.id,
+                device_id=device.id,
+                movement_type=models.MovementType.IN,
+                quantity=3,
+                unit_cost=Decimal("10.50"),
+                created_at=now - timedelta(days=1),
+            ),
+            models.InventoryMovement(
+                store_id=store_a.id,
+                device_id=device.id,
+                movement_type=models.MovementType.OUT,
+                quantity=2,
+                unit_cost=None,
+                created_at=now,
+            ),
+        ]
+    )
+    db_session.commit()
+    inventory_movement_rollup.rebuild_inventory_movement_daily(db_session)
+    db_session.commit()
+
+    def _report():
+        return inventory_crud.get_inventory_movements_report(
+            db_session,
+            store_ids=[store_a.id],
+            date_from=(now - timedelta(days=2)).date(),
+            date_to=now.date(),
+            limit=1,
+        )
+
+    report = _report()
+    # Los totales cubren todo el rango aunque el detalle esté paginado.
+    assert len(report.movimientos) == 1
+    assert report.resumen.total_movimientos == 2
+    assert report.resumen.total_unidades == 5
+    assert report.resumen.total_valor == Decimal("31.50")
+    assert [entry.total_cantidad for entry in report.periodos] == [3, 2]
+    assert _report() is report
+
+    inventory_crud.invalidate_inventory_movements_cache(store_b.id, now)
+    inventory_crud.invalidate_inventory_movements_cache(
+        store_a.id, now - timedelta(days=400)
+    )
+    assert _report() is report
+
+    inventory_crud.invalidate_inventory_movements_cache(store_a.id, now)
+    refreshed = _report()
+    assert refreshed is not report
+    assert refreshed == report
+
+
+def test_summary_totals_cover_the_whole_range_on_every_page(db_session):
+    inventory_crud.invalidate_inventory_movements_cache()
+    store = models.Store(name="Sucursal Rango", location="Centro", code="MOV-003")
+    db_session.add(store)
+    db_session.commit()
+    device = models.Device(
+        sku="MOV-RANGO", name="Equipo", quantity=50, unit_price=100.0, store_id=store.id
+    )
+    db_session.add(device)
+    db_session.commit()
+
+    now = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+    specs = [
+        (models.MovementType.IN, 4, Decimal("10.00"), now - timedelta(days=2)),
+        (models.MovementType.OUT, 1, Decimal("10.00"), now - timedelta(days=2)),
+        (models.MovementType.IN, 6, Decimal("2.50"), now - timedelta(days=1)),
+        (models.MovementType.ADJUST, 2, None, now - timedelta(days=1)),
+        (models.MovementType.OUT, 3, Decimal("1.00"), now),
+    ]
+    for movement_type, quantity, unit_cost, created_at in specs:
+        movement = models.InventoryMovement(
+            store_id=store.id,
+            device_id=device.id,
+            movement_type=movement_type,
+            quantity=quantity,
+            unit_cost=unit_cost,
+            created_at=created_at,
+        )
+        db_session.add(movement)
+        db_session.flush()
+        inventory_movement_rollup.record_inventory_movement_rollup(db_session, movement)
+    db_session.commit()
+
+    pages = [
+        inventory_crud.get_inventory_movements_report(
+            db_session,
+            store_ids=[store.id],
+            date_from=(now - timedelta(days=2)).date(),
+            date_to=now.date(),
+            limit=2,
+            offset=offset,
+        )
+        for offset in (0, 2, 4)
+    ]
+
+    assert [len(page.movimientos) for page in pages] == [2, 2, 1]
+    # Mismo resumen y periodos en cada página: cubren el rango, no el detalle.
+    assert all(page.resumen == pages[0].resumen for page in pages)
+    assert all(page.periodos == pages[0].periodos for page in pages)
+    resumen = pages[0].resumen
+    assert resumen.total_movimientos == len(specs) == 5
+    assert resumen.total_unidades == sum(quantity for _, quantity, _, _ in specs)
+    assert resumen.total_valor == sum(
+        (quantity * (unit_cost or 0) for _, quantity, unit_cost, _ in specs), Decimal("0")
+    )
+    by_type = {entry.tipo_movimiento: entry.total_cantidad for entry in resumen.por_tipo}
+    assert by_type == {
+        models.MovementType.IN: 10,
+        models.MovementType.OUT: 4,
+        models.MovementType.ADJUST: 2,
+    }
+    assert sum(entry.total_cantidad for entry in pages[0].periodos) == 16
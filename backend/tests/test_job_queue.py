@@ -0,0 +1,226 @@
+"""Pruebas de la cola persistente de trabajos en segundo plano."""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import models
+from backend.app.config import settings
+from backend.app.services import job_queue
+
+_calls: list[str] = []
+_finished = threading.Event()
+
+
+@job_queue.register_job_handler("test_echo")
+def _echo(context: job_queue.JobContext) -> job_queue.JobResult:
+    _calls.append(context.payload["name"])
+    context.progress(40, "Procesando")
+    _finished.set()
+    return context.write_bytes(
+        "eco.txt", context.payload["name"].encode("utf-8"), media_type="text/plain"
+    )
+
+
+@job_queue.register_job_handler("test_flaky")
+def _flaky(context: job_queue.JobContext) -> None:
+    raise RuntimeError("temporal")
+
+
+_inline_requeued: list[int] = []
+_inline_sessions: list[sessionmaker] = []
+
+
+@job_queue.register_job_handler("test_slow_inline")
+def _slow_inline(context: job_queue.JobContext) -> None:
+    time.sleep(1.5)
+    with _inline_sessions[0]() as other_process:
+        _inline_requeued.append(job_queue.requeue_stale_jobs(other_process))
+
+
+@pytest.fixture(autouse=True)
+def _job_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "logs_directory", str(tmp_path / "logs"))
+    monkeypatch.setattr(settings, "job_retry_backoff_seconds", 30)
+    monkeypatch.setattr(settings, "job_result_retention_hours", 24)
+    _calls.clear()
+    _finished.clear()
+
+
+@pytest.fixture()
+def job_sessions(tmp_path):
+    """Base SQLite propia: los workers abren sesiones independientes y confirman."""
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    models.BackgroundJob.__table__.create(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _auth_headers(client) -> dict[str, str]:
+    payload = {
+        "username": "admin-jobs",
+        "password": "ClaveSegura789",
+        "full_name": "Admin Jobs",
+        "roles": ["ADMIN"],
+    }
+    response = client.post("/auth/bootstrap", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    token_response = client.post(
+        "/auth/token",
+        data={"username": payload["username"], "password": payload["password"]},
+        headers={"content-type": "application/x-www-form-urlencoded"},
+    )
+    assert token_response.status_code == status.HTTP_200_OK
+    return {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+
+
+def test_claim_orders_by_priority_then_age(job_sessions):
+    db_session = job_sessions()
+    low = job_queue.enqueue_job(db_session, "test_echo", {"name": "baja"}, priority=9)
+    first = job_queue.enqueue_job(db_session, "test_echo", {"name": "alta-1"}, priority=1)
+    second = job_queue.enqueue_job(db_session, "test_echo", {"name": "alta-2"}, priority=1)
+
+    claimed = [
+        job_queue.claim_next_job(db_session, worker_id="w").id for _ in range(3)
+    ]
+
+    assert claimed == [first.id, second.id, low.id]
+    assert job_queue.claim_next_job(db_session, worker_id="w") is None
+    # Un trabajo ya tomado no puede tomarse de nuevo.
+    assert job_queue.claim_job(db_session, first.id, worker_id="otro") is None
+
+
+def test_pool_runs_job_and_stores_result(job_sessions):
+    db_session = job_sessions()
+    pool = job_queue.JobWorkerPool(job_sessions)
+    job = job_queue.enqueue_job(db_session, "test_echo", {"name": "reporte"})
+
+    assert pool.run_once() is True
+    assert pool.run_once() is False
+
+    db_session.expire_all()
+    job = job_queue.get_job(db_session, job.id)
+    assert job.status is models.BackgroundJobStatus.COMPLETED
+    assert job.progress == 100
+    assert job.progress_message == "Procesando"
+    assert job.attempts == 1
+    assert job.result_filename == "eco.txt"
+    with open(job.result_path, "rb") as handle:
+        assert handle.read() == b"reporte"
+    assert job.expires_at - job.finished_at == timedelta(hours=24)
+
+
+def test_failed_job_backs_off_then_fails(job_sessions):
+    db_session = job_sessions()
+    job = job_queue.enqueue_job(db_session, "test_flaky", max_attempts=2)
+
+    job = job_queue.run_job_now(db_session, job.id)
+    assert job.status is models.BackgroundJobStatus.QUEUED
+    assert job.attempts == 1
+    assert "RuntimeError: temporal" in job.error
+    assert job.available_at >= datetime.utcnow() + timedelta(seconds=25)
+    # Durante la espera ningún worker lo toma.
+    assert job_queue.claim_next_job(db_session, worker_id="w") is None
+
+    job.available_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+    claimed = job_queue.claim_next_job(db_session, worker_id="w")
+    job = job_queue.execute_job(db_session, claimed)
+
+    assert job.status is models.BackgroundJobStatus.FAILED
+    assert job.attempts == 2
+    assert job.finished_at is not None
+
+
+def test_stale_jobs_are_requeued_and_expired_jobs_pruned(job_sessions):
+    db_session = job_sessions()
+    stale = job_queue.enqueue_job(db_session, "test_echo", {"name": "caido"})
+    job_queue.claim_job(db_session, stale.id, worker_id="proceso-caido")
+    stale.heartbeat_at = datetime.utcnow() - timedelta(
+        seconds=settings.job_stale_after_seconds + 5
+    )
+    db_session.commit()
+
+    assert job_queue.requeue_stale_jobs(db_session) == 1
+    db_session.refresh(stale)
+    assert stale.status is models.BackgroundJobStatus.QUEUED
+    assert stale.worker_id is None
+
+    done = job_queue.run_job_now(db_session, stale.id)
+    job_id, result_path = done.id, done.result_path
+    done.expires_at = datetime.utcnow() - timedelta(minutes=1)
+    db_session.commit()
+
+    assert job_queue.prune_expired_jobs(db_session) == 1
+    with job_sessions() as fresh, pytest.raises(LookupError):
+        job_queue.get_job(fresh, job_id)
+    assert not job_queue.Path(result_path).exists()
+
+
+def test_inline_job_keeps_its_heartbeat_while_running(job_sessions, monkeypatch):
+    monkeypatch.setattr(settings, "job_stale_after_seconds", 1)
+    _inline_requeued.clear()
+    _inline_sessions[:] = [job_sessions]
+    db_session = job_sessions()
+    job = job_queue.enqueue_job(db_session, "test_slow_inline")
+
+    job = job_queue.run_job_now(db_session, job.id)
+
+    # Otro proceso revisó la cola después del corte de 1 s y no lo reencoló.
+    assert _inline_requeued == [0]
+    assert job.status is models.BackgroundJobStatus.COMPLETED
+    assert job.attempts == 1
+
+
+def test_worker_threads_pick_up_enqueued_jobs(job_sessions):
+    pool = job_queue.JobWorkerPool(job_sessions, workers=1, poll_interval_seconds=0.05)
+    pool.start()
+    try:
+        with job_sessions() as db:
+            job = job_queue.enqueue_job(db, "test_echo", {"name": "hilo"})
+        pool.wake()
+        assert _finished.wait(timeout=10)
+    finally:
+        pool.stop()
+    with job_sessions() as db:
+        assert job_queue.get_job(db, job.id).status is models.BackgroundJobStatus.COMPLETED
+    assert _calls == ["hilo"]
+
+
+def test_jobs_endpoints_expose_status_and_download(client, db_session):
+    headers = _auth_headers(client)
+    response = client.post(
+        "/reports/global/export/async",
+        params={"format": "csv"},
+        headers={**headers, "X-Reason": "Reporte global en segundo plano"},
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job_id = response.json()["id"]
+    assert response.json()["status"] == "queued"
+
+    pending = client.get(f"/jobs/{job_id}/download", headers=headers)
+    assert pending.status_code == status.HTTP_409_CONFLICT
+
+    job_queue.run_job_now(db_session, job_id)
+
+    detail = client.get(f"/jobs/{job_id}", headers=headers)
+    assert detail.status_code == status.HTTP_200_OK
+    assert detail.json()["status"] == "completed"
+    assert detail.json()["result_filename"] == "softmobile_reporte_global.csv"
+    listing = client.get("/jobs", params={"job_type": "global_report"}, headers=headers)
+    assert [item["id"] for item in listing.json()] == [job_id]
+
+    download = client.get(f"/jobs/{job_id}/download", headers=headers)
+    assert download.status_code == status.HTTP_200_OK
+    assert download.headers["content-type"].startswith("text/csv")
+    assert download.headers["accept-ranges"] == "bytes"
+    assert len(download.content) > 0
+
+    assert client.get("/jobs/no-existe", headers=headers).status_code == 404
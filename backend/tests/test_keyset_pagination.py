@@ -0,0 +1,201 @@
+"""Pruebas de la paginación por cursor y de los totales estimados."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from fastapi import status
+from sqlalchemy import text
+
+from backend.app import models, schemas
+from backend.app.core.roles import ADMIN
+from backend.app.crud import audit as audit_crud
+from backend.app.crud import devices as devices_crud
+from backend.app.crud import sync as sync_crud
+from backend.app.services import page_totals
+
+
+def _walk(fetch, encode, size: int) -> list[int]:
+    seen: list[int] = []
+    cursor = ""
+    while True:
+        page = fetch(cursor, size)
+        seen.extend(item.id for item in page)
+        if len(page) < size:
+            return seen
+        cursor = encode(page[-1])
+
+
+def test_cursor_walks_listings_in_stable_order(db_session):
+    moment = datetime(2026, 10, 16, 12, 0, 0)
+    logs = [
+        models.AuditLog(
+            action="store_updated",
+            entity_type="store",
+            entity_id=str(index),
+            created_at=moment,
+        )
+        for index in range(5)
+    ]
+    outbox = [
+        models.SyncOutbox(
+            entity_type="device",
+            entity_id=str(index),
+            operation="UPSERT",
+            payload={"index": index},
+            priority=priority,
+            conflict_flag=index == 3,
+            updated_at=moment,
+        )
+        for index, priority in enumerate(
+            [
+                models.SyncOutboxPriority.LOW,
+                models.SyncOutboxPriority.HIGH,
+                models.SyncOutboxPriority.NORMAL,
+                models.SyncOutboxPriority.NORMAL,
+                models.SyncOutboxPriority.HIGH,
+            ]
+        )
+    ]
+    store = models.Store(name="Sucursal Cursor", location="Centro", code="CUR-001")
+    db_session.add_all([*logs, *outbox, store])
+    db_session.commit()
+    devices = [
+        devices_crud.create_device(
+            db_session,
+            store.id,
+            schemas.DeviceCreate(sku=f"CUR-{index}", name=name, quantity=1, unit_price=10),
+        )
+        for index, name in enumerate(["Moto G", "Galaxy", "Moto G", "Xperia"])
+    ]
+
+    # Registros con la misma fecha se desempatan por id descendente.
+    audit_ids = _walk(
+        lambda cursor, size: audit_crud.list_audit_logs(
+            db_session, action="store_updated", cursor=cursor, limit=size
+        ),
+        audit_crud.encode_audit_log_cursor,
+        2,
+    )
+    assert audit_ids == sorted((log.id for log in logs), reverse=True)
+
+    outbox_ids = _walk(
+        lambda cursor, size: sync_crud.list_sync_outbox_by_cursor(
+            db_session, cursor=cursor, limit=size
+        ),
+        sync_crud.encode_sync_outbox_cursor,
+        2,
+    )
+    # Prioridad alta primero, conflictos antes dentro de la misma prioridad.
+    assert outbox_ids == [outbox[4].id, outbox[1].id, outbox[3].id, outbox[2].id, outbox[0].id]
+
+    device_ids = _walk(
+        lambda cursor, size: devices_crud.list_devices(
+            db_session, store.id, cursor=cursor, limit=size
+        ),
+        devices_crud.encode_device_cursor,
+        3,
+    )
+    assert device_ids == [devices[1].id, devices[0].id, devices[2].id, devices[3].id]
+
+    with pytest.raises(ValueError, match="invalid_cursor"):
+        audit_crud.list_audit_logs(db_session, cursor="no-es-un-cursor")
+
+
+def test_total_estimates_use_statistics_and_cache(db_session):
+    db_session.add_all(
+        models.AuditLog(action="login", entity_type="user", entity_id=str(index))
+        for index in range(3)
+    )
+    db_session.commit()
+    page_totals.invalidate_total_estimates()
+    count_calls: list[int] = []
+
+    def _count() -> int:
+        count_calls.append(1)
+        return audit_crud.count_audit_logs(db_session, action="login")
+
+    filters = {"action": "login", "module": None}
+    assert page_totals.resolve_total(
+        db_session, "estimate", table="audit_logs", filters=filters, count=_count
+    ) == (3, True)
+    db_session.add(models.AuditLog(action="login", entity_type="user", entity_id="4"))
+    db_session.commit()
+    # El conteo filtrado se reutiliza hasta que expira o se invalida.
+    assert page_totals.resolve_total(
+        db_session, "estimate", table="audit_logs", filters=filters, count=_count
+    ) == (3, True)
+    assert len(count_calls) == 1
+    assert page_totals.resolve_total(
+        db_session, "exact", table="audit_logs", filters=filters, count=_count
+    ) == (4, False)
+    assert page_totals.resolve_total(
+        db_session, "none", table="audit_logs", filters=filters, count=_count
+    ) == (None, False)
+
+    db_session.execute(text("ANALYZE"))
+    assert page_totals.table_statistics_rows(db_session, "audit_logs") == 4
+    page_totals.invalidate_total_estimates("audit_logs")
+    total, estimated = page_totals.resolve_total(
+        db_session, "estimate", table="audit_logs", filters={}, count=_count
+    )
+    assert (total, estimated) == (4, True)
+    assert len(count_calls) == 2
+    page_totals.invalidate_total_estimates()
+
+
+def test_reports_audit_cursor_mode(client, db_session):
+    credentials = {
+        "username": "cursor_admin",
+        "password": "Cursor123*",
+        "full_name": "Admin Cursor",
+        "roles": [ADMIN],
+    }
+    assert client.post("/auth/bootstrap", json=credentials).status_code == status.HTTP_201_CREATED
+    token = client.post(
+        "/auth/token",
+        data={"username": credentials["username"], "password": credentials["password"]},
+        headers={"content-type": "application/x-www-form-urlencoded"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}", "X-Reason": "Revision auditoria"}
+    db_session.add_all(
+        models.AuditLog(action="price_changed", entity_type="device", entity_id=str(index))
+        for index in range(3)
+    )
+    db_session.commit()
+
+    params = {"action": "price_changed", "size": 2, "cursor": ""}
+    first = client.get("/reports/audit", params=params, headers=headers)
+    assert first.status_code == status.HTTP_200_OK
+    body = first.json()
+    assert [item["entity_id"] for item in body["items"]] == ["2", "1"]
+    assert body["total"] == 3 and body["total_estimated"] is False
+    assert body["has_next"] is True and body["next_cursor"]
+
+    second = client.get(
+        "/reports/audit",
+        params={**params, "cursor": body["next_cursor"], "count": "none"},
+        headers=headers,
+    ).json()
+    assert [item["entity_id"] for item in second["items"]] == ["0"]
+    assert second["total"] is None and second["pages"] is None
+    assert second["has_next"] is False and second["next_cursor"] is None
+
+    invalid = client.get(
+        "/reports/audit", params={**params, "cursor": "x"}, headers=headers
+    )
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    listed = client.get(
+        "/audit/logs",
+        params={"action": "price_changed", "limit": 2, "cursor": ""},
+        headers=headers,
+    )
+    assert [item["entity_id"] for item in listed.json()] == ["2", "1"]
+    rest = client.get(
+        "/audit/logs",
+        params={"action": "price_changed", "limit": 2, "cursor": listed.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert [item["entity_id"] for item in rest.json()] == ["0"]
+    assert "X-Next-Cursor" not in rest.headers
@@ -0,0 +1,80 @@
+"""Pruebas del espacio de nombres perezoso de crud y del reporte de arranque."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from backend.app import crud
+from backend.app.crud import _index
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess[str]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(PROJECT_ROOT)
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+        check=False,
+    )
+
+
+def test_crud_index_is_up_to_date() -> None:
+    proc = subprocess.run(
+        [sys.executable, "backend/scripts/generate_crud_index.py", "--check"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_crud_resolves_symbols_from_specialized_modules() -> None:
+    from backend.app.crud import users
+
+    assert _index.SYMBOLS["get_user_by_username"] == ".users"
+    assert crud.get_user_by_username is users.get_user_by_username
+    assert "get_user_by_username" in dir(crud)
+
+
+def test_crud_import_does_not_load_legacy_or_renderers() -> None:
+    proc = _run_python(
+        "import sys\n"
+        "import backend.app.crud\n"
+        "import backend.app.services.sales_reports\n"
+        "loaded = [name for name in sys.modules if name.split('.')[0] in {'reportlab', 'openpyxl'}]\n"
+        "assert 'backend.app.crud_legacy' not in sys.modules\n"
+        "assert not loaded, loaded\n"
+    )
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_startup_profile_reports_module_breakdown() -> None:
+    sys.path.insert(0, str(PROJECT_ROOT / "backend" / "scripts"))
+    try:
+        import startup_profile
+    finally:
+        sys.path.pop(0)
+
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       500 |        500 | site",
+            "import time:      1000 |       1000 |     backend.app.utils",
+            "import time:      2000 |       3000 |   backend.app",
+            "import time:       400 |       3400 | backend",
+        ]
+    )
+    timings = startup_profile.parse_importtime(output)
+    report = startup_profile.build_report("backend", timings, top=5)
+
+    assert [timing.module for timing in timings] == ["backend.app.utils", "backend.app", "backend"]
+    assert report["total_ms"] == 3.4
+    assert report["packages"] == {"backend.app": 2.0, "backend.app.utils": 1.0, "backend": 0.4}
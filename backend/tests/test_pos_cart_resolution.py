@@ -0,0 +1,187 @@
+"""Pruebas de la resolución por lotes del carrito POS y de la configuración compilada."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend.app import models, schemas
+from backend.app.crud.pos import get_pos_config, resolve_devices_for_pos
+from backend.app.services import pos_config_cache, promotions
+
+
+@contextmanager
+def _count_queries(db_session) -> Iterator[list[str]]:
+    statements: list[str] = []
+    engine = db_session.get_bind()
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _create_store(db_session, devices: int) -> tuple[models.Store, list[models.Device]]:
+    store = models.Store(
+        name="Carrito Norte",
+        code="CAR-001",
+        timezone="UTC",
+        inventory_value=Decimal("0"),
+    )
+    created = [
+        models.Device(
+            store=store,
+            sku=f"CAR-{index:03d}",
+            name=f"Equipo {index}",
+            quantity=5,
+            unit_price=Decimal("100.00"),
+            imei=f"35000000000{index:04d}" if index % 2 else None,
+        )
+        for index in range(devices)
+    ]
+    db_session.add_all([store, *created])
+    db_session.flush()
+    return store, created
+
+
+def test_cart_lines_are_resolved_with_constant_queries(db_session):
+    store, devices = _create_store(db_session, 40)
+    identified = devices[0]
+    db_session.add(
+        models.DeviceIdentifier(producto_id=identified.id, imei_1="490154203237518")
+    )
+    db_session.flush()
+
+    def _lookups(size: int) -> list[tuple[int | None, str | None]]:
+        lookups: list[tuple[int | None, str | None]] = [(None, " 490154203237518 ")]
+        for device in devices[1:size]:
+            if device.imei:
+                lookups.append((None, device.imei.upper()))
+            else:
+                lookups.append((device.id, None))
+        return lookups
+
+    store_id = store.id
+    counts = []
+    for size in (3, 40):
+        lookups = _lookups(size)
+        expected = [identified.id] + [device.id for device in devices[1:size]]
+        db_session.expire_all()
+        with _count_queries(db_session) as statements:
+            resolved = resolve_devices_for_pos(db_session, store_id=store_id, lookups=lookups)
+            resolved_ids = [device.id for device in resolved]
+        counts.append(len(statements))
+        assert resolved_ids == expected
+    assert counts[0] == counts[1] == 2
+
+    with pytest.raises(LookupError):
+        resolve_devices_for_pos(
+            db_session, store_id=store.id, lookups=[(devices[2].id, None), (None, "999")]
+        )
+    devices[2].is_deleted = True
+    db_session.flush()
+    with pytest.raises(LookupError):
+        resolve_devices_for_pos(db_session, store_id=store.id, lookups=[(devices[2].id, None)])
+
+
+def test_pos_config_is_compiled_once_per_version(db_session):
+    store, devices = _create_store(db_session, 2)
+    config = models.POSConfig(
+        store=store,
+        invoice_prefix="CAR",
+        promotions_config={
+            "feature_flags": {"volume": True},
+            "volume_promotions": [
+                {
+                    "id": "VOL",
+                    "device_id": devices[0].id,
+                    "min_quantity": 2,
+                    "discount_percent": 10,
+                }
+            ],
+        },
+    )
+    db_session.add(config)
+    db_session.flush()
+
+    get_pos_config(db_session, store.id)
+    compiled = pos_config_cache.get_compiled(config)
+    with _count_queries(db_session) as statements:
+        assert get_pos_config(db_session, store.id) is config
+    assert len(statements) == 1
+    assert pos_config_cache.get_compiled(config) is compiled
+    assert compiled.promotions.volume_device_ids == {devices[0].id}
+
+    config.promotions_config = {"feature_flags": {"coupons": True}}
+    config.updated_at = datetime.now(timezone.utc) + timedelta(seconds=1)
+    db_session.flush()
+    recompiled = pos_config_cache.get_compiled(get_pos_config(db_session, store.id))
+    assert recompiled is not compiled
+    assert recompiled.promotions.volume_rules == ()
+
+    assert pos_config_cache.invalidate_store(store.id) >= 1
+    assert pos_config_cache.get_compiled(config) is not recompiled
+
+
+def test_promotions_do_not_modify_the_request():
+    config = schemas.POSPromotionsConfig.model_validate(
+        {
+            "feature_flags": {"volume": True, "combos": True, "coupons": True},
+            "volume_promotions": [
+                {"id": "VOL", "device_id": 1, "min_quantity": 2, "discount_percent": 10}
+            ],
+            "combo_promotions": [
+                {
+                    "id": "COMBO",
+                    "items": [{"device_id": 2, "quantity": 1}, {"device_id": 3, "quantity": 1}],
+                    "discount_percent": 15,
+                }
+            ],
+            "coupons": [{"code": "Bienvenida", "discount_percent": 5}],
+        }
+    )
+    request = schemas.POSSaleRequest.model_validate(
+        {
+            "store_id": 1,
+            "payment_method": "EFECTIVO",
+            "items": [
+                {"device_id": 1, "quantity": 3},
+                {"device_id": 2, "quantity": 1},
+                {"device_id": 3, "quantity": 1},
+                {"device_id": 4, "quantity": 1},
+            ],
+            "coupons": [" bienvenida "],
+        }
+    )
+    before = request.model_dump()
+    switches = promotions.PromotionFeatureSwitches(volume=True, combos=True, coupons=True)
+
+    from_schema = promotions.apply_promotions(request, config=config, switches=switches)
+    compiled = promotions.apply_promotions(
+        request, config=promotions.compile_promotions(config), switches=switches
+    )
+
+    assert request.model_dump() == before
+    assert from_schema.sale_request.model_dump() == compiled.sale_request.model_dump()
+    items = compiled.sale_request.items
+    assert [item.discount_percent for item in items[:3]] == [
+        Decimal("10"),
+        Decimal("15"),
+        Decimal("15"),
+    ]
+    assert items[3] is request.items[3]
+    assert compiled.sale_request.coupons == ["Bienvenida"]
+    assert compiled.sale_request.discount_percent == Decimal("5")
+    assert [app.promotion_id for app in compiled.applications] == [
+        "VOL",
+        "COMBO",
+        "Bienvenida",
+    ]
@@ -0,0 +1,129 @@
+"""Pruebas de la caché de recibos POS."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from backend.app import models
+from backend.app.config import settings
+from backend.app.crud.sales import cancel_sale
+from backend.app.services import pos_receipt_cache, pos_receipts
+
+
+@pytest.fixture()
+def receipt_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "recibos"
+    monkeypatch.setattr(settings, "pos_receipt_cache_directory", str(directory))
+    return directory
+
+
+def _create_sale(db_session) -> tuple[models.Sale, models.POSConfig]:
+    store = models.Store(
+        name="Recibos Centro",
+        code="REC-001",
+        timezone="UTC",
+        inventory_value=Decimal("0"),
+    )
+    device = models.Device(
+        store=store,
+        sku="REC-01",
+        name="Teléfono recibo",
+        quantity=5,
+        unit_price=Decimal("150.00"),
+    )
+    sale = models.Sale(
+        store=store,
+        customer_name="Cliente mostrador",
+        payment_method=models.PaymentMethod.EFECTIVO,
+        subtotal_amount=Decimal("150.00"),
+        tax_amount=Decimal("0"),
+        total_amount=Decimal("150.00"),
+    )
+    sale.items.append(
+        models.SaleItem(
+            device=device,
+            quantity=1,
+            unit_price=Decimal("150.00"),
+            total_line=Decimal("150.00"),
+        )
+    )
+    config = models.POSConfig(store=store, invoice_prefix="REC", tax_rate=Decimal("0"))
+    db_session.add_all([store, device, sale, config])
+    db_session.flush()
+    return sale, config
+
+
+def _entries(db_session, sale_id: int) -> list[models.POSReceiptCacheEntry]:
+    return list(
+        db_session.scalars(
+            select(models.POSReceiptCacheEntry).where(
+                models.POSReceiptCacheEntry.sale_id == sale_id
+            )
+        )
+    )
+
+
+def test_receipt_is_rendered_once_and_reused(db_session, receipt_dir, monkeypatch):
+    sale, config = _create_sale(db_session)
+
+    stored = pos_receipt_cache.render_receipt(db_session, sale, config)
+    assert stored.pdf.startswith(b"%PDF")
+    assert "REC-" in stored.escpos
+    [entry] = _entries(db_session, sale.id)
+    assert (receipt_dir / entry.content_hash[:2] / f"{entry.content_hash}.pdf").exists()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("el recibo debía salir de la caché")
+
+    monkeypatch.setattr(pos_receipts, "render_receipt_pdf", _fail)
+    reprint = pos_receipt_cache.get_receipt(db_session, sale, config)
+    assert reprint == stored
+    assert reprint.pdf_base64
+
+
+def test_config_change_renders_new_version(db_session, receipt_dir):
+    sale, config = _create_sale(db_session)
+    first = pos_receipt_cache.render_receipt(db_session, sale, config)
+    old_hash = _entries(db_session, sale.id)[0].content_hash
+
+    config.invoice_prefix = "NVO"
+    db_session.flush()
+    assert pos_receipt_cache.load_receipt(db_session, sale, config) is None
+
+    second = pos_receipt_cache.get_receipt(db_session, sale, config)
+    assert second.pdf != first.pdf
+    [entry] = _entries(db_session, sale.id)
+    assert entry.config_version == pos_receipt_cache.config_version(config)
+    assert not (receipt_dir / old_hash[:2] / f"{old_hash}.pdf").exists()
+
+    assert pos_receipt_cache.invalidate_store(db_session, sale.store_id) == 1
+    assert _entries(db_session, sale.id) == []
+
+
+def test_sale_cancellation_invalidates_receipt(db_session, receipt_dir):
+    sale, config = _create_sale(db_session)
+    pos_receipt_cache.render_receipt(db_session, sale, config)
+
+    cancel_sale(db_session, sale.id, performed_by_id=None, reason="Error de cobro")
+
+    assert _entries(db_session, sale.id) == []
+    assert pos_receipt_cache.load_receipt(db_session, sale, config) is None
+
+
+def test_missing_file_and_pruning(db_session, receipt_dir):
+    sale, config = _create_sale(db_session)
+    pos_receipt_cache.render_receipt(db_session, sale, config)
+    [entry] = _entries(db_session, sale.id)
+
+    (receipt_dir / entry.content_hash[:2] / f"{entry.content_hash}.pdf").unlink()
+    assert pos_receipt_cache.load_receipt(db_session, sale, config) is None
+    regenerated = pos_receipt_cache.get_receipt(db_session, sale, config)
+    assert regenerated.pdf.startswith(b"%PDF")
+
+    future = datetime.now(timezone.utc) + timedelta(days=1)
+    assert pos_receipt_cache.prune_receipt_cache(db_session, older_than=future) == 1
+    assert _entries(db_session, sale.id) == []
+    assert not any(receipt_dir.rglob("*.pdf"))
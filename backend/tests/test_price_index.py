@@ -0,0 +1,242 @@
+"""Pruebas del índice compilado de listas de precios."""
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, update
+
+from backend.app import models
+from backend.app.services import price_index, pricing
+
+
+@pytest.fixture(autouse=True)
+def _clean_index():
+    price_index.invalidate()
+    yield
+    price_index.invalidate()
+
+
+@contextmanager
+def _count_queries(db_session) -> Iterator[list[str]]:
+    statements: list[str] = []
+    engine = db_session.get_bind()
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def _reference(db_session, device, *, store_id, customer_id):
+    """Resolución previa: una consulta de listas y otra de precios por dispositivo."""
+
+    price_lists = pricing.list_applicable_price_lists(
+        db_session, store_id=store_id, customer_id=customer_id
+    )
+    items = {
+        item.price_list_id: item
+        for item in device.price_list_items
+        if item.price_list_id in {price_list.id for price_list in price_lists}
+    }
+    for price_list in sorted(
+        price_lists, key=lambda pl: (pricing._scope_rank(pl), pl.priority, pl.id)
+    ):
+        if price_list.id in items:
+            return price_list.id, items[price_list.id].id
+    return None
+
+
+def _catalog(db_session, *, devices: int, lists: int, seed: int = 11):
+    rng = random.Random(seed)
+    stores = [
+        models.Store(name=f"Precios {index}", code=f"PRC-{index}", timezone="UTC")
+        for index in range(2)
+    ]
+    customers = [
+        models.Customer(name=f"Cliente precios {index}", phone=f"55000000{index:02d}")
+        for index in range(2)
+    ]
+    db_session.add_all([*stores, *customers])
+    db_session.flush()
+    catalog = [
+        models.Device(
+            store=stores[0],
+            sku=f"PRC-{index:04d}",
+            name=f"Equipo {index}",
+            quantity=1,
+            unit_price=Decimal("100.00"),
+        )
+        for index in range(devices)
+    ]
+    db_session.add_all(catalog)
+    db_session.flush()
+    now = datetime.now(timezone.utc)
+    for index in range(lists):
+        starts_at = ends_at = None
+        window = rng.random()
+        if window < 0.15:
+            starts_at = now + timedelta(hours=2)
+        elif window < 0.3:
+            ends_at = now - timedelta(hours=2)
+        elif window < 0.45:
+            starts_at, ends_at = now - timedelta(days=1), now + timedelta(days=1)
+        price_list = models.PriceList(
+            name=f"Lista {index}",
+            priority=rng.choice([10, 50, 100]),
+            is_active=rng.random() > 0.15,
+            store_id=rng.choice([None, stores[0].id, stores[1].id]),
+            customer_id=rng.choice([None, None, customers[0].id]),
+            starts_at=starts_at,
+            ends_at=ends_at,
+        )
+        db_session.add(price_list)
+        db_session.flush()
+        db_session.add_all(
+            models.PriceListItem(
+                price_list_id=price_list.id,
+                device_id=device.id,
+                price=Decimal(rng.randint(50, 150)),
+                discount_percentage=rng.choice([None, Decimal("5")]),
+            )
+            for device in rng.sample(catalog, k=max(1, devices // 2))
+        )
+    db_session.flush()
+    return stores, customers, catalog
+
+
+def test_index_matches_per_device_resolution(db_session):
+    stores, customers, catalog = _catalog(db_session, devices=30, lists=25)
+
+    for store_id in (None, stores[0].id, stores[1].id):
+        for customer_id in (None, customers[0].id, customers[1].id):
+            resolved = pricing.resolve_prices_for_devices(
+                db_session, catalog, store_id=store_id, customer_id=customer_id
+            )
+            for device in catalog:
+                expected = _reference(
+                    db_session, device, store_id=store_id, customer_id=customer_id
+                )
+                match = resolved.get(device.id)
+                actual = (match[0].id, match[1].id) if match else None
+                assert actual == expected
+                effective = pricing.compute_effective_price(
+                    db_session, device, store_id=store_id, customer_id=customer_id
+                )
+                assert effective == (match[1].price if match else device.unit_price)
+
+
+def test_bulk_resolution_uses_constant_queries(db_session):
+    stores, customers, catalog = _catalog(db_session, devices=200, lists=6)
+    device_ids = [device.id for device in catalog]
+    store_id, customer_id = stores[0].id, customers[0].id
+
+    with _count_queries(db_session) as first:
+        resolutions = pricing.resolve_device_prices(
+            db_session, device_ids, store_id=store_id, customer_id=customer_id
+        )
+    # Versión, índice base de la sucursal e índice del cliente.
+    assert len(first) == 3
+    with _count_queries(db_session) as cached:
+        page = pricing.resolve_device_prices(
+            db_session, device_ids[:5], store_id=store_id, customer_id=customer_id
+        )
+    assert len(cached) == 1
+    assert page == {
+        device_id: resolutions[device_id]
+        for device_id in device_ids[:5]
+        if device_id in resolutions
+    }
+
+    resolution = next(iter(resolutions.values()))
+    assert resolution.source == "price_list"
+    assert resolution.final_price <= resolution.base_price
+
+    missing = catalog[-1].id + 1000
+    fallback = pricing.resolve_device_prices(
+        db_session,
+        [missing],
+        default_prices={missing: Decimal("99.999")},
+        default_currency="usd",
+    )
+    assert fallback[missing].scope == "fallback"
+    assert fallback[missing].final_price == Decimal("100.00")
+    assert fallback[missing].currency == "USD"
+
+
+def test_another_customer_reuses_the_store_index(db_session):
+    stores, customers, catalog = _catalog(db_session, devices=60, lists=12, seed=5)
+    own_list = models.PriceList(
+        name="Mayorista", priority=100, store_id=stores[0].id, customer_id=customers[1].id
+    )
+    db_session.add(own_list)
+    db_session.flush()
+    db_session.add(
+        models.PriceListItem(
+            price_list_id=own_list.id, device_id=catalog[0].id, price=Decimal("1.00")
+        )
+    )
+    db_session.flush()
+    store_id = stores[0].id
+
+    first = price_index.get_index(db_session, store_id=store_id, customer_id=customers[0].id)
+    with _count_queries(db_session) as statements:
+        second = price_index.get_index(
+            db_session, store_id=store_id, customer_id=customers[1].id
+        )
+    # Sólo la versión y las listas del segundo cliente: los precios globales
+    # y de la sucursal no se vuelven a cargar.
+    assert len(statements) == 2
+    assert "price_lists.customer_id = " in statements[1]
+    assert second.base is first.base
+    assert first.base is price_index.get_index(db_session, store_id=store_id)
+    assert set(second.candidates) == {catalog[0].id}
+
+    now = datetime.now(timezone.utc)
+    assert second.lookup(catalog[0].id, now).price_list_id == own_list.id
+    for device in catalog[1:]:
+        expected = _reference(
+            db_session, device, store_id=store_id, customer_id=customers[1].id
+        )
+        entry = second.lookup(device.id, now)
+        assert ((entry.price_list_id, entry.item_id) if entry else None) == expected
+
+
+def test_price_list_changes_rebuild_the_index(db_session):
+    stores, _customers, catalog = _catalog(db_session, devices=4, lists=1)
+    device = catalog[0]
+    price_list = models.PriceList(name="Liquidación", priority=1, store_id=stores[0].id)
+    db_session.add(price_list)
+    db_session.flush()
+    first = price_index.get_index(db_session, store_id=stores[0].id)
+    assert price_index.get_index(db_session, store_id=stores[0].id) is first
+    assert all(
+        entry.price_list_id != price_list.id
+        for entry in first.candidates.get(device.id, ())
+    )
+
+    # Un precio agregado desde otro worker sólo actualiza ``updated_at`` de la lista.
+    item = models.PriceListItem(
+        price_list_id=price_list.id, device_id=device.id, price=Decimal("10.00")
+    )
+    db_session.add(item)
+    db_session.execute(
+        update(models.PriceList)
+        .where(models.PriceList.id == price_list.id)
+        .values(updated_at=datetime.now(timezone.utc) + timedelta(seconds=1))
+    )
+    db_session.flush()
+    rebuilt = price_index.get_index(db_session, store_id=stores[0].id)
+    assert rebuilt is not first
+    assert rebuilt.lookup(device.id, datetime.now(timezone.utc)).item_id == item.id
+
+    assert price_index.invalidate() >= 1
+    assert price_index.get_index(db_session, store_id=stores[0].id) is not rebuilt
@@ -0,0 +1,120 @@
+"""Pruebas de la cache de principales autenticados y la actividad diferida."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi import status
+
+from backend.app.core.principal_cache import (
+    CachedPrincipal,
+    PrincipalCache,
+    SessionActivityBuffer,
+    principal_cache,
+)
+from backend.app.core.roles import ADMIN
+
+
+def _principal(token: str, *, session_id: int = 1, user_id: int = 1) -> CachedPrincipal:
+    return CachedPrincipal(
+        session_token=token,
+        session_id=session_id,
+        user_id=user_id,
+        username=f"user-{user_id}",
+        user=object(),
+        roles=frozenset({ADMIN}),
+        store_ids=frozenset(),
+    )
+
+
+def test_principal_cache_evicts_least_recently_used() -> None:
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+    cache.put(_principal("a", session_id=1))
+    cache.put(_principal("b", session_id=2))
+    assert cache.get("a") is not None
+
+    cache.put(_principal("c", session_id=3))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_principal_cache_invalidates_by_user_and_session() -> None:
+    cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+    cache.put(_principal("a", session_id=1, user_id=7))
+    cache.put(_principal("b", session_id=2, user_id=7))
+    cache.put(_principal("c", session_id=3, user_id=8))
+
+    cache.invalidate_session(3)
+    assert cache.get("c") is None
+
+    cache.invalidate_user(7)
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert len(cache) == 0
+
+
+def test_principal_cache_disabled_with_zero_ttl() -> None:
+    cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+    cache.put(_principal("a"))
+    assert cache.get("a") is None
+
+
+def test_session_activity_buffer_coalesces_by_session() -> None:
+    buffer = SessionActivityBuffer(flush_seconds=3600, batch_size=3)
+    first = datetime.now(timezone.utc)
+    buffer.record(1, first)
+    buffer.record(1, first + timedelta(seconds=5))
+    buffer.record(2, first)
+
+    assert len(buffer) == 2
+    assert buffer.is_due() is False
+
+    buffer.record(3, first)
+    assert buffer.is_due() is True
+
+    drained = buffer.drain()
+    assert drained[1] == first + timedelta(seconds=5)
+    assert len(buffer) == 0
+
+
+def test_cached_principal_is_invalidated_on_session_revocation(client) -> None:
+    payload = {
+        "username": "cache.principal@example.com",
+        "password": "CachePrincipal123$",
+        "full_name": "Admin Cache",
+        "roles": [ADMIN],
+    }
+    created = client.post("/auth/bootstrap", json=payload)
+    assert created.status_code == status.HTTP_201_CREATED
+
+    login_response = client.post(
+        "/auth/token",
+        data={"username": payload["username"], "password": payload["password"]},
+        headers={"content-type": "application/x-www-form-urlencoded"},
+    )
+    assert login_response.status_code == status.HTTP_200_OK
+    token_data = login_response.json()
+    headers = {
+        "Authorization": f"Bearer {token_data['access_token']}",
+        "X-Reason": "Validar cache de sesion",
+    }
+
+    first = client.get("/auth/me", headers=headers)
+    assert first.status_code == status.HTTP_200_OK
+    assert len(principal_cache) == 1
+
+    second = client.get("/auth/me", headers=headers)
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json()["username"] == payload["username"]
+
+    revoke_response = client.post(
+        f"/security/sessions/{token_data['session_id']}/revoke",
+        json={"reason": "Revocacion de prueba"},
+        headers=headers,
+    )
+    assert revoke_response.status_code == status.HTTP_200_OK
+    assert len(principal_cache) == 0
+
+    after_revoke = client.get("/auth/me", headers=headers)
+    assert after_revoke.status_code == status.HTTP_401_UNAUTHORIZED
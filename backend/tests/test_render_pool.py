@@ -0,0 +1,84 @@
+"""Pruebas del pool de procesos para generar PDF y XLSX."""
+from __future__ import annotations
+
+import time
+from io import BytesIO
+
+import pytest
+from openpyxl import load_workbook
+
+from backend.app import schemas, telemetry
+from backend.app.services import fiscal_books, inventory_catalog_export, render_pool
+
+
+def _empty_fiscal_book() -> schemas.FiscalBookReport:
+    filters = schemas.FiscalBookFilters(
+        year=2026, month=10, book_type=schemas.FiscalBookType.SALES
+    )
+    return fiscal_books.build_sales_fiscal_book([], filters)
+
+
+@pytest.fixture()
+def pool():
+    render_pool_instance = render_pool.RenderPool(1, timeout_seconds=60)
+    yield render_pool_instance
+    render_pool_instance.shutdown()
+
+
+def _render_count(renderer: str, mode: str) -> float:
+    return (
+        telemetry.get_metric_value(
+            "softmobile_render_seconds_count", {"renderer": renderer, "mode": mode}
+        )
+        or 0.0
+    )
+
+
+def test_pool_renders_pdf_and_xlsx_in_worker_process(pool):
+    report = _empty_fiscal_book()
+    before = _render_count("fiscal_books.render_fiscal_book_pdf", "process")
+
+    pdf_bytes = pool.run(
+        fiscal_books.render_fiscal_book_pdf, (report,), {}, output_path=None
+    )
+
+    assert pdf_bytes.startswith(b"%PDF")
+    assert _render_count("fiscal_books.render_fiscal_book_pdf", "process") == before + 1
+    assert pool.pending == 0
+
+    # Con RENDER_WORKERS=0 (pruebas) render_file genera en el mismo proceso.
+    rows_csv = b"SKU-1,Equipo,Marca,,3,1500.5,,SER-1\r\n"
+    with render_pool.render_file(
+        inventory_catalog_export.write_devices_catalog_xlsx, rows_csv
+    ) as workbook_file:
+        sheet = load_workbook(BytesIO(workbook_file.read()))["Catalogo"]
+    assert [cell.value for cell in sheet[2]] == [
+        "SKU-1", "Equipo", "Marca", None, 3, 1500.5, None, "SER-1"
+    ]
+
+
+def test_renderer_errors_keep_their_type(pool):
+    with pytest.raises(ValueError):
+        pool.run(int, ("no-es-numero",), {}, output_path=None)
+    # El proceso sigue disponible después de un error del generador.
+    assert pool.run(bytes, (b"ok",), {}, output_path=None) == b"ok"
+
+
+def test_timeout_recycles_worker_processes(pool):
+    started = time.perf_counter()
+    with pytest.raises(render_pool.RenderTimeoutError):
+        pool.run(time.sleep, (30,), {}, output_path=None, timeout=2)
+    assert time.perf_counter() - started < 15
+
+    assert pool.run(bytes, (b"de nuevo",), {}, output_path=None) == b"de nuevo"
+
+
+def test_render_file_moves_large_results_through_disk(pool, tmp_path):
+    report = _empty_fiscal_book()
+    target = tmp_path / "libro.xlsx"
+    pool.run(
+        fiscal_books.render_fiscal_book_excel, (report,), {}, output_path=str(target)
+    )
+
+    workbook = load_workbook(target)
+    assert workbook.active["A1"].value is not None
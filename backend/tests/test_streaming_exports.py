@@ -0,0 +1,193 @@
+"""Pruebas de las exportaciones en flujo y de las descargas por rangos."""
+from __future__ import annotations
+
+import csv
+import zipfile
+from io import BytesIO, StringIO
+
+from fastapi import status
+from openpyxl import load_workbook
+
+from backend.app.services import streaming_exports
+
+
+def _auth_headers(client) -> dict[str, str]:
+    payload = {
+        "username": "admin-stream",
+        "password": "ClaveSegura789",
+        "full_name": "Admin Stream",
+        "roles": ["ADMIN"],
+    }
+    response = client.post("/auth/bootstrap", json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    token_response = client.post(
+        "/auth/token",
+        data={"username": payload["username"], "password": payload["password"]},
+        headers={"content-type": "application/x-www-form-urlencoded"},
+    )
+    assert token_response.status_code == status.HTTP_200_OK
+    token = token_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _store_with_devices(client, headers: dict[str, str], total: int) -> int:
+    store_resp = client.post(
+        "/stores",
+        json={"name": "Sucursal Flujo", "location": "CDMX", "timezone": "America/Mexico_City"},
+        headers={**headers, "X-Reason": "Crear sucursal para flujo"},
+    )
+    assert store_resp.status_code == status.HTTP_201_CREATED
+    store_id = store_resp.json()["id"]
+    for idx in range(total):
+        response = client.post(
+            f"/stores/{store_id}/devices",
+            json={
+                "sku": f"FLU-{idx:03d}",
+                "name": f"Equipo flujo {idx:03d}",
+                "quantity": 1,
+                "unit_price": 1500,
+            },
+            headers={**headers, "X-Reason": "Alta dispositivo flujo"},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+    return store_id
+
+
+def test_iter_csv_emits_bounded_chunks():
+    rows = ([index, "x" * 50] for index in range(2_000))
+    chunks = list(streaming_exports.iter_csv(rows, header=["id", "valor"], chunk_size=4_096))
+
+    assert len(chunks) > 10
+    assert all(len(chunk) < 4_096 + 200 for chunk in chunks)
+    parsed = list(csv.reader(StringIO(b"".join(chunks).decode("utf-8"))))
+    assert parsed[0] == ["id", "valor"]
+    assert parsed[-1] == ["1999", "x" * 50]
+
+
+def test_write_xlsx_output_does_not_depend_on_the_clock():
+    def _render() -> bytes:
+        sheet = streaming_exports.XlsxSheet(
+            title="Datos", header=["#"], rows=([index] for index in range(50))
+        )
+        with streaming_exports.write_xlsx([sheet]) as workbook_file:
+            return workbook_file.read()
+
+    body = _render()
+    with zipfile.ZipFile(BytesIO(body)) as archive:
+        assert {info.date_time for info in archive.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        core = archive.read("docProps/core.xml").decode("utf-8")
+    assert core.count("1980-01-01T00:00:00Z") == 2
+    assert _render() == body
+
+
+def test_write_xlsx_streams_rows_with_styles():
+    rows = ([index, f"fila {index}"] for index in range(500))
+    with streaming_exports.write_xlsx(
+        [
+            streaming_exports.XlsxSheet(
+                title="Datos",
+                header=["#", "Texto"],
+                rows=rows,
+                column_width=18,
+                styled_header=True,
+            )
+        ]
+    ) as workbook_file:
+        workbook = load_workbook(BytesIO(workbook_file.read()))
+
+    sheet = workbook["Datos"]
+    assert sheet.max_row == 501
+    assert sheet["A1"].font.bold is True
+    assert sheet["B501"].value == "fila 499"
+    assert sheet.column_dimensions["A"].width == 18
+
+
+def test_devices_csv_export_supports_range_requests(client):
+    headers = _auth_headers(client)
+    store_id = _store_with_devices(client, headers, total=12)
+    url = f"/inventory/stores/{store_id}/devices/export/csv"
+    export_headers = {**headers, "X-Reason": "Exportar catalogo CSV"}
+
+    full = client.get(url, headers=export_headers)
+    assert full.status_code == status.HTTP_200_OK
+    assert full.headers["accept-ranges"] == "bytes"
+    rows = list(csv.DictReader(StringIO(full.text)))
+    assert [row["sku"] for row in rows] == [f"FLU-{idx:03d}" for idx in range(12)]
+    body = full.content
+    assert full.headers["content-length"] == str(len(body))
+    etag = full.headers["etag"]
+
+    # El CSV se regenera en cada petición: sin validador se entrega completo.
+    unvalidated = client.get(url, headers={**export_headers, "Range": "bytes=100-"})
+    assert unvalidated.status_code == status.HTTP_200_OK
+    assert unvalidated.content == body
+
+    partial = client.get(
+        url, headers={**export_headers, "Range": "bytes=100-", "If-Range": etag}
+    )
+    assert partial.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert partial.headers["content-range"] == f"bytes 100-{len(body) - 1}/{len(body)}"
+    assert partial.content == body[100:]
+
+    resumed = client.get(
+        url, headers={**export_headers, "Range": "bytes=0-99", "If-Range": etag}
+    )
+    assert resumed.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert resumed.content + partial.content == body
+
+    # Si el archivo cambió desde la primera descarga se entrega completo.
+    stale = client.get(
+        url, headers={**export_headers, "Range": "bytes=0-99", "If-Range": '"otro"'}
+    )
+    assert stale.status_code == status.HTTP_200_OK
+    assert stale.content == body
+
+    beyond = client.get(
+        url, headers={**export_headers, "Range": f"bytes={len(body)}-", "If-Range": etag}
+    )
+    assert beyond.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert beyond.headers["content-range"] == f"bytes */{len(body)}"
+
+
+def test_devices_excel_export_is_resumable(client):
+    headers = _auth_headers(client)
+    store_id = _store_with_devices(client, headers, total=3)
+    url = f"/inventory/stores/{store_id}/devices/export/xlsx"
+    export_headers = {**headers, "X-Reason": "Exportar catalogo XLSX"}
+
+    full = client.get(url, headers=export_headers)
+    assert full.status_code == status.HTTP_200_OK
+    body = full.content
+    assert full.headers["content-length"] == str(len(body))
+    etag = full.headers["etag"]
+
+    # El libro se regenera en cada petición con los mismos bytes.
+    again = client.get(url, headers=export_headers)
+    assert again.content == body
+    assert again.headers["etag"] == etag
+
+    unvalidated = client.get(url, headers={**export_headers, "Range": "bytes=100-"})
+    assert unvalidated.status_code == status.HTTP_200_OK
+    assert unvalidated.content == body
+
+    # Descarga interrumpida a la mitad y reanudada con `If-Range`.
+    half = len(body) // 2
+    rest = client.get(
+        url, headers={**export_headers, "Range": f"bytes={half}-", "If-Range": etag}
+    )
+    assert rest.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert body[:half] + rest.content == body
+
+    tail = client.get(
+        url, headers={**export_headers, "Range": "bytes=-64", "If-Range": etag}
+    )
+    assert tail.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert len(tail.content) == 64
+    size = int(tail.headers["content-range"].rsplit("/", 1)[1])
+    assert tail.headers["content-range"] == f"bytes {size - 64}-{size - 1}/{size}"
+    # El tramo final contiene el fin del directorio central del ZIP.
+    assert tail.content[-22:-18] == b"PK\x05\x06"
+
+    sheet = load_workbook(BytesIO(body))["Catalogo"]
+    assert [cell.value for cell in sheet[1]][:2] == ["sku", "name"]
+    assert sheet.max_row == 4
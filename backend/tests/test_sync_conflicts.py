@@ -1,3 +1,5 @@
+from sqlalchemy import select
+
 from backend.app import crud, models
 
 
@@ -83,3 +85,58 @@ def test_sync_outbox_conflict_resolution(db_session):
     assert resolved_entry.version == conflicting.version + 1
     audit_logs = crud.list_system_logs(db_session, modulo="inventario", limit=50)
     assert any(log.accion == "sync_conflict_resolved" for log in audit_logs)
+
+
+def test_sync_outbox_bulk_enqueue_matches_sequential_semantics(db_session):
+    existing = crud.enqueue_sync_outbox(
+        db_session,
+        entity_type="device",
+        entity_id="DEV-300",
+        operation="create",
+        payload={"name": "Telefono Z", "quantity": 1},
+    )
+
+    written = crud.enqueue_sync_outbox_bulk(
+        db_session,
+        [
+            crud.SyncOutboxItem(
+                entity_type="device",
+                entity_id="DEV-300",
+                operation="create",
+                payload={"name": "Telefono Z", "quantity": 4},
+            ),
+            crud.SyncOutboxItem(
+                entity_type="device",
+                entity_id="DEV-301",
+                operation="create",
+                payload={"name": "Tablet", "store_id": 3},
+            ),
+            crud.SyncOutboxItem(
+                entity_type="device",
+                entity_id="DEV-301",
+                operation="update",
+                payload={"name": "Tablet", "store_id": 3},
+            ),
+        ],
+    )
+    assert written == 2
+
+    db_session.refresh(existing)
+    assert existing.conflict_flag is True
+    assert existing.version == 2
+    assert existing.payload["quantity"] == 4
+
+    created = db_session.scalars(
+        select(models.SyncOutbox).where(models.SyncOutbox.entity_id == "DEV-301")
+    ).one()
+    assert created.operation == "update"
+    assert created.version == 2
+    assert created.store_id == 3
+    assert created.status == models.SyncOutboxStatus.PENDING
+
+    conflict_logs = db_session.scalars(
+        select(models.SystemLog).where(
+            models.SystemLog.accion == "sync_conflict_potential"
+        )
+    ).all()
+    assert len(conflict_logs) == 2
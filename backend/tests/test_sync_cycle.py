@@ -108,3 +108,36 @@ def test_run_sync_cycle_notifies_discrepancies(monkeypatch, db_session):
     assert recorded["message"].startswith("Discrepancias de inventario")
     assert recorded["extra"]["discrepancies"] == fake_discrepancies
     assert logged_payload["discrepancies"] == fake_discrepancies
+
+
+def test_run_sync_cycle_pages_store_backlog_by_routing_column(monkeypatch, db_session):
+    """Recorre colas mayores a una página usando la columna store_id indexada."""
+
+    monkeypatch.setattr(sync_service.settings, "sync_cycle_page_size", 2)
+    entries = [
+        models.SyncOutbox(
+            entity_type="transfer_order",
+            entity_id=f"transfer-{index}",
+            operation="update",
+            payload={"origin_store_id": 5 if index % 2 == 0 else 8},
+            status=models.SyncOutboxStatus.PENDING,
+            priority=models.SyncOutboxPriority.NORMAL,
+        )
+        for index in range(7)
+    ]
+    db_session.add_all(entries)
+    db_session.commit()
+
+    assert [entry.store_id for entry in entries] == [5, 8, 5, 8, 5, 8, 5]
+
+    result = sync_service.run_sync_cycle(db_session, store_id=5)
+
+    assert result["processed"] == 4
+    db_session.expire_all()
+    statuses = {
+        entry.entity_id: db_session.get(models.SyncOutbox, entry.id).status
+        for entry in entries
+    }
+    assert statuses["transfer-0"] == models.SyncOutboxStatus.SENT
+    assert statuses["transfer-6"] == models.SyncOutboxStatus.SENT
+    assert statuses["transfer-1"] == models.SyncOutboxStatus.PENDING
@@ -417,3 +417,96 @@ def test_sync_hybrid_forecast_estimates_completion(client, db_session):
     finally:
         settings.enable_hybrid_prep = original_hybrid
         settings.sync_remote_url = original_remote
+
+
+def test_dispatch_remote_batches_events_over_shared_client(monkeypatch):
+    import httpx
+
+    from backend.app.services import sync_queue
+
+    requests: list[dict] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append({"body": body, "key": request.headers.get("Idempotency-Key")})
+        results = [
+            {
+                "idempotency_key": event["idempotency_key"],
+                "success": event["idempotency_key"] != "evt-3",
+                "error": "rechazado",
+            }
+            for event in body["events"]
+        ]
+        return httpx.Response(200, json={"results": results})
+
+    monkeypatch.setattr(settings, "sync_remote_url", "https://central.example/sync")
+    monkeypatch.setattr(settings, "sync_dispatch_batch_size", 2)
+    monkeypatch.setattr(settings, "sync_dispatch_concurrency", 2)
+    monkeypatch.setattr(
+        sync_queue, "_http_client", httpx.Client(transport=httpx.MockTransport(_handler))
+    )
+
+    entries = [
+        models.SyncQueue(
+            id=index,
+            event_type="inventory.adjust",
+            payload={"device_id": index},
+            idempotency_key=key,
+        )
+        for index, key in enumerate(["evt-1", "evt-2", "evt-3", "evt-1"], start=1)
+    ]
+    try:
+        outcomes, batches = sync_queue._dispatch_remote(entries)
+    finally:
+        sync_queue.close_http_client()
+
+    assert batches == 2
+    assert len(requests) == 2
+    assert all(item["key"] for item in requests)
+    assert sorted(len(item["body"]["events"]) for item in requests) == [1, 2]
+    assert [outcome.success for outcome in outcomes] == [True, True, False, True]
+    assert outcomes[2].error_message == "rechazado"
+
+
+def test_dispatch_skips_rows_in_backoff_and_exhausted(db_session, monkeypatch):
+    from backend.app.services import sync_queue
+
+    monkeypatch.setattr(settings, "sync_remote_url", None)
+    monkeypatch.setattr(settings, "sync_max_attempts", 5)
+    now = datetime.utcnow()
+
+    def _entry(index: int, status, attempts: int, age: timedelta) -> models.SyncQueue:
+        return models.SyncQueue(
+            event_type="inventory.adjust",
+            payload={"device_id": index},
+            idempotency_key=f"backoff-{index}",
+            status=status,
+            attempts=attempts,
+            created_at=now - age,
+            updated_at=now - age,
+        )
+
+    # La cabeza de la cola (más antigua) no puede enviarse todavía.
+    waiting = [
+        _entry(index, models.SyncQueueStatus.PENDING, 3, timedelta(minutes=1))
+        for index in range(6)
+    ]
+    exhausted = [
+        _entry(index, models.SyncQueueStatus.FAILED, 5, timedelta(hours=2))
+        for index in range(6, 10)
+    ]
+    fresh = [
+        _entry(index, models.SyncQueueStatus.PENDING, 0, timedelta(seconds=5))
+        for index in range(10, 22)
+    ]
+    retry_due = _entry(22, models.SyncQueueStatus.FAILED, 1, timedelta(hours=1))
+    db_session.add_all([*waiting, *exhausted, *fresh, retry_due])
+    db_session.commit()
+
+    result = sync_queue.dispatch_pending_events(db_session, limit=5, rounds=3)
+
+    assert result.processed == 13
+    assert result.sent == 13
+    assert {entry.status for entry in [*fresh, retry_due]} == {models.SyncQueueStatus.SENT}
+    assert {entry.attempts for entry in waiting} == {3}
+    assert {entry.status for entry in exhausted} == {models.SyncQueueStatus.FAILED}
@@ -42,7 +42,7 @@ def fake_entries() -> list[Any]:
         SimpleNamespace(
             id=1,
             status=models.SyncOutboxStatus.PENDING,
-            payload="{\"store_id\": 5}",
+            store_id=5,
         )
     ]
 
@@ -54,11 +54,13 @@ def test_run_sync_cycle_with_fake_provider(monkeypatch: pytest.MonkeyPatch, fake
     provider = _build_provider(sessions)
     fake_session = provider()
 
-    def fake_list_sync_outbox(db: Any, *, statuses: Any, limit: int) -> list[Any]:
+    def fake_list_sync_outbox_page(
+        db: Any, *, statuses: Any, store_id: int | None, after_id: int, limit: int
+    ) -> list[Any]:
         assert db is fake_session
         assert statuses == (models.SyncOutboxStatus.PENDING,)
-        assert limit == 500
-        return fake_entries
+        assert store_id == 5
+        return fake_entries if after_id == 0 else []
 
     processed_ids: list[int] = []
 
@@ -71,7 +73,7 @@ def test_run_sync_cycle_with_fake_provider(monkeypatch: pytest.MonkeyPatch, fake
 
     fake_discrepancies = [{"sku": "SKU-1"}]
 
-    monkeypatch.setattr(sync_service.crud, "list_sync_outbox", fake_list_sync_outbox, raising=True)
+    monkeypatch.setattr(sync_service.crud, "list_sync_outbox_page", fake_list_sync_outbox_page, raising=True)
     monkeypatch.setattr(sync_service.crud, "mark_outbox_entries_sent", fake_mark_outbox_entries_sent, raising=True)
     monkeypatch.setattr(sync_service.crud, "log_sync_discrepancies", lambda db, discrepancies, performed_by_id=None: None, raising=True)
     monkeypatch.setattr(sync_service, "detect_inventory_discrepancies", lambda db: fake_discrepancies, raising=True)